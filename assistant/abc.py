@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, ABCMeta, abstractmethod
 from multiprocessing.pool import Pool
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -11,8 +11,10 @@ from redbot.core import commands
 from redbot.core.bot import Red
 
 from .common.command_index import CommandIndexStore
+from .common.conversation_store import ConversationStore
 from .common.embedding_store import EmbeddingStore
 from .common.models import DB, Conversation, EndpointProfile, GuildSettings, Skill
+from .common.semantic_cache import SemanticCache
 
 
 class CompositeMetaClass(CogMeta, ABCMeta):
@@ -29,7 +31,9 @@ class MixinMeta(ABC):
         self.registry: Dict[str, Dict[str, dict]]
         self.context_registry: Dict[str, Dict[str, dict]]
         self.embedding_store: EmbeddingStore
+        self.conversation_store: ConversationStore
         self.command_index: CommandIndexStore
+        self.semantic_cache: SemanticCache
         self.cmdindex_task: Optional[asyncio.Task]
         self.scheduler: AsyncIOScheduler
         # Keys: "cached", "cache_write", "total", "model".
@@ -37,6 +41,7 @@ class MixinMeta(ABC):
         # Smartmod review state (actually assigned in SmartMod.__init__).
         self.smartmod_cooldowns: Dict[tuple[int, int], float]
         self.smartmod_tasks: set
+        self.compaction_tasks: set[asyncio.Task]
 
     @abstractmethod
     async def _fire_reminder(self, reminder_id: str) -> None:
@@ -79,7 +84,12 @@ class MixinMeta(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def request_embeddings_batch(self, texts: List[str], conf: GuildSettings) -> tuple[List[List[float]], str]:
+    async def request_embeddings_batch(
+        self,
+        texts: List[str],
+        conf: GuildSettings,
+        progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> tuple[List[List[float]], str]:
         raise NotImplementedError
 
     @abstractmethod
@@ -91,7 +101,12 @@ class MixinMeta(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def resync_embeddings(self, conf: GuildSettings, guild_id: int) -> int:
+    async def resync_embeddings(
+        self,
+        conf: GuildSettings,
+        guild_id: int,
+        progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> int:
         raise NotImplementedError
 
     @abstractmethod
@@ -346,6 +361,14 @@ class MixinMeta(ABC):
     async def save_conversation(self, key: str):
         raise NotImplementedError
 
+    @abstractmethod
+    def load_conversation(self, key: str) -> Optional[Conversation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_conversation(self, member_id: int, channel_id: int, guild_id: int) -> Conversation:
+        raise NotImplementedError
+
     @abstractmethod
     def get_message_queue_key(
         self,
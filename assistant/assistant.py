@@ -50,6 +50,7 @@ from .common.models import (
     RolePrompt,
     normalize_tool_category,
 )
+from .common.semantic_cache import SemanticCache
 from .common.smartmod import SmartMod
 from .common.utils import clean_name, json_schema_invalid, normalize_skill_name
 from .listener import AssistantListener
@@ -89,9 +90,10 @@ class Assistant(
         return f"{helpcmd}\nVersion: {self.__version__}\nAuthor: {self.__author__}"
 
     async def red_delete_data_for_user(self, *, requester, user_id: int):
-        for key in self.db.conversations.copy():
+        stored = await asyncio.to_thread(self.conversation_store.keys)
+        for key in set(self.db.conversations) | set(stored):
             if key.split("-")[0] == str(user_id):
-                del self.db.conversations[key]
+                self.db.conversations.pop(key, None)
                 await asyncio.to_thread(self.conversation_store.delete, key)
 
     def __init__(self, bot: Red, *args, **kwargs):
@@ -106,7 +108,10 @@ class Assistant(
         self.mp_pool = mp.get_context("spawn").Pool(processes=1, maxtasksperchild=100)
         self.embedding_store = EmbeddingStore(cog_data_path(self))
         self.conversation_store = ConversationStore(cog_data_path(self))
+        self.conversation_save_locks: Dict[str, asyncio.Lock] = {}
+        self.compaction_tasks: set[asyncio.Task] = set()
         self.command_index = CommandIndexStore(self.embedding_store)
+        self.semantic_cache = SemanticCache()
         self.cmdindex_task: Optional[asyncio.Task] = None
         self.scheduler = AsyncIOScheduler()
 
@@ -157,6 +162,9 @@ class Assistant(
         self.scheduler.shutdown(wait=False)
         self.mp_pool.terminate()
         await asyncio.to_thread(self.mp_pool.join)
+        # Compactions run in threads and can't be cancelled, let them finish rewriting their files
+        if self.compaction_tasks:
+            await asyncio.gather(*self.compaction_tasks, return_exceptions=True)
         if self.cmdindex_task and not self.cmdindex_task.done():
             self.cmdindex_task.cancel()
         self.bot.dispatch("assistant_cog_remove")
@@ -195,16 +203,6 @@ class Assistant(
 
         self.db = await asyncio.to_thread(DB.model_validate, data)
 
-        # Load per-file conversations into the in-memory cache (persistent setups only).
-        if self.db.persistent_conversations:
-            raw = await asyncio.to_thread(self.conversation_store.load_all)
-            for key, cdata in raw.items():
-                try:
-                    self.db.conversations[key] = Conversation.model_validate(cdata)
-                except ValidationError:
-                    log.error("Dropping invalid stored conversation %s", key)
-            log.info("Loaded %s conversations from disk", len(self.db.conversations))
-
         log.info(f"Config loaded in {round((perf_counter() - start) * 1000, 2)}ms")
         await self.embedding_store.initialize()
         await self._cleanup_db()
@@ -301,13 +299,48 @@ class Assistant(
         """Persist a single conversation to its own file. No-op when not persistent."""
         if not self.db.persistent_conversations:
             return
-        convo = self.db.conversations.get(key)
-        if convo is None:
-            await asyncio.to_thread(self.conversation_store.delete, key)
-            return
-        # AssistantBaseModel.model_dump already forces mode="json"; passing it again collides.
-        dump = await asyncio.to_thread(convo.model_dump)
-        await asyncio.to_thread(self.conversation_store.save, key, dump)
+        lock = self.conversation_save_locks.setdefault(key, asyncio.Lock())
+        # Serialize saves per key so appended records land in the order the turns happened
+        async with lock:
+            convo = self.db.conversations.get(key)
+            if convo is None:
+                await asyncio.to_thread(self.conversation_store.delete, key)
+                return
+            # Only the small fields get dumped, the store appends the live message dicts that are new
+            # (AssistantBaseModel.model_dump already forces mode="json"; passing it again collides)
+            dump = convo.model_dump(exclude={"messages"}, exclude_defaults=False)
+            dump["messages"] = list(convo.messages)
+            await asyncio.to_thread(self.conversation_store.sync, key, dump)
+        if self.conversation_store.needs_compaction(key):
+            task = asyncio.create_task(asyncio.to_thread(self.conversation_store.compact, key))
+            self.compaction_tasks.add(task)
+            task.add_done_callback(self.compaction_tasks.discard)
+
+    async def get_conversation(self, member_id: int, channel_id: int, guild_id: int) -> Conversation:
+        """Get a conversation, reading it from disk off the event loop the first time its key is accessed"""
+        key = f"{member_id}-{channel_id}-{guild_id}"
+        if key not in self.db.conversations and self.db.persistent_conversations:
+            stored = await asyncio.to_thread(self.load_conversation, key)
+            # Another task may have loaded the same conversation while this one was reading
+            if stored is not None and key not in self.db.conversations:
+                self.db.conversations[key] = stored
+                # Later saves append to what was just read instead of rewriting it
+                self.conversation_store.track(key, stored.messages)
+        return self.db.get_conversation(member_id, channel_id, guild_id)
+
+    def load_conversation(self, key: str) -> Optional[Conversation]:
+        """Read a stored conversation from disk, runs in a thread from get_conversation"""
+        if not self.db.persistent_conversations:
+            return None
+        data = self.conversation_store.load(key)
+        if data is None:
+            return None
+        try:
+            convo = Conversation.model_validate(data)
+        except ValidationError:
+            log.error("Dropping invalid stored conversation %s", key)
+            return None
+        return convo
 
     async def _cleanup_db(self):
         cleaned = False
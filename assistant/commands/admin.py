@@ -6,6 +6,7 @@ import traceback
 import typing as t
 from datetime import datetime, timezone
 from io import BytesIO
+from time import perf_counter
 from typing import List, Union
 from urllib.parse import urlparse
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -201,6 +202,12 @@ class Admin(MixinMeta):
         """Configure OpenRouter response & prompt caching."""
         pass
 
+    @assistant.group(name="semanticcache", aliases=["semcache"])
+    @commands.admin_or_permissions(administrator=True)
+    async def semantic_cache(self, ctx: commands.Context):
+        """Answer repeated questions from recent answers to similar questions"""
+        pass
+
     @assistant.group(name="override")
     async def override(self, ctx: commands.Context):
         """Manage role-based overrides"""
@@ -2164,6 +2171,26 @@ class Admin(MixinMeta):
         await self.save_conf()
         await ctx.send(_("The seed has been set to **{}**").format(seed))
 
+    def embedding_progress(
+        self, message: discord.Message, message_text: str
+    ) -> t.Callable[[int, int], t.Awaitable[None]]:
+        """Progress callback for batch embedding that edits a message, at most every few seconds"""
+        last_edit = 0.0
+
+        async def _progress(done: int, total: int):
+            nonlocal last_edit
+            if done < total and perf_counter() - last_edit < 3:
+                return
+            last_edit = perf_counter()
+            with contextlib.suppress(discord.HTTPException):
+                await message.edit(
+                    content=_("{}\n`Embedded: `**{}/{}**").format(
+                        message_text, humanize_number(done), humanize_number(total)
+                    )
+                )
+
+        return _progress
+
     @embed.command(
         name="refresh",
         aliases=["refreshembeddings", "syncembeds", "syncembeddings"],
@@ -2180,7 +2207,11 @@ class Admin(MixinMeta):
         if not await self.can_call_llm(conf, ctx):
             return
         async with ctx.typing():
-            synced = await self.resync_embeddings(conf, ctx.guild.id)
+            message_text = _("Refreshing embeddings")
+            message = await ctx.send(message_text)
+            synced = await self.resync_embeddings(conf, ctx.guild.id, self.embedding_progress(message, message_text))
+            with contextlib.suppress(discord.HTTPException):
+                await message.edit(content=_("{}\n**COMPLETE**").format(message_text))
             if synced:
                 await ctx.send(_("{} embeddings have been updated").format(synced))
             else:
@@ -2384,11 +2415,14 @@ class Admin(MixinMeta):
         """
         if not yes_or_no:
             return await ctx.send(_("Not wiping conversations"))
-        # Snapshot the items: save_conversation awaits, so a concurrent chat turn could
+        # Snapshot the keys: save_conversation awaits, so a concurrent chat turn could
         # insert a key mid-loop and trigger "dict changed size during iteration".
-        for key, convo in list(self.db.conversations.items()):
-            if ctx.guild.id == int(key.split("-")[2]):
-                convo.messages.clear()
+        # Stored conversations that haven't been accessed yet are loaded so they get wiped too.
+        stored = await asyncio.to_thread(self.conversation_store.keys)
+        for key in set(self.db.conversations) | set(stored):
+            member_id, channel_id, guild_id = map(int, key.split("-"))
+            if ctx.guild.id == guild_id:
+                (await self.get_conversation(member_id, channel_id, guild_id)).messages.clear()
                 await self.save_conversation(key)
         await ctx.send(_("Conversations have been wiped in this server!"))
 
@@ -2572,8 +2606,10 @@ class Admin(MixinMeta):
                 _("You must attach **.json** files to this command or reference a message that has them!")
             )
 
-        imported = 0
         files = []
+        existing_names = set(await self.embedding_store.get_all_metadata(ctx.guild.id))
+        # name -> (text, embedding, model), later files win for repeated names
+        entries: dict[str, tuple[str, list[float], str]] = {}
         async with ctx.typing():
             for attachment in attachments:
                 file_bytes: bytes = await attachment.read()
@@ -2584,34 +2620,31 @@ class Admin(MixinMeta):
                     await ctx.send(_("Error reading **{}**: {}").format(attachment.filename, box(str(e))))
                     continue
                 try:
+                    parsed = {}
                     for name, em in embeddings.items():
-                        if not overwrite and await self.embedding_store.exists(ctx.guild.id, name):
+                        if not overwrite and name[:100] in existing_names:
                             continue
                         text = str(em.get("text", ""))[:4000]
-                        embedding_vec = em.get("embedding", [])
-                        model = em.get("model", conf.embed_model)
-                        if not embedding_vec:
-                            # Re-embed if no vector present
-                            (
-                                embedding_vec,
-                                model,
-                            ) = await self.request_embedding_with_info(text, conf)
-                        if not embedding_vec:
-                            continue
-                        await self.embedding_store.add(
-                            ctx.guild.id,
-                            name[:100],
-                            text,
-                            embedding_vec,
-                            model,
-                        )
-                        imported += 1
-                except (ValidationError, KeyError, TypeError):
+                        parsed[name[:100]] = (text, em.get("embedding", []), em.get("model", conf.embed_model))
+                except (ValidationError, KeyError, TypeError, AttributeError):
                     await ctx.send(
                         _("Failed to import **{}** because it contains invalid formatting!").format(attachment.filename)
                     )
                     continue
+                entries.update(parsed)
                 files.append(attachment.filename)
+
+            # Re-embed entries with no vector present in batched requests
+            missing = [name for name, (__, vec, __) in entries.items() if not vec]
+            if missing:
+                vectors, model = await self.request_embeddings_batch([entries[name][0] for name in missing], conf)
+                for name, vec in zip(missing, vectors):
+                    entries[name] = (entries[name][0], vec or [], model)
+
+            imported = await self.embedding_store.upsert_many(
+                ctx.guild.id,
+                [(name, text, vec, model) for name, (text, vec, model) in entries.items()],
+            )
             await ctx.send(
                 _("Imported the following files: `{}`\n{} embeddings imported").format(
                     humanize_list(files), humanize_number(imported)
@@ -2662,45 +2695,32 @@ class Admin(MixinMeta):
             message_text = _("Processing the following files in the background\n{}").format(box(humanize_list(files)))
             message = await ctx.send(message_text)
             df = await asyncio.to_thread(pd.concat, frames)
-            entries = len(df.index)
-            split_by = 10
-            if entries > 300:
-                split_by = round(entries / 25)
-            imported = 0
-            for index, row in df.iterrows():
+            existing = await self.embedding_store.get_all_metadata(ctx.guild.id)
+            # Last row wins for repeated names
+            to_embed: dict[str, str] = {}
+            for __, row in df.iterrows():
                 name = row["name"]
                 text = row["text"]
-                proc = _("processing")
-                if await self.embedding_store.exists(ctx.guild.id, name):
-                    proc = _("overwriting")
-                    existing = await self.embedding_store.get(ctx.guild.id, name)
-                    if not overwrite or (existing and existing.get("text") == text):
+                if name in existing:
+                    if not overwrite or existing[name].get("text") == text:
                         continue
+                to_embed[name] = text
 
-                if index and (index + 1) % split_by == 0:
-                    with contextlib.suppress(discord.DiscordServerError):
-                        await message.edit(
-                            content=_("{}\n`Currently {}: `**{}** ({}/{})").format(
-                                message_text, proc, name, index + 1, len(df)
-                            )
-                        )
-
-                (
-                    query_embedding,
-                    observed_model,
-                ) = await self.request_embedding_with_info(text, conf)
-                if len(query_embedding) == 0:
-                    await ctx.send(_("Failed to process embedding: `{}`").format(name))
-                    continue
-
-                await self.embedding_store.add(
+            imported = 0
+            if to_embed:
+                names = list(to_embed)
+                vectors, observed_model = await self.request_embeddings_batch(
+                    [to_embed[name] for name in names],
+                    conf,
+                    self.embedding_progress(message, message_text),
+                )
+                failed = [name for name, vec in zip(names, vectors) if not vec]
+                if failed:
+                    await ctx.send(_("Failed to process embeddings: {}").format(box(humanize_list(failed))))
+                imported = await self.embedding_store.upsert_many(
                     ctx.guild.id,
-                    name,
-                    text,
-                    query_embedding,
-                    observed_model,
+                    [(name, to_embed[name], vec, observed_model) for name, vec in zip(names, vectors)],
                 )
-                imported += 1
 
             if imported:
                 await message.edit(content=_("{}\n**COMPLETE**").format(message_text))
@@ -3182,6 +3202,89 @@ class Admin(MixinMeta):
         await self.save_conf()
         await ctx.send(_("OpenRouter provider prompt cache set to **{}**.").format(mode))
 
+    # ------------------------------------------------------------------
+    # Semantic response cache
+    # ------------------------------------------------------------------
+
+    @semantic_cache.command(name="enable")
+    async def semantic_cache_enable(self, ctx: commands.Context):
+        """Enable the semantic response cache
+
+        Only the first message of a conversation is looked up, and answers are only cached
+        when the model didn't call any functions. Prompts that use per-user or per-request
+        variables (time, balance, user info, 3rd party variables) or a floating context block
+        bypass the cache entirely.
+        """
+        conf = self.db.get_conf(ctx.guild)
+        conf.semantic_cache_enabled = True
+        await self.save_conf()
+        await ctx.send(
+            _("Semantic cache **enabled** (threshold: {}, TTL: {}s).").format(
+                conf.semantic_cache_threshold, conf.semantic_cache_ttl
+            )
+        )
+
+    @semantic_cache.command(name="disable")
+    async def semantic_cache_disable(self, ctx: commands.Context):
+        """Disable the semantic response cache"""
+        conf = self.db.get_conf(ctx.guild)
+        conf.semantic_cache_enabled = False
+        await self.save_conf()
+        self.semantic_cache.clear(ctx.guild.id)
+        await ctx.send(_("Semantic cache **disabled**."))
+
+    @semantic_cache.command(name="threshold")
+    async def semantic_cache_threshold(self, ctx: commands.Context, threshold: float):
+        """Set the minimum similarity for a question to reuse a cached answer (0.8 - 1.0)
+
+        Higher is stricter, **0.95** only matches questions that are worded almost the same.
+        """
+        if threshold < 0.8 or threshold > 1:
+            return await ctx.send(_("Threshold must be between 0.8 and 1.0"))
+        conf = self.db.get_conf(ctx.guild)
+        conf.semantic_cache_threshold = threshold
+        await self.save_conf()
+        await ctx.send(_("Semantic cache threshold set to **{}**").format(threshold))
+
+    @semantic_cache.command(name="ttl")
+    async def semantic_cache_ttl(self, ctx: commands.Context, seconds: int):
+        """Set how long cached answers can be reused in seconds (60 - 604800)"""
+        if seconds < 60 or seconds > 604800:
+            return await ctx.send(_("TTL must be between 60 and 604800 seconds (7 days)."))
+        conf = self.db.get_conf(ctx.guild)
+        conf.semantic_cache_ttl = seconds
+        await self.save_conf()
+        await ctx.send(_("Semantic cache TTL set to **{}** seconds.").format(seconds))
+
+    @semantic_cache.command(name="stats")
+    async def semantic_cache_stats(self, ctx: commands.Context):
+        """View semantic cache hit rate and tokens saved since the cog loaded"""
+        conf = self.db.get_conf(ctx.guild)
+        stats = self.semantic_cache.get_stats(ctx.guild.id)
+        embed = discord.Embed(title=_("Semantic Cache"), color=discord.Color.blue())
+        embed.add_field(
+            name=_("Status"), value=_("Enabled") if conf.semantic_cache_enabled else _("Disabled"), inline=True
+        )
+        embed.add_field(name=_("Threshold"), value=f"`{conf.semantic_cache_threshold}`", inline=True)
+        embed.add_field(name=_("TTL"), value=_("{}s").format(conf.semantic_cache_ttl), inline=True)
+        embed.add_field(name=_("Cached Answers"), value=humanize_number(self.semantic_cache.size(ctx.guild.id)))
+        embed.add_field(
+            name=_("Hit Rate"),
+            value=_("{} ({}/{} lookups)").format(
+                f"{stats.hit_rate:.1%}", humanize_number(stats.hits), humanize_number(stats.lookups)
+            ),
+        )
+        embed.add_field(name=_("Tokens Saved"), value=humanize_number(stats.tokens_saved))
+        embed.set_footer(text=_("Stats reset when the cog reloads"))
+        await ctx.send(embed=embed)
+
+    @semantic_cache.command(name="clear")
+    async def semantic_cache_clear(self, ctx: commands.Context):
+        """Clear all cached answers for this server"""
+        count = self.semantic_cache.size(ctx.guild.id)
+        self.semantic_cache.clear(ctx.guild.id)
+        await ctx.send(_("Cleared **{}** cached answers.").format(humanize_number(count)))
+
     # ------------------------------------------------------------------
     # OpenRouter provider routing preferences
     # ------------------------------------------------------------------
@@ -261,7 +261,7 @@ If a file has no extension it will still try to read it only if it can be decode
 
         conf = self.db.get_conf(ctx.guild)
         mem_id = ctx.channel.id if conf.collab_convos else user.id
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         messages = len(conversation.messages)
         max_tokens = self.get_max_tokens(conf, ctx.author)
         model = conf.get_user_model(user)
@@ -420,7 +420,7 @@ If a file has no extension it will still try to read it only if it can be decode
                     _("Only moderators can compact channel conversations when collaborative conversations are enabled!")
                 )
 
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         if not conversation.messages:
             return await ctx.send(_("You have no conversation history in this channel."))
 
@@ -471,7 +471,7 @@ If a file has no extension it will still try to read it only if it can be decode
         if conf.collab_convos and not any(perms):
             txt = _("Only moderators can clear channel conversations when collaborative conversations are enabled!")
             return await ctx.send(txt)
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         self.clear_message_queue(ctx.author.id, ctx.channel.id, ctx.guild.id, conf.collab_convos)
         conversation.reset()
         await self.save_conversation(f"{mem_id}-{ctx.channel.id}-{ctx.guild.id}")
@@ -513,7 +513,7 @@ If a file has no extension it will still try to read it only if it can be decode
         if conf.collab_convos and not any(perms):
             txt = _("Only moderators can pop messages from conversations when collaborative conversations are enabled!")
             return await ctx.send(txt)
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         if not conversation.messages:
             txt = _("There are no messages in this conversation yet!")
             return await ctx.send(txt)
@@ -778,7 +778,7 @@ If a file has no extension it will still try to read it only if it can be decode
             txt = _("Only moderators can copy conversations when collaborative conversations are enabled!")
             return await ctx.send(txt)
 
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         conversation.cleanup(conf, ctx.author)
         conversation.refresh()
 
@@ -791,7 +791,7 @@ If a file has no extension it will still try to read it only if it can be decode
 
         new_mem_id = channel.id if conf.collab_convos else ctx.author.id
         key = f"{new_mem_id}-{channel.id}-{ctx.guild.id}"
-        if key in self.db.conversations:
+        if key in self.db.conversations or self.conversation_store.exists(key):
             txt = _("This conversation has been overwritten in {}").format(channel.mention)
         else:
             txt = _("This conversation has been copied over to {}").format(channel.mention)
@@ -848,7 +848,7 @@ If a file has no extension it will still try to read it only if it can be decode
             ).format(ptokens, round(max_tokens * 0.9))
             return await ctx.send(txt)
 
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         conversation.system_prompt_override = prompt
         await self.save_conversation(f"{mem_id}-{ctx.channel.id}-{ctx.guild.id}")
         if prompt:
@@ -876,7 +876,7 @@ If a file has no extension it will still try to read it only if it can be decode
 
         conf = self.db.get_conf(ctx.guild)
         mem_id = ctx.channel.id if conf.collab_convos else user.id
-        conversation = self.db.get_conversation(mem_id, channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, channel.id, ctx.guild.id)
         if not conversation.messages:
             return await ctx.send(_("You have no conversation in this channel!"))
 
@@ -930,7 +930,7 @@ If a file has no extension it will still try to read it only if it can be decode
         if not any(perms) and conf.collab_convos:
             return await ctx.send(_("You do not have permission to import conversations."))
 
-        conversation = self.db.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
+        conversation = await self.get_conversation(mem_id, ctx.channel.id, ctx.guild.id)
         conversation.messages = messages
 
         await ctx.send(_("Conversation has been imported successfully!"))
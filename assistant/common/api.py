@@ -1,12 +1,16 @@
 import asyncio
+import hashlib
 import inspect
 import json
 import logging
 import math
 import re
+import threading
 import typing as t
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from datetime import datetime, timezone
+from time import perf_counter
 from typing import List, Optional
 from urllib.parse import urlparse
 
@@ -21,11 +25,15 @@ from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils.chat_formatting import box, humanize_number
 
 from ..abc import MixinMeta
-from .calls import request_chat_completion_raw, request_embedding_raw
+from .calls import request_chat_completion_raw, request_embedding_raw, request_embeddings_batch_raw
 from .constants import (
     COMPACTION_KEEP_RECENT,
     COMPACTION_SUMMARY_ROLE,
     COMPACTION_SYSTEM_PROMPT,
+    EMBED_BATCH_MAX_INPUTS,
+    EMBED_BATCH_MAX_TOKENS,
+    EMBED_MAX_CONCURRENCY,
+    EMBED_UPSERT_BATCH,
     MODELS,
     OR_SUFFIXES,
     SUPPORTS_VISION,
@@ -55,6 +63,54 @@ def get_encoding() -> tiktoken.Encoding:
     return ENCODING
 
 
+# Token counts keyed by a hash of the text, so each message in a conversation is only
+# encoded once instead of on every turn's budget check. Shared by all conversations
+# since the payloads built from them repeat the same message contents.
+TOKEN_CACHE_SIZE = 50_000
+# Encoding a string this short costs about as much as hashing it
+TOKEN_CACHE_MIN_LENGTH = 32
+_token_cache: OrderedDict[bytes, int] = OrderedDict()
+_token_cache_lock = threading.Lock()
+# Tool schema token counts keyed by a hash of the schema dump
+_function_token_cache: OrderedDict[bytes, int] = OrderedDict()
+FUNCTION_TOKEN_CACHE_SIZE = 256
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def cached_token_count(text: str) -> int:
+    """Token count for a string, encoding it only if it hasn't been seen recently.
+    May encode, so call inside a thread."""
+    if len(text) < TOKEN_CACHE_MIN_LENGTH:
+        return len(get_encoding().encode(text))
+    key = _text_key(text)
+    with _token_cache_lock:
+        count = _token_cache.get(key)
+        if count is not None:
+            _token_cache.move_to_end(key)
+            return count
+    count = len(get_encoding().encode(text))
+    with _token_cache_lock:
+        _token_cache[key] = count
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return count
+
+
+def peek_token_count(text: str) -> Optional[int]:
+    """Cached token count for a string, or None if counting it means encoding"""
+    if len(text) < TOKEN_CACHE_MIN_LENGTH:
+        return None
+    key = _text_key(text)
+    with _token_cache_lock:
+        count = _token_cache.get(key)
+        if count is not None:
+            _token_cache.move_to_end(key)
+        return count
+
+
 OPENROUTER_CHAT_FALLBACK_MODEL = "openrouter/auto"
 PREFERRED_EMBEDDING_FALLBACKS = (
     "text-embedding-3-small",
@@ -765,25 +821,67 @@ class API(MixinMeta):
         embedding, __ = await self.request_embedding_with_info(text, conf)
         return embedding
 
-    async def request_embeddings_batch(self, texts: List[str], conf: GuildSettings) -> tuple[List[List[float]], str]:
-        """Embed many texts with batched API calls. Returns (embeddings, observed_model)."""
+    async def request_embeddings_batch(
+        self,
+        texts: List[str],
+        conf: GuildSettings,
+        progress: Optional[t.Callable[[int, int], t.Awaitable[None]]] = None,
+    ) -> tuple[List[List[float]], str]:
+        """Embed many texts with batched API calls. Returns (embeddings, observed_model).
+
+        Texts are grouped into requests under EMBED_BATCH_MAX_INPUTS inputs and
+        EMBED_BATCH_MAX_TOKENS estimated tokens, with at most EMBED_MAX_CONCURRENCY
+        requests in flight. Rate limited requests are retried with backoff.
+
+        Args:
+            progress: Awaited with (embedded, total) as each request completes
+        """
+        if not texts:
+            return [], self.resolve_embedding_model(conf.embed_model, conf)
         base_url = self.get_guild_endpoint_url(conf)
         if base_url:
             await self.refresh_endpoint_profile(conf)
         requested_model = self.resolve_embedding_model(conf.embed_model, conf)
-        embeddings: List[List[float]] = []
+        api_key = self.get_api_key(conf)
+
+        token_counts = await asyncio.to_thread(lambda: [cached_token_count(text) for text in texts])
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        batch_tokens = 0
+        for idx, tokens in enumerate(token_counts):
+            if batch and (len(batch) >= EMBED_BATCH_MAX_INPUTS or batch_tokens + tokens > EMBED_BATCH_MAX_TOKENS):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(idx)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
         observed_model = requested_model
-        for start in range(0, len(texts), 100):
-            chunk = texts[start : start + 100]
-            response: CreateEmbeddingResponse = await request_embedding_raw(
-                text=chunk,
-                api_key=self.get_api_key(conf),
-                model=requested_model,
-                base_url=base_url,
-            )
+        done = 0
+        semaphore = asyncio.Semaphore(EMBED_MAX_CONCURRENCY)
+
+        async def _embed(indices: List[int]):
+            nonlocal observed_model, done
+            async with semaphore:
+                response: CreateEmbeddingResponse = await request_embeddings_batch_raw(
+                    texts=[texts[i] for i in indices],
+                    api_key=api_key,
+                    model=requested_model,
+                    base_url=base_url,
+                )
             observed_model = response.model or requested_model
-            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda d: d.index))
-        if embeddings:
+            for item in response.data:
+                embeddings[indices[item.index]] = item.embedding
+            done += len(indices)
+            if progress:
+                await progress(done, len(texts))
+
+        start = perf_counter()
+        await asyncio.gather(*[_embed(indices) for indices in batches])
+        log.debug(f"Embedded {len(texts)} texts in {len(batches)} requests in {perf_counter() - start:.2f}s")
+        if embeddings[0]:
             self.observe_embedding_runtime(observed_model, len(embeddings[0]), conf)
         return embeddings, observed_model
 
@@ -798,7 +896,6 @@ class API(MixinMeta):
             return 0
 
         def _count_payload():
-            encoding = get_encoding()
             tokens_per_message = 3
             tokens_per_name = 1
             num_tokens = 0
@@ -811,11 +908,11 @@ class API(MixinMeta):
                     if key == "content" and isinstance(value, list):
                         for item in value:
                             if item["type"] == "text":
-                                num_tokens += len(encoding.encode(item["text"]))
+                                num_tokens += cached_token_count(item["text"])
                             elif item["type"] == "image_url":
                                 num_tokens += 1000  # Just assume around 1k tokens for images
                     else:  # String, probably
-                        num_tokens += len(encoding.encode(str(value)))
+                        num_tokens += cached_token_count(str(value))
 
             num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
             return num_tokens
@@ -829,11 +926,20 @@ class API(MixinMeta):
         if not functions:
             return 0
 
+        dump = json.dumps(functions)
+        key = _text_key(dump)
+        if (count := _function_token_cache.get(key)) is not None:
+            _function_token_cache.move_to_end(key)
+            return count
+
         def _count():
-            encoding = get_encoding()
-            return len(encoding.encode(json.dumps(functions))) + 10 * len(functions)
+            return len(get_encoding().encode(dump)) + 10 * len(functions)
 
-        return await asyncio.to_thread(_count)
+        count = await asyncio.to_thread(_count)
+        _function_token_cache[key] = count
+        if len(_function_token_cache) > FUNCTION_TOKEN_CACHE_SIZE:
+            _function_token_cache.popitem(last=False)
+        return count
 
     async def get_tokens(self, text: str) -> list[int]:
         """Get token list from text"""
@@ -853,8 +959,13 @@ class API(MixinMeta):
             log.debug("No text to get token count from!")
             return 0
 
+        text = str(text)
+        # Most counts are for messages already seen this conversation, skip the thread hop
+        if (count := peek_token_count(text)) is not None:
+            return count
+
         def _count():
-            return len(get_encoding().encode(str(text)))
+            return cached_token_count(text)
 
         try:
             return await asyncio.to_thread(_count)
@@ -873,10 +984,18 @@ class API(MixinMeta):
             return False
         return True
 
-    async def resync_embeddings(self, conf: GuildSettings, guild_id: int) -> int:
+    async def resync_embeddings(
+        self,
+        conf: GuildSettings,
+        guild_id: int,
+        progress: Optional[t.Callable[[int, int], t.Awaitable[None]]] = None,
+    ) -> int:
         """Re-embed all entries using the current embedding model.
 
         Handles dimension mismatches by recreating the collection.
+
+        Args:
+            progress: Awaited with (embedded, total) as batches complete
         """
         all_data = await self.embedding_store.get_all_with_embeddings(guild_id)
         if not all_data:
@@ -912,17 +1031,15 @@ class API(MixinMeta):
         if not entries_to_sync:
             return 0
 
-        # Re-embed in parallel
+        # Re-embed in batched requests
         results: dict[str, tuple[list[float], str]] = (
             {first_name: (probe_embed, observed_model)} if first_name in dict(entries_to_sync) else {}
         )
-
-        async def _embed(name: str, text: str):
-            vec, model = await self.request_embedding_with_info(text, conf)
+        pending = [(name, text) for name, text in entries_to_sync if name not in results]
+        vectors, batch_model = await self.request_embeddings_batch([text for __, text in pending], conf, progress)
+        for (name, __), vec in zip(pending, vectors):
             if vec:
-                results[name] = (vec, model)
-
-        await asyncio.gather(*[_embed(n, t) for n, t in entries_to_sync if n not in results])
+                results[name] = (vec, batch_model)
 
         if not results:
             return 0
@@ -930,28 +1047,14 @@ class API(MixinMeta):
         if dimension_changed:
             # Recreate collection and re-add everything
             await self.embedding_store.recreate_collection(guild_id)
+            entries = []
             for name, meta in all_data.items():
                 vec, model = results.get(name, (meta.get("embedding", []), meta.get("model") or observed_model))
-                if not vec:
-                    continue
-                await self.embedding_store.add(
-                    guild_id,
-                    name,
-                    meta.get("text", ""),
-                    vec,
-                    model,
-                )
+                entries.append((name, meta.get("text", ""), vec, model))
         else:
             # Just update the changed entries
-            for name, (vec, model) in results.items():
-                meta = all_data[name]
-                await self.embedding_store.update(
-                    guild_id,
-                    name,
-                    meta.get("text", ""),
-                    vec,
-                    model,
-                )
+            entries = [(name, all_data[name].get("text", ""), vec, model) for name, (vec, model) in results.items()]
+        await self.embedding_store.upsert_many(guild_id, entries, batch_size=EMBED_UPSERT_BATCH)
 
         await self.save_conf()
         return len(results)
@@ -480,6 +480,38 @@ async def request_embedding_raw(
     return response
 
 
+@retry(
+    retry=retry_if_exception_type(
+        t.Union[
+            httpx.TimeoutException,
+            httpx.ReadTimeout,
+            openai.InternalServerError,
+            openai.RateLimitError,
+        ]
+    ),
+    wait=wait_random_exponential(min=2, max=60),
+    stop=stop_after_attempt(8),
+    reraise=True,
+)
+async def request_embeddings_batch_raw(
+    texts: list[str],
+    api_key: str,
+    model: str,
+    base_url: Optional[str] = None,
+) -> CreateEmbeddingResponse:
+    """Embed a batch of texts, backing off on rate limits. Not cached, batches rarely repeat."""
+    client = get_client(api_key, base_url)
+    add_breadcrumb(
+        category="api",
+        message="Calling request_embeddings_batch_raw",
+        level="info",
+        data={"inputs": len(texts)},
+    )
+    response: CreateEmbeddingResponse = await client.embeddings.create(input=texts, model=model)
+    log.debug(f"request_embeddings_batch_raw: {len(texts)} inputs, {model} -> {response.model}")
+    return response
+
+
 @retry(
     retry=retry_if_exception_type(
         t.Union[
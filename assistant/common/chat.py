@@ -59,6 +59,7 @@ from .models import (
     render_tool_category,
 )
 from .reply import send_reply
+from .semantic_cache import PERSONAL_VARIABLE_NAMES, get_cache_scope, has_variables
 from .utils import (
     DYNAMIC_VARIABLE_GROUPS,
     DYNAMIC_VARIABLE_NAMES,
@@ -655,7 +656,7 @@ class ChatHandler(MixinMeta):
         else:
             mem_id = message.author.id
 
-        conversation = self.db.get_conversation(mem_id, message.channel.id, message.guild.id)
+        conversation = await self.get_conversation(mem_id, message.channel.id, message.guild.id)
 
         # If referencing a message that isnt part of the user's conversation, include the context
         if hasattr(message, "reference") and message.reference:
@@ -836,7 +837,7 @@ class ChatHandler(MixinMeta):
         chan_id = channel if isinstance(channel, int) else channel.id
         if conf.collab_convos:
             mem_id = chan_id
-        conversation = self.db.get_conversation(
+        conversation = await self.get_conversation(
             member_id=mem_id,
             channel_id=chan_id,
             guild_id=guild.id,
@@ -904,6 +905,30 @@ class ChatHandler(MixinMeta):
         # Determine if we should embed the user's message
         message_tokens = await self.count_tokens(message)
         words = message.split(" ")
+
+        # Standalone questions may be answered from the semantic cache
+        cache_scope = None
+        cache_embedding = []
+        if message_tokens < 8191 and not any([images, model_override, auto_answer, trigger_prompt]):
+            cache_scope = await self.get_semantic_cache_scope(conf, conversation, user, channel)
+        if cache_scope:
+            try:
+                cache_embedding = await self.request_embedding(message, conf)
+            except Exception as e:
+                log.error("Failed to embed message for the semantic cache", exc_info=e)
+            if cache_embedding:
+                cached = self.semantic_cache.lookup(
+                    guild.id,
+                    cache_embedding,
+                    cache_scope,
+                    conf.semantic_cache_threshold,
+                    conf.semantic_cache_ttl,
+                )
+                if cached:
+                    conversation.update_messages(message, "user", clean_name(author.name) if author else None)
+                    conversation.update_messages(cached.answer, "assistant", clean_name(self.bot.user.name))
+                    return cached.answer
+
         has_embeds = await self.embedding_store.has_embeddings(guild.id)
         get_embed_conditions = [
             has_embeds,  # We actually have embeddings to compare with
@@ -916,9 +941,9 @@ class ChatHandler(MixinMeta):
                 if conf.question_mode:
                     # If question mode is enabled, only the first message and messages that end with a ? will be embedded
                     if message.endswith("?") or not conversation.messages:
-                        query_embedding = await self.request_embedding(message, conf)
+                        query_embedding = cache_embedding or await self.request_embedding(message, conf)
                 else:
-                    query_embedding = await self.request_embedding(message, conf)
+                    query_embedding = cache_embedding or await self.request_embedding(message, conf)
             except Exception as e:
                 log.error("Failed to get query embedding, continuing without embeddings", exc_info=e)
 
@@ -956,6 +981,8 @@ class ChatHandler(MixinMeta):
         )
         reply = None
         reply_reasoning = ""
+        answered = False  # Model produced a final answer
+        request_tokens = 0
 
         calls = 0
         tries = 0
@@ -989,6 +1016,7 @@ class ChatHandler(MixinMeta):
             convo_tokens = await self.count_payload_tokens(messages)
             func_tokens = await self.count_function_tokens(function_calls)
             context_fill_ratio = (convo_tokens + func_tokens) / max_tokens if max_tokens else 0.0
+            request_tokens = convo_tokens + func_tokens
 
             # Cap individual tool results to a fraction of the context window
             cap_tool_result_by_context(messages, max_tokens)
@@ -1095,6 +1123,7 @@ class ChatHandler(MixinMeta):
 
             if reply := response.content:
                 force_tool_choice_required = False
+                answered = True
                 break
 
             # Check for model refusal (newer API field)
@@ -1458,6 +1487,17 @@ class ChatHandler(MixinMeta):
             log.info("Auto answer triggered, not responding to user")
             return None
 
+        # Only answers the model gave without calling tools are reusable
+        if cache_embedding and answered and not calls and not block:
+            self.semantic_cache.store(
+                guild.id,
+                message,
+                cache_embedding,
+                reply,
+                cache_scope,
+                request_tokens + await self.count_tokens(reply),
+            )
+
         # Suppress duplicate if respond_and_continue already sent the same content
         if last_sent_content and reply and reply.strip() == last_sent_content.strip():
             log.debug("Suppressing duplicate reply already sent via respond_and_continue")
@@ -1465,6 +1505,41 @@ class ChatHandler(MixinMeta):
 
         return append_reasoning_block(reply, reply_reasoning, conf)
 
+    async def get_semantic_cache_scope(
+        self,
+        conf: GuildSettings,
+        conversation: Conversation,
+        member: Optional[discord.Member],
+        channel: Union[discord.TextChannel, discord.Thread, discord.ForumChannel],
+    ) -> Optional[str]:
+        """Get the semantic cache scope for a message, or None if its answer can't be shared
+
+        Only the first message of a conversation is eligible, and only when the prompts don't
+        reference anything that differs per user or per request.
+        """
+        if not conf.semantic_cache_enabled or conf.collab_convos or conversation.messages:
+            return None
+        if any(conf.context_block_var_statuses.values()):
+            # Floating context block carries per-request values
+            return None
+        system_prompt = (
+            conf.channel_prompts[channel.id]
+            if channel.id in conf.channel_prompts
+            else conversation.system_prompt_override or self.db.get_effective_system_prompt(conf)
+        )
+        replacement, append_texts = conf.get_role_prompt_layers(member)
+        templates = [system_prompt, conf.prompt, replacement, *append_texts]
+        if has_variables(templates, PERSONAL_VARIABLE_NAMES):
+            return None
+        catalog = self.db.get_context_variable_catalog(self.bot, self.context_registry)
+        if has_variables(templates, [entry["name"] for entry in catalog]):
+            # 3rd party variables can be anything
+            return None
+        skill_index = await self.build_skill_index_for_member(conf, member)
+        # Answers built on old knowledge stop matching once the embeddings change
+        generation = str(self.embedding_store.generation(channel.guild.id))
+        return get_cache_scope([conf.get_user_model(member), conf.embed_model, generation, skill_index, *templates])
+
     async def safe_regex(self, regex: str, content: str):
         process = self.mp_pool.apply_async(
             re.sub,
@@ -609,6 +609,25 @@ TOOL_RESULT_MAX_CONTEXT_SHARE = 0.15
 # responded to them a few times they add very little value.
 IMAGE_RETAIN_TURNS = 3
 
+# ---- Batch embedding (resync / imports) ----
+# Inputs per embeddings request (OpenAI accepts up to 2048)
+EMBED_BATCH_MAX_INPUTS = 256
+# Estimated tokens per embeddings request, well under OpenAI's 300k per-request cap
+EMBED_BATCH_MAX_TOKENS = 100_000
+# Embeddings requests in flight at once
+EMBED_MAX_CONCURRENCY = 4
+# Rows per ChromaDB upsert
+EMBED_UPSERT_BATCH = 5000
+
+# ---- Conversation storage ----
+# Conversation logs are compacted once their appended records outgrow the base
+# record, but never before the appended records reach this size
+CONVERSATION_COMPACT_MIN_BYTES = 64 * 1024
+
+# ---- Semantic response cache ----
+# Answered questions kept per guild, oldest are dropped first
+SEMANTIC_CACHE_MAX_ENTRIES = 500
+
 # ---- Compaction (LLM-based summarization) ----
 # Minimum number of messages to keep verbatim after compaction (the "tail")
 COMPACTION_KEEP_RECENT = 6
@@ -3,17 +3,29 @@ import logging
 import os
 import threading
 from pathlib import Path
+from typing import Optional
 from uuid import uuid4
 
+from .constants import CONVERSATION_COMPACT_MIN_BYTES
+
 log = logging.getLogger("red.vrt.assistant.conversation_store")
 
 
 class ConversationStore:
-    """One JSON file per conversation under <base>/conversations/.
+    """One append-only JSON lines log per conversation under <base>/conversations/.
 
-    Pure dict<->file persistence: callers pass and receive plain dicts
-    (Conversation.model_dump(mode="json") in, dict out for model_validate).
+    Pure dict<->file persistence: callers pass and receive plain dicts (the
+    conversation's live message dicts plus its dumped fields in, dict out for model_validate).
     Sidesteps Red's whole-file Config driver so each save is a tiny write.
+
+    Each log starts with a ``{"base": {...}}`` record holding the full conversation,
+    followed by delta records written by ``sync``::
+
+        {"drop": 2, "append": [...new messages], "meta": {...every field but messages}}
+
+    ``drop`` trims messages from the front (turn retention), ``append`` adds new ones.
+    Once the deltas outgrow the base the log is rewritten as a single base record.
+    Legacy ``<key>.json`` files are still read and get replaced on their next save.
     """
 
     def __init__(self, base_path: Path):
@@ -23,6 +35,11 @@ class ConversationStore:
         # A unique temp name per call keeps different keys fully independent.
         self.locks: dict[str, threading.Lock] = {}
         self.locks_guard = threading.Lock()
+        # What each log currently holds: the persisted message objects (compared by
+        # identity to find what's new), the last meta written, and base/delta sizes
+        self.synced: dict[str, list] = {}
+        self.synced_meta: dict[str, dict] = {}
+        self.sizes: dict[str, tuple[int, int]] = {}
 
     def lock_for(self, key: str) -> threading.Lock:
         with self.locks_guard:
@@ -31,34 +48,179 @@ class ConversationStore:
             return self.locks[key]
 
     def path_for(self, key: str) -> Path:
+        return self.dir / f"{key}.jsonl"
+
+    def legacy_path_for(self, key: str) -> Path:
         return self.dir / f"{key}.json"
 
+    def keys(self) -> list[str]:
+        """Keys of every stored conversation, loaded or not"""
+        return list({f.stem for f in self.dir.glob("*.jsonl")} | {f.stem for f in self.dir.glob("*.json")})
+
+    def exists(self, key: str) -> bool:
+        return self.path_for(key).exists() or self.legacy_path_for(key).exists()
+
+    def track(self, key: str, messages: list) -> None:
+        """Mark these message objects as the ones on disk, so the next sync only writes what follows them"""
+        self.synced[key] = list(messages)
+
     def save(self, key: str, data: dict) -> None:
+        """Rewrite the whole conversation as a single base record"""
+        with self.lock_for(key):
+            self.write_base(key, data)
+
+    def write_base(self, key: str, data: dict) -> None:
         # Atomic write with a unique temp name so concurrent saves for the same
         # key can't collide (the loser of os.replace would otherwise hit FileNotFoundError).
-        # A per-key lock serializes concurrent saves for the same key (required on Windows
-        # where os.replace raises PermissionError if the destination is being replaced
-        # simultaneously by another thread).
+        # Callers hold the per-key lock (required on Windows where os.replace raises
+        # PermissionError if the destination is being replaced simultaneously by another thread).
         path = self.path_for(key)
         tmp = self.dir / f"{key}.{uuid4().hex}.json.tmp"
-        tmp.write_text(json.dumps(data), encoding="utf-8")
+        line = json.dumps({"base": data}) + "\n"
+        tmp.write_text(line, encoding="utf-8")
+        os.replace(tmp, path)
+        self.legacy_path_for(key).unlink(missing_ok=True)
+        self.synced[key] = list(data.get("messages", []))
+        self.synced_meta[key] = {k: v for k, v in data.items() if k != "messages"}
+        self.sizes[key] = (len(line), 0)
+
+    def sync(self, key: str, data: dict) -> None:
+        """Persist a conversation, appending only what changed since it was last saved or loaded
+
+        Falls back to a full rewrite when earlier messages were replaced (compaction,
+        pruning, overwrite) rather than appended to or trimmed from the front.
+        """
+        messages: list = data.get("messages", [])
+        meta = {k: v for k, v in data.items() if k != "messages"}
+        with self.lock_for(key):
+            synced = self.synced.get(key)
+            drop = self.find_drop(synced, messages) if self.path_for(key).exists() else None
+            if drop is None:
+                self.write_base(key, data)
+                return
+            appended = messages[len(synced) - drop :]
+            if not drop and not appended and meta == self.synced_meta.get(key):
+                return
+            record: dict = {"drop": drop} if drop else {}
+            record.update({"append": appended, "meta": meta})
+            line = json.dumps(record) + "\n"
+            with self.path_for(key).open("a", encoding="utf-8") as f:
+                f.write(line)
+            self.synced[key] = list(messages)
+            self.synced_meta[key] = meta
+            base_size, delta_size = self.sizes.get(key, (0, 0))
+            self.sizes[key] = (base_size, delta_size + len(line))
+
+    @staticmethod
+    def find_drop(synced: Optional[list], messages: list) -> Optional[int]:
+        """How many synced messages were trimmed from the front, or None if the rest weren't kept as-is"""
+        if synced is None:
+            return None
+        if not synced:
+            return 0
+        if not messages:
+            return None
+        # Messages are compared by identity, edits always go through copies (see Conversation.overwrite)
+        drop = next((i for i, message in enumerate(synced) if message is messages[0]), None)
+        if drop is None:
+            return None
+        kept = len(synced) - drop
+        if len(messages) < kept:
+            return None
+        if any(synced[drop + i] is not messages[i] for i in range(kept)):
+            return None
+        return drop
+
+    def needs_compaction(self, key: str) -> bool:
+        base_size, delta_size = self.sizes.get(key, (0, 0))
+        return delta_size > max(base_size, CONVERSATION_COMPACT_MIN_BYTES)
+
+    def compact(self, key: str) -> None:
+        """Fold a log's delta records into a single base record"""
         with self.lock_for(key):
-            os.replace(tmp, path)
+            if not self.needs_compaction(key):
+                # Already compacted by an earlier call
+                return
+            data = self.read(key)
+            if data is None:
+                return
+            # Keep tracking the caller's live message objects, the rewritten log holds the same messages
+            synced = self.synced.get(key)
+            self.write_base(key, data)
+            if synced is not None:
+                self.synced[key] = synced
+
+    def read(self, key: str) -> Optional[dict]:
+        path = self.path_for(key)
+        if not path.exists():
+            legacy = self.legacy_path_for(key)
+            if not legacy.exists():
+                return None
+            data = json.loads(legacy.read_text(encoding="utf-8"))
+            size = legacy.stat().st_size
+            self.sizes[key] = (size, 0)
+            return data
+
+        data: dict = {}
+        base_size = delta_size = 0
+        truncated = False
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial trailing line from a crash mid-append, everything before it is intact
+                    log.warning("Ignoring truncated record in conversation log %s", path.name)
+                    truncated = True
+                    break
+                if "base" in record:
+                    data = record["base"]
+                    base_size, delta_size = len(line), 0
+                    continue
+                messages = data.setdefault("messages", [])
+                if record.get("drop"):
+                    del messages[: record["drop"]]
+                messages.extend(record.get("append", []))
+                data.update(record.get("meta", {}))
+                delta_size += len(line)
+        self.sizes[key] = (base_size, delta_size)
+        if truncated and data:
+            # Rewrite so new records aren't appended onto the partial line
+            self.write_base(key, data)
+        return data
+
+    def load(self, key: str) -> Optional[dict]:
+        """Load one conversation, None if it isn't stored or can't be read"""
+        with self.lock_for(key):
+            try:
+                data = self.read(key)
+            except (json.JSONDecodeError, OSError) as e:
+                log.error("Skipping unreadable conversation file %s: %s", key, e)
+                return None
+            if data is not None:
+                self.synced_meta[key] = {k: v for k, v in data.items() if k != "messages"}
+            return data
 
     def delete(self, key: str) -> None:
-        self.path_for(key).unlink(missing_ok=True)
+        with self.lock_for(key):
+            self.path_for(key).unlink(missing_ok=True)
+            self.legacy_path_for(key).unlink(missing_ok=True)
+            self.synced.pop(key, None)
+            self.synced_meta.pop(key, None)
+            self.sizes.pop(key, None)
 
     def clear(self) -> None:
-        for f in self.dir.glob("*.json"):
-            f.unlink(missing_ok=True)
-        for f in self.dir.glob("*.json.tmp"):
-            f.unlink(missing_ok=True)
+        for pattern in ("*.jsonl", "*.json", "*.json.tmp"):
+            for f in self.dir.glob(pattern):
+                f.unlink(missing_ok=True)
+        self.synced.clear()
+        self.synced_meta.clear()
+        self.sizes.clear()
 
     def load_all(self) -> dict:
         out: dict = {}
-        for f in self.dir.glob("*.json"):
-            try:
-                out[f.stem] = json.loads(f.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as e:
-                log.error("Skipping unreadable conversation file %s: %s", f.name, e)
+        for key in self.keys():
+            data = self.load(key)
+            if data is not None:
+                out[key] = data
         return out
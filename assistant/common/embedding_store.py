@@ -7,11 +7,14 @@ from time import perf_counter
 
 import chromadb
 import chromadb.api
-from chromadb.api.types import GetResult
+import numpy as np
 from chromadb.errors import ChromaError
 
 log = logging.getLogger("red.vrt.assistant.embedding_store")
 
+# Indexes bigger than this (rows * dimensions) are queried in a thread instead of inline
+INLINE_QUERY_MAX_CELLS = 8_000_000
+
 
 class DimensionMismatchError(Exception):
     """Raised when embedding dimensions don't match the collection's existing dimensions."""
@@ -22,18 +25,94 @@ class DimensionMismatchError(Exception):
         super().__init__(f"Embedding dimension {got} does not match collection dimension {expected}")
 
 
+class GuildIndex:
+    """In-memory copy of a guild's embeddings for exact cosine search.
+
+    Rows of ``matrix`` are L2-normalized so a query is a single matmul.
+    """
+
+    def __init__(self, names: list[str], texts: list[str], matrix: np.ndarray):
+        self.names = names
+        self.texts = texts
+        self.matrix = matrix
+        self.dimensions = matrix.shape[1] if matrix.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_collection(cls, guild_id: int, collection: t.Optional[chromadb.Collection]) -> "GuildIndex":
+        if not collection:
+            return cls([], [], np.empty((0, 0), dtype=np.float32))
+        data = collection.get(include=["metadatas", "embeddings"])
+        metadatas = data["metadatas"]
+        embeddings = data["embeddings"]
+        if embeddings is None or len(embeddings) == 0:
+            return cls([], [], np.empty((0, 0), dtype=np.float32))
+
+        # Chroma enforces one dimension per collection, but guard against stragglers anyway
+        dims = len(embeddings[0])
+        names: list[str] = []
+        texts: list[str] = []
+        rows: list = []
+        for i, name in enumerate(data["ids"]):
+            if len(embeddings[i]) != dims:
+                log.warning(f"Skipping embedding '{name}' with mismatched dimensions for guild {guild_id}")
+                continue
+            meta = metadatas[i] if metadatas is not None and len(metadatas) > 0 else {}
+            names.append(name)
+            texts.append(meta.get("text", ""))
+            rows.append(embeddings[i])
+
+        matrix = np.asarray(rows, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return cls(names, texts, matrix)
+
+    def query(
+        self, query_embedding: list[float], top_n: int, min_relatedness: float
+    ) -> list[tuple[str, str, float, int]]:
+        """Top-n rows by cosine similarity, as ``(name, text, relatedness, dimensions)``"""
+        if not len(self) or top_n <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        scores = self.matrix @ (query / norm)
+
+        n_results = min(top_n, len(self))
+        if n_results < len(self):
+            top = np.argpartition(scores, -n_results)[-n_results:]
+        else:
+            top = np.arange(len(self))
+        top = top[np.argsort(scores[top])[::-1]]
+        return [
+            (self.names[i], self.texts[i], float(scores[i]), self.dimensions)
+            for i in top
+            if scores[i] >= min_relatedness
+        ]
+
+
 class EmbeddingStore:
     """Persistent embedding storage backed by ChromaDB.
 
     All embedding data (vectors + metadata) lives in ChromaDB on disk.
     No embedding data is stored in Red's Config.
 
+    Similarity searches are answered from a per-guild in-memory index that is loaded
+    on first use and dropped whenever the guild's embeddings change.
+
     All public methods are async to avoid blocking the event loop.
     """
 
     def __init__(self, data_path: Path):
         self.data_path = data_path / "chromadb"
         self._client: t.Optional[chromadb.api.ClientAPI] = None
+        self._indexes: dict[int, GuildIndex] = {}
+        # Bumped on every write so an index loaded during a write is never cached
+        self._generations: dict[int, int] = {}
 
     async def initialize(self) -> None:
         """Create the PersistentClient in a thread to avoid blocking."""
@@ -64,9 +143,34 @@ class EmbeddingStore:
         except (ChromaError, ValueError):
             return None
 
+    # ---- in-memory index ----
+
+    def _invalidate(self, guild_id: int) -> None:
+        self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+        self._indexes.pop(guild_id, None)
+
+    def generation(self, guild_id: int) -> int:
+        """Counter bumped whenever a guild's embeddings change"""
+        return self._generations.get(guild_id, 0)
+
+    async def _get_index(self, guild_id: int) -> GuildIndex:
+        # An empty index is falsy, guilds without embeddings are still cached
+        if (index := self._indexes.get(guild_id)) is not None:
+            return index
+        generation = self._generations.get(guild_id, 0)
+        start = perf_counter()
+        index = await asyncio.to_thread(lambda: GuildIndex.from_collection(guild_id, self._get_collection(guild_id)))
+        if self._generations.get(guild_id, 0) == generation:
+            self._indexes[guild_id] = index
+        log.debug(f"Loaded {len(index)} embeddings into memory in {perf_counter() - start:.2f}s for guild {guild_id}")
+        return index
+
     # ---- read operations ----
 
     async def has_embeddings(self, guild_id: int) -> bool:
+        if (index := self._indexes.get(guild_id)) is not None:
+            return len(index) > 0
+
         def _check():
             collection = self._get_collection(guild_id)
             if not collection:
@@ -193,7 +297,10 @@ class EmbeddingStore:
                     raise DimensionMismatchError(expected, len(embedding)) from e
                 raise
 
-        await asyncio.to_thread(_add)
+        try:
+            await asyncio.to_thread(_add)
+        finally:
+            self._invalidate(guild_id)
 
     async def update(
         self,
@@ -236,10 +343,80 @@ class EmbeddingStore:
                 raise
             return True
 
-        result = await asyncio.to_thread(_update)
+        try:
+            result = await asyncio.to_thread(_update)
+        finally:
+            self._invalidate(guild_id)
         if not result:
             await self.add(guild_id, name, text, embedding, model)
 
+    async def upsert_many(
+        self,
+        guild_id: int,
+        entries: list[tuple[str, str, list[float], str]],
+        batch_size: int = 5000,
+    ) -> int:
+        """Add or update many embeddings with a few large upserts.
+
+        Existing entries keep their original creation date.
+
+        Args:
+            entries: ``(name, text, embedding, model)`` tuples
+
+        Returns: Number of embeddings written
+
+        Raises:
+            DimensionMismatchError: If dimensions differ from the collection's existing embeddings.
+        """
+        # Last write wins for repeated names, Chroma rejects duplicate IDs in one upsert
+        entries = list({entry[0]: entry for entry in entries if entry[2]}.values())
+        if not entries:
+            return 0
+
+        def _upsert():
+            collection = self._get_or_create_collection(guild_id)
+            now = datetime.now(tz=timezone.utc).isoformat()
+            for i in range(0, len(entries), batch_size):
+                chunk = entries[i : i + batch_size]
+                ids = [name for name, _text, _embedding, _model in chunk]
+                existing = collection.get(ids=ids, include=["metadatas"])
+                created: dict[str, str] = {}
+                for idx, name in enumerate(existing["ids"]):
+                    if existing["metadatas"] and existing["metadatas"][idx]:
+                        created[name] = existing["metadatas"][idx].get("created", now)
+                metadatas = [
+                    {
+                        "text": text,
+                        "created": created.get(name, now),
+                        "modified": now,
+                        "model": model,
+                        "dimensions": len(embedding),
+                    }
+                    for name, text, embedding, model in chunk
+                ]
+                try:
+                    collection.upsert(
+                        ids=ids,
+                        embeddings=[embedding for _name, _text, embedding, _model in chunk],
+                        metadatas=metadatas,
+                    )
+                except Exception as e:
+                    if "dimension" in str(e).lower():
+                        existing_peek = collection.peek(limit=1)
+                        expected = (
+                            len(existing_peek["embeddings"][0])
+                            if existing_peek.get("embeddings") and existing_peek["embeddings"]
+                            else 0
+                        )
+                        raise DimensionMismatchError(expected, len(chunk[0][2])) from e
+                    raise
+            return len(entries)
+
+        try:
+            return await asyncio.to_thread(_upsert)
+        finally:
+            self._invalidate(guild_id)
+
     async def delete(self, guild_id: int, name: str) -> None:
         def _delete():
             collection = self._get_collection(guild_id)
@@ -250,7 +427,10 @@ class EmbeddingStore:
             except (ChromaError, ValueError):
                 pass
 
-        await asyncio.to_thread(_delete)
+        try:
+            await asyncio.to_thread(_delete)
+        finally:
+            self._invalidate(guild_id)
 
     async def delete_all(self, guild_id: int) -> None:
         """Delete all embeddings for a guild by dropping the collection."""
@@ -261,7 +441,10 @@ class EmbeddingStore:
             except (ChromaError, ValueError):
                 pass
 
-        await asyncio.to_thread(_delete)
+        try:
+            await asyncio.to_thread(_delete)
+        finally:
+            self._invalidate(guild_id)
 
     # ---- query operations ----
 
@@ -279,56 +462,24 @@ class EmbeddingStore:
         if not query_embedding:
             return []
 
-        def _query():
-            collection = self._get_collection(guild_id)
-            if not collection or collection.count() == 0:
-                return []
-
-            n_results = min(top_n, collection.count())
-            if n_results == 0:
-                return []
-
-            # Check dimension compatibility
-            existing: GetResult = collection.peek(limit=1)
-            existing_embeddings = existing.get("embeddings")
-            if existing_embeddings is not None and len(existing_embeddings) > 0:
-                expected_dim = len(existing_embeddings[0])
-                if len(query_embedding) != expected_dim:
-                    log.warning(
-                        f"Query embedding dimension {len(query_embedding)} != collection dimension {expected_dim} "
-                        f"for guild {guild_id}. Skipping search."
-                    )
-                    return []
-
-            start = perf_counter()
-            try:
-                results = collection.query(
-                    query_embeddings=[query_embedding],
-                    n_results=n_results,
-                    include=["metadatas", "distances"],
-                )
-            except Exception as e:
-                log.error(f"Failed to query embeddings for guild {guild_id}: {e}")
-                return []
-
-            strings_and_relatedness: list[tuple[str, str, float, int]] = []
-            for idx in range(len(results["ids"][0])):
-                embed_name = results["ids"][0][idx]
-                metadata = results["metadatas"][0][idx] if results["metadatas"] else {}
-                distance = results["distances"][0][idx] if results["distances"] else 0.0
-                relatedness = 1 - distance
-
-                if relatedness >= min_relatedness:
-                    dims = metadata.get("dimensions", 0)
-                    strings_and_relatedness.append((embed_name, metadata.get("text", ""), relatedness, dims))
-
-            elapsed = perf_counter() - start
-            log.debug(f"Got {len(strings_and_relatedness)} related embeddings in {elapsed:.2f}s for guild {guild_id}")
-
-            strings_and_relatedness.sort(key=lambda x: x[2], reverse=True)
-            return strings_and_relatedness[:top_n]
+        index = await self._get_index(guild_id)
+        if not len(index):
+            return []
+        if len(query_embedding) != index.dimensions:
+            log.warning(
+                f"Query embedding dimension {len(query_embedding)} != collection dimension {index.dimensions} "
+                f"for guild {guild_id}. Skipping search."
+            )
+            return []
 
-        return await asyncio.to_thread(_query)
+        start = perf_counter()
+        if index.matrix.size > INLINE_QUERY_MAX_CELLS:
+            related = await asyncio.to_thread(index.query, query_embedding, top_n, min_relatedness)
+        else:
+            related = index.query(query_embedding, top_n, min_relatedness)
+        elapsed = perf_counter() - start
+        log.debug(f"Got {len(related)} related embeddings in {elapsed * 1000:.2f}ms for guild {guild_id}")
+        return related
 
     # ---- maintenance operations ----
 
@@ -402,4 +553,7 @@ class EmbeddingStore:
 
             return len(ids)
 
-        return await asyncio.to_thread(_migrate)
+        try:
+            return await asyncio.to_thread(_migrate)
+        finally:
+            self._invalidate(guild_id)
@@ -345,6 +345,14 @@ class GuildSettings(AssistantBaseModel):
     # system message.
     openrouter_prompt_cache_ttl: str = "5m"
 
+    # ------------------------------------------------------------------
+    # Semantic response cache: answer repeated standalone questions from
+    # recent answers with a similar question embedding (in memory only).
+    # ------------------------------------------------------------------
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.95  # Minimum cosine similarity
+    semantic_cache_ttl: int = 86400  # Seconds an answer can be reused
+
     # ------------------------------------------------------------------
     # OpenRouter provider routing preferences.
     # Sent as extra_body["provider"] on every OpenRouter request.
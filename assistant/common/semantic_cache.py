@@ -0,0 +1,178 @@
+"""Semantic response cache for repeated questions.
+
+Answers to standalone questions are kept in memory per guild alongside the question's
+embedding. A new question close enough to a recent one (cosine similarity at or above
+the guild's threshold) is answered from the cache without assembling a prompt, running
+RAG or calling the chat model.
+
+Entries are scoped by a hash of everything that shapes the answer besides the question
+(model, prompts, role prompt layers), so changing a prompt never serves stale answers.
+"""
+
+import hashlib
+import logging
+import typing as t
+from dataclasses import dataclass
+from time import time
+
+import numpy as np
+
+from .constants import SEMANTIC_CACHE_MAX_ENTRIES
+from .utils import DYNAMIC_VARIABLE_NAMES, STABLE_VARIABLE_GROUPS
+
+log = logging.getLogger("red.vrt.assistant.semantic_cache")
+
+# Prompts referencing any of these render differently per user or per request,
+# so answers generated with them can't be shared between questions
+PERSONAL_VARIABLE_NAMES: t.Set[str] = DYNAMIC_VARIABLE_NAMES | set(STABLE_VARIABLE_GROUPS["user_info"])
+
+
+def get_cache_scope(parts: t.Iterable[t.Optional[str]]) -> str:
+    """Hash the inputs that shape an answer, entries only match questions with the same scope"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update((part or "").encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def has_variables(templates: t.Iterable[t.Optional[str]], names: t.Iterable[str]) -> bool:
+    """Whether any template contains a ``{name}`` placeholder for one of the names"""
+    templates = [template for template in templates if template]
+    return any("{" + name + "}" in template for name in names for template in templates)
+
+
+@dataclass
+class CachedAnswer:
+    question: str
+    answer: str
+    scope: str
+    tokens: int  # Estimated prompt + completion tokens the answer originally cost
+    created: float
+    hits: int = 0
+
+
+@dataclass
+class SemanticCacheStats:
+    lookups: int = 0
+    hits: int = 0
+    stored: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class SemanticCache:
+    """Per-guild in-memory cache of answers keyed by question embeddings.
+
+    Question vectors are L2-normalized and stacked into one matrix per guild, so a
+    lookup is a single matmul.
+    """
+
+    def __init__(self, max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: t.Dict[int, t.List[CachedAnswer]] = {}
+        self._vectors: t.Dict[int, np.ndarray] = {}
+        self.stats: t.Dict[int, SemanticCacheStats] = {}
+
+    def get_stats(self, guild_id: int) -> SemanticCacheStats:
+        if guild_id not in self.stats:
+            self.stats[guild_id] = SemanticCacheStats()
+        return self.stats[guild_id]
+
+    def size(self, guild_id: int) -> int:
+        return len(self._entries.get(guild_id, []))
+
+    def clear(self, guild_id: int) -> None:
+        self._entries.pop(guild_id, None)
+        self._vectors.pop(guild_id, None)
+
+    def _normalize(self, embedding: t.List[float]) -> t.Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def _keep(self, guild_id: int, mask: np.ndarray) -> None:
+        entries = self._entries[guild_id]
+        self._entries[guild_id] = [entry for entry, keep in zip(entries, mask) if keep]
+        self._vectors[guild_id] = self._vectors[guild_id][mask]
+
+    def _expire(self, guild_id: int, ttl: int) -> None:
+        entries = self._entries.get(guild_id)
+        if not entries or ttl <= 0:
+            return
+        cutoff = time() - ttl
+        if entries[0].created >= cutoff:
+            # Entries are in insertion order, nothing has expired yet
+            return
+        self._keep(guild_id, np.array([entry.created >= cutoff for entry in entries], dtype=bool))
+
+    def lookup(
+        self,
+        guild_id: int,
+        embedding: t.List[float],
+        scope: str,
+        threshold: float,
+        ttl: int,
+    ) -> t.Optional[CachedAnswer]:
+        """Find the cached answer for the most similar question in the same scope"""
+        stats = self.get_stats(guild_id)
+        stats.lookups += 1
+        self._expire(guild_id, ttl)
+        entries = self._entries.get(guild_id)
+        query = self._normalize(embedding)
+        if not entries or query is None:
+            return None
+        vectors = self._vectors[guild_id]
+        if vectors.shape[1] != query.shape[0]:
+            # Embedding model changed, nothing cached can match anymore
+            self.clear(guild_id)
+            return None
+
+        scores = vectors @ query
+        scores[[entry.scope != scope for entry in entries]] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return None
+
+        entry = entries[best]
+        entry.hits += 1
+        stats.hits += 1
+        stats.tokens_saved += entry.tokens
+        log.debug(f"Semantic cache hit in guild {guild_id} ({scores[best]:.3f}): {entry.question[:80]}")
+        return entry
+
+    def store(
+        self,
+        guild_id: int,
+        question: str,
+        embedding: t.List[float],
+        answer: str,
+        scope: str,
+        tokens: int,
+    ) -> None:
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        vectors = self._vectors.get(guild_id)
+        if vectors is not None and vectors.shape[1] != vector.shape[0]:
+            self.clear(guild_id)
+            vectors = None
+
+        entry = CachedAnswer(question=question, answer=answer, scope=scope, tokens=tokens, created=time())
+        if vectors is None:
+            self._entries[guild_id] = [entry]
+            self._vectors[guild_id] = vector[np.newaxis, :]
+        else:
+            self._entries[guild_id].append(entry)
+            self._vectors[guild_id] = np.vstack([vectors, vector])
+            overflow = len(self._entries[guild_id]) - self.max_entries
+            if overflow > 0:
+                # Drop the oldest entries
+                self._entries[guild_id] = self._entries[guild_id][overflow:]
+                self._vectors[guild_id] = self._vectors[guild_id][overflow:]
+        self.get_stats(guild_id).stored += 1
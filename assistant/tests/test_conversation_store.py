@@ -99,3 +99,92 @@ def test_conversation_roundtrips_through_store(tmp_path):
     restored = Conversation.model_validate(store.load_all()["1-2-3"])
 
     assert restored.messages == [{"role": "user", "content": "hi"}]
+
+
+def log_lines(store, key):
+    return store.path_for(key).read_text(encoding="utf-8").splitlines()
+
+
+def test_sync_appends_only_new_messages(tmp_path):
+    store = ConversationStore(tmp_path)
+    messages = [{"role": "user", "content": "hi"}]
+    store.sync("1-2-3", {"messages": list(messages)})
+    messages.append({"role": "assistant", "content": "hello"})
+    store.sync("1-2-3", {"messages": list(messages)})
+
+    lines = log_lines(store, "1-2-3")
+    assert len(lines) == 2
+    assert '"hi"' not in lines[1]  # second turn only wrote the new message
+    assert ConversationStore(tmp_path).load("1-2-3")["messages"] == messages
+
+
+def test_sync_records_messages_trimmed_from_the_front(tmp_path):
+    store = ConversationStore(tmp_path)
+    messages = [{"role": "user", "content": str(n)} for n in range(4)]
+    store.sync("1-2-3", {"messages": list(messages)})
+    messages = messages[2:] + [{"role": "user", "content": "4"}]
+    store.sync("1-2-3", {"messages": list(messages)})
+
+    assert len(log_lines(store, "1-2-3")) == 2
+    assert ConversationStore(tmp_path).load("1-2-3")["messages"] == messages
+
+
+def test_sync_rewrites_when_history_is_replaced(tmp_path):
+    store = ConversationStore(tmp_path)
+    messages = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    store.sync("1-2-3", {"messages": list(messages)})
+    # Conversation.overwrite swaps in copies, so nothing can be appended
+    store.sync("1-2-3", {"messages": [dict(m) for m in messages[1:]]})
+
+    assert len(log_lines(store, "1-2-3")) == 1
+    assert ConversationStore(tmp_path).load("1-2-3")["messages"] == messages[1:]
+
+
+def test_sync_updates_meta_fields(tmp_path):
+    store = ConversationStore(tmp_path)
+    messages = [{"role": "user", "content": "hi"}]
+    store.sync("1-2-3", {"messages": messages, "system_prompt_override": "be brief"})
+    store.sync("1-2-3", {"messages": messages, "system_prompt_override": None})
+
+    assert ConversationStore(tmp_path).load("1-2-3")["system_prompt_override"] is None
+
+
+def test_compact_folds_log_into_one_record(tmp_path):
+    store = ConversationStore(tmp_path)
+    messages = [{"role": "user", "content": "x" * 1000}]
+    store.sync("1-2-3", {"messages": list(messages)})
+    while not store.needs_compaction("1-2-3"):
+        messages.append({"role": "user", "content": "y" * 1000})
+        store.sync("1-2-3", {"messages": list(messages)})
+
+    store.compact("1-2-3")
+
+    assert len(log_lines(store, "1-2-3")) == 1
+    assert ConversationStore(tmp_path).load("1-2-3")["messages"] == messages
+    # Still appends to the compacted log afterwards
+    messages.append({"role": "assistant", "content": "done"})
+    store.sync("1-2-3", {"messages": list(messages)})
+    assert len(log_lines(store, "1-2-3")) == 2
+
+
+def test_truncated_record_is_ignored_and_repaired(tmp_path):
+    store = ConversationStore(tmp_path)
+    store.save("1-2-3", {"messages": [{"role": "user", "content": "hi"}]})
+    with store.path_for("1-2-3").open("a", encoding="utf-8") as f:
+        f.write('{"append": [{"role": "us')
+
+    loaded = ConversationStore(tmp_path).load("1-2-3")
+
+    assert loaded == {"messages": [{"role": "user", "content": "hi"}]}
+    assert len(log_lines(store, "1-2-3")) == 1
+
+
+def test_legacy_json_file_loads_and_is_replaced_on_save(tmp_path):
+    store = ConversationStore(tmp_path)
+    store.legacy_path_for("1-2-3").write_text('{"messages": []}', encoding="utf-8")
+
+    assert store.load("1-2-3") == {"messages": []}
+    store.sync("1-2-3", {"messages": [{"role": "user", "content": "hi"}]})
+
+    assert not store.legacy_path_for("1-2-3").exists()
+    assert store.keys() == ["1-2-3"]
@@ -1,10 +1,10 @@
-import asyncio
 from abc import ABC, ABCMeta
 from pathlib import Path
 
 from discord.ext.commands.cog import CogMeta
 from redbot.core.bot import Red
 
+from .common.battle_pool import BattleWorkerPool
 from .common.models import DB, PartsRegistry
 from .common.telemetry import BattleTelemetry
 
@@ -23,7 +23,7 @@ class MixinMeta(ABC):
         self.data_path: Path
         self.telemetry: BattleTelemetry
         self.active_battles: set[int]
-        self.battle_semaphore: asyncio.Semaphore
+        self.battle_pool: BattleWorkerPool
 
     def save(self) -> None:
         raise NotImplementedError
@@ -3,10 +3,16 @@
 Bot Arena - Battle Runner
 
 Standalone script that runs a battle and renders it to video.
-This is designed to be called from a subprocess to avoid blocking the Discord bot.
+This is designed to be called from a subprocess to avoid blocking the Discord bot, either
+as a script or through the cog's warm battle workers (see common/battle_pool.py).
 
 Usage:
     python battle_runner.py <input_json> <output_path> [--format=gif|mp4]
+    python battle_runner.py <input_json> --headless [--keyframes=HZ]
+
+Headless mode skips rendering and frame capture and prints the result, including a
+"replay" entry. Passing that entry back as {"replay": ...} instead of the teams
+regenerates the exact same battle with full frames, e.g. to render it later.
 
 Input JSON format:
 {
@@ -35,6 +41,7 @@ Output: Creates video file and prints JSON result to stdout
 import argparse
 import json
 import sys
+import typing as t
 from pathlib import Path
 
 # Add parent directory to path so we can import botarena modules
@@ -49,27 +56,31 @@ from botarena.common.engine import (  # noqa
     BattleConfig,
     BattleEngine,
     TargetPriority,
+    create_engine,
+    replay_battle,
 )
 from botarena.common.renderer import BattleRenderer  # noqa
 from botarena.constants.parts import build_registry  # noqa
 
+if t.TYPE_CHECKING:
+    from botarena.common.models import PartsRegistry
+
 
-def run_battle_from_json(input_data: dict, output_path: str, format: str = "gif") -> dict:
+def simulate_battle(input_data: dict, record_frames: bool = True, keyframe_rate: float = 0.0) -> dict:
     """
-    Run a battle from JSON input and render to file.
+    Run the battle simulation without rendering.
 
     Args:
-        input_data: Battle configuration and bot data
-        output_path: Where to save the video
-        format: "gif" or "mp4"
+        input_data: Battle configuration and bot data, or {"replay": ...} from an earlier result
+        record_frames: Capture every frame (needed for rendering)
+        keyframe_rate: Keyframes per second to keep when not recording every frame
 
     Returns:
-        Battle result dict (without frame data for smaller output)
+        Battle result dict
     """
-    # Build parts registry for rendering
-    parts_registry = build_registry()
+    if "replay" in input_data:
+        return replay_battle(input_data["replay"])
 
-    # Parse config
     config_data = input_data.get("config", {})
     config = BattleConfig(
         arena_width=config_data.get("arena_width", 1000),
@@ -77,10 +88,13 @@ def run_battle_from_json(input_data: dict, output_path: str, format: str = "gif"
         fps=config_data.get("fps", 30),
         max_duration=config_data.get("max_duration", 60.0),
         seed=config_data.get("seed"),
+        record_frames=record_frames,
+        keyframe_rate=keyframe_rate,
     )
 
-    # Create engine
-    engine = BattleEngine(config)
+    # Create engine, large battles get the NumPy-backed engine (same results, less time)
+    bot_count = len(input_data.get("team1", [])) + len(input_data.get("team2", []))
+    engine = create_engine(config, bot_count)
 
     # Add team 1 bots
     for bot_data in input_data.get("team1", []):
@@ -90,8 +104,40 @@ def run_battle_from_json(input_data: dict, output_path: str, format: str = "gif"
     for bot_data in input_data.get("team2", []):
         _add_bot_from_data(engine, bot_data, team=2)
 
+    return engine.run()
+
+
+def run_battle_from_json(
+    input_data: dict,
+    output_path: str,
+    format: str = "gif",
+    parts_registry: t.Optional["PartsRegistry"] = None,
+    render_workers: t.Optional[int] = None,
+    show_progress: bool = True,
+) -> dict:
+    """
+    Run a battle from JSON input and render to file.
+
+    Args:
+        input_data: Battle configuration and bot data, or {"replay": ...} from an earlier result
+        output_path: Where to save the video
+        format: "gif" or "mp4"
+        parts_registry: Registry to render with (built fresh if not given)
+        render_workers: Processes to render frames with (None = based on CPU count)
+        show_progress: Print rendering progress to stderr
+
+    Returns:
+        Battle result dict (without frame data for smaller output)
+    """
+    # Build parts registry for rendering
+    if parts_registry is None:
+        parts_registry = build_registry()
+
+    config_data = input_data.get("config", {})
+
     # Run simulation
-    result = engine.run()
+    result = simulate_battle(input_data)
+    fps = result["fps"]
 
     # Render video with team colors
     scale = config_data.get("scale", 0.5)
@@ -100,32 +146,34 @@ def run_battle_from_json(input_data: dict, output_path: str, format: str = "gif"
     chapter = config_data.get("chapter")  # Campaign chapter for arena background
     mission_id = config_data.get("mission_id")  # Mission ID for mission-specific arena
     renderer = BattleRenderer(
-        width=config.arena_width,
-        height=config.arena_height,
+        width=result["arena_width"],
+        height=result["arena_height"],
         scale=scale,
-        fps=config.fps,
+        fps=fps,
         team1_color=team1_color,
         team2_color=team2_color,
         parts_registry=parts_registry,
         chapter=chapter,
         mission_id=mission_id,
+        workers=render_workers,
     )
 
     output_path = Path(output_path)
     if format == "gif":
         # For GIF, skip frames to keep size manageable
-        frame_skip = max(1, config.fps // 15)  # Target ~15 fps for GIF
-        renderer.render_to_gif(result, output_path, frame_skip=frame_skip, show_progress=True)
+        frame_skip = max(1, fps // 15)  # Target ~15 fps for GIF
+        renderer.render_to_gif(result, output_path, frame_skip=frame_skip, show_progress=show_progress)
     else:
         # Try MP4, fall back to GIF if ffmpeg not available
         try:
-            renderer.render_to_video(result, output_path, show_progress=True)
+            renderer.render_to_video(result, output_path, show_progress=show_progress)
         except (RuntimeError, FileNotFoundError) as e:
             # ffmpeg not available, fall back to GIF
-            print(f"MP4 rendering failed ({e}), falling back to GIF", file=sys.stderr)
+            if show_progress:
+                print(f"MP4 rendering failed ({e}), falling back to GIF", file=sys.stderr)
             gif_path = Path(output_path).with_suffix(".gif")
-            frame_skip = max(1, config.fps // 15)
-            renderer.render_to_gif(result, gif_path, frame_skip=frame_skip, show_progress=True)
+            frame_skip = max(1, fps // 15)
+            renderer.render_to_gif(result, gif_path, frame_skip=frame_skip, show_progress=show_progress)
             output_path = str(gif_path)
 
     # Return result without frames (too large)
@@ -137,6 +185,7 @@ def run_battle_from_json(input_data: dict, output_path: str, format: str = "gif"
         "team1_survivors": result["team1_survivors"],
         "team2_survivors": result["team2_survivors"],
         "bot_stats": result["bot_stats"],
+        "replay": result["replay"],
         "output_path": str(output_path),
     }
 
@@ -203,13 +252,24 @@ def _add_bot_from_data(engine: BattleEngine, bot_data: dict, team: int):
 def main():
     parser = argparse.ArgumentParser(description="Run a Bot Arena battle and render video")
     parser.add_argument("input", help="Path to input JSON file")
-    parser.add_argument("output", help="Path to output video file")
+    parser.add_argument("output", nargs="?", help="Path to output video file (not needed with --headless)")
     parser.add_argument(
         "--format",
         choices=["gif", "mp4"],
         default="gif",
         help="Output format (default: gif)",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Only simulate the battle and print the result, no frames or video",
+    )
+    parser.add_argument(
+        "--keyframes",
+        type=float,
+        default=0.0,
+        help="Keyframes per second to include in headless results (default: 0, results only)",
+    )
 
     args = parser.parse_args()
 
@@ -225,9 +285,16 @@ def main():
         print(json.dumps({"error": f"Invalid JSON: {e}"}))
         sys.exit(1)
 
+    if not args.headless and not args.output:
+        print(json.dumps({"error": "An output path is required unless --headless is used"}))
+        sys.exit(1)
+
     # Run battle
     try:
-        result = run_battle_from_json(input_data, args.output, args.format)
+        if args.headless:
+            result = simulate_battle(input_data, record_frames=False, keyframe_rate=args.keyframes)
+        else:
+            result = run_battle_from_json(input_data, args.output, args.format)
         print(json.dumps(result))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
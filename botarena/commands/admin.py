@@ -117,6 +117,22 @@ class AdminCommands(MixinMeta):
         files = view.get_attachments()
         view.message = await ctx.send(view=view, files=files)
 
+    @botarenaset.command(name="battlequeue")
+    @commands.is_owner()
+    async def baset_battlequeue(self, ctx: commands.Context):
+        """[Owner] View the battle worker queue"""
+        stats = self.battle_pool.stats()
+        await ctx.send(
+            f"⚔️ **Battle Workers**\n"
+            f"Running: **{stats['running']}/{stats['workers']}**\n"
+            f"Queued: **{stats['queued']}/{stats['max_queue']}**\n"
+            f"Completed: **{humanize_number(stats['completed'])}** | "
+            f"Failed: **{humanize_number(stats['failed'])}** | "
+            f"Timed out: **{humanize_number(stats['timed_out'])}** | "
+            f"Rejected: **{humanize_number(stats['rejected'])}**\n"
+            f"Last battle: waited **{stats['last_wait']:.1f}s**, ran **{stats['last_duration']:.1f}s**"
+        )
+
     @botarenaset.group(name="telemetry")
     @commands.is_owner()
     async def baset_telemetry(self, ctx: commands.Context):
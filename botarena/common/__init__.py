@@ -1,4 +1,4 @@
-from .engine import BattleConfig, BattleEngine
+from .engine import BattleConfig, BattleEngine, VectorizedBattleEngine, create_engine
 from .models import (
     DB,
     Bot,
@@ -28,5 +28,7 @@ __all__ = [
     "PartsRegistry",
     "PlayerData",
     "Plating",
+    "VectorizedBattleEngine",
     "WeightClass",
+    "create_engine",
 ]
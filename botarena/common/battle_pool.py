@@ -0,0 +1,257 @@
+"""
+Bot Arena - Battle Worker Pool
+
+Long-lived worker processes that run and render battles off the bot's event loop.
+Each worker imports the engine and renderer and builds the parts registry and
+collision masks once at start-up, so a battle only pays for simulating and encoding.
+
+Every worker sits in its own slot (a single-process executor) so a battle that runs
+past its timeout can be killed and replaced without touching the other workers.
+
+Red loads cogs from their folder rather than sys.path, so a spawned worker can't import
+this package on its own. Workers start by running battle_runner.py by path, which puts the
+cog's parent folder on sys.path before any of the jobs sent to them are unpickled.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import runpy
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+log = logging.getLogger("red.vrt.botarena.battle_pool")
+
+# Run by path in each new worker to make the botarena package importable there
+_RUNNER_PATH = str(Path(__file__).resolve().parent.parent / "battle_runner.py")
+
+# Registry built once per worker process by _init_worker
+_worker_registry = None
+
+
+def _init_worker():
+    """Warm up a worker: import the heavy modules and load everything battles share"""
+    global _worker_registry
+    from .. import battle_runner  # noqa: F401 - imports NumPy, PIL and PyAV once
+    from ..constants.parts import PLATING, build_registry
+
+    _worker_registry = build_registry()
+    try:
+        from .collision import preload_masks
+    except ImportError:
+        # No NumPy, engine uses circular hitboxes
+        return
+    preload_masks(plating.name for plating in PLATING)
+
+
+def _run_job(input_data: dict, output_path: str, output_format: str, render_workers: int) -> dict:
+    """Run and render one battle inside a worker"""
+    from ..battle_runner import run_battle_from_json
+
+    return run_battle_from_json(
+        input_data,
+        output_path,
+        output_format,
+        parts_registry=_worker_registry,
+        render_workers=render_workers,
+        show_progress=False,
+    )
+
+
+class BattleQueueFull(Exception):
+    """Raised when the battle queue has no room for another job"""
+
+
+class BattleTimeout(Exception):
+    """Raised when a battle runs longer than the pool's job timeout"""
+
+
+@dataclass
+class _Job:
+    input_data: dict
+    output_path: str
+    output_format: str
+    future: asyncio.Future
+    queued_at: float = field(default_factory=perf_counter)
+
+
+class BattleWorkerPool:
+    """
+    Bounded queue of battles served by a fixed number of warm worker processes.
+
+    Jobs and results are passed to the workers in memory; only the rendered video is
+    written to disk.
+    """
+
+    def __init__(self, workers: t.Optional[int] = None, max_queue: int = 10, job_timeout: float = 300.0):
+        """
+        Args:
+            workers: Battles to run at once (None = based on CPU count)
+            max_queue: Battles that can wait for a worker before new ones are rejected
+            job_timeout: Seconds a battle may run before its worker is killed
+        """
+        cpus = os.cpu_count() or 1
+        self.workers = workers or max(2, min(4, cpus))
+        self.max_queue = max_queue
+        self.job_timeout = job_timeout
+        # Split the CPUs between the workers' frame renderers
+        self.render_workers = max(1, cpus // self.workers)
+
+        self._queue: t.Optional[asyncio.Queue[_Job]] = None
+        self._slots: list[t.Optional[ProcessPoolExecutor]] = [None] * self.workers
+        self._tasks: list[asyncio.Task] = []
+
+        # Metrics
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.last_wait = 0.0
+        self.last_duration = 0.0
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def stats(self) -> dict:
+        """Snapshot of queue depth and job counters"""
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "last_wait": self.last_wait,
+            "last_duration": self.last_duration,
+        }
+
+    def start(self):
+        """Start the workers and the tasks that feed them"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        for slot in range(self.workers):
+            self._slots[slot] = self._new_executor()
+            self._tasks.append(asyncio.create_task(self._serve(slot)))
+        log.info(f"Started {self.workers} battle workers")
+
+    async def close(self):
+        """Stop the workers, failing any battles still waiting in the queue"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._queue:
+            while not self._queue.empty():
+                job = self._queue.get_nowait()
+                if not job.future.done():
+                    job.future.set_exception(RuntimeError("Battle pool is shutting down"))
+        for slot, executor in enumerate(self._slots):
+            if executor is not None:
+                self._kill_executor(executor)
+                self._slots[slot] = None
+
+    async def run(self, input_data: dict, output_path: t.Union[str, Path], output_format: str) -> dict:
+        """
+        Queue a battle and wait for its result.
+
+        Raises:
+            BattleQueueFull: The queue is at capacity
+            BattleTimeout: The battle ran longer than job_timeout
+        """
+        if not self._tasks:
+            self.start()
+        job = _Job(input_data, str(output_path), output_format, asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise BattleQueueFull(f"{self.running} battles running and {self.queued} waiting")
+        return await job.future
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Spawn rather than fork, forking a process running an event loop and threads isn't safe.
+        # The initializer has to be a stdlib function, the worker can't import botarena until it has run
+        executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=runpy.run_path,
+            initargs=(_RUNNER_PATH, None, "botarena_worker"),
+        )
+        # First job, starts the worker right away and warms it up before any battle arrives
+        executor.submit(_init_worker)
+        return executor
+
+    @staticmethod
+    def _kill_executor(executor: ProcessPoolExecutor):
+        """Shut an executor down without waiting on the job it's running"""
+        if hasattr(executor, "terminate_workers"):  # Python 3.14+
+            executor.terminate_workers()
+            return
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+    async def _serve(self, slot: int):
+        """Feed queued battles to one worker, replacing it if it hangs or dies"""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            if job.future.done():
+                # Caller gave up while the job was queued
+                continue
+            started = perf_counter()
+            self.last_wait = started - job.queued_at
+            self.running += 1
+            try:
+                pending = loop.run_in_executor(
+                    self._slots[slot],
+                    _run_job,
+                    job.input_data,
+                    job.output_path,
+                    job.output_format,
+                    self.render_workers,
+                )
+                result = await asyncio.wait_for(pending, self.job_timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                log.warning(f"Battle in worker {slot} exceeded {self.job_timeout}s, restarting worker")
+                self._replace_worker(slot)
+                if not job.future.done():
+                    job.future.set_exception(BattleTimeout(f"Battle took longer than {self.job_timeout:.0f}s"))
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except BrokenProcessPool as e:
+                self.failed += 1
+                log.error(f"Battle worker {slot} died, restarting it", exc_info=e)
+                self._replace_worker(slot)
+                if not job.future.done():
+                    job.future.set_exception(e)
+            except Exception as e:
+                self.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self.completed += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self.running -= 1
+                self.last_duration = perf_counter() - started
+
+    def _replace_worker(self, slot: int):
+        self._kill_executor(self._slots[slot])
+        self._slots[slot] = self._new_executor()
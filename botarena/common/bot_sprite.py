@@ -10,6 +10,7 @@ Note: Chassis images are not rendered because plating always covers them complet
 import io
 import math
 import typing as t
+from functools import lru_cache
 
 from PIL import Image
 
@@ -76,6 +77,31 @@ def _rotate_around_pivot(
     return rotated_canvas, (0, 0)
 
 
+@lru_cache(maxsize=128)
+def _load_scaled_part(folder: str, name: str, scale: float) -> t.Optional[Image.Image]:
+    """Load a part image resized by scale. Cached, so callers must not modify the result."""
+    img = load_image(folder, name)
+    if img and scale != 1.0:
+        new_size = (int(img.width * scale), int(img.height * scale))
+        img = img.resize(new_size, Image.Resampling.LANCZOS)
+    return img
+
+
+@lru_cache(maxsize=4096)
+def _rotated_part(
+    folder: str, name: str, scale: float, angle: float, pivot_x: float, pivot_y: float
+) -> t.Optional[tuple[Image.Image, tuple[int, int]]]:
+    """Scaled part image rotated around its pivot, cached by angle.
+
+    Battle frames pass whole-degree angles, so each part is rotated at most 360 times
+    per battle instead of once per bot per frame. Callers must not modify the result.
+    """
+    img = _load_scaled_part(folder, name, scale)
+    if not img:
+        return None
+    return _rotate_around_pivot(img, angle, pivot_x, pivot_y)
+
+
 def _apply_tint(img: Image.Image, tint_color: tuple[int, int, int], intensity: float) -> Image.Image:
     """Apply a color tint to an image."""
     r, g, b, a = img.split()
@@ -119,23 +145,17 @@ def render_bot_sprite(
     if weapon_orientation is None:
         weapon_orientation = orientation
 
-    # Load plating image (this is the base layer)
-    plating_img = load_image("plating", plating_name)
-    if not plating_img:
+    # Plating image is the base layer
+    if not _load_scaled_part("plating", plating_name, scale):
         return None
 
-    # Apply scale to plating
-    if scale != 1.0:
-        new_size = (int(plating_img.width * scale), int(plating_img.height * scale))
-        plating_img = plating_img.resize(new_size, Image.Resampling.LANCZOS)
-
     # Get plating center pivot from registry
     plating = registry.get_plating(plating_name)
     plating_center_x = plating.center_x * scale
     plating_center_y = plating.center_y * scale
 
     # Rotate plating around its pivot
-    rotated_plating, _ = _rotate_around_pivot(plating_img, orientation, plating_center_x, plating_center_y)
+    rotated_plating, _ = _rotated_part("plating", plating_name, scale, orientation, plating_center_x, plating_center_y)
 
     # Apply team tint if specified
     if tint_color:
@@ -143,22 +163,15 @@ def render_bot_sprite(
 
     # Load and position weapon if specified
     if weapon_name:
-        weapon_img = load_image("weapons", weapon_name)
-        if weapon_img:
-            # Scale weapon
-            if scale != 1.0:
-                new_size = (int(weapon_img.width * scale), int(weapon_img.height * scale))
-                weapon_img = weapon_img.resize(new_size, Image.Resampling.LANCZOS)
-
-            # Get weapon mount point from component
-            component = registry.get_component(weapon_name)
-            weapon_mount_x = component.mount_x * scale
-            weapon_mount_y = component.mount_y * scale
-
-            # Rotate weapon around its mount point
-            rotated_weapon, weapon_offset = _rotate_around_pivot(
-                weapon_img, weapon_orientation, weapon_mount_x, weapon_mount_y
-            )
+        # Get weapon mount point from component
+        component = registry.get_component(weapon_name)
+        weapon_mount_x = component.mount_x * scale
+        weapon_mount_y = component.mount_y * scale
+
+        # Scale and rotate weapon around its mount point
+        rotated = _rotated_part("weapons", weapon_name, scale, weapon_orientation, weapon_mount_x, weapon_mount_y)
+        if rotated:
+            rotated_weapon, weapon_offset = rotated
 
             # Determine the attachment point on the plating
             # Use the plating's weapon mount point relative to its center
@@ -194,7 +207,8 @@ def render_bot_sprite(
 
             return final
 
-    return rotated_plating
+    # Copy so callers can't modify the cached rotation
+    return rotated_plating.copy()
 
 
 def render_bot_sprite_to_bytes(
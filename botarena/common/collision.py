@@ -9,7 +9,9 @@ Note: Weapons are NOT included in collision detection because they rotate
 independently from the chassis (weapon_orientation vs bot orientation).
 """
 
+import math
 import typing as t
+from functools import lru_cache
 
 import numpy as np
 from PIL import Image
@@ -17,6 +19,41 @@ from PIL import Image
 from .image_utils import SPRITE_SCALE, load_image
 
 
+@lru_cache(maxsize=None)
+def _load_base_mask(plating_name: str) -> tuple[t.Optional[np.ndarray], tuple[int, int]]:
+    """Load the plating-only mask for a plating, shared by every CollisionMask using it.
+
+    The returned array is read-only since it's shared.
+    """
+    plating_img = load_image("plating", plating_name)
+    if not plating_img:
+        return None, (0, 0)
+
+    try:
+        # Extract alpha channel as numpy array
+        alpha = np.array(plating_img.split()[-1])
+
+        # Create binary mask: 1 where alpha > threshold (128), 0 elsewhere
+        mask = (alpha > 128).astype(np.uint8)
+    except (OSError, ValueError, IndexError):
+        # OSError: image file issues
+        # ValueError: invalid image mode
+        # IndexError: image has no alpha channel
+        return None, (0, 0)
+
+    mask.setflags(write=False)
+    return mask, plating_img.size
+
+
+def preload_masks(plating_names: t.Iterable[str]):
+    """Load the base masks for the given platings ahead of the first battle that uses them.
+
+    Rotated masks are still built per battle, so results don't depend on earlier battles.
+    """
+    for name in plating_names:
+        _load_base_mask(name)
+
+
 class CollisionMask:
     """
     A collision mask for a bot, based on the plating image only.
@@ -58,23 +95,7 @@ class CollisionMask:
 
         The plating-only mask correctly represents the bot's "body" hitbox.
         """
-        plating_img = load_image("plating", self.plating_name)
-        if not plating_img:
-            return
-
-        try:
-            # Extract alpha channel as numpy array
-            alpha = np.array(plating_img.split()[-1])
-
-            # Create binary mask: 1 where alpha > threshold (128), 0 elsewhere
-            self._base_mask = (alpha > 128).astype(np.uint8)
-            self._base_size = plating_img.size
-
-        except (OSError, ValueError, IndexError):
-            # OSError: image file issues
-            # ValueError: invalid image mode
-            # IndexError: image has no alpha channel
-            self._base_mask = None
+        self._base_mask, self._base_size = _load_base_mask(self.plating_name)
 
     def _quantize_angle(self, angle: float) -> int:
         """Quantize angle to nearest 5 degrees for caching."""
@@ -211,6 +232,32 @@ class CollisionManager:
 
         return mask.check_point_collision(proj_x, proj_y, bot_x, bot_y, bot_angle, self._scale)
 
+    def get_reach(self, bot_id: str) -> t.Optional[float]:
+        """
+        Furthest distance from a bot's center at which its mask can register a hit.
+
+        Holds for every rotation, so it can be used as a broad-phase radius before
+        calling `check_collision`. Returns None if no collision mask is available.
+        """
+        mask = self._masks.get(bot_id)
+        if mask is None or mask._base_mask is None:
+            return None
+        width, height = mask._base_size
+        # Rotated masks expand to at most the diagonal, plus a pixel of rounding on each side
+        return (math.hypot(width, height) / 2 + 2) * self._scale
+
+    def warm_mask(self, bot_id: str, bot_angle: float):
+        """
+        Build the rotated mask `check_collision` would use for this bot at this angle.
+
+        Rotated masks are cached by quantized angle, so the first angle seen in each
+        bucket decides the cached mask. Callers that skip some `check_collision` calls
+        use this to keep the cache in the same state as if they had made them.
+        """
+        mask = self._masks.get(bot_id)
+        if mask is not None:
+            mask._get_rotated_mask(bot_angle)
+
     def clear(self):
         """Clear all registered collision masks."""
         self._masks.clear()
@@ -17,7 +17,7 @@ Collision Detection:
 import math
 import random
 import typing as t
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
 if t.TYPE_CHECKING:
@@ -32,6 +32,13 @@ except ImportError:
     HAS_PIXEL_COLLISION = False
     _CollisionManager = None  # type: ignore
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 if t.TYPE_CHECKING:
     try:
         from .models import Bot, TacticalOrders
@@ -397,6 +404,8 @@ class BattleConfig:
     projectile_speed: float = 500.0  # pixels per second
     bot_radius: float = 32.0  # collision radius
     seed: t.Optional[int] = None  # RNG seed for reproducible battles (None = random)
+    record_frames: bool = True  # Capture every tick for rendering (False = results only)
+    keyframe_rate: float = 0.0  # Keyframes per second to sample when not recording frames (0 = none)
 
 
 class BattleEngine:
@@ -423,8 +432,10 @@ class BattleEngine:
         self.bots: dict[str, BotRuntimeState] = {}
         self.projectiles: list[Projectile] = []
         self.frames: list[FrameData] = []
+        self.loadouts: list[dict] = []  # add_bot arguments, in order, so the battle can be replayed
         self.current_time: float = 0.0
         self.frame_number: int = 0
+        self.ticks: int = 0
         self.dt: float = 1.0 / self.config.fps
         self.events: list[dict] = []  # Events for current frame
 
@@ -473,6 +484,8 @@ class BattleEngine:
             projectile_type: Visual type of projectile (bullet, laser, cannon, missile, heal)
             muzzle_offset: Distance from bot center to weapon muzzle (for projectile spawn point)
         """
+        self.loadouts.append({k: v for k, v in locals().items() if k != "self"})
+
         shots_per_second = shots_per_minute / 60.0
 
         # Apply range scaling - original BA3 ranges are for smaller arena
@@ -575,8 +588,12 @@ class BattleEngine:
         self.setup_positions()
         self.current_time = 0.0
         self.frame_number = 0
+        self.ticks = 0
 
         max_frames = int(self.config.max_duration * self.config.fps)
+        keyframe_interval = 0
+        if not self.config.record_frames and self.config.keyframe_rate > 0:
+            keyframe_interval = max(1, round(self.config.fps / self.config.keyframe_rate))
 
         while self.frame_number < max_frames:
             self.events = []
@@ -588,12 +605,20 @@ class BattleEngine:
             self._update_weapon_orientation()
             self._update_projectiles()
             self._update_combat()
-
-            # Capture frame
-            self._capture_frame()
+            self.ticks += 1
 
             # Check for battle end
-            if self._check_battle_end():
+            ended = self._check_battle_end()
+
+            # Capture frame, or just the sampled keyframes (and the final state) in results-only mode
+            if self.config.record_frames:
+                self._capture_frame()
+            elif keyframe_interval and (
+                ended or self.frame_number == max_frames - 1 or self.frame_number % keyframe_interval == 0
+            ):
+                self._capture_frame()
+
+            if ended:
                 break
 
             self.current_time += self.dt
@@ -646,7 +671,7 @@ class BattleEngine:
                 # Calculate distance to nearest enemy
                 nearest_enemy = self._find_nearest_enemy(bot)
                 if nearest_enemy:
-                    dist = bot.position.distance_to(nearest_enemy.position)
+                    dist = self._bot_distance(bot, nearest_enemy)
                     # If too far, override target position to move closer
                     if dist > bot.max_range * 0.6:
                         # Set target position closer to enemy
@@ -699,6 +724,31 @@ class BattleEngine:
 
     def _find_best_target(self, bot: BotRuntimeState) -> t.Optional[str]:
         """Find the best target for this bot based on tactical orders"""
+        candidates = self._target_candidates(bot)
+
+        if not candidates:
+            return None
+
+        # FOCUS_FIRE: Find what teammates are targeting and prioritize that
+        if bot.target_priority == TargetPriority.FOCUS_FIRE:
+            # Count how many teammates are targeting each enemy
+            target_counts: dict[str, int] = {}
+            for ally in self.bots.values():
+                if ally.team == bot.team and ally.bot_id != bot.bot_id and ally.is_alive:
+                    if ally.target_id and ally.target_id in [c.bot_id for c in candidates]:
+                        target_counts[ally.target_id] = target_counts.get(ally.target_id, 0) + 1
+
+            if target_counts:
+                # Target what most allies are targeting
+                best_target_id = max(target_counts, key=target_counts.get)
+                return best_target_id
+            # Fall through to WEAKEST if no allies have targets
+            return self._select_by_priority(bot, candidates, TargetPriority.WEAKEST)
+
+        return self._select_by_priority(bot, candidates, bot.target_priority)
+
+    def _target_candidates(self, bot: BotRuntimeState) -> list[BotRuntimeState]:
+        """Bots this bot could target: damaged allies for healers, enemies within approach range otherwise"""
         candidates = []
 
         for other in self.bots.values():
@@ -720,31 +770,12 @@ class BattleEngine:
                     continue
                 # Only consider enemies within reasonable approach distance
                 # max_range * 2.0 allows bots to pursue enemies but prevents chasing unreachable targets
-                distance = bot.position.distance_to(other.position)
+                distance = self._bot_distance(bot, other)
                 max_approach_distance = bot.max_range * 2.0
                 if distance <= max_approach_distance:
                     candidates.append(other)
 
-        if not candidates:
-            return None
-
-        # FOCUS_FIRE: Find what teammates are targeting and prioritize that
-        if bot.target_priority == TargetPriority.FOCUS_FIRE:
-            # Count how many teammates are targeting each enemy
-            target_counts: dict[str, int] = {}
-            for ally in self.bots.values():
-                if ally.team == bot.team and ally.bot_id != bot.bot_id and ally.is_alive:
-                    if ally.target_id and ally.target_id in [c.bot_id for c in candidates]:
-                        target_counts[ally.target_id] = target_counts.get(ally.target_id, 0) + 1
-
-            if target_counts:
-                # Target what most allies are targeting
-                best_target_id = max(target_counts, key=target_counts.get)
-                return best_target_id
-            # Fall through to WEAKEST if no allies have targets
-            return self._select_by_priority(bot, candidates, TargetPriority.WEAKEST)
-
-        return self._select_by_priority(bot, candidates, bot.target_priority)
+        return candidates
 
     def _select_by_priority(
         self, bot: BotRuntimeState, candidates: list[BotRuntimeState], priority: TargetPriority
@@ -781,7 +812,7 @@ class BattleEngine:
         else:  # CLOSEST (default) or FOCUS_FIRE fallback
             # Sort by distance (closest first), with noise and threat weighting
             def score(c: BotRuntimeState) -> float:
-                dist = bot.position.distance_to(c.position)
+                dist = self._bot_distance(bot, c)
                 noise = self.rng.uniform(0, 50) * (10 - bot.intelligence) / 10
                 threat_bonus = get_threat_bonus(c.bot_id)
                 # Lower score = higher priority, so subtract threat bonus from distance
@@ -1307,7 +1338,7 @@ class BattleEngine:
                 score -= 25  # Priority boost
 
             # Slight bonus for closer allies (easier to reach)
-            distance = bot.position.distance_to(other.position)
+            distance = self._bot_distance(bot, other)
             score += distance * 0.05  # Small distance penalty
 
             candidates.append((score, other))
@@ -1332,7 +1363,7 @@ class BattleEngine:
             if other.team == bot.team:
                 continue
 
-            dist = bot.position.distance_to(other.position)
+            dist = self._bot_distance(bot, other)
             if dist < nearest_dist:
                 nearest_dist = dist
                 nearest_enemy = other
@@ -1366,7 +1397,7 @@ class BattleEngine:
         if is_in_danger:
             nearest_enemy = self._find_nearest_enemy(bot)
             if nearest_enemy:
-                enemy_dist = bot.position.distance_to(nearest_enemy.position)
+                enemy_dist = self._bot_distance(bot, nearest_enemy)
                 # If enemy is close and we're low, RUN AWAY
                 if enemy_dist < bot.max_range * 0.8:
                     self._flee_from_enemy(bot, nearest_enemy)
@@ -1387,7 +1418,7 @@ class BattleEngine:
 
         # Calculate desired position
         ally_pos = ally_to_heal.position
-        bot_to_ally_dist = bot.position.distance_to(ally_pos)
+        bot_to_ally_dist = self._bot_distance(bot, ally_to_heal)
 
         # Healing range management - stay within range but not too close
         # Ideal distance is 60-70% of max healing range
@@ -1478,7 +1509,7 @@ class BattleEngine:
             if not ally.is_alive:
                 continue
 
-            dist = ally.position.distance_to(nearest_enemy.position)
+            dist = self._bot_distance(ally, nearest_enemy)
             if dist < closest_dist:
                 closest_dist = dist
                 closest_to_enemy = ally
@@ -1673,11 +1704,24 @@ class BattleEngine:
             bot.last_wall_contact = self.current_time
 
         # Collision checking
+        if self._collides_with_bot(bot, new_pos):
+            return  # Collision, don't move
+
+        self._set_bot_position(bot, new_pos)
+
+    def _bot_distance(self, bot: BotRuntimeState, other: BotRuntimeState) -> float:
+        """Distance between two bots' centers"""
+        return bot.position.distance_to(other.position)
+
+    def _collides_with_bot(self, bot: BotRuntimeState, new_pos: Vector2) -> bool:
+        """Check if moving a bot to new_pos would overlap any other living bot"""
         for other in self.bots.values():
             if other.bot_id != bot.bot_id and other.is_alive:
                 if new_pos.distance_to(other.position) < self.config.bot_radius * 2.2:
-                    return  # Collision, don't move
+                    return True
+        return False
 
+    def _set_bot_position(self, bot: BotRuntimeState, new_pos: Vector2):
         bot.position = new_pos
 
     def _friendly_in_line_of_fire(self, shooter: BotRuntimeState, target: BotRuntimeState) -> bool:
@@ -1733,8 +1777,8 @@ class BattleEngine:
             blocking_radius = self.config.bot_radius * 1.2
             if dist_sq < blocking_radius * blocking_radius:
                 # Also verify the friendly is actually BETWEEN shooter and target (not behind)
-                dist_to_friendly = shooter_pos.distance_to(friendly_pos)
-                dist_to_target = shooter_pos.distance_to(target_pos)
+                dist_to_friendly = self._bot_distance(shooter, bot)
+                dist_to_target = self._bot_distance(shooter, target)
                 if dist_to_friendly < dist_to_target:
                     return True  # Friendly is blocking!
 
@@ -1764,114 +1808,12 @@ class BattleEngine:
                 # Skip the shooter - can't hit yourself
                 if bot.bot_id == proj.shooter_id:
                     continue
-
-                # Check collision - use pixel-perfect if available, otherwise circular hitbox
-                collision = False
-                if self.collision_manager is not None:
-                    # Pixel-perfect collision: check if projectile hits non-transparent pixel
-                    # Returns None if no mask is available for this bot
-                    pixel_collision = self.collision_manager.check_collision(
-                        proj.position.x,
-                        proj.position.y,
-                        bot.bot_id,
-                        bot.position.x,
-                        bot.position.y,
-                        bot.orientation,
-                    )
-                    if pixel_collision is not None:
-                        collision = pixel_collision
-                    else:
-                        # No mask available, fall back to circular collision
-                        collision = proj.position.distance_to(bot.position) < self.config.bot_radius
-                else:
-                    # No collision manager, use simple circular collision
-                    collision = proj.position.distance_to(bot.position) < self.config.bot_radius
-
-                if collision:
+                if self._projectile_collides(proj, bot):
                     hit_bot = bot
                     break
 
             if hit_bot:
-                # Determine if this is the intended target or a blocker
-                shooter = self.bots.get(proj.shooter_id)
-                is_friendly_fire = shooter and hit_bot.team == shooter.team
-
-                if proj.is_heal:
-                    # Heal projectiles only heal teammates (intended or not)
-                    if is_friendly_fire or hit_bot.bot_id == proj.target_id:
-                        actual = hit_bot.heal(abs(proj.damage))
-                        if proj.shooter_id in self.bots:
-                            self.bots[proj.shooter_id].damage_dealt += actual
-                        self.events.append(
-                            {
-                                "type": "heal",
-                                "shooter_id": proj.shooter_id,
-                                "target_id": hit_bot.bot_id,
-                                "amount": actual,
-                            }
-                        )
-                        proj.alive = False
-                    # Heal projectiles pass through enemies
-                else:
-                    # Damage projectiles hit ANY bot they touch (including teammates blocking)
-                    if is_friendly_fire:
-                        # Teammate blocked the shot - reduced friendly fire damage (25%)
-                        actual = hit_bot.take_damage(
-                            proj.damage // 4, source_id=proj.shooter_id, current_time=self.current_time
-                        )
-                        if actual > 0:
-                            self.last_damage_time = self.current_time
-                        self.events.append(
-                            {
-                                "type": "blocked",
-                                "shooter_id": proj.shooter_id,
-                                "blocker_id": hit_bot.bot_id,
-                                "target_id": proj.target_id,
-                            }
-                        )
-                        # If the teammate died from the blocked shot, emit the same
-                        # kill event as the normal damage path so stats/render stay in sync
-                        if not hit_bot.is_alive:
-                            if proj.shooter_id in self.bots:
-                                self.bots[proj.shooter_id].kills += 1
-                            self.events.append(
-                                {
-                                    "type": "kill",
-                                    "killer_id": proj.shooter_id,
-                                    "victim_id": hit_bot.bot_id,
-                                }
-                            )
-                    else:
-                        # Enemy hit - full damage with threat tracking
-                        actual = hit_bot.take_damage(
-                            proj.damage, source_id=proj.shooter_id, current_time=self.current_time
-                        )
-                        if actual > 0:
-                            self.last_damage_time = self.current_time
-                        if proj.shooter_id in self.bots:
-                            self.bots[proj.shooter_id].damage_dealt += actual
-                        self.events.append(
-                            {
-                                "type": "hit",
-                                "shooter_id": proj.shooter_id,
-                                "target_id": hit_bot.bot_id,
-                                "damage": actual,
-                            }
-                        )
-
-                        # Check for kill
-                        if not hit_bot.is_alive:
-                            if proj.shooter_id in self.bots:
-                                self.bots[proj.shooter_id].kills += 1
-                            self.events.append(
-                                {
-                                    "type": "kill",
-                                    "killer_id": proj.shooter_id,
-                                    "victim_id": hit_bot.bot_id,
-                                }
-                            )
-
-                    proj.alive = False
+                self._apply_projectile_hit(proj, hit_bot)
 
             # Check if out of bounds
             if (
@@ -1885,6 +1827,105 @@ class BattleEngine:
         # Remove dead projectiles
         self.projectiles = [p for p in self.projectiles if p.alive]
 
+    def _projectile_collides(self, proj: Projectile, bot: BotRuntimeState) -> bool:
+        """Check collision - use pixel-perfect if available, otherwise circular hitbox"""
+        if self.collision_manager is not None:
+            # Pixel-perfect collision: check if projectile hits non-transparent pixel
+            # Returns None if no mask is available for this bot
+            pixel_collision = self.collision_manager.check_collision(
+                proj.position.x,
+                proj.position.y,
+                bot.bot_id,
+                bot.position.x,
+                bot.position.y,
+                bot.orientation,
+            )
+            if pixel_collision is not None:
+                return pixel_collision
+        # No collision manager or no mask available, use simple circular collision
+        return proj.position.distance_to(bot.position) < self.config.bot_radius
+
+    def _apply_projectile_hit(self, proj: Projectile, hit_bot: BotRuntimeState):
+        """Apply a projectile's heal or damage to the bot it touched"""
+        # Determine if this is the intended target or a blocker
+        shooter = self.bots.get(proj.shooter_id)
+        is_friendly_fire = shooter and hit_bot.team == shooter.team
+
+        if proj.is_heal:
+            # Heal projectiles only heal teammates (intended or not)
+            if is_friendly_fire or hit_bot.bot_id == proj.target_id:
+                actual = hit_bot.heal(abs(proj.damage))
+                if proj.shooter_id in self.bots:
+                    self.bots[proj.shooter_id].damage_dealt += actual
+                self.events.append(
+                    {
+                        "type": "heal",
+                        "shooter_id": proj.shooter_id,
+                        "target_id": hit_bot.bot_id,
+                        "amount": actual,
+                    }
+                )
+                proj.alive = False
+            # Heal projectiles pass through enemies
+        else:
+            # Damage projectiles hit ANY bot they touch (including teammates blocking)
+            if is_friendly_fire:
+                # Teammate blocked the shot - reduced friendly fire damage (25%)
+                actual = hit_bot.take_damage(
+                    proj.damage // 4, source_id=proj.shooter_id, current_time=self.current_time
+                )
+                if actual > 0:
+                    self.last_damage_time = self.current_time
+                self.events.append(
+                    {
+                        "type": "blocked",
+                        "shooter_id": proj.shooter_id,
+                        "blocker_id": hit_bot.bot_id,
+                        "target_id": proj.target_id,
+                    }
+                )
+                # If the teammate died from the blocked shot, emit the same
+                # kill event as the normal damage path so stats/render stay in sync
+                if not hit_bot.is_alive:
+                    if proj.shooter_id in self.bots:
+                        self.bots[proj.shooter_id].kills += 1
+                    self.events.append(
+                        {
+                            "type": "kill",
+                            "killer_id": proj.shooter_id,
+                            "victim_id": hit_bot.bot_id,
+                        }
+                    )
+            else:
+                # Enemy hit - full damage with threat tracking
+                actual = hit_bot.take_damage(proj.damage, source_id=proj.shooter_id, current_time=self.current_time)
+                if actual > 0:
+                    self.last_damage_time = self.current_time
+                if proj.shooter_id in self.bots:
+                    self.bots[proj.shooter_id].damage_dealt += actual
+                self.events.append(
+                    {
+                        "type": "hit",
+                        "shooter_id": proj.shooter_id,
+                        "target_id": hit_bot.bot_id,
+                        "damage": actual,
+                    }
+                )
+
+                # Check for kill
+                if not hit_bot.is_alive:
+                    if proj.shooter_id in self.bots:
+                        self.bots[proj.shooter_id].kills += 1
+                    self.events.append(
+                        {
+                            "type": "kill",
+                            "killer_id": proj.shooter_id,
+                            "victim_id": hit_bot.bot_id,
+                        }
+                    )
+
+            proj.alive = False
+
     def _update_combat(self):
         """Handle weapon firing"""
         for bot in self.bots.values():
@@ -1900,7 +1941,7 @@ class BattleEngine:
                 continue
 
             # Check range
-            distance = bot.position.distance_to(target.position)
+            distance = self._bot_distance(bot, target)
             # Weapons with min_range=0 can shoot point-blank (bypass min_range check)
             if not bot.allows_point_blank and distance < bot.min_range:
                 continue
@@ -2057,7 +2098,7 @@ class BattleEngine:
         return {
             "winner_team": winner,
             "seed": self.seed,
-            "total_frames": len(self.frames),
+            "total_frames": self.ticks,
             "duration": self.current_time,
             "fps": self.config.fps,
             "arena_width": self.config.arena_width,
@@ -2087,4 +2128,258 @@ class BattleEngine:
                 }
                 for f in self.frames
             ],
+            # Keyframes only hold every Nth tick, frames is empty in results-only mode
+            "keyframes_only": not self.config.record_frames,
+            # Everything replay_battle() needs to regenerate the full frames later
+            "replay": {
+                "config": asdict(self.config) | {"seed": self.seed},
+                "loadouts": self.loadouts,
+            },
         }
+
+
+class VectorizedBattleEngine(BattleEngine):
+    """
+    BattleEngine that keeps bot and projectile state in NumPy arrays.
+
+    Bot-to-bot distances live in a matrix that is patched whenever a bot moves, so target
+    selection, movement collision and line-of-fire checks become lookups instead of fresh
+    Vector2 math. Projectiles are integrated in bulk each tick and only pixel-tested against
+    bots inside their broad-phase radius.
+
+    The AI and everything else that draws from the RNG still runs bot by bot in the same order,
+    and every float goes through the same operations as in BattleEngine, so a battle plays out
+    exactly like BattleEngine.run() for the same seed and bots.
+    """
+
+    # Below this many bots the array bookkeeping costs more than it saves (see create_engine)
+    MIN_BOTS = 20
+    # Below this many projectile/bot pairs per tick the plain per-pair loop is faster
+    MIN_BULK_PAIRS = 48
+
+    def __init__(self, config: BattleConfig = None):
+        if not HAS_NUMPY:
+            raise RuntimeError("VectorizedBattleEngine requires numpy")
+        super().__init__(config)
+        self._order: list[BotRuntimeState] = []  # Bots in self.bots iteration order
+        self._index: dict[str, int] = {}  # bot_id -> row in the arrays below
+        self._xy = np.zeros((0, 2))  # Bot positions
+        self._dist = np.zeros((0, 0))  # Pairwise bot distances
+        self._team = np.zeros(0, dtype=np.int64)
+        self._alive = np.zeros(0, dtype=bool)  # Refreshed after each phase that can kill
+        self._reach_sq = np.zeros(0)  # Squared broad-phase hit radius per bot
+        self._pending_move: tuple[int, "np.ndarray"] = (-1, np.zeros(0))
+
+    def setup_positions(self):
+        super().setup_positions()
+        self._order = list(self.bots.values())
+        self._index = {bot.bot_id: i for i, bot in enumerate(self._order)}
+        self._xy = np.array([(bot.position.x, bot.position.y) for bot in self._order], dtype=np.float64)
+        self._xy = self._xy.reshape(-1, 2)
+        dx = self._xy[:, 0, None] - self._xy[:, 0]
+        dy = self._xy[:, 1, None] - self._xy[:, 1]
+        self._dist = np.sqrt(dx * dx + dy * dy)
+        self._team = np.array([bot.team for bot in self._order], dtype=np.int64)
+        self._refresh_alive()
+
+        reach = []
+        for bot in self._order:
+            radius = self.config.bot_radius
+            if self.collision_manager is not None:
+                mask_reach = self.collision_manager.get_reach(bot.bot_id)
+                if mask_reach is not None:
+                    radius = mask_reach
+            # Pad the radius so float rounding can never drop a real hit
+            reach.append(radius + 1.0)
+        self._reach_sq = np.square(np.array(reach, dtype=np.float64))
+
+    def _refresh_alive(self):
+        self._alive = np.fromiter((bot.is_alive for bot in self._order), dtype=bool, count=len(self._order))
+
+    def _bot_distance(self, bot: BotRuntimeState, other: BotRuntimeState) -> float:
+        return self._dist.item(self._index[bot.bot_id], self._index[other.bot_id])
+
+    def _update_projectiles(self):
+        self._step_projectiles()
+        # Bots only die during the projectile and combat phases
+        self._refresh_alive()
+
+    def _update_combat(self):
+        super()._update_combat()
+        self._refresh_alive()
+
+    def _target_candidates(self, bot: BotRuntimeState) -> list[BotRuntimeState]:
+        if bot.is_healer:
+            return super()._target_candidates(bot)
+        i = self._index[bot.bot_id]
+        in_range = self._dist[i] <= bot.max_range * 2.0
+        in_range &= self._alive
+        in_range &= self._team != bot.team
+        return [self._order[j] for j in np.flatnonzero(in_range).tolist()]
+
+    def _find_nearest_enemy(self, bot: BotRuntimeState) -> t.Optional[BotRuntimeState]:
+        row = np.where(self._alive & (self._team != bot.team), self._dist[self._index[bot.bot_id]], np.inf)
+        # argmin keeps the first of equal distances, like the strict < in BattleEngine
+        nearest = int(row.argmin())
+        if row[nearest] == np.inf:
+            return None
+        return self._order[nearest]
+
+    def _collides_with_bot(self, bot: BotRuntimeState, new_pos: Vector2) -> bool:
+        i = self._index[bot.bot_id]
+        dist = self._distances_from(new_pos)
+        dist[i] = 0.0
+        # Keep the distances around, they become row i of the matrix if the move goes ahead
+        self._pending_move = (i, dist)
+        blocked = dist < self.config.bot_radius * 2.2
+        blocked &= self._alive
+        blocked[i] = False
+        return True in blocked.tolist()
+
+    def _distances_from(self, pos: Vector2) -> "np.ndarray":
+        """Distance from a point to every bot, rounded exactly like Vector2.distance_to"""
+        delta = self._xy - (pos.x, pos.y)
+        delta *= delta
+        return np.sqrt(delta[:, 0] + delta[:, 1])
+
+    def _set_bot_position(self, bot: BotRuntimeState, new_pos: Vector2):
+        super()._set_bot_position(bot, new_pos)
+        i, dist = self._pending_move
+        if i != self._index[bot.bot_id]:
+            i = self._index[bot.bot_id]
+            dist = self._distances_from(new_pos)
+            dist[i] = 0.0
+        self._xy[i, 0] = new_pos.x
+        self._xy[i, 1] = new_pos.y
+        self._dist[i, :] = dist
+        self._dist[:, i] = dist
+
+    def _step_projectiles(self):
+        """Update projectile positions in bulk and check broad-phase candidates for hits"""
+        projectiles = [p for p in self.projectiles if p.alive]
+        if len(projectiles) * len(self._order) < self.MIN_BULK_PAIRS:
+            # Too few pairs for the array setup to pay for itself, results are the same either way
+            super()._update_projectiles()
+            return
+
+        state = np.array(
+            [(p.position.x, p.position.y, p.velocity.x, p.velocity.y, p.ttl) for p in projectiles],
+            dtype=np.float64,
+        )
+        x, y, vx, vy, ttl = state.T
+        timed = ttl > 0
+        ttl = np.where(timed, ttl - self.dt, ttl)
+        expired = timed & (ttl <= 0)
+        x = x + vx * self.dt
+        y = y + vy * self.dt
+
+        # Broad phase: every bot a projectile could possibly touch this tick
+        dx = x[:, None] - self._xy[:, 0]
+        dy = y[:, None] - self._xy[:, 1]
+        near = (dx * dx + dy * dy) <= self._reach_sq
+        near[expired] = False
+        has_near = near.any(axis=1)
+        out_of_bounds = (x < 0) | (x > self.config.arena_width) | (y < 0) | (y > self.config.arena_height)
+
+        unwarmed = self._unwarmed_masks()
+        columns = zip(
+            x.tolist(),
+            y.tolist(),
+            ttl.tolist(),
+            timed.tolist(),
+            expired.tolist(),
+            has_near.tolist(),
+            out_of_bounds.tolist(),
+        )
+        for k, (proj, (px, py, proj_ttl, is_timed, is_expired, is_near, is_out)) in enumerate(
+            zip(projectiles, columns)
+        ):
+            if is_timed:
+                proj.ttl = proj_ttl
+                if is_expired:
+                    proj.alive = False
+                    continue
+
+            proj.position = Vector2(px, py)
+
+            # Narrow phase in bot order, same as BattleEngine, so the first bot touched wins
+            hit_bot = None
+            hit_index = len(self._order)
+            if is_near:
+                for j in np.flatnonzero(near[k]).tolist():
+                    bot = self._order[j]
+                    if not bot.is_alive or bot.bot_id == proj.shooter_id:
+                        continue
+                    if self._projectile_collides(proj, bot):
+                        hit_bot = bot
+                        hit_index = j
+                        break
+
+            if unwarmed:
+                unwarmed = self._warm_masks(unwarmed, proj.shooter_id, hit_index)
+
+            if hit_bot:
+                self._apply_projectile_hit(proj, hit_bot)
+
+            if is_out:
+                proj.alive = False
+
+        # Remove dead projectiles
+        self.projectiles = [p for p in self.projectiles if p.alive]
+
+    def _unwarmed_masks(self) -> list[int]:
+        """Rows of living bots whose rotated mask the per-pair loop would have touched this tick"""
+        if self.collision_manager is None:
+            return []
+        return [
+            i
+            for i, bot in enumerate(self._order)
+            if bot.is_alive and self.collision_manager.get_reach(bot.bot_id) is not None
+        ]
+
+    def _warm_masks(self, unwarmed: list[int], shooter_id: str, hit_index: int) -> list[int]:
+        """Build the rotated masks BattleEngine would have built while testing this projectile
+
+        BattleEngine tests each projectile against every living bot up to the one it hits, and
+        each test caches a rotated mask. Skipping those tests would change which exact angle
+        seeds each cached mask, and with it later hits, so the skipped bots are warmed here.
+        """
+        remaining = []
+        for i in unwarmed:
+            bot = self._order[i]
+            if not bot.is_alive:
+                continue  # Dead bots are never tested again
+            if i > hit_index or bot.bot_id == shooter_id:
+                remaining.append(i)
+                continue
+            self.collision_manager.warm_mask(bot.bot_id, bot.orientation)
+        return remaining
+
+
+def create_engine(config: BattleConfig = None, bot_count: int = 0) -> BattleEngine:
+    """Pick the faster engine for a battle of this size, both produce identical results"""
+    if HAS_NUMPY and bot_count >= VectorizedBattleEngine.MIN_BOTS:
+        return VectorizedBattleEngine(config)
+    return BattleEngine(config)
+
+
+def replay_battle(replay: dict) -> dict:
+    """Re-simulate a battle with every frame captured, e.g. to render a battle that ran results-only
+
+    Args:
+        replay: The "replay" entry of a battle result (config with the seed used, and bot loadouts)
+
+    Returns:
+        The full battle result, identical to running the original battle with frame recording on
+    """
+    config = BattleConfig(**(replay["config"] | {"record_frames": True, "keyframe_rate": 0.0}))
+    engine = create_engine(config, len(replay["loadouts"]))
+    for loadout in replay["loadouts"]:
+        loadout = dict(loadout)
+        # Loadouts that went through JSON carry the enum values as plain strings
+        if loadout.get("behavior") is not None:
+            loadout["behavior"] = AIBehavior(loadout["behavior"])
+        if loadout.get("target_priority") is not None:
+            loadout["target_priority"] = TargetPriority(loadout["target_priority"])
+        engine.add_bot(**loadout)
+    return engine.run()
@@ -8,11 +8,14 @@ Uses Pillow for drawing and ffmpeg for video encoding.
 import itertools
 import logging
 import math
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
 import typing as t
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -127,6 +130,34 @@ TEAM_COLORS = {
 # Path to data directory with part images
 DATA_DIR = Path(__file__).parent.parent / "data"
 
+# Parallel rendering: frames are sent to worker processes in chunks, and at most
+# CHUNKS_IN_FLIGHT chunks per worker are queued or waiting for the encoder at once
+FRAMES_PER_CHUNK = 8
+CHUNKS_IN_FLIGHT = 2
+# Shorter renders aren't worth the worker start-up cost
+MIN_PARALLEL_FRAMES = 90
+# Bots are drawn at whole-degree angles so rotated sprites can be cached (see bot_sprite.py)
+SPRITE_ANGLE_STEP = 1
+
+
+def default_render_workers() -> int:
+    """Worker processes per render, capped since a couple of battles can render at once"""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+# Renderer owned by each worker process, built once by _init_render_worker
+_worker_renderer: t.Optional["BattleRenderer"] = None
+
+
+def _init_render_worker(renderer_kwargs: dict):
+    global _worker_renderer
+    _worker_renderer = BattleRenderer(**renderer_kwargs)
+
+
+def _render_chunk(frames: list[dict], battle_info: dict) -> list[bytes]:
+    """Render frames in a worker, returned as raw RGB bytes (cheaper to ship than images)"""
+    return [_worker_renderer.render_frame(frame, battle_info).tobytes() for frame in frames]
+
 
 class BattleRenderer:
     """Renders battle frames to video"""
@@ -142,6 +173,7 @@ class BattleRenderer:
         parts_registry: t.Optional["PartsRegistry"] = None,
         chapter: t.Optional[int] = None,
         mission_id: t.Optional[str] = None,
+        workers: t.Optional[int] = None,
     ):
         """
         Initialize the renderer.
@@ -156,7 +188,22 @@ class BattleRenderer:
             parts_registry: Optional registry for looking up component render offsets
             chapter: Campaign chapter number (1-5) for chapter-specific arena backgrounds
             mission_id: Mission ID for mission-specific arena backgrounds (e.g., "1-1")
+            workers: Processes to render video frames with (None = based on CPU count, 1 = in-process)
         """
+        # Everything a worker process needs to build an identical renderer
+        self._worker_kwargs = {
+            "width": width,
+            "height": height,
+            "scale": scale,
+            "fps": fps,
+            "team1_color": team1_color,
+            "team2_color": team2_color,
+            "parts_registry": parts_registry,
+            "chapter": chapter,
+            "mission_id": mission_id,
+            "workers": 1,
+        }
+        self.workers = workers if workers is not None else default_render_workers()
         self.arena_width = width
         self.arena_height = height
         self.scale = scale
@@ -192,6 +239,18 @@ class BattleRenderer:
                 self.font = ImageFont.load_default()
                 self.small_font = ImageFont.load_default()
 
+        # Background and grid never change during a battle, so draw them once
+        self._static_layer = self._render_static_layer()
+
+    def _render_static_layer(self) -> Image.Image:
+        """Arena background, or the plain arena with its grid if there is no background image"""
+        # Use arena background if available, otherwise solid color
+        if self._arena_background:
+            return self._arena_background.convert("RGBA")
+        img = Image.new("RGBA", (self.output_width, self.output_height), ARENA_BG)
+        self._draw_grid(ImageDraw.Draw(img))
+        return img
+
     def _load_arena_background(self):
         """Load and scale the arena background image if available.
 
@@ -242,17 +301,9 @@ class BattleRenderer:
         Returns:
             PIL Image of the rendered frame
         """
-        # Use arena background if available, otherwise solid color
-        if self._arena_background:
-            img = self._arena_background.copy().convert("RGBA")
-        else:
-            img = Image.new("RGBA", (self.output_width, self.output_height), ARENA_BG)
+        img = self._static_layer.copy()
         draw = ImageDraw.Draw(img)
 
-        # Draw grid (only if no background image, or make it subtle overlay)
-        if not self._arena_background:
-            self._draw_grid(draw)
-
         # Draw bots - dead bots first (underneath), then alive bots on top
         bots = frame_data.get("bots", [])
         dead_bots = [b for b in bots if not b.get("is_alive", True)]
@@ -309,8 +360,8 @@ class BattleRenderer:
             bot_sprite = render_bot_sprite(
                 plating_name=plating_name,
                 weapon_name=weapon_name,
-                orientation=orientation,
-                weapon_orientation=weapon_orientation,
+                orientation=self._sprite_angle(orientation),
+                weapon_orientation=self._sprite_angle(weapon_orientation),
                 scale=sprite_scale,
                 registry=self.parts_registry,
             )
@@ -373,6 +424,11 @@ class BattleRenderer:
             font=self.small_font,
         )
 
+    @staticmethod
+    def _sprite_angle(angle: float) -> int:
+        """Snap an angle to the sprite cache's step"""
+        return int(round(angle / SPRITE_ANGLE_STEP) * SPRITE_ANGLE_STEP) % 360
+
     def _draw_bot_shape_with_turret(
         self,
         draw: ImageDraw.ImageDraw,
@@ -686,11 +742,11 @@ class BattleRenderer:
         (potentially thousands of images) in memory at once.
         """
         last_img = None
-        for i, frame in enumerate(frames):
+        for i, img in enumerate(self._render_frames(frames, battle_info)):
             if show_progress and i % 30 == 0:
                 print(f"Rendering frame {i}/{len(frames)}", file=sys.stderr)
-            last_img = self.render_frame(frame, battle_info)
-            yield last_img
+            last_img = img
+            yield img
 
         # Freeze on the final frame to show the battle outcome
         if last_img is not None and freeze_duration > 0:
@@ -700,18 +756,53 @@ class BattleRenderer:
             for _ in range(freeze_frame_count):
                 yield last_img
 
+    def _render_frames(self, frames: list[dict], battle_info: dict) -> t.Iterator[Image.Image]:
+        """Render frames in order, on worker processes when the battle is long enough to benefit"""
+        if self.workers <= 1 or len(frames) < MIN_PARALLEL_FRAMES:
+            for frame in frames:
+                yield self.render_frame(frame, battle_info)
+            return
+
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_render_worker,
+                initargs=(self._worker_kwargs,),
+            )
+        except (OSError, NotImplementedError) as e:
+            log.warning("Could not start render workers, rendering in-process", exc_info=e)
+            for frame in frames:
+                yield self.render_frame(frame, battle_info)
+            return
+
+        size = (self.output_width, self.output_height)
+        chunks = (frames[i : i + FRAMES_PER_CHUNK] for i in range(0, len(frames), FRAMES_PER_CHUNK))
+        # Bounded queue of chunks in submission order, so the encoder gets frames in order
+        # and workers never run more than CHUNKS_IN_FLIGHT chunks ahead of it
+        pending: deque[Future] = deque()
+        try:
+            for chunk in itertools.islice(chunks, self.workers * CHUNKS_IN_FLIGHT):
+                pending.append(pool.submit(_render_chunk, chunk, battle_info))
+            while pending:
+                rendered = pending.popleft().result()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(pool.submit(_render_chunk, next_chunk, battle_info))
+                for data in rendered:
+                    yield Image.frombytes("RGB", size, data)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def _write_video_pyav(self, frames: t.Iterable[Image.Image], output_path: Path):
         """Write video using PyAV directly with Discord-compatible settings."""
         if av is None:
             raise RuntimeError("PyAV not installed")
 
-        frame_iter = iter(frames)
-        first_img = next(frame_iter)
-
         container = av.open(str(output_path), mode="w")
+        # Set up the stream before pulling any frames, so a missing codec fails before rendering starts
         stream = container.add_stream("libx264", rate=self.fps)
-        stream.width = first_img.width
-        stream.height = first_img.height
+        stream.width = self.output_width
+        stream.height = self.output_height
         stream.pix_fmt = "yuv420p"  # Required for Discord
         # H.264 encoding options for maximum compatibility
         stream.options = {
@@ -721,7 +812,7 @@ class BattleRenderer:
             "crf": "23",  # Quality (lower = better, 23 is default)
         }
 
-        for img in itertools.chain([first_img], frame_iter):
+        for img in frames:
             # Convert PIL Image to av.VideoFrame
             frame = av.VideoFrame.from_image(img)
             frame = frame.reformat(format="yuv420p")
@@ -747,37 +838,51 @@ class BattleRenderer:
         if not ffmpeg_path:
             raise RuntimeError("ffmpeg not found - install imageio-ffmpeg or system ffmpeg")
 
-        # Create temp directory for frames
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Save frames as images one at a time (streamed, never held in a list)
-            for i, img in enumerate(frames):
-                img.save(tmpdir / f"frame_{i:06d}.png")
-
-            # Run ffmpeg
-            cmd = [
-                ffmpeg_path,
-                "-y",  # Overwrite output
-                "-framerate",
-                str(self.fps),
-                "-i",
-                str(tmpdir / "frame_%06d.png"),
-                "-c:v",
-                "libx264",
-                "-pix_fmt",
-                "yuv420p",
-                "-profile:v",
-                "baseline",
-                "-level",
-                "3.0",
-                "-movflags",
-                "+faststart",
-                "-crf",
-                "23",
-                str(output_path),
-            ]
-            subprocess.run(cmd, check=True, capture_output=True)
+        # Pipe raw frames straight into ffmpeg instead of writing an image file per frame
+        cmd = [
+            ffmpeg_path,
+            "-y",  # Overwrite output
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{self.output_width}x{self.output_height}",
+            "-framerate",
+            str(self.fps),
+            "-i",
+            "-",
+            "-c:v",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            "-profile:v",
+            "baseline",
+            "-level",
+            "3.0",
+            "-movflags",
+            "+faststart",
+            "-crf",
+            "23",
+            str(output_path),
+        ]
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr)
+            try:
+                for img in frames:
+                    proc.stdin.write(img.tobytes())
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            if proc.wait() != 0:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr.read())
 
     def render_to_gif(
         self,
@@ -811,14 +916,10 @@ class BattleRenderer:
 
         # Render frames (skipping some for GIF size)
         images = []
-        for i, frame in enumerate(frames):
-            if i % frame_skip != 0:
-                continue
-
-            if show_progress and i % 30 == 0:
-                print(f"Rendering frame {i}/{len(frames)}", file=sys.stderr)
-
-            img = self.render_frame(frame, battle_info)
+        kept = frames[::frame_skip]
+        for i, img in enumerate(self._render_frames(kept, battle_info)):
+            if show_progress and (i * frame_skip) % 30 == 0:
+                print(f"Rendering frame {i * frame_skip}/{len(frames)}", file=sys.stderr)
             images.append(img)
 
         if not images:
@@ -1,7 +1,5 @@
 import asyncio
-import json
 import logging
-import sys
 import tempfile
 import typing as t
 from pathlib import Path
@@ -14,6 +12,7 @@ from redbot.core.data_manager import cog_data_path
 
 from .abc import CompositeMetaClass
 from .commands import Commands
+from .common.battle_pool import BattleQueueFull, BattleTimeout, BattleWorkerPool
 from .common.models import DB, Bot, PartsRegistry
 from .common.telemetry import BattleTelemetry
 from .constants import CHASSIS, COMPONENTS, PLATING
@@ -48,7 +47,7 @@ class BotArena(Commands, commands.Cog, metaclass=CompositeMetaClass):
 
         # Battle concurrency controls
         self.active_battles: set[int] = set()  # User IDs with a battle in progress
-        self.battle_semaphore: asyncio.Semaphore = asyncio.Semaphore(2)  # Max concurrent render subprocesses
+        self.battle_pool: BattleWorkerPool = BattleWorkerPool()  # Warm worker processes that run battles
 
         # Telemetry
         self.telemetry: BattleTelemetry = BattleTelemetry(self.data_path)
@@ -72,10 +71,12 @@ class BotArena(Commands, commands.Cog, metaclass=CompositeMetaClass):
 
     async def cog_load(self):
         """Called when the cog is loaded"""
+        self.battle_pool.start()
         asyncio.create_task(self.initialize())
 
     async def cog_unload(self):
         """Called when the cog is unloaded"""
+        await self.battle_pool.close()
         # Wait for any pending save tasks to complete before unloading
         if self._pending_save_tasks:
             log.info(f"Waiting for {len(self._pending_save_tasks)} pending save task(s) to complete...")
@@ -170,7 +171,7 @@ class BotArena(Commands, commands.Cog, metaclass=CompositeMetaClass):
         mission_id: t.Optional[str] = None,
     ) -> tuple[t.Optional[Path], t.Optional[dict], t.Optional[str]]:
         """
-        Run a battle in a subprocess and return the video path and results.
+        Run a battle in a battle worker and return the video path and results.
 
         Args:
             team1: List of Bot objects for team 1
@@ -187,12 +188,10 @@ class BotArena(Commands, commands.Cog, metaclass=CompositeMetaClass):
             On success: (Path, dict, None)
             On error: (None, None, error_string)
         """
-        # Create temp files for input/output
         battle_id = str(uuid4())[:8]
         temp_dir = Path(tempfile.gettempdir()) / "botarena"
         temp_dir.mkdir(exist_ok=True)
 
-        input_file = temp_dir / f"battle_{battle_id}_input.json"
         output_file = temp_dir / f"battle_{battle_id}.{output_format}"
 
         # Build input data
@@ -218,84 +217,27 @@ class BotArena(Commands, commands.Cog, metaclass=CompositeMetaClass):
             "team2": [bot.model_dump() for bot in team2],
         }
 
-        # Write input file
-        await asyncio.to_thread(input_file.write_text, json.dumps(input_data))
-
         try:
-            # Run battle in subprocess
-            runner_path = Path(__file__).parent / "battle_runner.py"
-            cmd = [
-                sys.executable,
-                str(runner_path),
-                str(input_file),
-                str(output_file),
-                f"--format={output_format}",
-            ]
-
-            log.debug(f"Running battle subprocess: {' '.join(cmd)}")
-
-            # Run subprocess asynchronously, capped globally so N users can't fork N render processes
-            async with self.battle_semaphore:
-                proc = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-
-                stdout, stderr = await proc.communicate()
-            stderr_text = stderr.decode() if stderr else ""
-            stdout_text = stdout.decode() if stdout else ""
-
-            # Always log stderr if it contains anything substantial (helps debug on Linux)
-            if stderr_text and stderr_text.strip():
-                # Filter out just progress lines but keep anything else
-                error_lines = [
-                    line
-                    for line in stderr_text.split("\n")
-                    if line.strip()
-                    and not line.startswith("Rendering frame")
-                    and not line.startswith("Adding ")
-                    and not line.startswith("Writing video")
-                ]
-                if error_lines:
-                    log.warning(f"Battle subprocess stderr: {chr(10).join(error_lines)}")
-
-            if proc.returncode != 0:
-                log.error(f"Battle subprocess exited with code {proc.returncode}")
-                if stderr_text:
-                    log.error(f"Stderr: {stderr_text}")
-                if stdout_text:
-                    log.error(f"Stdout: {stdout_text}")
-                # Details are logged above; return a generic message so raw stderr never reaches users
-                return None, None, f"Battle process failed (exit code {proc.returncode})"
-
-            # Parse result from stdout
-            try:
-                result = json.loads(stdout_text)
-            except json.JSONDecodeError as e:
-                log.error(f"Failed to parse battle result JSON: {e}")
-                log.error(f"Stdout was: {stdout_text[:500]}")
-                return None, None, f"Failed to parse battle results: {e}"
-
-            if "error" in result:
-                log.error(f"Battle error: {result['error']}")
-                return None, None, result["error"]
-
-            # Get actual output path (might differ if fallback was used)
-            actual_output = Path(result.get("output_path", str(output_file)))
-
-            if actual_output.exists():
-                return actual_output, result, None
-            elif output_file.exists():
-                return output_file, result, None
-            else:
-                log.error(f"Battle output file not created at {output_file}")
-                return None, None, "Battle video file was not created"
-
+            log.debug(f"Queueing battle {battle_id}: {self.battle_pool.stats()}")
+            result = await self.battle_pool.run(input_data, output_file, output_format)
+        except BattleQueueFull as e:
+            log.warning(f"Battle queue full, rejected battle {battle_id}: {e}")
+            return None, None, "Too many battles are running right now, please try again in a moment"
+        except BattleTimeout as e:
+            log.error(f"Battle {battle_id} timed out: {e}")
+            return None, None, "The battle took too long to run"
         except Exception as e:
-            log.exception(f"Failed to run battle subprocess: {e}")
-            return None, None, f"Battle subprocess error: {type(e).__name__}: {e}"
-        finally:
-            # Clean up input file
-            if input_file.exists():
-                input_file.unlink()
+            log.exception(f"Failed to run battle {battle_id}: {e}")
+            # Details are logged above; return a generic message so raw errors never reach users
+            return None, None, f"Battle process failed: {type(e).__name__}"
+
+        # Get actual output path (might differ if fallback was used)
+        actual_output = Path(result.get("output_path", str(output_file)))
+
+        if actual_output.exists():
+            return actual_output, result, None
+        elif output_file.exists():
+            return output_file, result, None
+        else:
+            log.error(f"Battle output file not created at {output_file}")
+            return None, None, "Battle video file was not created"
@@ -0,0 +1,63 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+COG_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def spec_loaded_cog(monkeypatch):
+    """Load the cog the way Red does, by spec from its folder with nothing on sys.path pointing at it"""
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if Path(p or ".").resolve() != COG_DIR.parent])
+    previous = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "botarena"}
+    for name in previous:
+        del sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(
+        "botarena", COG_DIR / "__init__.py", submodule_search_locations=[str(COG_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["botarena"] = module
+    spec.loader.exec_module(module)
+    yield module
+
+    for name in [name for name in sys.modules if name.split(".")[0] == "botarena"]:
+        del sys.modules[name]
+    sys.modules.update(previous)
+
+
+@pytest.mark.asyncio
+async def test_spec_loaded_cog_runs_battle_in_pool(spec_loaded_cog, tmp_path):
+    from botarena.common.battle_pool import BattleWorkerPool
+    from botarena.common.models import Bot
+    from botarena.constants.parts import build_registry
+
+    registry = build_registry()
+
+    def make_bot(name: str) -> dict:
+        bot = Bot(
+            name=name,
+            chassis=registry.get_chassis("DLZ-100"),
+            plating=registry.get_plating("Santrin"),
+            component=registry.get_component("Zintek"),
+        )
+        return bot.model_dump()
+
+    input_data = {
+        "config": {"arena_width": 400, "arena_height": 400, "fps": 10, "max_duration": 5.0, "scale": 0.25},
+        "team1": [make_bot("Blue")],
+        "team2": [make_bot("Red")],
+    }
+    output_path = tmp_path / "battle.gif"
+    pool = BattleWorkerPool(workers=1, job_timeout=120)
+    try:
+        result = await pool.run(input_data, output_path, "gif")
+    finally:
+        await pool.close()
+
+    assert "error" not in result
+    assert Path(result.get("output_path", output_path)).exists()
+    assert pool.completed == 1
+    assert pool.failed == 0
@@ -5,15 +5,15 @@ from pathlib import Path
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 
-from .serializers import GuildBackup
+from .models import load_backup
 
 _ = Translator("Cartographer", __file__)
 
 
 def backup_str(filepath: Path) -> str:
-    backup = GuildBackup.model_validate_json(filepath.read_text(encoding="utf-8"))
-    total_messages = sum(len(channel.messages) for channel in backup.text_channels)
-    voice_messages = sum(len(channel.messages) for channel in backup.voice_channels)
+    backup = load_backup(filepath, load_images=False)
+    total_messages = sum(channel.message_count for channel in backup.text_channels)
+    voice_messages = sum(channel.message_count for channel in backup.voice_channels)
     txt = _(
         "## {}\n"
         "`Size:           `{}\n"
@@ -12,11 +12,26 @@ from redbot.core.i18n import Translator
 
 from . import Base
 from .serializers import GuildBackup
+from .store import BackupStore
 
 log = logging.getLogger("red.vrt.cartographer.models")
 _ = Translator("Cartographer", __file__)
 
 
+def load_backup(path: Path, load_images: bool = True) -> GuildBackup:
+    """Load a snapshot manifest (or an older single file backup) along with the store it reads from"""
+    backup = GuildBackup.model_validate_json(path.read_text(encoding="utf-8"))
+    backup.attach_store(BackupStore(path.parent), load_images=load_images)
+    return backup
+
+
+def export_backup(path: Path) -> bytes:
+    """A standalone copy of a snapshot with everything it uses from the store inlined"""
+    backup = load_backup(path)
+    backup.inline_store()
+    return backup.model_dump_json().encode()
+
+
 class RestoreOptions(Base):
     """Options for granular restore control."""
 
@@ -96,6 +111,22 @@ class GuildSettings(Base):
         backup_emojis: bool = True,
         backup_stickers: bool = True,
     ) -> None:
+        backup_dir = backups_dir / str(guild.id)
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        store = BackupStore(backup_dir)
+
+        # Pick up where the latest snapshot left off so only new messages are fetched
+        previous: GuildBackup | None = None
+        manifests = await asyncio.to_thread(store.manifests)
+        if manifests:
+            try:
+                previous = await asyncio.to_thread(load_backup, manifests[-1], False)
+            except Exception as e:
+                log.warning("Failed to load the latest backup of %s, doing a full backup", guild.name, exc_info=e)
+        if previous is not None:
+            # Keep what may be reused safe from garbage collection while the backup runs
+            await asyncio.to_thread(store.touch, *previous.store_references())
+
         backup_obj = await GuildBackup.serialize(
             guild=guild,
             limit=limit,
@@ -103,10 +134,10 @@ class GuildSettings(Base):
             backup_roles=backup_roles,
             backup_emojis=backup_emojis,
             backup_stickers=backup_stickers,
+            store=store,
+            previous=previous,
         )
         dump = await asyncio.to_thread(backup_obj.model_dump_json)
-        backup_dir = backups_dir / str(guild.id)
-        backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Clean the guild name to make it filename safe
         guild_name = "".join(c for c in guild.name if c.isalnum())
@@ -149,11 +180,13 @@ class DB(Base):
         path = backup_dir / guild_id
         if not path.exists():
             return
+        store = BackupStore(path)
         # Ensure there are no more than `max_backups_per_guild` backups
         # Delete oldest backups if there are more than `max_backups_per_guild`
-        backups = sorted(path.iterdir(), key=lambda x: x.stat().st_mtime)
-        if len(backups) <= self.max_backups_per_guild:
-            return
-        for backup in backups[: -self.max_backups_per_guild]:
-            log.debug("Cleaning up old backup: %s", backup)
-            backup.unlink()
+        backups = store.manifests()
+        if len(backups) > self.max_backups_per_guild:
+            for backup in backups[: -self.max_backups_per_guild]:
+                log.debug("Cleaning up old backup: %s", backup)
+                backup.unlink()
+        # Then drop the attachments, images and messages no remaining backup uses
+        store.collect_garbage()
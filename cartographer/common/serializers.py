@@ -11,7 +11,7 @@ from time import perf_counter
 import aiohttp
 import discord
 from packaging.version import parse as parse_version
-from pydantic import VERSION, Field
+from pydantic import VERSION, Field, PrivateAttr
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_timedelta
 from tenacity import (
@@ -22,6 +22,7 @@ from tenacity import (
 )
 
 from . import Base
+from .store import BackupStore, is_ref, ref_key
 
 if t.TYPE_CHECKING:
     from .models import RestoreOptions
@@ -39,6 +40,17 @@ _ = Translator("Cartographer", __file__)
 
 VOICE = t.Union[discord.VoiceChannel, discord.StageChannel]
 GuildChannels = t.Union[VOICE, discord.ForumChannel, discord.TextChannel, discord.CategoryChannel]
+# Once a channel's messages are spread over more segments than this they get merged into one
+MAX_SEGMENTS = 20
+
+
+async def pack_bytes(data: bytes | None, store: BackupStore | None = None) -> str | None:
+    """Put bytes in the backup store if there is one, otherwise base64 encode them inline"""
+    if not data:
+        return None
+    if store is not None:
+        return await asyncio.to_thread(store.put, data)
+    return (await asyncio.to_thread(base64.b64encode, data)).decode()
 
 
 class Role(Base):
@@ -77,7 +89,7 @@ class Role(Base):
         return all(cases)
 
     @classmethod
-    async def serialize(cls, role: discord.Role, load_icon: bool = True) -> Role:
+    async def serialize(cls, role: discord.Role, load_icon: bool = True, store: BackupStore | None = None) -> Role:
         icon = await role.icon.read() if role.icon and load_icon else None
         return cls(
             id=role.id,
@@ -87,7 +99,7 @@ class Role(Base):
             position=role.position,
             permissions=role.permissions.value,
             mentionable=role.mentionable,
-            icon=base64.b64encode(icon).decode() if icon else None,
+            icon=await pack_bytes(icon, store),
             is_assignable=role.is_assignable(),
             is_bot_managed=role.is_bot_managed(),
             is_integration=role.is_integration(),
@@ -398,17 +410,21 @@ class CategoryChannel(ChannelBase):
 
 class FileBackup(Base):
     filename: str
-    filebytes: str  # base64 encoded file
+    filebytes: str  # base64 encoded file or a backup store reference
 
     @classmethod
-    async def serialize(cls, attachment: discord.Attachment) -> FileBackup:
+    async def serialize(cls, attachment: discord.Attachment, store: BackupStore | None = None) -> FileBackup:
         return cls(
             filename=attachment.filename,
-            filebytes=base64.b64encode(await attachment.read()).decode(),
+            filebytes=await pack_bytes(await attachment.read(), store) or "",
         )
 
-    async def restore(self) -> discord.File:
-        return discord.File(BytesIO(base64.b64decode(self.filebytes)), filename=self.filename)
+    async def restore(self, store: BackupStore | None = None) -> discord.File:
+        if is_ref(self.filebytes):
+            data = await asyncio.to_thread(store.get, self.filebytes)
+        else:
+            data = base64.b64decode(self.filebytes)
+        return discord.File(BytesIO(data), filename=self.filename)
 
 
 class MessageBackup(Base):
@@ -421,7 +437,7 @@ class MessageBackup(Base):
     avatar_url: str
 
     @classmethod
-    async def serialize(cls, message: discord.Message) -> MessageBackup:
+    async def serialize(cls, message: discord.Message, store: BackupStore | None = None) -> MessageBackup:
         # Files larger than the guild's upload limit can't be re-uploaded on restore anyway
         max_size = message.guild.filesize_limit if message.guild else 8388608
         return cls(
@@ -429,7 +445,7 @@ class MessageBackup(Base):
             channel_name=message.channel.name,
             content=message.content[:2000] if message.content else None,
             embeds=[i.to_dict() for i in message.embeds],
-            files=[await FileBackup.serialize(i) for i in message.attachments if i.size < max_size],
+            files=[await FileBackup.serialize(i, store) for i in message.attachments if i.size < max_size],
             username=message.author.display_name,
             avatar_url=message.author.display_avatar.url,
         )
@@ -437,18 +453,85 @@ class MessageBackup(Base):
     async def embed_objects(self) -> list[discord.Embed]:
         return [discord.Embed.from_dict(i) for i in self.embeds]
 
-    async def attachment_objects(self) -> list[discord.File]:
-        return [await i.restore() for i in self.files]
+    async def attachment_objects(self, store: BackupStore | None = None) -> list[discord.File]:
+        files: list[discord.File] = []
+        for i in self.files:
+            try:
+                files.append(await i.restore(store))
+            except FileNotFoundError:
+                log.warning("Attachment %s is missing from the backup store", i.filename)
+        return files
+
+
+class MessageSegment(Base):
+    key: str  # Segment file in the backup store
+    count: int
+    blobs: list[str] = []  # Store keys of the attachments in this segment
+
+
+async def backup_channel_messages(
+    channel: discord.TextChannel | VOICE,
+    limit: int,
+    store: BackupStore,
+    previous: TextChannel | VoiceChannel | None = None,
+) -> tuple[list[MessageSegment], int | None]:
+    """Store the messages sent since the previous snapshot as a new segment
+
+    Older messages are carried over from the previous snapshot's segments, so each message and
+    attachment is only downloaded once. Edits and deletions of already saved messages aren't picked up.
+    """
+    segments: list[MessageSegment] = list(previous.segments) if previous else []
+    last_message_id: int | None = previous.last_message_id if previous else None
+    newest: int | None = None
+    messages: list[MessageBackup] = []
+    try:
+        async for message in channel.history(limit=limit):
+            if last_message_id and message.id <= last_message_id:
+                # Caught up with the previous snapshot
+                break
+            if newest is None:
+                newest = message.id
+            messages.append(await MessageBackup.serialize(message, store))
+    except discord.HTTPException as e:
+        # Keep the previous messages rather than leave a gap in the history
+        log.warning("Failed to fetch messages for channel %s: %s", channel.name, e)
+        return segments, last_message_id
+
+    if messages:
+        if len(messages) >= limit:
+            # Everything from before falls outside the limit
+            segments = []
+        # History comes newest first, segments are stored oldest first
+        messages.reverse()
+        rows = [i.model_dump(mode="json") for i in messages]
+        key = await asyncio.to_thread(store.put_segment, rows)
+        blobs = sorted({ref_key(f.filebytes) for i in messages for f in i.files if is_ref(f.filebytes)})
+        segments.append(MessageSegment(key=key, count=len(messages), blobs=blobs))
+        last_message_id = newest
+
+    # Drop whole segments from the front once the newer ones cover the limit
+    total = sum(i.count for i in segments)
+    while segments and total - segments[0].count >= limit:
+        total -= segments.pop(0).count
+
+    if len(segments) > MAX_SEGMENTS:
+        key = await asyncio.to_thread(store.merge_segments, [i.key for i in segments])
+        blobs = sorted({blob for i in segments for blob in i.blobs})
+        segments = [MessageSegment(key=key, count=total, blobs=blobs)]
+
+    return segments, last_message_id
 
 
 async def restore_channel_messages(
-    channel: discord.TextChannel | discord.VoiceChannel, messages: list[MessageBackup]
+    channel: discord.TextChannel | discord.VoiceChannel,
+    messages: t.AsyncIterator[MessageBackup],
+    store: BackupStore | None = None,
 ) -> None:
     try:
         hook = await channel.create_webhook(name=_("Cartographer Restore"), reason=_("Restoring messages from backup"))
-        for message in messages:
+        async for message in messages:
             embeds = await message.embed_objects()
-            files = await message.attachment_objects()
+            files = await message.attachment_objects(store)
             if not any([embeds, files, message.content]):
                 continue
             await hook.send(
@@ -463,14 +546,42 @@ async def restore_channel_messages(
         log.exception("Failed to restore messages for channel %s", channel.name, exc_info=e)
 
 
-class TextChannel(ChannelBase):
+class MessageChannel(ChannelBase):
+    """Channels that can have their messages backed up"""
+
+    messages: list[MessageBackup] = []  # Older backups keep their messages inline
+    segments: list[MessageSegment] = []  # Messages kept in the backup store, oldest first
+    last_message_id: int | None = None
+
+    _store: BackupStore | None = PrivateAttr(default=None)
+
+    @property
+    def message_count(self) -> int:
+        return len(self.messages) + sum(i.count for i in self.segments)
+
+    async def iter_messages(self) -> t.AsyncIterator[MessageBackup]:
+        """Messages to restore, segments are read from the store one at a time"""
+        for message in self.messages:
+            yield message
+        for segment in self.segments:
+            try:
+                rows = await asyncio.to_thread(lambda key=segment.key: list(self._store.read_segment(key)))
+            except FileNotFoundError:
+                log.warning(
+                    "Message segment %s for channel %s is missing from the backup store", segment.key, self.name
+                )
+                continue
+            for row in rows:
+                yield MessageBackup.model_validate(row)
+
+
+class TextChannel(MessageChannel):
     topic: str | None = None
     news: bool = False
     slowmode_delay: int = 0
     default_auto_archive_duration: int | None = None
     default_thread_slowmode_delay: int | None = None
     category: CategoryChannel | None = None
-    messages: list[MessageBackup] = []
 
     def is_match(self, channel: discord.TextChannel, check_category: bool = False) -> bool:
         if not isinstance(channel, discord.TextChannel):
@@ -489,9 +600,19 @@ class TextChannel(ChannelBase):
         return all(matches) and super().is_match(channel)
 
     @classmethod
-    async def serialize(cls, channel: discord.TextChannel, limit: int = 0) -> TextChannel:
+    async def serialize(
+        cls,
+        channel: discord.TextChannel,
+        limit: int = 0,
+        store: BackupStore | None = None,
+        previous: TextChannel | None = None,
+    ) -> TextChannel:
         messages: list[MessageBackup] = []
-        if limit:
+        segments: list[MessageSegment] = []
+        last_message_id: int | None = None
+        if limit and store is not None:
+            segments, last_message_id = await backup_channel_messages(channel, limit, store, previous)
+        elif limit:
             try:
                 async for message in channel.history(limit=limit):
                     messages.append(await MessageBackup.serialize(message))
@@ -510,6 +631,8 @@ class TextChannel(ChannelBase):
             default_thread_slowmode_delay=channel.default_thread_slowmode_delay,
             category=await CategoryChannel.serialize(channel.category) if channel.category else None,
             messages=messages,
+            segments=segments,
+            last_message_id=last_message_id,
         )
 
     @retry(
@@ -577,8 +700,8 @@ class TextChannel(ChannelBase):
                 category=category,
             )
             self.id = channel.id
-            if self.messages:
-                asyncio.create_task(restore_channel_messages(channel, self.messages))
+            if self.messages or self.segments:
+                asyncio.create_task(restore_channel_messages(channel, self.iter_messages(), self._store))
         return channel
 
 
@@ -787,14 +910,13 @@ class ForumChannel(ChannelBase):
         return forum
 
 
-class VoiceChannel(ChannelBase):
+class VoiceChannel(MessageChannel):
     slowmode_delay: int = 0
     user_limit: int = 0
     bitrate: int
     video_quality_mode: int = 1
     topic: str | None = None
     category: CategoryChannel | None = None
-    messages: list[MessageBackup] = []
 
     def is_match(self, channel: discord.VoiceChannel, check_category: bool = False) -> bool:
         if not isinstance(channel, discord.VoiceChannel):
@@ -812,9 +934,19 @@ class VoiceChannel(ChannelBase):
         return all(matches) and super().is_match(channel)
 
     @classmethod
-    async def serialize(cls, channel: VOICE, limit: int = 0) -> VoiceChannel:
+    async def serialize(
+        cls,
+        channel: VOICE,
+        limit: int = 0,
+        store: BackupStore | None = None,
+        previous: VoiceChannel | None = None,
+    ) -> VoiceChannel:
         messages: list[MessageBackup] = []
-        if limit:
+        segments: list[MessageSegment] = []
+        last_message_id: int | None = None
+        if limit and store is not None:
+            segments, last_message_id = await backup_channel_messages(channel, limit, store, previous)
+        elif limit:
             try:
                 async for message in channel.history(limit=limit):
                     messages.append(await MessageBackup.serialize(message))
@@ -832,6 +964,8 @@ class VoiceChannel(ChannelBase):
             "video_quality_mode": channel.video_quality_mode.value,
             "category": await CategoryChannel.serialize(channel.category) if channel.category else None,
             "messages": messages,
+            "segments": segments,
+            "last_message_id": last_message_id,
         }
         if isinstance(channel, discord.StageChannel):
             kwargs["topic"] = channel.topic
@@ -898,8 +1032,8 @@ class VoiceChannel(ChannelBase):
             if self.slowmode_delay:
                 await channel.edit(slowmode_delay=self.slowmode_delay)
 
-            if self.messages:
-                asyncio.create_task(restore_channel_messages(channel, self.messages))
+            if self.messages or self.segments:
+                asyncio.create_task(restore_channel_messages(channel, self.iter_messages(), self._store))
 
         return channel
 
@@ -907,15 +1041,25 @@ class VoiceChannel(ChannelBase):
 class GuildEmojiBackup(Base):
     id: int
     name: str
-    image: str  # base64 encoded image
+    image: str  # base64 encoded image or a backup store reference
     roles: list[Role] = []
 
     @classmethod
-    async def serialize(cls, emoji: discord.Emoji):
+    async def serialize(
+        cls,
+        emoji: discord.Emoji,
+        store: BackupStore | None = None,
+        previous: GuildEmojiBackup | None = None,
+    ):
+        if previous and is_ref(previous.image):
+            # Emoji images can't be changed, the stored copy is still good
+            image = previous.image
+        else:
+            image = await pack_bytes(await emoji.read(), store)
         return cls(
             id=emoji.id,
             name=emoji.name,
-            image=base64.b64encode(await emoji.read()).decode(),
+            image=image,
             roles=[await Role.serialize(i, load_icon=False) for i in emoji.roles],
         )
 
@@ -962,20 +1106,30 @@ class GuildStickerBackup(Base):
     name: str
     description: str | None = None
     emoji: str
-    image: str  # base64 encoded image
+    image: str  # base64 encoded image or a backup store reference
     extension: str = "png"
 
     def is_match(self, sticker: discord.GuildSticker) -> bool:
         return self.name == sticker.name and self.description == sticker.description and self.emoji == sticker.emoji
 
     @classmethod
-    async def serialize(cls, sticker: discord.GuildSticker):
+    async def serialize(
+        cls,
+        sticker: discord.GuildSticker,
+        store: BackupStore | None = None,
+        previous: GuildStickerBackup | None = None,
+    ):
+        if previous and is_ref(previous.image):
+            # Sticker images can't be changed, the stored copy is still good
+            image = previous.image
+        else:
+            image = await pack_bytes(await sticker.read(), store)
         return cls(
             id=sticker.id,
             name=sticker.name,
             description=sticker.description,
             emoji=sticker.emoji,
-            image=base64.b64encode(await sticker.read()).decode(),
+            image=image,
             extension=sticker.format.name,
         )
 
@@ -1029,10 +1183,10 @@ class GuildBackup(Base):
     afk_timeout: int = 0
     verification_level: int  # Enum[0, 1, 2, 3, 4]
     default_notifications: int  # Enum[0, 1]
-    icon: str | None = None  # base64 encoded image or None
-    banner: str | None = None  # base64 encoded image or None
-    splash: str | None = None  # base64 encoded image or None
-    discovery_splash: str | None = None  # base64 encoded image or None
+    icon: str | None = None  # base64 encoded image, backup store reference or None
+    banner: str | None = None  # base64 encoded image, backup store reference or None
+    splash: str | None = None  # base64 encoded image, backup store reference or None
+    discovery_splash: str | None = None  # base64 encoded image, backup store reference or None
     preferred_locale: str = "en-US"
     community: bool = False
     system_channel: TextChannel | None = None
@@ -1054,9 +1208,84 @@ class GuildBackup(Base):
     forums: list[ForumChannel] = []
     indexes: dict[int, int] = {}
 
+    # Everything this snapshot uses from the backup store, read by garbage collection
+    blobs: list[str] = []
+    segments: list[str] = []
+
+    _store: BackupStore | None = PrivateAttr(default=None)
+
     def created_fmt(self, type: t.Literal["d", "D", "t", "T", "f", "F", "R"] = "F") -> str:
         return f"<t:{int(self.created.timestamp())}:{type}>"
 
+    def _images(self) -> t.Iterator[tuple[Base, str]]:
+        for attr in ("icon", "banner", "splash", "discovery_splash"):
+            yield self, attr
+        for emoji in self.emojis:
+            yield emoji, "image"
+        for sticker in self.stickers:
+            yield sticker, "image"
+        for role in self.roles:
+            yield role, "icon"
+
+    def store_references(self) -> tuple[list[str], list[str]]:
+        """Keys of the blobs and segments this backup needs from the store"""
+        blobs = {ref_key(getattr(obj, attr)) for obj, attr in self._images() if is_ref(getattr(obj, attr))}
+        segments = set()
+        for channel in self.text_channels + self.voice_channels:
+            for segment in channel.segments:
+                segments.add(segment.key)
+                blobs.update(segment.blobs)
+        return sorted(blobs), sorted(segments)
+
+    def attach_store(self, store: BackupStore, load_images: bool = True) -> None:
+        """Point the backup at the store holding its messages and images
+
+        Images are loaded up front since the restore needs all of them anyway,
+        messages stay in the store and are read a segment at a time while restoring.
+        """
+        self._store = store
+        for channel in self.text_channels + self.voice_channels:
+            channel._store = store
+        if not load_images:
+            return
+        for obj, attr in self._images():
+            value = getattr(obj, attr)
+            if not is_ref(value):
+                continue
+            try:
+                setattr(obj, attr, base64.b64encode(store.get(value)).decode())
+            except FileNotFoundError:
+                log.warning("Image %s of %s is missing from the backup store", value, self.name)
+                setattr(obj, attr, "")
+
+    def inline_store(self) -> None:
+        """Pull the messages held in the store into the backup itself so it can be used as a standalone file"""
+        for channel in self.text_channels + self.voice_channels:
+            messages = list(channel.messages)
+            for segment in channel.segments:
+                try:
+                    rows = list(self._store.read_segment(segment.key))
+                except FileNotFoundError:
+                    log.warning("Message segment %s of %s is missing from the backup store", segment.key, self.name)
+                    continue
+                for row in rows:
+                    message = MessageBackup.model_validate(row)
+                    files: list[FileBackup] = []
+                    for file in message.files:
+                        if is_ref(file.filebytes):
+                            try:
+                                file.filebytes = base64.b64encode(self._store.get(file.filebytes)).decode()
+                            except FileNotFoundError:
+                                continue
+                        files.append(file)
+                    message.files = files
+                    messages.append(message)
+            channel.messages = messages
+            channel.segments = []
+            channel.last_message_id = None
+        self.blobs = []
+        self.segments = []
+
     @classmethod
     async def serialize(
         cls,
@@ -1066,12 +1295,27 @@ class GuildBackup(Base):
         backup_roles: bool = True,
         backup_emojis: bool = True,
         backup_stickers: bool = True,
+        store: BackupStore | None = None,
+        previous: GuildBackup | None = None,
     ) -> GuildBackup:
+        """Snapshot a guild
+
+        With a store, images and messages go into it and only messages newer than the
+        `previous` snapshot are fetched. Without one everything is kept inline.
+        """
         banner = await guild.banner.read() if guild.banner else None
         icon = await guild.icon.read() if guild.icon else None
         splash = await guild.splash.read() if guild.splash else None
         discovery_splash = await guild.discovery_splash.read() if guild.discovery_splash else None
 
+        previous_channels: dict[int, TextChannel | VoiceChannel] = {}
+        previous_emojis: dict[int, GuildEmojiBackup] = {}
+        previous_stickers: dict[int, GuildStickerBackup] = {}
+        if previous is not None:
+            previous_channels = {i.id: i for i in previous.text_channels + previous.voice_channels}
+            previous_emojis = {i.id: i for i in previous.emojis}
+            previous_stickers = {i.id: i for i in previous.stickers}
+
         index = 0
         indexes: dict[int, int] = {}
         categories: t.List[CategoryChannel] = []
@@ -1088,9 +1332,13 @@ class GuildBackup(Base):
                 indexes[channel.id] = index
                 index += 1
                 if isinstance(channel, discord.TextChannel):
-                    text_channels.append(await TextChannel.serialize(channel, limit))
+                    text_channels.append(
+                        await TextChannel.serialize(channel, limit, store, previous_channels.get(channel.id))
+                    )
                 elif isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
-                    voice_channels.append(await VoiceChannel.serialize(channel, limit))
+                    voice_channels.append(
+                        await VoiceChannel.serialize(channel, limit, store, previous_channels.get(channel.id))
+                    )
                 elif isinstance(channel, discord.ForumChannel):
                     forums.append(await ForumChannel.serialize(channel))
                 else:
@@ -1098,7 +1346,7 @@ class GuildBackup(Base):
 
         bans: list[BanBackup] = [BanBackup(user_id=ban.user.id, reason=ban.reason) async for ban in guild.bans()]
 
-        return cls(
+        backup = cls(
             id=guild.id,
             owner_id=guild.owner_id,
             name=guild.name,
@@ -1107,16 +1355,18 @@ class GuildBackup(Base):
             afk_timeout=guild.afk_timeout,
             verification_level=guild.verification_level.value,
             default_notifications=guild.default_notifications.value,
-            icon=(await asyncio.to_thread(base64.b64encode, icon)).decode() if icon else None,
-            banner=(await asyncio.to_thread(base64.b64encode, banner)).decode() if banner else None,
-            splash=(await asyncio.to_thread(base64.b64encode, splash)).decode() if splash else None,
-            discovery_splash=(await asyncio.to_thread(base64.b64encode, discovery_splash)).decode()
-            if discovery_splash
-            else None,
-            emojis=await asyncio.gather(*[GuildEmojiBackup.serialize(i) for i in guild.emojis])
+            icon=await pack_bytes(icon, store),
+            banner=await pack_bytes(banner, store),
+            splash=await pack_bytes(splash, store),
+            discovery_splash=await pack_bytes(discovery_splash, store),
+            emojis=await asyncio.gather(
+                *[GuildEmojiBackup.serialize(i, store, previous_emojis.get(i.id)) for i in guild.emojis]
+            )
             if backup_emojis
             else [],
-            stickers=await asyncio.gather(*[GuildStickerBackup.serialize(i) for i in guild.stickers])
+            stickers=await asyncio.gather(
+                *[GuildStickerBackup.serialize(i, store, previous_stickers.get(i.id)) for i in guild.stickers]
+            )
             if backup_stickers
             else [],
             preferred_locale=guild.preferred_locale.value,
@@ -1129,7 +1379,7 @@ class GuildBackup(Base):
             explicit_content_filter=guild.explicit_content_filter.value,
             invites_disabled=guild.invites_paused(),
             bans=bans,
-            roles=[await Role.serialize(i) for i in guild.roles] if backup_roles else [],
+            roles=[await Role.serialize(i, store=store) for i in guild.roles] if backup_roles else [],
             members=[await Member.serialize(i) for i in guild.members] if backup_members else [],
             categories=categories,
             text_channels=text_channels,
@@ -1137,6 +1387,9 @@ class GuildBackup(Base):
             forums=forums,
             indexes=indexes,
         )
+        if store is not None:
+            backup.blobs, backup.segments = backup.store_references()
+        return backup
 
     async def restore(
         self,
@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import orjson
+
+log = logging.getLogger("red.vrt.cartographer.store")
+
+# Image and file fields hold either base64 data (older backups) or a reference into the store
+REF_PREFIX = "sha256:"
+# Unreferenced store files younger than this are left alone, a backup may still be writing them
+GC_GRACE_SECONDS = 86400
+
+
+def is_ref(value: t.Optional[str]) -> bool:
+    return bool(value) and value.startswith(REF_PREFIX)
+
+
+def ref_key(value: str) -> str:
+    return value[len(REF_PREFIX) :]
+
+
+class BackupStore:
+    """
+    Content-addressed storage shared by all of a guild's backups
+
+    Layout of a guild's backup folder:
+    - `<name>_<timestamp>.json`: one small manifest per snapshot
+    - `store/blobs/<ab>/<sha256>`: raw attachment, icon, emoji and sticker bytes
+    - `store/segments/<sha256>.jsonl`: runs of a channel's messages, one JSON object per line
+
+    Files in the store are named by the hash of their contents, so the same attachment or
+    image is only written once no matter how many snapshots use it. Nothing in the store is
+    ever modified, snapshots are added and deleted and `collect_garbage` removes what no
+    remaining manifest references.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.blobs_dir = path / "store" / "blobs"
+        self.segments_dir = path / "store" / "segments"
+
+    def manifests(self) -> list[Path]:
+        """Snapshot files, oldest first"""
+        if not self.path.exists():
+            return []
+        return sorted((i for i in self.path.glob("*.json") if i.is_file()), key=lambda x: x.stat().st_mtime)
+
+    def blob_path(self, key: str) -> Path:
+        return self.blobs_dir / key[:2] / key
+
+    def segment_path(self, key: str) -> Path:
+        return self.segments_dir / f"{key}.jsonl"
+
+    def put(self, data: bytes) -> str:
+        """Store raw bytes, returns a reference to them"""
+        key = hashlib.sha256(data).hexdigest()
+        self._write(self.blob_path(key), data)
+        return REF_PREFIX + key
+
+    def get(self, ref: str) -> bytes:
+        return self.blob_path(ref_key(ref)).read_bytes()
+
+    def put_segment(self, rows: list[dict]) -> str:
+        """Store a run of messages, returns the segment key"""
+        data = b"".join(orjson.dumps(row) + b"\n" for row in rows)
+        key = hashlib.sha256(data).hexdigest()
+        self._write(self.segment_path(key), data)
+        return key
+
+    def read_segment(self, key: str) -> t.Iterator[dict]:
+        with self.segment_path(key).open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+
+    def merge_segments(self, keys: list[str]) -> str:
+        """Concatenate segments into a single new one, returns its key"""
+        data = b"".join(self.segment_path(key).read_bytes() for key in keys)
+        key = hashlib.sha256(data).hexdigest()
+        self._write(self.segment_path(key), data)
+        return key
+
+    def touch(self, blobs: t.Iterable[str] = (), segments: t.Iterable[str] = ()) -> None:
+        """Refresh the mtime of store files a new backup is about to reuse so garbage collection leaves them be"""
+        paths = [self.blob_path(key) for key in blobs] + [self.segment_path(key) for key in segments]
+        for path in paths:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                log.warning("Backup store for %s is missing %s", self.path.name, path.name)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        if path.exists():
+            # Same hash, same contents. Touch it so garbage collection sees it's in use again
+            try:
+                os.utime(path)
+                return
+            except FileNotFoundError:
+                pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent writers of the same contents each need their own temp file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except (FileNotFoundError, FileExistsError):
+            # Another writer got there first with the same contents
+            if not path.exists():
+                raise
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    def collect_garbage(self) -> int:
+        """Delete store files that no manifest references, returns how many were removed"""
+        blobs: set[str] = set()
+        segments: set[str] = set()
+        for manifest in self.manifests():
+            try:
+                data = orjson.loads(manifest.read_bytes())
+            except (OSError, orjson.JSONDecodeError) as e:
+                # Can't tell what this snapshot needs, so don't risk deleting any of it
+                log.warning("Skipping garbage collection for %s, unreadable manifest %s: %s", self.path, manifest, e)
+                return 0
+            blobs.update(data.get("blobs", []))
+            segments.update(data.get("segments", []))
+
+        cutoff = time.time() - GC_GRACE_SECONDS
+        removed = 0
+        for root, referenced, suffix in ((self.blobs_dir, blobs, ""), (self.segments_dir, segments, ".jsonl")):
+            if not root.exists():
+                continue
+            for path in root.rglob("*"):
+                if not path.is_file():
+                    continue
+                key = path.name[: -len(suffix)] if suffix and path.name.endswith(suffix) else path.name
+                if key in referenced or path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink(missing_ok=True)
+                removed += 1
+            for folder in root.iterdir():
+                if folder.is_dir() and not any(folder.iterdir()):
+                    folder.rmdir()
+        if removed:
+            log.debug("Removed %s unreferenced files from the backup store for %s", removed, self.path.name)
+        return removed
+
+    def wipe(self) -> None:
+        """Delete the guild's backup folder, snapshots and store alike"""
+        if self.path.exists():
+            shutil.rmtree(self.path)
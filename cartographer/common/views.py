@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from contextlib import suppress
+from io import BytesIO
 from pathlib import Path
 from time import perf_counter
 
@@ -10,8 +11,9 @@ from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, humanize_timedelta, text_to_file
 
 from .formatting import backup_str, humanize_size
-from .models import DB, GuildSettings, RestoreOptions
+from .models import DB, GuildSettings, RestoreOptions, export_backup, load_backup
 from .serializers import GuildBackup
+from .store import BackupStore
 
 log = logging.getLogger("red.vrt.cartographer.views")
 _ = Translator("Cartographer", __file__)
@@ -379,7 +381,7 @@ class BackupMenu(discord.ui.View):
         self.db = db
         self.backup_dir = backup_dir
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self.backups: list[Path] = sorted(self.backup_dir.iterdir(), key=lambda x: x.stat().st_ctime)
+        self.backups: list[Path] = BackupStore(self.backup_dir).manifests()
 
         self.guild = ctx.guild
         self.conf: GuildSettings = self.db.get_conf(self.guild)
@@ -426,7 +428,7 @@ class BackupMenu(discord.ui.View):
         )
 
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self.backups: list[Path] = sorted(self.backup_dir.iterdir(), key=lambda x: x.stat().st_ctime)
+        self.backups: list[Path] = BackupStore(self.backup_dir).manifests()
 
         # Show which guild's backups we're viewing if different from current
         viewing_note = ""
@@ -548,7 +550,7 @@ class BackupMenu(discord.ui.View):
         embed = discord.Embed(title=_("Backup Created"), description=txt, color=discord.Color.green())
         await message.edit(embed=embed)
         await self.message.edit(embed=await self.get_page())
-        self.db.cleanup(self.guild, self.backup_dir.parent)
+        await asyncio.to_thread(self.db.cleanup, self.guild, self.backup_dir.parent)
 
     @discord.ui.button(style=discord.ButtonStyle.danger, emoji=e_restore, row=1)
     async def restore(self, interaction: discord.Interaction, button: discord.Button):
@@ -576,8 +578,7 @@ class BackupMenu(discord.ui.View):
         # Load the backup first to show options
         self.page %= len(self.backups)
         backup_file = self.backups[self.page]
-        text = await asyncio.to_thread(backup_file.read_text, encoding="utf-8")
-        backup: GuildBackup = await asyncio.to_thread(GuildBackup.model_validate_json, text)
+        backup: GuildBackup = await asyncio.to_thread(load_backup, backup_file)
 
         # Show the restore options view
         options_view = RestoreOptionsView(
@@ -667,6 +668,8 @@ class BackupMenu(discord.ui.View):
         backup_file = self.backups[self.page]
         backup_file.unlink()
         del self.backups[self.page]
+        # Free whatever only this backup was using
+        await asyncio.to_thread(BackupStore(self.backup_dir).collect_garbage)
 
         # Adjust page index if we deleted the last backup in the list
         if self.backups and self.page >= len(self.backups):
@@ -688,9 +691,11 @@ class BackupMenu(discord.ui.View):
             return await interaction.response.send_message(txt, ephemeral=True)
         await interaction.response.defer(ephemeral=True)
         backup_file = self.backups[self.page]
+        # Snapshots share their messages and images through the store, bundle them into one file
+        data = await asyncio.to_thread(export_backup, backup_file)
         await interaction.followup.send(
             _("Here is your backup file:"),
-            file=discord.File(backup_file, filename=backup_file.name),
+            file=discord.File(BytesIO(data), filename=backup_file.name),
             ephemeral=True,
         )
 
@@ -12,8 +12,8 @@ from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils.chat_formatting import humanize_number, text_to_file
 
 from .common.formatting import humanize_size
-from .common.models import DB
-from .common.serializers import GuildBackup
+from .common.models import DB, load_backup
+from .common.store import BackupStore
 from .common.views import BackupMenu
 
 log = logging.getLogger("red.vrt.cartographer")
@@ -45,7 +45,7 @@ class Cartographer(commands.Cog):
     """
 
     __author__ = "[vertyco](https://github.com/vertyco/vrt-cogs)"
-    __version__ = "2.2.0"
+    __version__ = "2.3.0"
 
     def __init__(self, bot: Red):
         super().__init__()
@@ -111,11 +111,7 @@ class Cartographer(commands.Cog):
                 log.info("Removing guild %s from backups", guild_id)
                 # Delete the backups
                 del self.db.configs[guild_id]
-                path = self.backups_dir / str(guild_id)
-                if path.exists():
-                    for backup in path.iterdir():
-                        backup.unlink()
-                    path.rmdir()
+                await asyncio.to_thread(BackupStore(self.backups_dir / str(guild_id)).wipe)
                 save = True
                 continue
 
@@ -133,7 +129,7 @@ class Cartographer(commands.Cog):
                 backup_stickers=self.db.backup_stickers,
             )
             save = True
-            self.db.cleanup(guild, self.backups_dir)
+            await asyncio.to_thread(self.db.cleanup, guild, self.backups_dir)
 
         if save:
             await self.save()
@@ -194,9 +190,7 @@ class Cartographer(commands.Cog):
 
         self.backups_dir.mkdir(parents=True, exist_ok=True)
         for guild_backup_folder in self.backups_dir.iterdir():
-            for backup in guild_backup_folder.iterdir():
-                backup.unlink()
-            guild_backup_folder.rmdir()
+            await asyncio.to_thread(BackupStore(guild_backup_folder).wipe)
 
         await self.save()
         await ctx.send(_("All backups have been wiped!"))
@@ -254,18 +248,11 @@ class Cartographer(commands.Cog):
             return await ctx.send(txt)
 
         async with ctx.typing():
-            backups = self.backups_dir / str(ctx.guild.id)
-            if not backups.exists():
-                txt = _("There are no backups for this guild!")
-                return await ctx.send(txt)
-            backup_files = sorted(backups.iterdir(), key=lambda x: x.stat().st_mtime)
+            backup_files = BackupStore(self.backups_dir / str(ctx.guild.id)).manifests()
             if not backup_files:
                 txt = _("There are no backups for this guild!")
                 return await ctx.send(txt)
-            latest = backup_files[-1]
-            backup = await asyncio.to_thread(
-                lambda: GuildBackup.model_validate_json(latest.read_text(encoding="utf-8"))
-            )
+            backup = await asyncio.to_thread(load_backup, backup_files[-1])
             results = await backup.restore(ctx.guild, ctx.channel)
             await ctx.send(_("Server restore is complete!"))
             if results:
@@ -280,9 +267,11 @@ class Cartographer(commands.Cog):
         total_size = 0
         self.backups_dir.mkdir(parents=True, exist_ok=True)
         for guild_backup_folder in self.backups_dir.iterdir():
-            all_backups += len(list(guild_backup_folder.iterdir()))
-            for backup in guild_backup_folder.iterdir():
-                total_size += backup.stat().st_size
+            all_backups += len(BackupStore(guild_backup_folder).manifests())
+            # Snapshots and their shared store
+            for file in guild_backup_folder.rglob("*"):
+                if file.is_file():
+                    total_size += file.stat().st_size
 
         ignored = ", ".join([f"`{i}`" for i in self.db.ignored_guilds]) if self.db.ignored_guilds else _("**None Set**")
         allowed = ", ".join([f"`{i}`" for i in self.db.allowed_guilds]) if self.db.allowed_guilds else _("**None Set**")
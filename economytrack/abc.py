@@ -1,3 +1,4 @@
+import typing as t
 from abc import ABC, ABCMeta, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 
@@ -7,6 +8,8 @@ from discord.ext.commands.cog import CogMeta
 from redbot.core.bot import Red
 from redbot.core.config import Config
 
+from economytrack.series import RingSeries
+
 
 class CompositeMetaClass(CogMeta, ABCMeta):
     """Type detection"""
@@ -19,6 +22,14 @@ class MixinMeta(ABC):
     config: Config
     executor: ThreadPoolExecutor
 
+    @abstractmethod
+    def get_series(self, guild: t.Optional[discord.abc.Snowflake], kind: str) -> RingSeries:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_max_points(self) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_plot(self, df: pd.DataFrame, y_label: str) -> discord.File:
         raise NotImplementedError
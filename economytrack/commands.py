@@ -1,6 +1,7 @@
 import datetime
 
 import discord
+import numpy as np
 import pandas as pd
 import pytz
 from discord.ext.commands.cooldowns import BucketType
@@ -92,12 +93,8 @@ class EconomyTrackCommands(MixinMeta):
         conf = await self.config.guild(ctx.guild).all()
         timezone = conf["timezone"]
         enabled = conf["enabled"]
-        if is_global:
-            data = await self.config.data()
-            points = len(data)
-        else:
-            data = await self.config.guild(ctx.guild).data()
-            points = len(data)
+        points = len(self.get_series(None if is_global else ctx.guild, "bank"))
+        member_points = len(self.get_series(ctx.guild, "members"))
         avg_iter = self.looptime if self.looptime else "(N/A)"
         ptime = humanize_timedelta(seconds=int(points * 60))
         mptime = humanize_timedelta(seconds=int(max_points * 60))
@@ -109,12 +106,12 @@ class EconomyTrackCommands(MixinMeta):
             f"`LoopTime:   `{avg_iter}ms"
         )
         embed = discord.Embed(title="EconomyTrack Settings", description=desc, color=ctx.author.color)
-        memtime = humanize_timedelta(seconds=len(conf["member_data"]) * 60)
+        memtime = humanize_timedelta(seconds=member_points * 60)
         embed.add_field(
             name="Member Tracking",
             value=(
                 f"`Enabled:   `{conf['member_tracking']}\n"
-                f"`Collected: `{humanize_number(len(conf['member_data']))} ({memtime if memtime else 'None'})"
+                f"`Collected: `{humanize_number(member_points)} ({memtime if memtime else 'None'})"
             ),
             inline=False,
         )
@@ -155,14 +152,12 @@ class EconomyTrackCommands(MixinMeta):
         is_global = await bank.is_global()
 
         if banktype:
-            if is_global:
-                data = await self.config.data()
-            else:
-                data = await self.config.guild(ctx.guild).data()
+            series = self.get_series(None if is_global else ctx.guild, "bank")
         else:
-            data = await self.config.guild(ctx.guild).member_data()
+            series = self.get_series(ctx.guild, "members")
+        timestamps, values = series.read()
 
-        if len(data) < 10:
+        if len(values) < 10:
             embed = discord.Embed(
                 description="There is not enough data collected. Try again later.",
                 color=discord.Color.red(),
@@ -170,29 +165,23 @@ class EconomyTrackCommands(MixinMeta):
             return await ctx.send(embed=embed)
 
         # Filter data based on provided thresholds
-        original_count = len(data)
+        keep = values != 0
         if min_value is not None and max_value is not None:
-            newrows = [i for i in data if i[1] and min_value <= i[1] <= max_value]
+            keep &= (values >= min_value) & (values <= max_value)
             range_str = f"between {min_value} and {max_value}"
         elif min_value is not None:
-            newrows = [i for i in data if i[1] and i[1] >= min_value]
+            keep &= values >= min_value
             range_str = f"below {min_value}"
         else:  # max_value is not None
-            newrows = [i for i in data if i[1] and i[1] <= max_value]
+            keep &= values <= max_value
             range_str = f"above {max_value}"
 
-        deleted = original_count - len(newrows)
+        deleted = int((~keep).sum())
         if not deleted:
             return await ctx.send("No data points found outside the specified range.")
 
         async with ctx.typing():
-            if banktype:
-                if is_global:
-                    await self.config.data.set(newrows)
-                else:
-                    await self.config.guild(ctx.guild).data.set(newrows)
-            else:
-                await self.config.guild(ctx.guild).member_data.set(newrows)
+            series.write(timestamps[keep], values[keep], await self.get_max_points())
 
             data_type_str = "bank balance" if banktype else "member count"
             await ctx.send(f"Deleted {deleted} data points with {data_type_str} {range_str}")
@@ -221,11 +210,8 @@ class EconomyTrackCommands(MixinMeta):
         is_global = await bank.is_global()
         currency_name = await bank.get_currency_name(ctx.guild)
         bank_name = await bank.get_bank_name(ctx.guild)
-        if is_global:
-            data = await self.config.data()
-        else:
-            data = await self.config.guild(ctx.guild).data()
-        if len(data) < 10:
+        series = self.get_series(None if is_global else ctx.guild, "bank")
+        if len(series) < 10:
             embed = discord.Embed(
                 description="There is not enough data collected to generate a graph right now. Try again later.",
                 color=discord.Color.red(),
@@ -234,16 +220,11 @@ class EconomyTrackCommands(MixinMeta):
         timezone = await self.config.guild(ctx.guild).timezone()
         now = datetime.datetime.now().astimezone(tz=pytz.timezone(timezone))
         start = now - delta
-        columns = ["ts", "total"]
-        rows = [i for i in data]
-        for i in rows:
-            i[0] = datetime.datetime.fromtimestamp(i[0]).astimezone(tz=pytz.timezone(timezone))
-        df = pd.DataFrame(rows, columns=columns)
-        df = df.set_index(["ts"])
+        timestamps, values = series.read(since=int(start.timestamp()))
+        index = pd.to_datetime(timestamps, unit="s", utc=True).tz_convert(timezone).rename("ts")
+        df = pd.DataFrame({"total": values}, index=index)
         df = df[~df.index.duplicated(keep="first")]  # Remove duplicate indexes
-        mask = (df.index > start) & (df.index <= now)
-        df = df.loc[mask]
-        df = pd.DataFrame(df)
+        df = df.loc[df.index <= now]
 
         if df.empty or len(df.values) < 10:  # In case there is data but it is old
             embed = discord.Embed(
@@ -314,8 +295,8 @@ class EconomyTrackCommands(MixinMeta):
             if delta is None:
                 delta = datetime.timedelta(hours=1)
 
-        data = await self.config.guild(ctx.guild).member_data()
-        if len(data) < 10:
+        series = self.get_series(ctx.guild, "members")
+        if len(series) < 10:
             embed = discord.Embed(
                 description="There is not enough data collected to generate a graph right now. Try again later.",
                 color=discord.Color.red(),
@@ -324,16 +305,11 @@ class EconomyTrackCommands(MixinMeta):
         timezone = await self.config.guild(ctx.guild).timezone()
         now = datetime.datetime.now().astimezone(tz=pytz.timezone(timezone))
         start = now - delta
-        columns = ["ts", "total"]
-        rows = [i for i in data]
-        for i in rows:
-            i[0] = datetime.datetime.fromtimestamp(i[0]).astimezone(tz=pytz.timezone(timezone))
-        df = pd.DataFrame(rows, columns=columns)
-        df = df.set_index(["ts"])
+        timestamps, values = series.read(since=int(start.timestamp()))
+        index = pd.to_datetime(timestamps, unit="s", utc=True).tz_convert(timezone).rename("ts")
+        df = pd.DataFrame({"total": values}, index=index)
         df = df[~df.index.duplicated(keep="first")]  # Remove duplicate indexes
-        mask = (df.index > start) & (df.index <= now)
-        df = df.loc[mask]
-        df = pd.DataFrame(df)
+        df = df.loc[df.index <= now]
 
         if df.empty or len(df.values) < 10:  # In case there is data but it is old
             embed = discord.Embed(
@@ -422,33 +398,26 @@ class EconomyTrackCommands(MixinMeta):
         is_global = await bank.is_global()
 
         if banktype:
-            if is_global:
-                data = await self.config.data()
-            else:
-                data = await self.config.guild(ctx.guild).data()
+            series = self.get_series(None if is_global else ctx.guild, "bank")
         else:
-            data = await self.config.guild(ctx.guild).member_data()
+            series = self.get_series(ctx.guild, "members")
+        timestamps, values = series.read()
 
-        if len(data) < 10:
+        if len(values) < 10:
             embed = discord.Embed(
                 description="There is not enough data collected. Try again later.",
                 color=discord.Color.red(),
             )
             return await ctx.send(embed=embed)
 
-        # Extract values for statistical analysis
-        values = [point[1] for point in data if point[1] is not None]
-        if not values:
-            return await ctx.send("No valid data points found.")
-
         # Calculate quartiles and IQR
-        values.sort()
-        mid = len(values) // 2
+        sorted_values = np.sort(values)
+        mid = len(sorted_values) // 2
         q1_idx = mid // 2
-        q3_idx = mid + (len(values) - mid) // 2
+        q3_idx = mid + (len(sorted_values) - mid) // 2
 
-        q1 = values[q1_idx]
-        q3 = values[q3_idx]
+        q1 = int(sorted_values[q1_idx])
+        q3 = int(sorted_values[q3_idx])
         iqr = q3 - q1
 
         # Calculate bounds
@@ -456,9 +425,8 @@ class EconomyTrackCommands(MixinMeta):
         upper_bound = q3 + (multiplier * iqr)
 
         # Filter out outliers
-        original_count = len(data)
-        newrows = [i for i in data if i[1] and lower_bound <= i[1] <= upper_bound]
-        deleted = original_count - len(newrows)
+        keep = (values != 0) & (values >= lower_bound) & (values <= upper_bound)
+        deleted = int((~keep).sum())
 
         if not deleted:
             return await ctx.send("No outliers detected in the data.")
@@ -466,13 +434,7 @@ class EconomyTrackCommands(MixinMeta):
         async with ctx.typing():
             # Only update data if confirm is True
             if confirm:
-                if banktype:
-                    if is_global:
-                        await self.config.data.set(newrows)
-                    else:
-                        await self.config.guild(ctx.guild).data.set(newrows)
-                else:
-                    await self.config.guild(ctx.guild).member_data.set(newrows)
+                series.write(timestamps[keep], values[keep], await self.get_max_points())
 
             data_type_str = "bank balance" if banktype else "member count"
             stats_msg = (
@@ -1,17 +1,21 @@
 import asyncio
 import logging
+import typing as t
 from datetime import datetime
 from time import monotonic
 
 import discord
+import numpy as np
 from discord.ext import tasks
 from redbot.core import Config, bank, commands
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils import AsyncIter
 
 from economytrack.abc import CompositeMetaClass
 from economytrack.commands import EconomyTrackCommands
 from economytrack.graph import PlotGraph
+from economytrack.series import RingSeries
 
 log = logging.getLogger("red.vrt.economytrack")
 
@@ -28,7 +32,7 @@ class EconomyTrack(commands.Cog, EconomyTrackCommands, PlotGraph, metaclass=Comp
     """
 
     __author__ = "[vertyco](https://github.com/vertyco/vrt-cogs)"
-    __version__ = "0.6.0"
+    __version__ = "0.7.0"
 
     def format_help_for_context(self, ctx):
         helpcmd = super().format_help_for_context(ctx)
@@ -42,6 +46,7 @@ class EconomyTrack(commands.Cog, EconomyTrackCommands, PlotGraph, metaclass=Comp
         super().__init__(*args, **kwargs)
         self.bot = bot
         self.config = Config.get_conf(self, identifier=117, force_registration=True)
+        # "data" and "member_data" are legacy, points now live in ring buffer files under series/
         default_global = {"max_points": 21600, "data": []}
         default_guild = {
             "timezone": "UTC",
@@ -52,44 +57,69 @@ class EconomyTrack(commands.Cog, EconomyTrackCommands, PlotGraph, metaclass=Comp
         }
         self.config.register_global(**default_global)
         self.config.register_guild(**default_guild)
+        self.series_path = cog_data_path(self) / "series"
         self.looptime = None
         self.bank_loop.start()
 
     def cog_unload(self):
         self.bank_loop.cancel()
 
+    def get_series(self, guild: t.Optional[discord.abc.Snowflake], kind: str) -> RingSeries:
+        """Series for a guild's `bank` or `members` data, or the global bank when guild is None"""
+        name = f"global_{kind}" if guild is None else f"{guild.id}_{kind}"
+        return RingSeries(self.series_path / f"{name}.bin")
+
+    async def get_max_points(self) -> int:
+        max_points = await self.config.max_points()
+        if max_points == 0:  # 0 is no limit
+            max_points = 26280000  # 100 years is plenty
+        return max_points
+
+    async def migrate_config_data(self):
+        """Move points stored in Config into series files"""
+        max_points = await self.get_max_points()
+
+        def _migrate(series: RingSeries, rows: list):
+            rows = sorted((row for row in rows if row[1] is not None), key=lambda x: x[0])
+            timestamps = np.array([int(row[0]) for row in rows], dtype=np.int64)
+            values = np.array([int(row[1]) for row in rows], dtype=np.int64)
+            series.write(timestamps, values, max_points)
+
+        if data := await self.config.data():
+            await asyncio.to_thread(_migrate, self.get_series(None, "bank"), data)
+            await self.config.data.set([])
+            log.info(f"Migrated {len(data)} global bank points")
+
+        for guild_id, conf in (await self.config.all_guilds()).items():
+            guild_conf = self.config.guild_from_id(guild_id)
+            guild = discord.Object(id=guild_id)
+            if conf.get("data"):
+                await asyncio.to_thread(_migrate, self.get_series(guild, "bank"), conf["data"])
+                await guild_conf.data.set([])
+            if conf.get("member_data"):
+                await asyncio.to_thread(_migrate, self.get_series(guild, "members"), conf["member_data"])
+                await guild_conf.member_data.set([])
+
     @tasks.loop(minutes=2)
     async def bank_loop(self):
         start = monotonic()
         is_global = await bank.is_global()
-        max_points = await self.config.max_points()
-        if max_points == 0:  # 0 is no limit
-            max_points = 26280000  # 100 years is plenty
-        now = datetime.now().replace(microsecond=0, second=0).timestamp()
+        max_points = await self.get_max_points()
+        now = int(datetime.now().replace(microsecond=0, second=0).timestamp())
         if is_global:
             total = await self.get_total_bal()
-            async with self.config.data() as data:
-                data.append((now, total))
-                if len(data) > max_points:
-                    del data[0 : len(data) - max_points]
+            self.get_series(None, "bank").append(now, total, max_points)
         else:
             async for guild in AsyncIter(self.bot.guilds):
                 if not await self.config.guild(guild).enabled():
                     continue
                 total = await self.get_total_bal(guild)
-                async with self.config.guild(guild).data() as data:
-                    data.append((now, total))
-                    if len(data) > max_points:
-                        del data[0 : len(data) - max_points]
+                self.get_series(guild, "bank").append(now, total, max_points)
 
         async for guild in AsyncIter(self.bot.guilds):
             if not await self.config.guild(guild).member_tracking():
                 continue
-            members = guild.member_count
-            async with self.config.guild(guild).member_data() as data:
-                data.append((now, members))
-                if len(data) > max_points:
-                    del data[0 : len(data) - max_points]
+            self.get_series(guild, "members").append(now, guild.member_count or 0, max_points)
 
         iter_time = round((monotonic() - start) * 1000)
         avg_iter = self.looptime
@@ -111,5 +141,6 @@ class EconomyTrack(commands.Cog, EconomyTrackCommands, PlotGraph, metaclass=Comp
     @bank_loop.before_loop
     async def before_bank_loop(self):
         await self.bot.wait_until_red_ready()
+        await self.migrate_config_data()
         await asyncio.sleep(120)
         log.info("EconomyTrack Ready")
@@ -0,0 +1,130 @@
+import logging
+import os
+import struct
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+log = logging.getLogger("red.vrt.economytrack.series")
+
+# magic, version, capacity, start, count
+HEADER = struct.Struct("<4sIqqq")
+MAGIC = b"ETRB"
+VERSION = 1
+MIN_CAPACITY = 1024
+INT64_MAX = np.iinfo(np.int64).max
+
+
+class RingSeries:
+    """
+    Fixed-width time series stored as a ring buffer in its own file
+
+    Layout: a 32 byte header followed by two int64 columns of `capacity` slots each,
+    timestamps (unix seconds) then values. Appending writes one slot per column and the
+    header, so a tick costs the same no matter how much history is kept. Once the buffer
+    holds `max_points` the oldest slot is overwritten.
+
+    Capacity starts small and doubles as points come in (up to max_points), so an
+    unlimited series doesn't preallocate years of empty slots.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _read_header(self) -> tuple[int, int, int]:
+        with self.path.open("rb") as f:
+            magic, version, capacity, start, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path.name} is not an EconomyTrack series file")
+        return capacity, start, count
+
+    def __len__(self) -> int:
+        if not self.exists():
+            return 0
+        return self._read_header()[2]
+
+    def append(self, timestamp: int, value: int, max_points: int) -> None:
+        value = max(-INT64_MAX, min(int(value), INT64_MAX))
+        if not self.exists():
+            self.write(np.array([timestamp], dtype=np.int64), np.array([value], dtype=np.int64), max_points)
+            return
+        capacity, start, count = self._read_header()
+        if capacity > max_points:
+            # Max points was lowered
+            timestamps, values = self.read()
+            self.write(np.append(timestamps, timestamp), np.append(values, value), max_points)
+            return
+        if count == capacity and capacity < max_points:
+            # Full but allowed to grow, rewrite in order with room to spare
+            timestamps, values = self.read()
+            self.write(np.append(timestamps, timestamp), np.append(values, value), max_points)
+            return
+
+        if count < capacity:
+            slot = (start + count) % capacity
+            count += 1
+        else:
+            # Full, overwrite the oldest point
+            slot = start
+            start = (start + 1) % capacity
+        with self.path.open("r+b") as f:
+            f.seek(HEADER.size + slot * 8)
+            f.write(struct.pack("<q", timestamp))
+            f.seek(HEADER.size + (capacity + slot) * 8)
+            f.write(struct.pack("<q", value))
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, capacity, start, count))
+
+    def write(self, timestamps: np.ndarray, values: np.ndarray, max_points: int) -> None:
+        """Replace the whole series, keeping the newest max_points"""
+        timestamps = np.asarray(timestamps, dtype=np.int64)[-max_points:]
+        values = np.asarray(values, dtype=np.int64)[-max_points:]
+        count = len(timestamps)
+        capacity = min(max_points, max(MIN_CAPACITY, count * 2))
+        columns = np.zeros((2, capacity), dtype=np.int64)
+        columns[0, :count] = timestamps
+        columns[1, :count] = values
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, capacity, 0, count))
+            f.write(columns.tobytes())
+        os.replace(tmp, self.path)
+
+    def read(self, since: t.Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Timestamps and values in chronological order, optionally only those after `since`
+
+        The columns are memory-mapped and only the requested window is copied out.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if not self.exists():
+            return empty, empty
+        capacity, start, count = self._read_header()
+        if not count:
+            return empty, empty
+        columns = np.memmap(self.path, dtype=np.int64, mode="r", offset=HEADER.size, shape=(2, capacity))
+        # The oldest points sit at `start`, wrapped points continue from slot 0
+        segments = [(start, min(start + count, capacity)), (0, max(0, start + count - capacity))]
+        timestamps, values = [], []
+        for lo, hi in segments:
+            if hi <= lo:
+                continue
+            ts = columns[0, lo:hi]
+            if since is not None:
+                lo += int(np.searchsorted(ts, since, side="right"))
+            timestamps.append(columns[0, lo:hi])
+            values.append(columns[1, lo:hi])
+        if not timestamps:
+            return empty, empty
+        ts_out, val_out = np.concatenate(timestamps), np.concatenate(values)
+        del columns
+        return ts_out, val_out
+
+    def delete(self) -> None:
+        self.path.unlink(missing_ok=True)
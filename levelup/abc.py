@@ -10,6 +10,10 @@ from redbot.core import commands
 from redbot.core.bot import Red
 
 from .common.models import DB, GuildSettings, Profile, VoiceTracking
+from .common.ranks import RankIndex
+from .common.rendercache import RenderCache
+from .common.renderpool import RenderPool
+from .common.storage import ShardedStorage
 from .generator.tenor.converter import TenorAPI
 
 
@@ -25,13 +29,15 @@ class MixinMeta(ABC):
 
         # Cache
         self.db: DB
+        self.ranks: RankIndex
         self.lastmsg: t.Dict[int, t.Dict[int, float]]
         self.msg_cache: t.Dict[int, t.Dict[int, t.List[str]]]  # guild_id -> user_id -> list of normalized messages
         self.voice_tracking: t.Dict[int, t.Dict[int, VoiceTracking]]
-        self.profile_cache: t.Dict[int, t.Dict[int, t.Tuple[str, bytes]]]
+        self.render_cache: RenderCache
         self.stars: t.Dict[int, t.Dict[int, datetime]]
 
         self.cog_path: Path
+        self.storage: ShardedStorage
         self.bundled_path: Path
         # Custom
         self.custom_fonts: Path
@@ -53,6 +59,7 @@ class MixinMeta(ABC):
         # Managed API process
         self._managed_api_process: t.Optional[asyncio.subprocess.Process]
         self._subprocess_semaphore: asyncio.Semaphore
+        self.render_pool: t.Optional[RenderPool]
 
     @abstractmethod
     def save(self) -> None:
@@ -69,6 +76,18 @@ class MixinMeta(ABC):
     ) -> t.Tuple[t.Optional[Path], t.Optional[dict]]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def render_image(self, request_data: dict) -> t.Tuple[t.Optional[bytes], bool]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _start_render_pool(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _stop_render_pool(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def _start_managed_api(self) -> bool:
         raise NotImplementedError
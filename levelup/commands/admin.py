@@ -415,9 +415,9 @@ class Admin(MixinMeta):
             txt = _("The following roles gain exp as a group:\n{}").format(joined)
             add_field(embed, _("Role Exp Groups"), txt)
         if ctx.author.id not in self.bot.owner_ids:
-            txt = _("➣ Profile Cache Time\n")
-            if self.db.cache_seconds:
-                txt += _("Profiles will be cached for {}\n").format(utils.humanize_delta(self.db.cache_seconds))
+            txt = _("➣ Profile Cache\n")
+            if self.db.render_cache_mb:
+                txt += _("Profiles are cached until their stats or appearance change\n")
             else:
                 txt += _("Profiles are not cached\n")
             txt += _("➣ Profile Rendering\n")
@@ -517,6 +517,7 @@ class Admin(MixinMeta):
             profile.xp = new_xp
             profile.level = conf.algorithm.get_level(profile.xp)
             txt = _("Added {} XP to {}").format(xp, user_or_role.name)
+            self.ranks.update(ctx.guild, conf, user_or_role.id)
             self.save()
             return await ctx.send(txt)
 
@@ -527,6 +528,7 @@ class Admin(MixinMeta):
                 return await ctx.send(_("That XP value is too high!"))
             profile.xp = new_xp
             profile.level = conf.algorithm.get_level(profile.xp)
+            self.ranks.update(ctx.guild, conf, user.id)
         txt = _("Added {} XP {} member(s) with the {} role").format(
             xp,
             len(user_or_role.members),
@@ -550,12 +552,14 @@ class Admin(MixinMeta):
             profile.xp -= removed
             profile.level = conf.algorithm.get_level(profile.xp)
             txt = _("Removed {} XP from {}").format(round(removed), user_or_role.name)
+            self.ranks.update(ctx.guild, conf, user_or_role.id)
             self.save()
             return await ctx.send(txt)
         for user in user_or_role.members:
             profile = conf.get_profile(user)
             profile.xp -= min(profile.xp, xp)
             profile.level = conf.algorithm.get_level(profile.xp)
+            self.ranks.update(ctx.guild, conf, user.id)
         txt = _("Removed {} XP from {} member(s) with the {} role").format(
             xp,
             len(user_or_role.members),
@@ -800,6 +804,7 @@ class Admin(MixinMeta):
             # Make sure xp is a valid number that python can actually handle
             if profile.xp > 1e308:
                 return await ctx.send(_("That level is too high!"))
+            self.ranks.update(ctx.guild, conf, user.id)
             self.save()
             reason = _("User {} set {}'s level to {}").format(ctx.author.name, user.name, level)
             added, removed = await self.ensure_roles(user, conf, reason)
@@ -825,6 +830,7 @@ class Admin(MixinMeta):
             return await ctx.send(_("That prestige level does not exist!"))
         profile = conf.get_profile(user)
         profile.prestige = prestige
+        self.ranks.update(ctx.guild, conf, user.id)
         self.save()
         await ctx.send(_("{} has been set to prestige level {}").format(user.name, prestige))
 
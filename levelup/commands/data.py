@@ -117,6 +117,7 @@ class DataAdmin(MixinMeta):
             await ctx.send(_("No data to prune!"))
         else:
             await ctx.send(_("Cleanup complete\n{}").format(txt.rstrip()))
+        self.ranks.invalidate()
         self.save()
 
     @lvldata.command(name="resetglobal")
@@ -130,6 +131,8 @@ class DataAdmin(MixinMeta):
         for guild_id in list(self.db.configs.keys()):
             self.db.configs[guild_id].users = {}
             self.db.configs[guild_id].users_weekly = {}
+        self.db.mark_dirty(*self.db.configs)
+        self.ranks.invalidate()
         self.save()
         await msg.edit(content=_("Global data reset!"))
 
@@ -143,6 +146,7 @@ class DataAdmin(MixinMeta):
         conf = self.db.get_conf(ctx.guild)
         conf.users = {}
         conf.users_weekly = {}
+        self.ranks.invalidate()
         self.save()
         await msg.edit(content=_("Server data reset!"))
 
@@ -155,6 +159,7 @@ class DataAdmin(MixinMeta):
         if not yes:
             return await msg.edit(content=_("Reset cancelled!"))
         self.db = DB()
+        self.ranks.invalidate()
         self.save()
         await msg.edit(content=_("Cog data reset!"))
 
@@ -199,6 +204,7 @@ class DataAdmin(MixinMeta):
             await DynamicMenu(ctx, pages).refresh()
             return
         self.db.configs[ctx.guild.id] = conf
+        self.ranks.invalidate()
         self.save()
         await ctx.send(_("Server data restored!"))
 
@@ -219,6 +225,7 @@ class DataAdmin(MixinMeta):
             await ctx.send(_("Failed to restore data!"))
             await DynamicMenu(ctx, pages).refresh()
             return
+        self.ranks.invalidate()
         self.save()
         await ctx.send(_("Cog data restored!"))
 
@@ -344,6 +351,7 @@ class DataAdmin(MixinMeta):
                 txt += _(" ({} skipped since they are no longer in the discord)").format(str(failed))
             await msg.edit(content=txt)
             await ctx.tick()
+            self.ranks.invalidate()
             self.save()
 
     @lvldata.command(name="importfixator")
@@ -443,6 +451,8 @@ class DataAdmin(MixinMeta):
             if not imported:
                 return await msg.edit(content=_("There was no data to import!"))
 
+            self.ranks.invalidate()
+
             self.save()
             await msg.edit(content=_("Imported data for {} users from Fixator's Leveler cog!").format(imported))
 
@@ -511,6 +521,7 @@ class DataAdmin(MixinMeta):
             return await ctx.send(_("There were no profiles to import"))
         txt = _("Imported {} profile(s)").format(imported)
         await ctx.send(txt)
+        self.ranks.invalidate()
         self.save()
 
     @lvldata.command(name="importmee6")
@@ -638,6 +649,7 @@ class DataAdmin(MixinMeta):
                 txt += _(" ({} skipped since they are no longer in the discord)").format(str(failed))
             await msg.edit(content=txt)
             await ctx.tick()
+            self.ranks.invalidate()
             self.save()
 
     @lvldata.command(name="importpolaris")
@@ -759,4 +771,5 @@ class DataAdmin(MixinMeta):
                 txt += _(" ({} skipped since they are no longer in the discord)").format(str(failed))
             await msg.edit(content=txt)
             await ctx.tick()
+            self.ranks.invalidate()
             self.save()
@@ -7,6 +7,7 @@ from io import BytesIO, StringIO
 import discord
 from redbot.core import commands
 from redbot.core.i18n import Translator
+from redbot.core.utils.chat_formatting import humanize_number
 
 from ..abc import MixinMeta
 from ..common import utils
@@ -32,15 +33,16 @@ class Owner(MixinMeta):
             size_bytes = utils.deep_getsizeof(self.db)
             size_bytes += utils.deep_getsizeof(self.lastmsg)
             size_bytes += utils.deep_getsizeof(self.voice_tracking)
-            size_bytes += utils.deep_getsizeof(self.profile_cache)
-            return size_bytes
+            return size_bytes + self.render_cache.size
 
         embed = discord.Embed(color=await self.bot.get_embed_color(ctx))
         size = await asyncio.to_thread(_size)
         embed.add_field(
             name=_("Global Settings"),
-            value=_("`Profile Cache Time: `{}\n`Cache Size:         `{}\n").format(
-                utils.humanize_delta(self.db.cache_seconds),
+            value=_("`Profile Cache:      `{}\n`Cache Size:         `{}\n").format(
+                _("{} budget").format(utils.humanize_size(self.db.render_cache_mb * 1024 * 1024))
+                if self.db.render_cache_mb
+                else _("Disabled"),
                 utils.humanize_size(size),
             ),
             inline=False,
@@ -125,6 +127,28 @@ class Owner(MixinMeta):
             inline=False,
         )
 
+        # Render pool section
+        if pool := self.render_pool:
+            alive = len([w for w in pool.workers if w.alive])
+            txt = _(
+                "*Pre-warmed worker processes render images without spawning a new interpreter per request.*\n"
+                "- **Workers:** {}/{} running ({} busy)\n"
+                "- **Job Timeout:** {}s\n"
+                "- **Jobs:** {} completed, {} failed, {} timed out\n"
+                "- **Worker Restarts:** {}\n"
+            ).format(
+                alive, pool.size, pool.busy, pool.timeout, pool.completed, pool.failed, pool.timeouts, pool.restarts
+            )
+        elif self.db.render_workers < 0:
+            txt = _("*Render pool is disabled. Using one subprocess per image.*")
+        else:
+            txt = _("*Render pool is not running.*")
+        embed.add_field(
+            name=_("Render Pool"),
+            value=txt,
+            inline=False,
+        )
+
         status = _("Enabled") if self.db.auto_cleanup else _("Disabled")
         embed.add_field(
             name=_("Auto-Cleanup ({})").format(status),
@@ -267,6 +291,49 @@ class Owner(MixinMeta):
                 )
             )
 
+    @lvlowner.command(name="renderworkers")
+    async def set_render_workers(self, ctx: commands.Context, workers: int):
+        """
+        Set the number of persistent render workers
+
+        Render workers are long-lived processes that keep Pillow and the fonts loaded,
+        so profiles and level-up alerts don't pay for a fresh interpreter each time.
+
+        **Arguments**
+        - `workers`: Number of workers (1-32). Set to 0 for auto (cpu_count // 2) or -1 to disable the pool.
+
+        **Notes**
+        - When disabled, each image is generated in its own subprocess.
+        - The external and managed APIs still take precedence when configured.
+        """
+        if workers < -1 or workers > 32:
+            return await ctx.send(_("Workers must be between -1 and 32. Use 0 for auto-detection or -1 to disable."))
+
+        self.db.render_workers = workers
+        self.save()
+        async with ctx.typing():
+            await self._start_render_pool()
+
+        if workers < 0:
+            await ctx.send(_("Render pool disabled. Images will be generated in a subprocess per request."))
+        elif self.render_pool is not None:
+            await ctx.send(_("Render pool restarted with {} workers.").format(self.render_pool.size))
+
+    @lvlowner.command(name="rendertimeout")
+    async def set_render_timeout(self, ctx: commands.Context, seconds: int):
+        """
+        Set how long a render worker may spend on one image
+
+        Workers that exceed this are killed and replaced, and the image falls back to a one-shot subprocess.
+        """
+        if seconds < 5 or seconds > 300:
+            return await ctx.send(_("Timeout must be between 5 and 300 seconds."))
+        self.db.render_timeout = seconds
+        if self.render_pool is not None:
+            self.render_pool.timeout = seconds
+        await ctx.send(_("Render job timeout set to {} seconds.").format(seconds))
+        self.save()
+
     @lvlowner.command(name="rendergifs", aliases=["rendergif", "gif"])
     async def toggle_gif_rendering(self, ctx: commands.Context):
         """Toggle rendering of GIFs for animated profiles"""
@@ -305,12 +372,58 @@ class Owner(MixinMeta):
         self.save()
 
     @lvlowner.command(name="cache")
-    async def set_cache(self, ctx: commands.Context, seconds: int):
-        """Set the cache time for user profiles"""
-        self.db.cache_seconds = seconds
-        await ctx.send(_("Cache time set to {} seconds.").format(seconds))
+    async def set_cache(self, ctx: commands.Context, megabytes: int):
+        """
+        Set the memory budget for cached profile images
+
+        Profiles are cached by everything that goes into rendering them, so a cached image is only
+        reused while the user's stats and appearance are unchanged.
+        When the budget is full, the least recently viewed profiles are dropped first.
+
+        Set to 0 to disable the cache
+        """
+        if megabytes < 0:
+            return await ctx.send(_("Cache size cannot be negative!"))
+        self.db.render_cache_mb = megabytes
+        self.render_cache.resize(megabytes * 1024 * 1024)
+        if megabytes:
+            await ctx.send(_("Profile cache budget set to {} MB.").format(megabytes))
+        else:
+            self.render_cache.clear()
+            await ctx.send(_("Profile cache disabled."))
         self.save()
 
+    @lvlowner.command(name="cachestats")
+    @commands.bot_has_permissions(embed_links=True)
+    async def cache_stats(self, ctx: commands.Context):
+        """View profile cache hit/miss stats"""
+        cache = self.render_cache
+        lookups = cache.hits + cache.misses
+        hit_rate = f"{cache.hits / lookups:.1%}" if lookups else "N/A"
+        embed = discord.Embed(
+            title=_("Profile Cache"),
+            description=_(
+                "`Entries:   `{}\n"
+                "`Size:      `{} / {}\n"
+                "`Hits:      `{}\n"
+                "`Misses:    `{}\n"
+                "`Hit Rate:  `{}\n"
+                "`Evictions: `{}\n"
+            ).format(
+                humanize_number(len(cache)),
+                utils.humanize_size(cache.size),
+                utils.humanize_size(cache.max_bytes),
+                humanize_number(cache.hits),
+                humanize_number(cache.misses),
+                hit_rate,
+                humanize_number(cache.evictions),
+            ),
+            color=await self.bot.get_embed_color(ctx),
+        )
+        if not self.db.render_cache_mb:
+            embed.set_footer(text=_("The profile cache is disabled"))
+        await ctx.send(embed=embed)
+
     @commands.command(name="mocklvl", hidden=True)
     @commands.is_owner()
     @commands.bot_has_permissions(attach_files=True)
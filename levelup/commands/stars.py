@@ -58,6 +58,7 @@ class Stars(MixinMeta):
         if conf.weeklysettings.on:
             weekly = conf.get_weekly_profile(user)
             weekly.stars += 1
+        self.ranks.update(ctx.guild, conf, user.id)
         self.save(False)
         name = user.mention if conf.starmention else f"**{user.display_name}**"
         kwargs = {"ephemeral": True}
@@ -75,6 +76,9 @@ class Stars(MixinMeta):
     ):
         """View the Star Leaderboard"""
         stat = "stars"
+        ranked = None
+        if not globalstats:
+            ranked = self.ranks.ranked(ctx.guild, self.db.get_conf(ctx.guild), "lb", formatter.get_stat_key(stat))
         pages = await asyncio.to_thread(
             formatter.get_leaderboard,
             bot=self.bot,
@@ -86,6 +90,7 @@ class Stars(MixinMeta):
             member=ctx.author,
             use_displayname=displayname,
             color=await self.bot.get_embed_color(ctx),
+            ranked=ranked,
         )
         if isinstance(pages, str):
             return await ctx.send(pages)
@@ -78,6 +78,9 @@ class User(MixinMeta):
         `displayname` - Use display names instead of usernames
         """
         stat = stat.lower()
+        ranked = None
+        if not globalstats:
+            ranked = self.ranks.ranked(ctx.guild, self.db.get_conf(ctx.guild), "lb", formatter.get_stat_key(stat))
         pages = await asyncio.to_thread(
             formatter.get_leaderboard,
             bot=self.bot,
@@ -89,6 +92,7 @@ class User(MixinMeta):
             member=ctx.author,
             use_displayname=displayname,
             color=await self.bot.get_embed_color(ctx),
+            ranked=ranked,
         )
         if isinstance(pages, str):
             return await ctx.send(pages)
@@ -265,6 +269,7 @@ class User(MixinMeta):
         profile.level = new_level
         profile.xp = new_xp
         profile.prestige = next_prestige
+        self.ranks.update(ctx.guild, conf, ctx.author.id)
         self.save()
 
         txt = _("You have reached Prestige {}!\n").format(f"**{next_prestige}**")
@@ -333,14 +338,6 @@ class User(MixinMeta):
                         file = discord.File(str(path), filename=path.name)
                         break
 
-        if self.db.cache_seconds:
-            embed.add_field(
-                name=_("Cache Time"),
-                value=_("Profiles are cached for {} seconds, this is configured by the bot owner.").format(
-                    self.db.cache_seconds
-                ),
-            )
-
         embeds = [embed]
         if not conf.use_embeds:
             embeds += [
@@ -739,23 +736,15 @@ class User(MixinMeta):
         if profile.style in const.STATIC_FONT_STYLES:
             return await ctx.send(_("You cannot change your name color with the current profile style!"))
 
-        cached_txt = _("\n\nProfiles are cached for {} seconds so you may not see the change immediately").format(
-            self.db.cache_seconds
-        )
-
         if url and url == "random":
             profile.background = "random"
             self.save()
             txt = _("Your profile background has been set to random!")
-            if self.db.cache_seconds:
-                txt += cached_txt
             return await ctx.send(txt)
         if url and url == "default":
             profile.background = "default"
             self.save()
             txt = _("Your profile background has been set to default!")
-            if self.db.cache_seconds:
-                txt += cached_txt
             return await ctx.send(txt)
 
         attachments = utils.get_attachments(ctx)
@@ -768,8 +757,6 @@ class User(MixinMeta):
                 profile.background = "default"
                 self.save()
                 txt = _("Your background has been reset to default!")
-                if self.db.cache_seconds:
-                    txt += cached_txt
                 return await ctx.send(txt)
 
         if url is None:
@@ -789,8 +776,6 @@ class User(MixinMeta):
                 return await ctx.send(_("That image is not a valid profile background!\n{}").format(str(e)))
             self.save()
             txt = _("Your profile background has been set!")
-            if self.db.cache_seconds:
-                txt += cached_txt
             return await ctx.send(txt)
 
         if url.startswith("http"):
@@ -824,8 +809,6 @@ class User(MixinMeta):
                 return await ctx.send(_("That image is not a valid profile background!\n{}").format(str(e)))
             self.save()
             txt = _("Your profile background has been set!")
-            if self.db.cache_seconds:
-                txt += cached_txt
             return await ctx.send(txt)
 
         # Check if the user provided a filename
@@ -839,8 +822,6 @@ class User(MixinMeta):
         profile.background = path.stem
         self.save()
         txt = _("Your profile background has been set to {}").format(f"`{path.name}`")
-        if self.db.cache_seconds:
-            txt += cached_txt
         await ctx.send(txt, file=file)
 
     @set_profile.command(name="font")
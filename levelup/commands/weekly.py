@@ -27,6 +27,7 @@ class Weekly(MixinMeta):
             txt = _("Weekly stats are not enabled on this server")
             return await ctx.send(txt)
         stat = stat.lower()
+        ranked = self.ranks.ranked(ctx.guild, conf, "weekly", formatter.get_stat_key(stat))
         pages = await asyncio.to_thread(
             formatter.get_leaderboard,
             bot=self.bot,
@@ -38,6 +39,7 @@ class Weekly(MixinMeta):
             member=ctx.author,
             use_displayname=displayname,
             color=await self.bot.get_embed_color(ctx),
+            ranked=ranked,
         )
         if isinstance(pages, str):
             return await ctx.send(pages)
@@ -14,51 +14,16 @@ from ..common.models import DB, GuildSettings, Profile, ProfileWeekly, WeeklySet
 _ = Translator("LevelUp", __file__)
 
 
-def get_user_position(
-    guild: discord.Guild,
-    conf: GuildSettings,
-    lbtype: t.Literal["lb", "weekly"],
-    target_user: int,
-    key: str,
-) -> dict:
-    """Get the position of a user in the leaderboard
-
-    Args:
-        lb (t.Dict[int, t.Union[Profile, ProfileWeekly]]): The leaderboard
-        target_user (int): The user's ID
-        key (str): The key to sort by
-
-    Returns:
-        int: The user's position
-    """
-    if lbtype == "weekly":
-        lb: t.Dict[int, ProfileWeekly] = conf.users_weekly
-    elif not conf.prestigedata:
-        lb: t.Dict[int, Profile] = conf.users
-    else:
-        lb: t.Dict[int, Profile] = {}
-        for user_id in list(conf.users.keys()):
-            profile = (
-                conf.users[user_id].model_copy()
-                if hasattr(conf.users[user_id], "model_copy")
-                else conf.users[user_id].copy()
-            )
-            if profile.prestige and conf.prestigelevel:
-                profile.xp += profile.prestige * conf.algorithm.get_xp(conf.prestigelevel)
-                profile.level += profile.prestige * conf.prestigelevel
-            lb[user_id] = profile
-
-    valid_users = {k: v for k, v in lb.items() if guild.get_member(k)}
-    sorted_users = sorted(valid_users.items(), key=lambda x: getattr(x[1], key), reverse=True)
-    for idx, (uid, _) in enumerate(sorted_users):
-        if uid == target_user:
-            position = idx + 1
-            break
-    else:
-        position = -1
-    total = sum([getattr(x[1], key) for x in sorted_users])
-    percent = getattr(lb[target_user], key) / total * 100 if total else 0
-    return {"position": position, "total": total, "percent": percent}
+def get_stat_key(stat: str) -> str:
+    """Map a leaderboard stat argument to the profile attribute it sorts by"""
+    stat = stat.lower()
+    if "v" in stat:
+        return "voice"
+    if "m" in stat:
+        return "messages"
+    if "s" in stat:
+        return "stars"
+    return "xp"
 
 
 def get_role_leaderboard(rolegroups: t.Dict[int, float], color: discord.Color) -> t.List[discord.Embed]:
@@ -109,6 +74,7 @@ def get_leaderboard(
     dashboard: bool = False,
     color: discord.Color = discord.Color.random(),
     query: str = None,
+    ranked: t.Optional[t.List[t.Tuple[int, float]]] = None,
 ) -> t.Union[t.List[discord.Embed], t.Dict[str, t.Any], str]:
     """Format and return the leaderboard
 
@@ -123,6 +89,8 @@ def get_leaderboard(
         use_displayname (bool, optional): If false, uses username. Defaults to True.
         dashboard (bool, optional): True when called by the dashboard integration. Defaults to False.
         color (discord.Color, optional): Defaults to discord.Color.random().
+        ranked (t.List[t.Tuple[int, float]], optional): Pre-sorted (user_id, value) pairs from the RankIndex.
+            Skips building and sorting the leaderboard when provided for a guild leaderboard.
 
     Returns:
         t.Union[t.List[discord.Embed], t.Dict[str, t.Any], str]: If called from dashboard returns a dict, else returns a list of embeds or a string
@@ -130,9 +98,13 @@ def get_leaderboard(
     stat = stat.lower()
     color = member.color if member else color
     conf = db.get_conf(guild)
-    lb: t.Dict[int, t.Union[Profile, ProfileWeekly]]
+    lb: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {}
     weekly: WeeklySettings = None
-    if lbtype == "weekly":
+    if ranked is not None and not is_global:
+        title = _("Weekly ") if lbtype == "weekly" else _("LevelUp ")
+        if lbtype == "weekly":
+            weekly = conf.weeklysettings
+    elif lbtype == "weekly":
         title = _("Weekly ")
         lb = db.get_conf(guild).users_weekly
         weekly = db.get_conf(guild).weeklysettings
@@ -189,26 +161,44 @@ def get_leaderboard(
         emoji = conf.emojis.get("bulb", bot)
         statname = _("Experience")
 
-    if is_global:
-        valid_users: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {k: v for k, v in lb.items() if bot.get_user(k)}
+    # (user_id, value, level) sorted by value
+    sorted_users: t.List[t.Tuple[int, float, int]]
+    if ranked is not None and not is_global:
+        sorted_users = []
+        for user_id, value in ranked:
+            profile = conf.users_weekly.get(user_id) if lbtype == "weekly" else conf.users.get(user_id)
+            level = getattr(profile, "level", 0)
+            if (
+                key == "xp"
+                and lbtype != "weekly"
+                and profile
+                and profile.prestige
+                and conf.prestigelevel
+                and conf.prestigedata
+            ):
+                level += profile.prestige * conf.prestigelevel
+            sorted_users.append((user_id, value, level))
     else:
-        valid_users: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {k: v for k, v in lb.items() if guild.get_member(k)}
+        if is_global:
+            valid_users: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {k: v for k, v in lb.items() if bot.get_user(k)}
+        else:
+            valid_users: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {
+                k: v for k, v in lb.items() if guild.get_member(k)
+            }
+        filtered_users = [(k, getattr(v, key), getattr(v, "level", 0)) for k, v in valid_users.items()]
+        sorted_users = sorted([x for x in filtered_users if x[1] > 0], key=lambda x: x[1], reverse=True)
 
-    filtered_users: t.Dict[int, t.Union[Profile, ProfileWeekly]] = {
-        k: v for k, v in valid_users.items() if getattr(v, key) > 0
-    }
-    if not filtered_users and not dashboard:
+    if not sorted_users and not dashboard:
         txt = _("There is no data for the {} leaderboard yet").format(
             _("weekly {}").format(statname) if lbtype == "weekly" else statname
         )
         return txt
 
-    sorted_users = sorted(filtered_users.items(), key=lambda x: getattr(x[1], key), reverse=True)
     usercount = len(sorted_users)
     func = utils.humanize_delta if "v" in stat else humanize_number
-    total: str = func(round(sum([getattr(x, key) for x in filtered_users.values()])))
+    total: str = func(round(sum([x[1] for x in sorted_users])))
 
-    for idx, (user_id, stats) in enumerate(sorted_users):
+    for idx, (user_id, _value, _level) in enumerate(sorted_users):
         if member and user_id == member.id:
             you = _(" | You: {}").format(f"{idx + 1}/{len(sorted_users)}")
             break
@@ -254,7 +244,7 @@ def get_leaderboard(
             "user_position": you,
             "stats": [],
         }
-        for idx, (user_id, stats) in enumerate(sorted_users):
+        for idx, (user_id, value, level) in enumerate(sorted_users):
             user_obj = bot.get_user(user_id) if is_global else guild.get_member(user_id)
             user = (user_obj.display_name if use_displayname else user_obj.name) if user_obj else user_id
             if query:
@@ -273,12 +263,12 @@ def get_leaderboard(
                         continue
             place = idx + 1
             if key == "voice":
-                stat = utils.humanize_delta(round(getattr(stats, key)))
+                stat = utils.humanize_delta(round(value))
             else:
-                stat = utils.abbreviate_number(round(getattr(stats, key)))
+                stat = utils.abbreviate_number(round(value))
 
                 if key == "xp" and lbtype != "weekly" and not is_global:
-                    stat += f" 🎖{stats.level}"
+                    stat += f" 🎖{level}"
 
             entry = {"position": place, "name": user, "id": user_id, "stat": stat}
             payload["stats"].append(entry)
@@ -292,16 +282,16 @@ def get_leaderboard(
         stop = min(usercount, stop)
         buffer = StringIO()
         for i in range(start, stop):
-            user_id, stats = sorted_users[i]
+            user_id, value, level = sorted_users[i]
             user_obj = bot.get_user(user_id) if is_global else guild.get_member(user_id)
             name = (user_obj.display_name if use_displayname else user_obj.name) if user_obj else user_id
             place = i + 1
             if key == "voice":
-                stat = utils.humanize_delta(round(getattr(stats, key)))
+                stat = utils.humanize_delta(round(value))
             else:
-                stat = utils.abbreviate_number(round(getattr(stats, key)))
+                stat = utils.abbreviate_number(round(value))
                 if key == "xp" and lbtype != "weekly" and not is_global:
-                    stat += f" 🎖{stats.level}"
+                    stat += f" 🎖{level}"
 
             buffer.write(f"**{place}**. {name} (`{stat}`)\n")
 
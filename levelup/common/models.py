@@ -11,7 +11,7 @@ from uuid import uuid4
 
 import discord
 import orjson
-from pydantic import VERSION, BaseModel, Field
+from pydantic import VERSION, BaseModel, Field, PrivateAttr
 from redbot.core.bot import Red
 
 from .utils import get_twemoji
@@ -82,25 +82,34 @@ class Base(BaseModel):
 
     def to_file(self, path: Path, pretty: bool = False) -> None:
         dump = self.dumpjson(exclude_defaults=True, pretty=pretty)
-        # We want to write the file as safely as possible
-        # https://github.com/Cog-Creators/Red-DiscordBot/blob/V3/develop/redbot/core/_drivers/json.py#L224
-        tmp_file = f"{path.stem}-{uuid4().fields[0]}.tmp"
-        tmp_path = path.parent / tmp_file
-        with tmp_path.open(encoding="utf-8", mode="w") as fs:
-            fs.write(dump)
-            fs.flush()  # This does get closed on context exit, ...
-            os.fsync(fs.fileno())  # but that needs to happen prior to this line
-
-        # Replace the original file with the new content
-        tmp_path.replace(path)
-
-        # Ensure directory fsync for better durability
-        if hasattr(os, "O_DIRECTORY"):
-            fd = os.open(path.parent, os.O_DIRECTORY)
-            try:
-                os.fsync(fd)
-            finally:
-                os.close(fd)
+        atomic_write(path, dump)
+
+
+def atomic_write(path: Path, text: str, sync_dir: bool = True) -> None:
+    """Write text to a file as safely as possible"""
+    # https://github.com/Cog-Creators/Red-DiscordBot/blob/V3/develop/redbot/core/_drivers/json.py#L224
+    tmp_file = f"{path.stem}-{uuid4().fields[0]}.tmp"
+    tmp_path = path.parent / tmp_file
+    with tmp_path.open(encoding="utf-8", mode="w") as fs:
+        fs.write(text)
+        fs.flush()  # This does get closed on context exit, ...
+        os.fsync(fs.fileno())  # but that needs to happen prior to this line
+
+    # Replace the original file with the new content
+    tmp_path.replace(path)
+
+    # Ensure directory fsync for better durability
+    if sync_dir:
+        fsync_dir(path.parent)
+
+
+def fsync_dir(path: Path) -> None:
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(path, os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
 
 class VoiceTracking(Base):
@@ -370,20 +379,30 @@ class GuildSettings(Base):
 class DB(Base):
     configs: t.Dict[int, GuildSettings] = {}
     ignored_guilds: t.List[int] = []
-    cache_seconds: int = 0  # How long generated profile images should be cached, 0 to disable
+    render_cache_mb: int = 32  # Memory budget for rendered profile images, keyed by their inputs. 0 to disable
     render_gifs: bool = False  # Whether to render profiles as gifs
     force_embeds: bool = False  # Globally force embeds for leveling
     external_api_url: str = ""  # If specified, uses external API for image generation
     managed_api: bool = False  # If True, cog manages a local uvicorn API process
     managed_api_port: int = 6789  # Port for the managed local API
     managed_api_workers: int = 0  # Number of uvicorn workers (0 = auto: cpu_count // 2)
+    render_workers: int = 0  # Persistent render worker processes (0 = auto: cpu_count // 2, -1 = disabled)
+    render_timeout: int = 30  # Seconds a render job may take before its worker is recycled
     auto_cleanup: bool = False  # If True, will clean up configs of old guilds
     ignore_bots: bool = True  # Ignore bots completely
 
+    # Guilds whose config was handed out since the last flush, see common/storage.py
+    _dirty: t.Set[int] = PrivateAttr(default_factory=set)
+
     def get_conf(self, guild: t.Union[discord.Guild, int]) -> GuildSettings:
         gid = guild if isinstance(guild, int) else guild.id
+        self._dirty.add(gid)
         return self.configs.setdefault(gid, GuildSettings())
 
+    def mark_dirty(self, *guild_ids: int) -> None:
+        """Flag guild configs that were modified without going through get_conf"""
+        self._dirty.update(guild_ids)
+
 
 def run_migrations(settings: t.Dict[str, t.Any]) -> DB:
     """Sanitize old config data to be validated by the new schema"""
@@ -0,0 +1,249 @@
+"""
+Incrementally maintained leaderboard rankings.
+
+Each guild gets one `RankedList` per (leaderboard type, stat) that has been queried. The lists only
+hold current members of the guild, are built once on first use and then kept in sync by the XP,
+voice and star listeners, so profile positions and leaderboard pages no longer copy, filter and
+sort every profile on each call.
+
+Bulk changes (resets, imports, algorithm or prestige changes) either swap out the underlying
+dicts/settings, which is detected automatically, or call `RankIndex.invalidate` so the guild is
+rebuilt on its next query.
+"""
+
+import typing as t
+from bisect import bisect_left, insort
+
+import discord
+
+from .models import GuildSettings, Profile, ProfileWeekly
+
+LBType = t.Literal["lb", "weekly"]
+StatKey = t.Literal["xp", "messages", "voice", "stars"]
+
+
+class RankedList:
+    """Bucketed sorted list of (-value, user_id) with a user_id -> value lookup
+
+    Items live in sorted buckets of roughly `LOAD` entries with a parallel list of bucket maximums,
+    so inserts/removals are a bisect plus a small list shift, and rank lookups only sum bucket lengths.
+    """
+
+    LOAD = 512
+
+    def __init__(self, values: t.Dict[int, float]):
+        self.values: t.Dict[int, float] = dict(values)
+        self.total: float = sum(self.values.values())
+        items = sorted((-v, uid) for uid, v in self.values.items())
+        self._buckets: t.List[t.List[t.Tuple[float, int]]] = [
+            items[i : i + self.LOAD] for i in range(0, len(items), self.LOAD)
+        ]
+        self._maxes: t.List[t.Tuple[float, int]] = [b[-1] for b in self._buckets]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.values
+
+    def _insert(self, item: t.Tuple[float, int]) -> None:
+        if not self._buckets:
+            self._buckets.append([item])
+            self._maxes.append(item)
+            return
+        idx = bisect_left(self._maxes, item)
+        if idx == len(self._maxes):
+            idx -= 1
+            self._buckets[idx].append(item)
+            self._maxes[idx] = item
+        else:
+            insort(self._buckets[idx], item)
+        bucket = self._buckets[idx]
+        if len(bucket) > self.LOAD * 2:
+            half = bucket[self.LOAD :]
+            del bucket[self.LOAD :]
+            self._buckets.insert(idx + 1, half)
+            self._maxes[idx] = bucket[-1]
+            self._maxes.insert(idx + 1, half[-1])
+
+    def _remove(self, item: t.Tuple[float, int]) -> None:
+        idx = bisect_left(self._maxes, item)
+        bucket = self._buckets[idx]
+        del bucket[bisect_left(bucket, item)]
+        if bucket:
+            self._maxes[idx] = bucket[-1]
+        else:
+            del self._buckets[idx]
+            del self._maxes[idx]
+
+    def upsert(self, user_id: int, value: float) -> None:
+        old = self.values.get(user_id)
+        if old == value:
+            return
+        if old is not None:
+            self._remove((-old, user_id))
+            self.total -= old
+        self.values[user_id] = value
+        self.total += value
+        self._insert((-value, user_id))
+
+    def discard(self, user_id: int) -> None:
+        old = self.values.pop(user_id, None)
+        if old is None:
+            return
+        self._remove((-old, user_id))
+        self.total -= old
+
+    def position(self, user_id: int) -> int:
+        """1-based rank of a user, or -1 if they aren't ranked"""
+        value = self.values.get(user_id)
+        if value is None:
+            return -1
+        item = (-value, user_id)
+        idx = bisect_left(self._maxes, item)
+        before = sum(len(b) for b in self._buckets[:idx])
+        return before + bisect_left(self._buckets[idx], item) + 1
+
+    def positive_count(self) -> int:
+        """Number of users with a value above zero"""
+        idx = bisect_left(self._maxes, (0, -1))
+        before = sum(len(b) for b in self._buckets[:idx])
+        if idx == len(self._buckets):
+            return before
+        return before + bisect_left(self._buckets[idx], (0, -1))
+
+    def page(self, start: int, stop: int) -> t.List[t.Tuple[int, float]]:
+        """(user_id, value) pairs for ranks start+1 through stop, highest first"""
+        result: t.List[t.Tuple[int, float]] = []
+        offset = 0
+        for bucket in self._buckets:
+            if offset + len(bucket) <= start:
+                offset += len(bucket)
+                continue
+            for neg_value, uid in bucket[max(0, start - offset) :]:
+                if len(result) >= stop - start:
+                    return result
+                result.append((uid, -neg_value))
+            offset += len(bucket)
+            if len(result) >= stop - start:
+                break
+        return result
+
+
+class GuildRanks:
+    def __init__(self, signature: tuple, conf: GuildSettings):
+        self.signature = signature
+        # Hold on to the objects whose ids are in the signature so those ids can't be reused
+        self.refs = (conf, conf.users, conf.users_weekly)
+        self.boards: t.Dict[t.Tuple[LBType, StatKey], RankedList] = {}
+
+
+def get_value(conf: GuildSettings, lbtype: LBType, key: StatKey, user_id: int) -> t.Optional[float]:
+    """The value a user is ranked by, including prestige XP on the main leaderboard"""
+    source: t.Dict[int, t.Union[Profile, ProfileWeekly]] = conf.users_weekly if lbtype == "weekly" else conf.users
+    profile = source.get(user_id)
+    if profile is None:
+        return None
+    value = getattr(profile, key)
+    if lbtype == "lb" and key == "xp" and profile.prestige and conf.prestigelevel and conf.prestigedata:
+        value += profile.prestige * conf.algorithm.get_xp(conf.prestigelevel)
+    return value
+
+
+class RankIndex:
+    """Per-guild leaderboard rankings, shared by the profile, leaderboard and dashboard code
+
+    Not thread safe, only use it from the event loop.
+    """
+
+    def __init__(self):
+        self._guilds: t.Dict[int, GuildRanks] = {}
+
+    @staticmethod
+    def _signature(conf: GuildSettings) -> tuple:
+        # Anything that changes every user's ranked value at once
+        return (
+            id(conf),
+            id(conf.users),
+            id(conf.users_weekly),
+            conf.prestigelevel,
+            bool(conf.prestigedata),
+            conf.algorithm.base,
+            conf.algorithm.exp,
+        )
+
+    def invalidate(self, guild_id: t.Optional[int] = None) -> None:
+        """Drop rankings so they get rebuilt on next use"""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def _guild(self, guild: discord.Guild, conf: GuildSettings) -> GuildRanks:
+        signature = self._signature(conf)
+        ranks = self._guilds.get(guild.id)
+        if ranks is None or ranks.signature != signature:
+            ranks = self._guilds[guild.id] = GuildRanks(signature, conf)
+        return ranks
+
+    def board(self, guild: discord.Guild, conf: GuildSettings, lbtype: LBType, key: StatKey) -> RankedList:
+        lbtype = "weekly" if lbtype == "weekly" else "lb"
+        ranks = self._guild(guild, conf)
+        if (lbtype, key) not in ranks.boards:
+            source = conf.users_weekly if lbtype == "weekly" else conf.users
+            values = {uid: get_value(conf, lbtype, key, uid) for uid in source if guild.get_member(uid)}
+            ranks.boards[(lbtype, key)] = RankedList(values)
+        return ranks.boards[(lbtype, key)]
+
+    def update(self, guild: discord.Guild, conf: GuildSettings, user_id: int) -> None:
+        """Re-rank a user on every leaderboard built for their guild"""
+        ranks = self._guilds.get(guild.id)
+        if ranks is None:
+            return
+        if ranks.signature != self._signature(conf):
+            self.invalidate(guild.id)
+            return
+        is_member = guild.get_member(user_id) is not None
+        for (lbtype, key), board in ranks.boards.items():
+            value = get_value(conf, lbtype, key, user_id) if is_member else None
+            if value is None:
+                board.discard(user_id)
+            else:
+                board.upsert(user_id, value)
+
+    def remove(self, guild_id: int, user_id: int) -> None:
+        """Drop a user from a guild's rankings, e.g. when they leave"""
+        if ranks := self._guilds.get(guild_id):
+            for board in ranks.boards.values():
+                board.discard(user_id)
+
+    def get_position(
+        self,
+        guild: discord.Guild,
+        conf: GuildSettings,
+        lbtype: LBType,
+        target_user: int,
+        key: StatKey,
+    ) -> dict:
+        """Get the position of a user in the leaderboard
+
+        Returns:
+            dict: position (1-based, -1 if unranked), total of the stat and the user's percent of it
+        """
+        board = self.board(guild, conf, lbtype, key)
+        # Cheap to do, and picks up profiles created on read paths (e.g. a first profile view)
+        self.update(guild, conf, target_user)
+        value = board.values.get(target_user, 0)
+        total = board.total
+        return {
+            "position": board.position(target_user),
+            "total": total,
+            "percent": value / total * 100 if total else 0,
+        }
+
+    def ranked(
+        self, guild: discord.Guild, conf: GuildSettings, lbtype: LBType, key: StatKey
+    ) -> t.List[t.Tuple[int, float]]:
+        """All members with a value above zero as (user_id, value), highest first"""
+        board = self.board(guild, conf, lbtype, key)
+        return board.page(0, board.positive_count())
@@ -0,0 +1,74 @@
+"""
+Content-addressed cache for rendered profile cards.
+
+Entries are keyed by a hash of everything that goes into a render (stats, rank, avatar URL,
+background, font, style, colors...), so an unchanged profile is served from cache no matter how
+old the entry is, and any change to the inputs produces a new key and an immediate re-render.
+The cache is a byte-budgeted LRU, least recently used cards are evicted first.
+"""
+
+import hashlib
+import typing as t
+from collections import OrderedDict
+
+import orjson
+
+
+def make_key(request_data: t.Dict[str, t.Any], **extras: t.Any) -> str:
+    """Hash render inputs into a cache key
+
+    Base64 asset payloads are left out of the hash since they are either derived from another input
+    (e.g. a background setting passed via `extras`) or too large to be worth hashing on every view.
+    """
+    inputs = {k: v for k, v in request_data.items() if not k.endswith("_b64")}
+    inputs.update(extras)
+    dump = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(dump, digest_size=16).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size: int = 0
+        self._entries: OrderedDict[str, t.Tuple[bytes, str]] = OrderedDict()
+
+        # Metrics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Optional[t.Tuple[bytes, str]]:
+        """Get cached (image_bytes, filename), marking the entry as recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, img_bytes: bytes, filename: str) -> None:
+        if len(img_bytes) > self.max_bytes:
+            return
+        if old := self._entries.pop(key, None):
+            self.size -= len(old[0])
+        self._entries[key] = (img_bytes, filename)
+        self.size += len(img_bytes)
+        self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._entries:
+            _key, (img_bytes, _filename) = self._entries.popitem(last=False)
+            self.size -= len(img_bytes)
+            self.evictions += 1
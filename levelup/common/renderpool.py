@@ -0,0 +1,203 @@
+"""
+Persistent pool of pre-warmed image render workers.
+
+Each worker is a long-lived `profile_runner.py --worker` process that has already imported
+Pillow, the fonts and every profile style. Jobs are ProfileRequest/LevelUpRequest payloads sent
+over the worker's stdin, and the ImageResponse header plus raw image bytes come back over stdout,
+so no temp files or interpreter start-up are paid per image.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import sys
+import typing as t
+from pathlib import Path
+
+from ..generator.schemas import ImageResponse
+
+log = logging.getLogger("red.vrt.levelup.renderpool")
+
+RUNNER_PATH = Path(__file__).parent.parent / "generator" / "profile_runner.py"
+FRAME_HEADER = struct.Struct(">I")
+# Workers are recycled after this many jobs to keep Pillow's memory fragmentation in check
+MAX_JOBS_PER_WORKER = 500
+# How long a fresh worker gets to import everything and report ready
+STARTUP_TIMEOUT = 60
+
+
+class WorkerError(Exception):
+    """Raised when a worker dies or breaks protocol mid-job"""
+
+
+class RenderWorker:
+    """A single persistent render process"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.proc: t.Optional[asyncio.subprocess.Process] = None
+        self.jobs: int = 0
+        self._stderr_task: t.Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(RUNNER_PATH),
+            "--worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self.jobs = 0
+        self._stderr_task = asyncio.create_task(self._relay_stderr(self.proc))
+        try:
+            ready = await asyncio.wait_for(self._read_json(), timeout=STARTUP_TIMEOUT)
+        except Exception:
+            await self.kill()
+            raise
+        if not ready.get("ready"):
+            await self.kill()
+            raise WorkerError(f"Render worker {self.index} sent an invalid handshake: {ready}")
+        log.debug(f"Render worker {self.index} ready (PID {self.proc.pid})")
+
+    async def kill(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                log.warning(f"Render worker {self.index} (PID {proc.pid}) did not exit after kill")
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
+    async def stop(self) -> None:
+        """Close stdin so the worker exits its loop cleanly, killing it if it doesn't"""
+        if not self.alive:
+            await self.kill()
+            return
+        try:
+            self.proc.stdin.close()
+            await asyncio.wait_for(self.proc.wait(), timeout=5)
+        except (asyncio.TimeoutError, ConnectionError, OSError):
+            pass
+        await self.kill()
+
+    async def render(self, request_data: dict) -> t.Tuple[bytes, ImageResponse]:
+        if not self.alive:
+            raise WorkerError(f"Render worker {self.index} is not running")
+        payload = json.dumps(request_data).encode("utf-8")
+        try:
+            self.proc.stdin.write(FRAME_HEADER.pack(len(payload)) + payload)
+            await self.proc.stdin.drain()
+            header = await self._read_json()
+            img_bytes = await self._read_frame()
+        except (asyncio.IncompleteReadError, ConnectionError, BrokenPipeError) as e:
+            raise WorkerError(f"Render worker {self.index} died mid-job: {e}") from e
+        self.jobs += 1
+        return img_bytes, ImageResponse.model_validate(header)
+
+    async def _read_frame(self) -> bytes:
+        header = await self.proc.stdout.readexactly(FRAME_HEADER.size)
+        (size,) = FRAME_HEADER.unpack(header)
+        return await self.proc.stdout.readexactly(size)
+
+    async def _read_json(self) -> dict:
+        return json.loads(await self._read_frame())
+
+    async def _relay_stderr(self, proc: asyncio.subprocess.Process) -> None:
+        while line := await proc.stderr.readline():
+            text = line.decode(errors="replace").rstrip()
+            if text:
+                log.warning(f"Render worker {self.index}: {text}")
+
+
+class RenderPool:
+    """Fixed-size pool of persistent render workers
+
+    Workers are handed out through an idle queue so at most `size` jobs run at once.
+    A worker that times out, crashes or breaks protocol is killed and lazily respawned
+    on its next job, and every worker is recycled after `MAX_JOBS_PER_WORKER` jobs.
+    """
+
+    def __init__(self, size: int, timeout: float):
+        self.size = size
+        self.timeout = timeout
+        self.workers: t.List[RenderWorker] = [RenderWorker(i) for i in range(size)]
+        self._idle: asyncio.Queue[RenderWorker] = asyncio.Queue()
+        self._closed = False
+
+        # Metrics
+        self.completed: int = 0
+        self.failed: int = 0
+        self.timeouts: int = 0
+        self.restarts: int = 0
+
+    @property
+    def busy(self) -> int:
+        return self.size - self._idle.qsize()
+
+    async def start(self) -> None:
+        results = await asyncio.gather(*(w.start() for w in self.workers), return_exceptions=True)
+        for worker, res in zip(self.workers, results):
+            if isinstance(res, Exception):
+                log.error(f"Render worker {worker.index} failed to start, will retry on first job", exc_info=res)
+            self._idle.put_nowait(worker)
+        started = len([w for w in self.workers if w.alive])
+        log.info(f"Render pool started with {started}/{self.size} workers")
+
+    async def close(self) -> None:
+        self._closed = True
+        await asyncio.gather(*(w.stop() for w in self.workers), return_exceptions=True)
+
+    async def submit(self, request_data: dict) -> t.Tuple[t.Optional[bytes], t.Optional[ImageResponse]]:
+        """Render an image on the next idle worker
+
+        Returns:
+            Tuple of (image_bytes, response) or (None, None) if the job failed
+        """
+        if self._closed:
+            return None, None
+        worker = await self._idle.get()
+        clean = False
+        try:
+            if not worker.alive:
+                self.restarts += 1
+                await worker.start()
+            img_bytes, response = await asyncio.wait_for(worker.render(request_data), timeout=self.timeout)
+            clean = True
+            if not response.success:
+                self.failed += 1
+                log.error(f"Render worker {worker.index} failed to generate image: {response.error}")
+                return None, None
+            self.completed += 1
+            return img_bytes, response
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            log.error(f"Render worker {worker.index} timed out after {self.timeout}s, recycling it")
+            return None, None
+        except Exception as e:
+            self.failed += 1
+            log.error(f"Render worker {worker.index} crashed, recycling it", exc_info=e)
+            return None, None
+        finally:
+            # A worker interrupted mid-job has unread output in its pipe, so it can't be reused
+            if not clean or worker.jobs >= MAX_JOBS_PER_WORKER:
+                await worker.kill()
+            self._idle.put_nowait(worker)
+
+
+def default_pool_size() -> int:
+    return max(1, (os.cpu_count() or 4) // 2)
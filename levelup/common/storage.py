@@ -0,0 +1,119 @@
+"""
+Sharded persistence for the LevelUp DB.
+
+Instead of re-serializing every guild into one settings file on each save, the global settings
+and each guild's config live in their own files:
+
+    storage/
+        global.json        DB fields other than `configs`
+        guilds/<id>.json   one GuildSettings per guild
+
+A flush only rewrites the guilds that were touched since the last one. A guild counts as touched
+when its config was fetched through `DB.get_conf`, flagged with `DB.mark_dirty`, or swapped for a
+different GuildSettings object. Replacing the whole DB (resets/restores) rewrites every shard, and
+guilds removed from `configs` have their shard deleted.
+"""
+
+import logging
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+from .models import DB, GuildSettings, atomic_write, fsync_dir
+
+log = logging.getLogger("red.vrt.levelup.storage")
+
+
+@dataclass
+class Changeset:
+    """Snapshot of what needs writing, collected on the event loop before handing off to a thread"""
+
+    db: DB
+    guilds: t.Dict[int, GuildSettings] = field(default_factory=dict)
+    removed: t.Set[int] = field(default_factory=set)
+
+
+class ShardedStorage:
+    def __init__(self, root: Path):
+        self.root = root
+        self.guilds_dir = root / "guilds"
+        self.global_file = root / "global.json"
+
+        # The DB instance and per-guild objects that were last written to disk
+        self._db: t.Optional[DB] = None
+        self._written: t.Dict[int, GuildSettings] = {}
+
+    def exists(self) -> bool:
+        return self.global_file.exists()
+
+    def load(self) -> DB:
+        """Load the global settings and every guild shard"""
+        start = perf_counter()
+        db: DB = DB.loadjson(self.global_file.read_text(encoding="utf-8"))
+        configs: t.Dict[int, GuildSettings] = {}
+        if self.guilds_dir.exists():
+            for path in self.guilds_dir.glob("*.json"):
+                if not path.stem.isdigit():
+                    continue
+                try:
+                    configs[int(path.stem)] = GuildSettings.loadjson(path.read_text(encoding="utf-8"))
+                except Exception as e:
+                    # Refuse to load partially, a save would otherwise wipe this guild
+                    raise ValueError(f"Failed to load guild shard {path.name}") from e
+        db.configs = configs
+        self._db = db
+        self._written = dict(configs)
+        log.debug(f"Loaded {len(configs)} guild shards in {(perf_counter() - start) * 1000:.1f}ms")
+        return db
+
+    def collect(self, db: DB) -> Changeset:
+        """Gather the guilds that need writing. Must be called from the event loop thread."""
+        changes = Changeset(db=db)
+        if db is not self._db:
+            # Brand new DB (first save, migration, reset or restore), everything is dirty
+            changes.guilds = dict(db.configs)
+            changes.removed = set(self._written) - set(db.configs)
+            if not self._written and self.guilds_dir.exists():
+                existing = {int(p.stem) for p in self.guilds_dir.glob("*.json") if p.stem.isdigit()}
+                changes.removed = existing - set(db.configs)
+            db._dirty.clear()
+            return changes
+
+        dirty, db._dirty = db._dirty, set()
+        for gid, conf in db.configs.items():
+            if gid in dirty or self._written.get(gid) is not conf:
+                changes.guilds[gid] = conf
+        changes.removed = set(self._written) - set(db.configs)
+        return changes
+
+    def write(self, changes: Changeset) -> None:
+        """Write a changeset to disk, safe to run in a thread"""
+        self.guilds_dir.mkdir(parents=True, exist_ok=True)
+        for gid, conf in changes.guilds.items():
+            atomic_write(self.guilds_dir / f"{gid}.json", conf.dumpjson(exclude_defaults=True), sync_dir=False)
+        for gid in changes.removed:
+            (self.guilds_dir / f"{gid}.json").unlink(missing_ok=True)
+        if changes.guilds or changes.removed:
+            fsync_dir(self.guilds_dir)
+
+        # Global settings are tiny so they are always rewritten
+        atomic_write(self.global_file, changes.db.model_dump_json(exclude={"configs"}, exclude_defaults=True))
+
+        if changes.db is not self._db:
+            self._db = changes.db
+            self._written = {}
+        self._written.update(changes.guilds)
+        for gid in changes.removed:
+            self._written.pop(gid, None)
+
+    def flush(self, db: DB) -> t.Tuple[int, float]:
+        """Collect and write in one go, for use outside the event loop (migrations, tests)
+
+        Returns:
+            Tuple of (guilds written, seconds taken)
+        """
+        start = perf_counter()
+        changes = self.collect(db)
+        self.write(changes)
+        return len(changes.guilds), perf_counter() - start
@@ -41,6 +41,7 @@ async def get_dashboard_leaderboard(
                 "error_message": _("There is no data for the weekly leaderboard yet, please chat a bit first."),
             }
 
+    ranked = cog.ranks.ranked(guild, conf, lbtype, formatter.get_stat_key(stat))
     res: dict = await asyncio.to_thread(
         formatter.get_leaderboard,
         bot=cog.bot,
@@ -52,6 +53,7 @@ async def get_dashboard_leaderboard(
         member=guild.get_member(user.id),
         use_displayname=True,
         dashboard=True,
+        ranked=ranked,
     )
     try:
         query_params = LeaderboardQueryParams.model_validate(kwargs.get("extra_kwargs", {}))
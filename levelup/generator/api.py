@@ -14,19 +14,23 @@ Environment variables (.env file supported):
     LEVELUP_PORT=8888
     LEVELUP_HOST=0.0.0.0
     LEVELUP_LOG_DIR=/path/to/logs
+    LEVELUP_BATCH_MAX=200
 """
 
 import asyncio
 import base64
+import json
 import logging
 import os
+import struct
 import typing as t
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 # Determine if running as standalone service or imported by cog
 try:
@@ -135,6 +139,16 @@ class ImageResponse(BaseModel):
     format: str = "webp"
 
 
+class BatchRequest(BaseModel):
+    """Request model for batch image generation.
+
+    Each item is a ProfileRequest or LevelUpRequest payload with a `request_type` of "profile" (default) or "levelup".
+    """
+
+    requests: t.List[t.Dict[str, t.Any]]
+    concurrency: t.Optional[int] = None  # Max renders at once, defaults to the CPU count
+
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
@@ -167,28 +181,20 @@ def _resolve_font(font_name: t.Optional[str], font_b64: t.Optional[str] = None)
         if font_path.exists():
             return str(font_path)
 
-    # If font_b64 provided, write to temp file
+    # If font_b64 provided, write it to a content-addressed file so repeat requests reuse the cached font
     if font_b64:
         try:
-            import tempfile
-
-            font_bytes = base64.b64decode(font_b64)
-            fd, temp_path = tempfile.mkstemp(suffix=".ttf")
-            with os.fdopen(fd, "wb") as f:
-                f.write(font_bytes)
-            log.debug(f"Wrote custom font to temp file: {temp_path}")
-            return temp_path
+            font_path = imgtools.store_font(base64.b64decode(font_b64))
+            log.debug(f"Using custom font file: {font_path}")
+            return font_path
         except Exception as e:
             log.warning(f"Failed to decode font_b64: {e}")
 
     return None
 
 
-@app.post("/profile", response_model=ImageResponse)
-async def generate_profile(request: ProfileRequest) -> ImageResponse:
-    """Generate a profile image (new JSON API)."""
-    log.info(f"Generating {request.style} profile for {request.username}")
-
+async def _render_profile(request: ProfileRequest) -> t.Tuple[bytes, bool]:
+    """Fetch the assets for a profile request and render it in a thread."""
     # Fetch assets
     avatar_bytes = await asyncio.to_thread(_download_url, request.avatar_url)
     background_bytes = (
@@ -246,26 +252,11 @@ async def generate_profile(request: ProfileRequest) -> ImageResponse:
         "runescape": generate_runescape_profile,
     }
     generator = generators.get(request.style, generate_default_profile)
+    return await asyncio.to_thread(generator, **kwargs)
 
-    try:
-        img_bytes, animated = await asyncio.to_thread(generator, **kwargs)
-    except Exception as e:
-        log.exception(f"Profile generation failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
-    return ImageResponse(
-        b64=base64.b64encode(img_bytes).decode("utf-8"),
-        animated=animated,
-        format="gif" if animated else "webp",
-    )
-
-
-@app.post("/levelup", response_model=ImageResponse)
-async def generate_levelup_image(request: LevelUpRequest) -> ImageResponse:
-    """Generate a level-up alert image (new JSON API)."""
-    log.info(f"Generating level-up image for level {request.level}")
-
-    # Fetch assets
+async def _render_levelup(request: LevelUpRequest) -> t.Tuple[bytes, bool]:
+    """Fetch the assets for a level-up request and render it in a thread."""
     avatar_bytes = await asyncio.to_thread(_download_url, request.avatar_url)
     background_bytes = await asyncio.to_thread(_download_url, request.background_url)
 
@@ -284,8 +275,34 @@ async def generate_levelup_image(request: LevelUpRequest) -> ImageResponse:
     if font_path:
         kwargs["font_path"] = font_path
 
+    return await asyncio.to_thread(generate_level_img, **kwargs)
+
+
+@app.post("/profile", response_model=ImageResponse)
+async def generate_profile(request: ProfileRequest) -> ImageResponse:
+    """Generate a profile image (new JSON API)."""
+    log.info(f"Generating {request.style} profile for {request.username}")
+
     try:
-        img_bytes, animated = await asyncio.to_thread(generate_level_img, **kwargs)
+        img_bytes, animated = await _render_profile(request)
+    except Exception as e:
+        log.exception(f"Profile generation failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return ImageResponse(
+        b64=base64.b64encode(img_bytes).decode("utf-8"),
+        animated=animated,
+        format="gif" if animated else "webp",
+    )
+
+
+@app.post("/levelup", response_model=ImageResponse)
+async def generate_levelup_image(request: LevelUpRequest) -> ImageResponse:
+    """Generate a level-up alert image (new JSON API)."""
+    log.info(f"Generating level-up image for level {request.level}")
+
+    try:
+        img_bytes, animated = await _render_levelup(request)
     except Exception as e:
         log.exception(f"Level-up generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -297,6 +314,96 @@ async def generate_levelup_image(request: LevelUpRequest) -> ImageResponse:
     )
 
 
+# ============================================================================
+# Batch endpoint
+# ============================================================================
+#
+# The response body is a stream of length-prefixed frames (4 byte big-endian length, then the data),
+# the same framing the cog's render workers use. Each finished image produces two frames, in
+# completion order rather than request order:
+#   1. a JSON header: {"index": int, "success": bool, "animated": bool, "format": str, "size": int, "error": str|null}
+#   2. the raw image bytes (empty if the render failed)
+
+FRAME_HEADER = struct.Struct(">I")
+BATCH_MAX = int(os.environ.get("LEVELUP_BATCH_MAX", 200))
+BATCH_MEDIA_TYPE = "application/x-levelup-frames"
+
+
+def _frame(data: bytes) -> bytes:
+    return FRAME_HEADER.pack(len(data)) + data
+
+
+def _parse_batch_item(item: t.Dict[str, t.Any]) -> t.Union[ProfileRequest, LevelUpRequest, str]:
+    """Validate a batch item, returning the error text instead of raising so one bad item doesn't sink the batch"""
+    try:
+        if item.get("request_type", "profile") == "levelup":
+            return LevelUpRequest.model_validate(item)
+        return ProfileRequest.model_validate(item)
+    except ValidationError as e:
+        return str(e)
+
+
+async def _prefetch(requests: t.List[t.Union[ProfileRequest, LevelUpRequest, str]]) -> None:
+    """Download every distinct asset URL in a batch once, so renders read them from the download cache."""
+    urls = set()
+    for request in requests:
+        if isinstance(request, str):
+            continue
+        urls.update(getattr(request, f, None) for f in ("avatar_url", "background_url"))
+        if isinstance(request, ProfileRequest) and request.style != "runescape":
+            urls.update((request.prestige_emoji_url, request.role_icon_url))
+    urls.discard(None)
+    await asyncio.gather(*(asyncio.to_thread(_download_url, url) for url in urls))
+
+
+@app.post("/batch")
+async def generate_batch(batch: BatchRequest) -> StreamingResponse:
+    """Render many profile/level-up images in one request, streaming each image back as it finishes."""
+    if len(batch.requests) > BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"Batch size limited to {BATCH_MAX} requests")
+    requests = [_parse_batch_item(item) for item in batch.requests]
+
+    limit = os.cpu_count() or 1
+    if batch.concurrency:
+        limit = max(1, min(batch.concurrency, limit))
+    semaphore = asyncio.Semaphore(limit)
+    log.info(f"Generating batch of {len(requests)} images ({limit} at a time)")
+
+    async def _run(index: int, request: t.Union[ProfileRequest, LevelUpRequest, str]) -> t.Tuple[int, bytes, dict]:
+        if isinstance(request, str):
+            return index, b"", {"success": False, "error": request}
+        async with semaphore:
+            try:
+                if isinstance(request, LevelUpRequest):
+                    img_bytes, animated = await _render_levelup(request)
+                else:
+                    img_bytes, animated = await _render_profile(request)
+            except Exception as e:
+                log.exception(f"Batch item {index} failed: {e}")
+                return index, b"", {"success": False, "error": str(e)}
+        return index, img_bytes, {"success": True, "animated": animated, "format": "gif" if animated else "webp"}
+
+    async def _stream() -> t.AsyncIterator[bytes]:
+        await _prefetch(requests)
+        tasks = [asyncio.create_task(_run(i, r)) for i, r in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, img_bytes, result = await next_done
+                header = {"index": index, "animated": False, "format": "webp", "error": None, **result}
+                header["size"] = len(img_bytes)
+                yield _frame(json.dumps(header).encode()) + _frame(img_bytes)
+        finally:
+            # Client went away mid-stream, don't keep rendering for nobody
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        _stream(),
+        media_type=BATCH_MEDIA_TYPE,
+        headers={"X-Batch-Size": str(len(requests))},
+    )
+
+
 # ============================================================================
 # Legacy endpoints for backward compatibility with existing external deployments
 # ============================================================================
@@ -377,6 +484,12 @@ async def health():
     return {"status": "ok", "version": "2.0.0"}
 
 
+@app.get("/cache")
+async def cache_stats():
+    """Font, image and download cache stats for this worker process."""
+    return imgtools.cache_stats()
+
+
 # ============================================================================
 # CLI Entry Point for running as external service
 # ============================================================================
@@ -0,0 +1,88 @@
+"""
+Per-render latency with and without the process level asset caches.
+
+"Cold" clears every cache before each render, which is how every render behaved before the
+caches existed. "Warm" renders the same profile again, like repeat views or a leaderboard
+full of the same backgrounds.
+
+Usage:
+    python levelup/generator/benchmark.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import sys
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import imgtools  # noqa: E402
+from levelalert import generate_level_img  # noqa: E402
+from PIL import Image  # noqa: E402
+from styles.default import generate_default_profile  # noqa: E402
+from styles.gaming import generate_gaming_profile  # noqa: E402
+from styles.minimal import generate_minimal_profile  # noqa: E402
+from styles.runescape import generate_runescape_profile  # noqa: E402
+
+
+def make_image(size: tuple, color: tuple) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def time_renders(func, kwargs: dict, runs: int, cold: bool) -> float:
+    """Median render time in milliseconds"""
+    func(**kwargs)  # Import/JIT style warm up, not counted
+    timings = []
+    for _ in range(runs):
+        if cold:
+            imgtools.clear_caches()
+        start = perf_counter()
+        func(**kwargs)
+        timings.append((perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LevelUp asset caches")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    avatar = make_image((512, 512), (200, 80, 80))
+    background = make_image((1920, 1080), (40, 90, 160))
+    profile = {
+        "avatar_bytes": avatar,
+        "background_bytes": background,
+        "username": "Spartan117",
+        "level": 42,
+        "messages": 12345,
+        "voicetime": 399815,
+        "stars": 69,
+        "prestige": 2,
+        "balance": 1000000,
+        "previous_xp": 1000,
+        "current_xp": 1258,
+        "next_xp": 5000,
+        "position": 3,
+        "blur": True,
+    }
+    cases = {
+        "default": (generate_default_profile, profile),
+        "minimal": (generate_minimal_profile, profile),
+        "gaming": (generate_gaming_profile, profile),
+        "runescape": (generate_runescape_profile, profile),
+        "levelup": (generate_level_img, {"avatar_bytes": avatar, "background_bytes": background, "level": 42}),
+    }
+    print(f"{'style':<10} {'cold (ms)':>10} {'warm (ms)':>10} {'speedup':>8}")
+    for name, (func, kwargs) in cases.items():
+        cold = time_renders(func, kwargs, args.runs, cold=True)
+        warm = time_renders(func, kwargs, args.runs, cold=False)
+        print(f"{name:<10} {cold:>10.1f} {warm:>10.1f} {cold / warm:>7.2f}x")
+    print(imgtools.cache_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
+import functools
+import hashlib
 import logging
 import math
+import os
 import random
+import tempfile
+import threading
 import typing as t
+from collections import OrderedDict
 from io import BytesIO
 from pathlib import Path
+from time import monotonic
 from typing import Union
 
 import colorgram
@@ -38,15 +45,154 @@ STATUS = {
     "streaming": Image.open(STOCK / "streaming.webp"),
 }
 
+# Process level asset cache limits, override with env vars for the standalone API/workers
+FONT_CACHE_SIZE = int(os.environ.get("LEVELUP_FONT_CACHE_SIZE", 512))  # (path, size) font objects
+IMAGE_CACHE_MB = int(os.environ.get("LEVELUP_IMAGE_CACHE_MB", 64))  # Decoded and resized images
+DOWNLOAD_CACHE_MB = int(os.environ.get("LEVELUP_DOWNLOAD_CACHE_MB", 64))  # Raw downloaded image bytes
+DOWNLOAD_CACHE_TTL = int(os.environ.get("LEVELUP_DOWNLOAD_CACHE_TTL", 3600))  # Seconds
+# Custom fonts sent as bytes are written here once, named by their hash, so their font objects can be cached too
+FONT_SPOOL = Path(tempfile.gettempdir()) / "levelup-fonts"
+
 log = logging.getLogger("red.vrt.levelup.imagetools")
 _ = Translator("LevelUp", __file__)
 
 
+class AssetCache:
+    """Thread safe LRU capped by the total size of its entries, shared by every render in the process"""
+
+    def __init__(self, name: str, max_bytes: int, ttl: float = 0):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[t.Hashable, t.Tuple[t.Any, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: t.Hashable) -> t.Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (self.ttl and monotonic() - entry[2] > self.ttl):
+                if entry is not None:
+                    del self._entries[key]
+                    self.size -= entry[1]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: t.Hashable, value: t.Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if old := self._entries.pop(key, None):
+                self.size -= old[1]
+            self._entries[key] = (value, size, monotonic())
+            self.size += size
+            while self.size > self.max_bytes and self._entries:
+                _key, (_value, old_size, _added) = self._entries.popitem(last=False)
+                self.size -= old_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+IMAGE_CACHE = AssetCache("images", IMAGE_CACHE_MB * 1024 * 1024)
+DOWNLOAD_CACHE = AssetCache("downloads", DOWNLOAD_CACHE_MB * 1024 * 1024, ttl=DOWNLOAD_CACHE_TTL)
+
+
+def asset_key(data: t.Union[bytes, str, None]) -> t.Optional[str]:
+    """Hash image bytes (or a URL/path) into a cache key"""
+    if not data:
+        return None
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(path: str, mtime_ns: int, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+def get_font(font_path: t.Union[str, Path], size: int) -> ImageFont.FreeTypeFont:
+    """Get a font object, cached by (path, size) so shrink-to-fit loops don't reload the font file"""
+    path = str(font_path)
+    try:
+        # Include the modified time so fonts replaced on disk are picked up
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return ImageFont.truetype(path, size)
+    return _load_font(path, mtime_ns, size)
+
+
+def store_font(font_bytes: bytes) -> str:
+    """Write custom font bytes to a content-addressed file and return its path
+
+    The file is kept so repeat renders with the same font reuse both the file and the cached font objects.
+    """
+    path = FONT_SPOOL / f"{asset_key(font_bytes)}.ttf"
+    if not path.exists():
+        FONT_SPOOL.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=FONT_SPOOL)
+        with os.fdopen(fd, "wb") as f:
+            f.write(font_bytes)
+        os.replace(temp_path, path)
+    return str(path)
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters and sizes of the process level asset caches"""
+    fonts = _load_font.cache_info()
+    return {
+        "fonts": {
+            "entries": fonts.currsize,
+            "max_entries": fonts.maxsize,
+            "hits": fonts.hits,
+            "misses": fonts.misses,
+        },
+        "images": IMAGE_CACHE.stats(),
+        "downloads": DOWNLOAD_CACHE.stats(),
+    }
+
+
+def clear_caches() -> None:
+    _load_font.cache_clear()
+    IMAGE_CACHE.clear()
+    DOWNLOAD_CACHE.clear()
+
+
 def download_image(url: str) -> t.Union[bytes, None]:
-    """Get an image from a URL"""
+    """Get an image from a URL, reusing recent downloads of the same URL"""
+    key = asset_key(url)
+    if cached := DOWNLOAD_CACHE.get(key):
+        return cached
+    content = _download_image(url)
+    if content:
+        DOWNLOAD_CACHE.put(key, content, len(content))
+    return content
+
+
+def _download_image(url: str) -> t.Union[bytes, None]:
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:126.0) Gecko/20100101 Firefox/126.0"}
     try:
-        response = requests.get(url, headers=headers)
+        response = requests.get(url, headers=headers, timeout=30)
         if response.status_code == 404:
             return None
         response.raise_for_status()
@@ -87,6 +233,59 @@ def open_avatar(avatar_bytes: t.Union[bytes, str, None]) -> Image.Image:
     return DEFAULT_PFP.copy()
 
 
+def load_background(
+    background_bytes: t.Optional[bytes], reraise: bool = False
+) -> t.Tuple[Image.Image, t.Optional[str]]:
+    """Open background bytes, falling back to a random default background
+
+    Returns:
+        Tuple of (image, cache key for `fit_background`)
+    """
+    if background_bytes:
+        try:
+            return Image.open(BytesIO(background_bytes)), asset_key(background_bytes)
+        except UnidentifiedImageError as e:
+            if reraise:
+                raise e
+            log.error(f"Failed to open background image ({len(background_bytes)} bytes)", exc_info=e)
+    card = get_random_background()
+    return card, asset_key(card.filename)
+
+
+def fit_background(image: Image.Image, size: t.Tuple[int, int], key: t.Optional[str]) -> Image.Image:
+    """Convert a static background to RGBA and fit it to `size`, cached by its source key
+
+    Returns a copy the caller is free to draw on.
+    """
+    cache_key = ("background", key, size)
+    if key and (cached := IMAGE_CACHE.get(cache_key)):
+        return cached.copy()
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    image = fit_aspect_ratio(image, size)
+    if key:
+        IMAGE_CACHE.put(cache_key, image.copy(), image.width * image.height * 4)
+    return image
+
+
+def fit_avatar(pfp: Image.Image, size: t.Tuple[int, int], key: t.Optional[str], circle: bool = True) -> Image.Image:
+    """Convert a static avatar to RGBA, resize it and optionally crop it into a circle, cached by its source key
+
+    Returns a copy the caller is free to draw on.
+    """
+    cache_key = ("avatar", key, size, circle)
+    if key and (cached := IMAGE_CACHE.get(cache_key)):
+        return cached.copy()
+    if pfp.mode != "RGBA":
+        pfp = pfp.convert("RGBA")
+    pfp = pfp.resize(size, Image.Resampling.LANCZOS)
+    if circle:
+        pfp = make_profile_circle(pfp)
+    if key:
+        IMAGE_CACHE.put(cache_key, pfp.copy(), pfp.width * pfp.height * 4)
+    return pfp
+
+
 def abbreviate_number(number: int) -> str:
     """Abbreviate a number"""
     abbreviations = [(1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")]
@@ -235,7 +434,7 @@ def format_fonts(filepaths: t.List[str]) -> Image.Image:
     color = (255, 255, 255)
     draw = ImageDraw.Draw(img)
     for idx, path in enumerate(filepaths):
-        font = ImageFont.truetype(path, fontsize)
+        font = get_font(path, fontsize)
         draw.text((5, idx * (fontsize + 15)), Path(path).stem, color, font=font, stroke_width=1, stroke_fill=(0, 0, 0))
     return img
 
@@ -260,7 +459,7 @@ def format_backgrounds(filepaths: t.List[str]) -> Image.Image:
             draw.text(
                 (10, 10),
                 name,
-                font=ImageFont.truetype(str(DEFAULT_FONT), 100),
+                font=get_font(DEFAULT_FONT, 100),
                 fill=(255, 255, 255),
                 stroke_width=5,
                 stroke_fill="#000000",
@@ -19,7 +19,7 @@ import typing as t
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont, ImageSequence, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageSequence
 from redbot.core.i18n import Translator
 
 try:
@@ -49,15 +49,9 @@ def generate_level_img(
         log.debug("Avatar image is a URL, attempting to download")
         avatar_bytes = imgtools.download_image(avatar_bytes)
 
-    if background_bytes:
-        try:
-            card = Image.open(BytesIO(background_bytes))
-        except UnidentifiedImageError as e:
-            log.error("Error opening background image", exc_info=e)
-            card = imgtools.get_random_background()
-    else:
-        card = imgtools.get_random_background()
+    card, card_key = imgtools.load_background(background_bytes)
     pfp = imgtools.open_avatar(avatar_bytes)
+    pfp_key = imgtools.asset_key(avatar_bytes)
 
     pfp_animated = getattr(pfp, "is_animated", False)
     bg_animated = getattr(card, "is_animated", False)
@@ -79,12 +73,12 @@ def generate_level_img(
         else:
             font_path = imgtools.DEFAULT_FONT
     font_path = str(font_path)
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     text = _("Level {}").format(level)
     placement_area_center_x = th + ((tw - th) / 2)
     while font.getlength(text) > (tw - th) - 10:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw = ImageDraw.Draw(text_layer)
     draw.text(
         xy=(placement_area_center_x, int(th / 2)),
@@ -98,13 +92,8 @@ def generate_level_img(
     # FINALIZE IMAGE
     if not render_gif or (not pfp_animated and not bg_animated):
         # Render a static pfp on a static background
-        if not card.mode == "RGBA":
-            card = card.convert("RGBA")
-        if not pfp.mode == "RGBA":
-            pfp = pfp.convert("RGBA")
-        card = imgtools.fit_aspect_ratio(card, desired_card_size)
-        pfp = pfp.resize((card.height, card.height), Image.Resampling.LANCZOS)
-        pfp = imgtools.make_profile_circle(pfp)
+        card = imgtools.fit_background(card, desired_card_size, card_key)
+        pfp = imgtools.fit_avatar(pfp, (card.height, card.height), pfp_key)
         card.paste(text_layer, (0, 0), text_layer)
         card.paste(pfp, (0, 0), pfp)
         card = imgtools.round_image_corners(card, card.height)
@@ -116,9 +105,7 @@ def generate_level_img(
         return buffer.getvalue(), False
     if pfp_animated and not bg_animated:
         # Render an animated pfp on a static background
-        if not card.mode == "RGBA":
-            card = card.convert("RGBA")
-        card = imgtools.fit_aspect_ratio(card, desired_card_size)
+        card = imgtools.fit_background(card, desired_card_size, card_key)
         avg_duration = imgtools.get_avg_duration(pfp)
         log.debug(f"Average frame duration: {avg_duration}")
         frames: t.List[Image.Image] = []
@@ -153,10 +140,7 @@ def generate_level_img(
         return buffer.getvalue(), True
     if bg_animated and not pfp_animated:
         # Render a static pfp on an animated background
-        if not pfp.mode == "RGBA":
-            pfp = pfp.convert("RGBA")
-        pfp = pfp.resize((desired_card_size[1], desired_card_size[1]), Image.Resampling.LANCZOS)
-        pfp = imgtools.make_profile_circle(pfp)
+        pfp = imgtools.fit_avatar(pfp, (desired_card_size[1], desired_card_size[1]), pfp_key)
         avg_duration = imgtools.get_avg_duration(card)
         log.debug(f"Average frame duration: {avg_duration}")
         frames: t.List[Image.Image] = []
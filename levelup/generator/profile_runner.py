@@ -7,6 +7,12 @@ image processing from the main Discord bot process.
 
 Usage:
     python profile_runner.py <input_json_path> <output_image_path>
+    python profile_runner.py --worker
+
+In worker mode the process stays alive and serves render jobs over stdin/stdout
+using length-prefixed frames (see `read_frame`/`write_frame`). Each job is a
+ProfileRequest or LevelUpRequest JSON frame; each reply is an ImageResponse JSON
+frame followed by a frame holding the raw image bytes.
 
 Input JSON format (ProfileRequest or LevelUpRequest schema):
 {
@@ -31,7 +37,9 @@ import base64
 import json
 import logging
 import os
+import struct
 import sys
+import typing as t
 from pathlib import Path
 
 # Setup logging to stderr so it doesn't interfere with JSON stdout
@@ -52,19 +60,10 @@ for p in [str(_THIS_DIR), str(_COG_DIR), str(_COGS_DIR)]:
 
 
 def download_image(url: str) -> bytes | None:
-    """Download image from URL using requests (sync for subprocess)."""
-    import requests
+    """Download image from URL, reusing recent downloads when running as a worker."""
+    import imgtools
 
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:126.0) Gecko/20100101 Firefox/126.0"}
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        return response.content
-    except Exception as e:
-        log.warning(f"Failed to download image from {url}: {e}")
-        return None
+    return imgtools.download_image(url)
 
 
 def get_asset_bytes(url: str | None, b64: str | None) -> bytes | None:
@@ -80,12 +79,36 @@ def get_asset_bytes(url: str | None, b64: str | None) -> bytes | None:
     return None
 
 
-def generate_profile(input_data: dict, output_path: Path) -> dict:
-    """Generate a profile image from input data."""
+def resolve_font(input_data: dict) -> str | None:
+    """Resolve the font path for a request."""
+    import imgtools
+
+    if font_name := input_data.get("font_name"):
+        # Check default fonts first, then custom fonts path if provided
+        default_fonts = imgtools.DEFAULT_FONTS
+        if (default_fonts / font_name).exists():
+            return str(default_fonts / font_name)
+        if custom_fonts_dir := input_data.get("custom_fonts_dir"):
+            custom_path = Path(custom_fonts_dir) / font_name
+            if custom_path.exists():
+                return str(custom_path)
+
+    # If font_b64 is provided (custom font), write it to a content-addressed file that later jobs reuse
+    if font_b64 := input_data.get("font_b64"):
+        try:
+            font_path = imgtools.store_font(base64.b64decode(font_b64))
+            log.debug(f"Using custom font file: {font_path}")
+            return font_path
+        except Exception as e:
+            log.warning(f"Failed to decode font_b64: {e}")
+    return None
+
+
+def render_profile(input_data: dict) -> tuple[bytes, bool]:
+    """Render a profile image, returning the image bytes and whether it is animated."""
     # Import here to avoid loading PIL until needed. Import the generator standalone
     # (the generator dir is on sys.path) rather than via the `levelup` package, which
     # would execute levelup/__init__.py and pull the entire cog into the subprocess.
-    import imgtools
     from styles.default import generate_default_profile
     from styles.gaming import generate_gaming_profile
     from styles.minimal import generate_minimal_profile
@@ -99,32 +122,7 @@ def generate_profile(input_data: dict, output_path: Path) -> dict:
     prestige_emoji_bytes = get_asset_bytes(input_data.get("prestige_emoji_url"), input_data.get("prestige_emoji_b64"))
     role_icon_bytes = get_asset_bytes(input_data.get("role_icon_url"), input_data.get("role_icon_b64"))
 
-    # Resolve font path
-    font_path = None
-    if font_name := input_data.get("font_name"):
-        # Check default fonts first, then custom fonts path if provided
-        default_fonts = imgtools.DEFAULT_FONTS
-        if (default_fonts / font_name).exists():
-            font_path = str(default_fonts / font_name)
-        elif custom_fonts_dir := input_data.get("custom_fonts_dir"):
-            custom_path = Path(custom_fonts_dir) / font_name
-            if custom_path.exists():
-                font_path = str(custom_path)
-
-    # If font_b64 is provided (custom font), write to temp file
-    if not font_path and (font_b64 := input_data.get("font_b64")):
-        try:
-            import tempfile
-
-            font_bytes = base64.b64decode(font_b64)
-            # Create temp file with .ttf extension
-            fd, temp_font_path = tempfile.mkstemp(suffix=".ttf")
-            with os.fdopen(fd, "wb") as f:
-                f.write(font_bytes)
-            font_path = temp_font_path
-            log.debug(f"Wrote custom font to temp file: {temp_font_path}")
-        except Exception as e:
-            log.warning(f"Failed to decode font_b64: {e}")
+    font_path = resolve_font(input_data)
 
     # Build kwargs for generator
     kwargs = {
@@ -174,54 +172,18 @@ def generate_profile(input_data: dict, output_path: Path) -> dict:
 
     generator_func = generators.get(style, generate_default_profile)
 
-    # Generate image
-    img_bytes, animated = generator_func(**kwargs)
-
-    # Write output file
-    output_path.write_bytes(img_bytes)
-
-    return {
-        "success": True,
-        "output_path": str(output_path),
-        "animated": animated,
-        "format": "gif" if animated else "webp",
-        "size": len(img_bytes),
-    }
+    return generator_func(**kwargs)
 
 
-def generate_levelup(input_data: dict, output_path: Path) -> dict:
-    """Generate a level-up alert image from input data."""
-    import imgtools
+def render_levelup(input_data: dict) -> tuple[bytes, bool]:
+    """Render a level-up alert image, returning the image bytes and whether it is animated."""
     from levelalert import generate_level_img
 
     # Resolve assets
     avatar_bytes = get_asset_bytes(input_data.get("avatar_url"), input_data.get("avatar_b64"))
     background_bytes = get_asset_bytes(input_data.get("background_url"), input_data.get("background_b64"))
 
-    # Resolve font path
-    font_path = None
-    if font_name := input_data.get("font_name"):
-        default_fonts = imgtools.DEFAULT_FONTS
-        if (default_fonts / font_name).exists():
-            font_path = str(default_fonts / font_name)
-        elif custom_fonts_dir := input_data.get("custom_fonts_dir"):
-            custom_path = Path(custom_fonts_dir) / font_name
-            if custom_path.exists():
-                font_path = str(custom_path)
-
-    # If font_b64 is provided (custom font), write to temp file
-    if not font_path and (font_b64 := input_data.get("font_b64")):
-        try:
-            import tempfile
-
-            font_bytes = base64.b64decode(font_b64)
-            fd, temp_font_path = tempfile.mkstemp(suffix=".ttf")
-            with os.fdopen(fd, "wb") as f:
-                f.write(font_bytes)
-            font_path = temp_font_path
-            log.debug(f"Wrote custom font to temp file: {temp_font_path}")
-        except Exception as e:
-            log.warning(f"Failed to decode font_b64: {e}")
+    font_path = resolve_font(input_data)
 
     # Build kwargs
     kwargs = {
@@ -236,8 +198,35 @@ def generate_levelup(input_data: dict, output_path: Path) -> dict:
     if font_path:
         kwargs["font_path"] = font_path
 
-    # Generate image
-    img_bytes, animated = generate_level_img(**kwargs)
+    return generate_level_img(**kwargs)
+
+
+def render(input_data: dict) -> tuple[bytes, bool]:
+    """Dispatch a request to the right renderer based on its request_type."""
+    if input_data.get("request_type", "profile") == "levelup":
+        return render_levelup(input_data)
+    return render_profile(input_data)
+
+
+def generate_profile(input_data: dict, output_path: Path) -> dict:
+    """Generate a profile image from input data."""
+    img_bytes, animated = render_profile(input_data)
+
+    # Write output file
+    output_path.write_bytes(img_bytes)
+
+    return {
+        "success": True,
+        "output_path": str(output_path),
+        "animated": animated,
+        "format": "gif" if animated else "webp",
+        "size": len(img_bytes),
+    }
+
+
+def generate_levelup(input_data: dict, output_path: Path) -> dict:
+    """Generate a level-up alert image from input data."""
+    img_bytes, animated = render_levelup(input_data)
 
     # Write output file
     output_path.write_bytes(img_bytes)
@@ -251,12 +240,83 @@ def generate_levelup(input_data: dict, output_path: Path) -> dict:
     }
 
 
+# ---------------------------- Worker mode ----------------------------
+# Frames are a 4 byte big-endian length followed by that many bytes.
+FRAME_HEADER = struct.Struct(">I")
+
+
+def read_frame(stream: t.BinaryIO) -> bytes | None:
+    """Read one length-prefixed frame, returning None on EOF."""
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    data = stream.read(size)
+    if len(data) < size:
+        return None
+    return data
+
+
+def write_frame(stream: t.BinaryIO, data: bytes) -> None:
+    stream.write(FRAME_HEADER.pack(len(data)) + data)
+
+
+def warm_up() -> None:
+    """Import the generators and their heavy dependencies before accepting jobs."""
+    import imgtools  # noqa: F401
+    import levelalert  # noqa: F401
+    from styles import default, gaming, minimal, runescape  # noqa: F401
+
+
+def run_worker() -> None:
+    """Serve render jobs over stdin/stdout until stdin is closed."""
+    # Keep the real stdout for the protocol and send stray prints to stderr
+    # so nothing a generator prints can corrupt a frame.
+    proto_in = sys.stdin.buffer
+    proto_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    sys.stdout = sys.stderr
+
+    warm_up()
+    write_frame(proto_out, json.dumps({"success": True, "ready": True, "pid": os.getpid()}).encode())
+    proto_out.flush()
+
+    while True:
+        frame = read_frame(proto_in)
+        if frame is None:
+            break
+        img_bytes = b""
+        try:
+            input_data = json.loads(frame)
+            img_bytes, animated = render(input_data)
+            result = {
+                "success": True,
+                "animated": animated,
+                "format": "gif" if animated else "webp",
+                "size": len(img_bytes),
+            }
+        except Exception as e:
+            log.exception(f"Generation failed: {e}")
+            img_bytes = b""
+            result = {"success": False, "error": str(e), "size": 0}
+        write_frame(proto_out, json.dumps(result).encode())
+        write_frame(proto_out, img_bytes)
+        proto_out.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate LevelUp profile or level-up images")
-    parser.add_argument("input", help="Path to input JSON file")
-    parser.add_argument("output", help="Path to output image file")
+    parser.add_argument("input", nargs="?", help="Path to input JSON file")
+    parser.add_argument("output", nargs="?", help="Path to output image file")
+    parser.add_argument("--worker", action="store_true", help="Serve render jobs over stdin/stdout")
     args = parser.parse_args()
 
+    if args.worker:
+        run_worker()
+        return
+
+    if not args.input or not args.output:
+        parser.error("input and output are required unless running with --worker")
+
     input_path = Path(args.input)
     output_path = Path(args.output)
 
@@ -276,9 +336,7 @@ def main():
 
     # Determine request type and generate
     try:
-        request_type = input_data.get("request_type", "profile")
-
-        if request_type == "levelup":
+        if input_data.get("request_type", "profile") == "levelup":
             result = generate_levelup(input_data, output_path)
         else:
             result = generate_profile(input_data, output_path)
@@ -3,6 +3,7 @@ Pydantic schemas for LevelUp image generation API.
 
 These schemas define the contracts for:
 - Subprocess communication (JSON file I/O)
+- Render worker pool jobs (length-prefixed JSON frames over stdin/stdout)
 - External API HTTP requests/responses
 """
 
@@ -14,6 +15,8 @@ from pydantic import BaseModel, Field
 class ProfileRequest(BaseModel):
     """Request schema for profile image generation."""
 
+    request_type: t.Literal["profile"] = Field(default="profile", description="Job type for the render runner")
+
     # Profile style
     style: str = Field(
         default="default",
@@ -68,6 +71,8 @@ class ProfileRequest(BaseModel):
 class LevelUpRequest(BaseModel):
     """Request schema for level-up alert image generation."""
 
+    request_type: t.Literal["levelup"] = Field(default="levelup", description="Job type for the render runner")
+
     level: int = Field(default=1, description="New level achieved")
 
     # Asset URLs
@@ -96,7 +101,7 @@ class ImageResponse(BaseModel):
     success: bool = Field(default=True, description="Whether generation succeeded")
     error: t.Optional[str] = Field(default=None, description="Error message if failed")
 
-    # For subprocess mode - path to generated file
+    # For subprocess mode - path to generated file (render workers send the bytes in the next frame instead)
     output_path: t.Optional[str] = Field(default=None, description="Path to generated image file")
 
     # For HTTP API mode - base64 encoded image
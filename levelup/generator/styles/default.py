@@ -6,7 +6,7 @@ import typing as t
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont, ImageSequence, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageSequence
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 
@@ -20,9 +20,11 @@ except ImportError:
     parent_dir = Path(__file__).parent.parent
     sys.path.insert(0, str(parent_dir))
 
-    # Import imgtools directly
+    # Import imgtools directly, reusing an already loaded copy so its asset caches are shared
     imgtools_path = parent_dir / "imgtools.py"
-    if imgtools_path.exists():
+    if "imgtools" in sys.modules:
+        imgtools = sys.modules["imgtools"]
+    elif imgtools_path.exists():
         spec = importlib.util.spec_from_file_location("imgtools", imgtools_path)
         imgtools = importlib.util.module_from_spec(spec)
         sys.modules["imgtools"] = imgtools
@@ -168,19 +170,9 @@ def generate_default_profile(
     else:
         role_icon_bytes = role_icon
 
-    if background_bytes:
-        try:
-            card = Image.open(BytesIO(background_bytes))
-        except UnidentifiedImageError as e:
-            if reraise:
-                raise e
-            log.error(
-                f"Failed to open background image ({type(background_bytes)} - {len(background_bytes)})", exc_info=e
-            )
-            card = imgtools.get_random_background()
-    else:
-        card = imgtools.get_random_background()
+    card, card_key = imgtools.load_background(background_bytes, reraise)
     pfp = imgtools.open_avatar(avatar_bytes)
+    pfp_key = imgtools.asset_key(avatar_bytes)
 
     pfp_animated = getattr(pfp, "is_animated", False)
     bg_animated = getattr(card, "is_animated", False)
@@ -263,12 +255,12 @@ def generate_default_profile(
     draw = ImageDraw.Draw(stats)
     # ---------------- Username text ----------------
     fontsize = 60
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     with Pilmoji(stats) as pilmoji:
         # Ensure text doesnt pass star_icon_x
         while pilmoji.getsize(username, font)[0] + stat_start > star_icon_x - 10:
             fontsize -= 1
-            font = ImageFont.truetype(font_path, fontsize)
+            font = imgtools.get_font(font_path, fontsize)
         pilmoji.text(
             xy=(stat_start, name_y),
             text=username,
@@ -281,11 +273,11 @@ def generate_default_profile(
     if prestige:
         text = _("(Prestige {})").format(f"{humanize_number(prestige)}")
         fontsize = 40
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
         # Ensure text doesnt pass stat_end
         while font.getlength(text) + stat_start > stat_end:
             fontsize -= 1
-            font = ImageFont.truetype(font_path, fontsize)
+            font = imgtools.get_font(font_path, fontsize)
         draw.text(
             xy=(stat_start, name_y + 70),
             text=text,
@@ -303,11 +295,11 @@ def generate_default_profile(
     # ---------------- Stars text ----------------
     text = humanize_number(stars)
     fontsize = 60
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass stat_end
     while font.getlength(text) + star_text_x > stat_end:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(star_text_x, star_text_y),
         text=text,
@@ -320,11 +312,11 @@ def generate_default_profile(
     # ---------------- Rank text ----------------
     text = _("Rank: {}").format(f"#{humanize_number(position)}")
     fontsize = 40
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass stat_split point
     while font.getlength(text) + stat_start > stat_split - 5:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(stat_start, stats_y),
         text=text,
@@ -336,11 +328,11 @@ def generate_default_profile(
     # ---------------- Level text ----------------
     text = _("Level: {}").format(humanize_number(level))
     fontsize = 40
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass the stat_split point
     while font.getlength(text) + stat_start > stat_split - 5:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(stat_start, stats_y + stat_offset),
         text=text,
@@ -352,11 +344,11 @@ def generate_default_profile(
     # ---------------- Messages text ----------------
     text = _("Messages: {}").format(humanize_number(messages))
     fontsize = 40
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass the stat_end
     while font.getlength(text) + stat_split > stat_end:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(stat_split, stats_y),
         text=text,
@@ -368,11 +360,11 @@ def generate_default_profile(
     # ---------------- Voice text ----------------
     text = _("Voice: {}").format(imgtools.abbreviate_time(voicetime))
     fontsize = 40
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass the stat_end
     while font.getlength(text) + stat_split > stat_end:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(stat_split, stats_y + stat_offset),
         text=text,
@@ -384,12 +376,12 @@ def generate_default_profile(
     # ---------------- Balance text ----------------
     if balance:
         text = _("Balance: {}").format(f"{humanize_number(balance)} {currency_name}")
-        font = ImageFont.truetype(font_path, 40)
+        font = imgtools.get_font(font_path, 40)
         with Pilmoji(stats) as pilmoji:
             # Ensure text doesnt pass the stat_end
             while pilmoji.getsize(text, font)[0] + stat_start > stat_end:
                 fontsize -= 1
-                font = ImageFont.truetype(font_path, fontsize)
+                font = imgtools.get_font(font_path, fontsize)
             placement = (stat_start, stat_bottom - stat_offset * 2)
             pilmoji.text(
                 xy=placement,
@@ -406,11 +398,11 @@ def generate_default_profile(
         f"{humanize_number(current)}/{humanize_number(goal)}", humanize_number(current_xp)
     )
     fontsize = 40
-    font = ImageFont.truetype(font_path, fontsize)
+    font = imgtools.get_font(font_path, fontsize)
     # Ensure text doesnt pass the stat_end
     while font.getlength(text) + stat_start > stat_end:
         fontsize -= 1
-        font = ImageFont.truetype(font_path, fontsize)
+        font = imgtools.get_font(font_path, fontsize)
     draw.text(
         xy=(stat_start, stat_bottom - stat_offset),
         text=text,
@@ -449,21 +441,14 @@ def generate_default_profile(
     # Resize the profile image
     desired_pfp_size = (330, 330)
     if not render_gif or (not pfp_animated and not bg_animated):
-        if card.mode != "RGBA":
-            log.debug(f"Converting card mode '{card.mode}' to RGBA")
-            card = card.convert("RGBA")
-        if pfp.mode != "RGBA":
-            log.debug(f"Converting pfp mode '{pfp.mode}' to RGBA")
-            pfp = pfp.convert("RGBA")
-        card = imgtools.fit_aspect_ratio(card, desired_card_size)
+        card = imgtools.fit_background(card, desired_card_size, card_key)
         if blur:
             blur_section = imgtools.blur_section(card, (blur_edge, 0, card.width, card.height))
             # Paste onto the stats
             card.paste(blur_section, (blur_edge, 0), blur_section)
         card = imgtools.round_image_corners(card, 45)
-        pfp = pfp.resize(desired_pfp_size, Image.Resampling.LANCZOS)
-        # Crop the profile image into a circle
-        pfp = imgtools.make_profile_circle(pfp)
+        # Resize the profile image and crop it into a circle
+        pfp = imgtools.fit_avatar(pfp, desired_pfp_size, pfp_key)
         # Paste the items onto the card
         card.paste(stats, (0, 0), stats)
         card.paste(pfp, (circle_x, circle_y), pfp)
@@ -475,10 +460,7 @@ def generate_default_profile(
         return buffer.getvalue(), False
 
     if pfp_animated and not bg_animated:
-        if card.mode != "RGBA":
-            log.debug(f"Converting card mode '{card.mode}' to RGBA")
-            card = card.convert("RGBA")
-        card = imgtools.fit_aspect_ratio(card, desired_card_size)
+        card = imgtools.fit_background(card, desired_card_size, card_key)
         if blur:
             blur_section = imgtools.blur_section(card, (blur_edge, 0, card.width, card.height))
             # Paste onto the stats
@@ -524,12 +506,8 @@ def generate_default_profile(
         log.debug(f"Rendering card as gif with avg duration of {avg_duration}ms")
         frames: t.List[Image.Image] = []
 
-        if pfp.mode != "RGBA":
-            log.debug(f"Converting pfp mode '{pfp.mode}' to RGBA")
-            pfp = pfp.convert("RGBA")
-        pfp = pfp.resize(desired_pfp_size, Image.Resampling.LANCZOS)
-        # Crop the profile image into a circle
-        pfp = imgtools.make_profile_circle(pfp)
+        # Resize the profile image and crop it into a circle
+        pfp = imgtools.fit_avatar(pfp, desired_pfp_size, pfp_key)
         for frame in range(getattr(card, "n_frames", 1)):
             card.seek(frame)
             # Prepare copies of the card and stats
@@ -15,7 +15,7 @@ import typing as t
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFilter, ImageFont, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageFilter
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 
@@ -154,17 +154,9 @@ def generate_gaming_profile(
         role_icon = imgtools.download_image(role_icon)
 
     # Load images
-    if background_bytes:
-        try:
-            bg = Image.open(BytesIO(background_bytes))
-        except UnidentifiedImageError as e:
-            if reraise:
-                raise e
-            bg = imgtools.get_random_background()
-    else:
-        bg = imgtools.get_random_background()
-
+    bg, bg_key = imgtools.load_background(background_bytes, reraise)
     pfp = imgtools.open_avatar(avatar_bytes)
+    pfp_key = imgtools.asset_key(avatar_bytes)
 
     pfp_animated = getattr(pfp, "is_animated", False)
     bg_animated = getattr(bg, "is_animated", False)
@@ -214,13 +206,13 @@ def generate_gaming_profile(
 
         # Username in header
         username_fontsize = 32
-        username_font = ImageFont.truetype(font_path, username_fontsize)
+        username_font = imgtools.get_font(font_path, username_fontsize)
 
         with Pilmoji(stats) as pilmoji:
             max_name_width = card_width - 300
             while pilmoji.getsize(username, username_font)[0] > max_name_width and username_fontsize > 18:
                 username_fontsize -= 2
-                username_font = ImageFont.truetype(font_path, username_fontsize)
+                username_font = imgtools.get_font(font_path, username_fontsize)
 
             name_width = pilmoji.getsize(username, username_font)[0]
             name_x = (card_width - name_width) // 2
@@ -234,7 +226,7 @@ def generate_gaming_profile(
         # Rank badge on left of header
         rank_text = f"#{position}"
         rank_fontsize = 22
-        rank_font = ImageFont.truetype(font_path, rank_fontsize)
+        rank_font = imgtools.get_font(font_path, rank_fontsize)
         draw.text(
             xy=(padding + 45, header_y + (header_height - rank_fontsize) // 2),
             text=rank_text,
@@ -245,7 +237,7 @@ def generate_gaming_profile(
         # Level badge on right of header (with optional prestige emoji)
         level_text = f"LV.{level}"
         level_fontsize = 22
-        level_font = ImageFont.truetype(font_path, level_fontsize)
+        level_font = imgtools.get_font(font_path, level_fontsize)
         level_width = level_font.getlength(level_text)
 
         # Calculate right edge position for level + optional prestige emoji
@@ -320,8 +312,8 @@ def generate_gaming_profile(
 
         label_fontsize = 12
         value_fontsize = 24
-        label_font = ImageFont.truetype(font_path, label_fontsize)
-        value_font = ImageFont.truetype(font_path, value_fontsize)
+        label_font = imgtools.get_font(font_path, label_fontsize)
+        value_font = imgtools.get_font(font_path, value_fontsize)
 
         stat_y = panel_y + 8  # Tighter top padding
         stat_spacing = (panel_height - 20) // len(stat_items)
@@ -362,7 +354,7 @@ def generate_gaming_profile(
         progress = max(0.0, min(1.0, progress))
 
         # XP label
-        xp_label_font = ImageFont.truetype(font_path, 14)
+        xp_label_font = imgtools.get_font(font_path, 14)
         draw.text(xy=(bar_x, bar_y - 18), text="EXPERIENCE", fill=stat_color, font=xp_label_font)
 
         # Draw the bar
@@ -380,7 +372,7 @@ def generate_gaming_profile(
         current = current_xp - previous_xp
         goal = next_xp - previous_xp
         xp_text = f"{humanize_number(current)} / {humanize_number(goal)}"
-        xp_font = ImageFont.truetype(font_path, 16)
+        xp_font = imgtools.get_font(font_path, 16)
         xp_width = xp_font.getlength(xp_text)
         draw.text(
             xy=(bar_x + bar_width - xp_width, bar_y + bar_height + 5),
@@ -406,16 +398,12 @@ def generate_gaming_profile(
 
         return stats
 
-    def create_avatar_layer(pfp_frame: Image.Image) -> Image.Image:
+    def create_avatar_layer(pfp_frame: Image.Image, key: t.Optional[str] = None) -> Image.Image:
         """Create avatar"""
         layer = Image.new("RGBA", card_size, (0, 0, 0, 0))
 
-        if pfp_frame.mode != "RGBA":
-            pfp_frame = pfp_frame.convert("RGBA")
-
-        pfp_frame = pfp_frame.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-
         # Keep square for gaming aesthetic (no circle crop)
+        pfp_frame = imgtools.fit_avatar(pfp_frame, (avatar_size, avatar_size), key, circle=False)
         layer.paste(pfp_frame, (avatar_x, avatar_y), pfp_frame)
 
         # Status indicator
@@ -431,12 +419,9 @@ def generate_gaming_profile(
 
         return layer
 
-    def prepare_background(bg_frame: Image.Image) -> Image.Image:
+    def prepare_background(bg_frame: Image.Image, key: t.Optional[str] = None) -> Image.Image:
         """Prepare gaming-style background"""
-        if bg_frame.mode != "RGBA":
-            bg_frame = bg_frame.convert("RGBA")
-
-        bg_frame = imgtools.fit_aspect_ratio(bg_frame, card_size)
+        bg_frame = imgtools.fit_background(bg_frame, card_size, key)
 
         if blur:
             bg_frame = bg_frame.filter(ImageFilter.GaussianBlur(2))
@@ -467,9 +452,9 @@ def generate_gaming_profile(
 
     # --- Rendering ---
     if not render_gif or (not pfp_animated and not bg_animated):
-        card = prepare_background(bg.copy())
+        card = prepare_background(bg, bg_key)
         stats_layer = create_stats_layer()
-        avatar_layer = create_avatar_layer(pfp.copy())
+        avatar_layer = create_avatar_layer(pfp, pfp_key)
 
         card = Image.alpha_composite(card, stats_layer)
         card = Image.alpha_composite(card, avatar_layer)
@@ -483,7 +468,7 @@ def generate_gaming_profile(
 
     # Animated renders
     if pfp_animated and not bg_animated:
-        card_base = prepare_background(bg.copy())
+        card_base = prepare_background(bg, bg_key)
         stats_layer = create_stats_layer()
         card_base = Image.alpha_composite(card_base, stats_layer)
 
@@ -510,7 +495,7 @@ def generate_gaming_profile(
 
     if bg_animated and not pfp_animated:
         stats_layer = create_stats_layer()
-        avatar_layer = create_avatar_layer(pfp.copy())
+        avatar_layer = create_avatar_layer(pfp, pfp_key)
 
         avg_duration = imgtools.get_avg_duration(bg)
         frames: t.List[Image.Image] = []
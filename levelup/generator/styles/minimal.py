@@ -15,7 +15,7 @@ import typing as t
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFilter, ImageFont, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageFilter
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 
@@ -87,19 +87,11 @@ def generate_minimal_profile(
         role_icon = imgtools.download_image(role_icon)
 
     # Load background
-    if background_bytes:
-        try:
-            bg = Image.open(BytesIO(background_bytes))
-        except UnidentifiedImageError as e:
-            if reraise:
-                raise e
-            log.error("Failed to open background image", exc_info=e)
-            bg = imgtools.get_random_background()
-    else:
-        bg = imgtools.get_random_background()
+    bg, bg_key = imgtools.load_background(background_bytes, reraise)
 
     # Load avatar
     pfp = imgtools.open_avatar(avatar_bytes)
+    pfp_key = imgtools.asset_key(avatar_bytes)
 
     pfp_animated = getattr(pfp, "is_animated", False)
     bg_animated = getattr(bg, "is_animated", False)
@@ -137,7 +129,7 @@ def generate_minimal_profile(
 
         # --- Username ---
         username_fontsize = 48
-        username_font = ImageFont.truetype(font_path, username_fontsize)
+        username_font = imgtools.get_font(font_path, username_fontsize)
         username_y = avatar_y + 10
 
         with Pilmoji(stats) as pilmoji:
@@ -145,7 +137,7 @@ def generate_minimal_profile(
             max_width = content_width - 100  # Leave room for stars
             while pilmoji.getsize(username, username_font)[0] > max_width and username_fontsize > 20:
                 username_fontsize -= 2
-                username_font = ImageFont.truetype(font_path, username_fontsize)
+                username_font = imgtools.get_font(font_path, username_fontsize)
 
             pilmoji.text(
                 xy=(content_x, username_y),
@@ -157,7 +149,7 @@ def generate_minimal_profile(
         # --- Stars (top right of content area) ---
         stars_text = humanize_number(stars)
         stars_fontsize = 32
-        stars_font = ImageFont.truetype(font_path, stars_fontsize)
+        stars_font = imgtools.get_font(font_path, stars_fontsize)
         stars_width = stars_font.getlength(stars_text) + 35  # Icon + text
         stars_x = card_width - padding - int(stars_width)
 
@@ -176,7 +168,7 @@ def generate_minimal_profile(
         if prestige:
             prestige_text = _("Prestige {}").format(prestige)
             prestige_fontsize = 22
-            prestige_font = ImageFont.truetype(font_path, prestige_fontsize)
+            prestige_font = imgtools.get_font(font_path, prestige_fontsize)
 
             # Draw prestige badge background
             badge_padding = 8
@@ -222,9 +214,9 @@ def generate_minimal_profile(
         # --- Stats row ---
         stats_y = prestige_y + 15 if prestige else username_y + username_fontsize + 25
         stat_fontsize = 24
-        stat_font = ImageFont.truetype(font_path, stat_fontsize)
+        stat_font = imgtools.get_font(font_path, stat_fontsize)
         label_fontsize = 16
-        label_font = ImageFont.truetype(font_path, label_fontsize)
+        label_font = imgtools.get_font(font_path, label_fontsize)
 
         # Define stats to show
         stat_items = [
@@ -261,7 +253,7 @@ def generate_minimal_profile(
             balance_y = stats_y + label_fontsize + stat_fontsize + 20
             balance_text = f"{humanize_number(balance)} {currency_name}"
             balance_fontsize = 20
-            balance_font = ImageFont.truetype(font_path, balance_fontsize)
+            balance_font = imgtools.get_font(font_path, balance_fontsize)
 
             with Pilmoji(stats) as pilmoji:
                 pilmoji.text(
@@ -301,7 +293,7 @@ def generate_minimal_profile(
         goal = next_xp - previous_xp
         xp_text = f"{humanize_number(current)} / {humanize_number(goal)} XP"
         xp_fontsize = 16
-        xp_font = ImageFont.truetype(font_path, xp_fontsize)
+        xp_font = imgtools.get_font(font_path, xp_fontsize)
         draw.text(
             xy=(content_x, bar_y + bar_height + 6),
             text=xp_text,
@@ -333,15 +325,11 @@ def generate_minimal_profile(
 
         return stats
 
-    def create_avatar_layer(pfp_frame: Image.Image) -> Image.Image:
+    def create_avatar_layer(pfp_frame: Image.Image, key: t.Optional[str] = None) -> Image.Image:
         """Create the avatar with border"""
         layer = Image.new("RGBA", card_size, (0, 0, 0, 0))
 
-        if pfp_frame.mode != "RGBA":
-            pfp_frame = pfp_frame.convert("RGBA")
-
-        pfp_frame = pfp_frame.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-        pfp_frame = imgtools.make_profile_circle(pfp_frame)
+        pfp_frame = imgtools.fit_avatar(pfp_frame, (avatar_size, avatar_size), key)
 
         # Create a subtle border ring
         border_size = avatar_size + 8
@@ -369,12 +357,9 @@ def generate_minimal_profile(
 
         return layer
 
-    def prepare_background(bg_frame: Image.Image) -> Image.Image:
+    def prepare_background(bg_frame: Image.Image, key: t.Optional[str] = None) -> Image.Image:
         """Prepare background with overlay"""
-        if bg_frame.mode != "RGBA":
-            bg_frame = bg_frame.convert("RGBA")
-
-        bg_frame = imgtools.fit_aspect_ratio(bg_frame, card_size)
+        bg_frame = imgtools.fit_background(bg_frame, card_size, key)
 
         # Apply slight blur for depth
         bg_frame = bg_frame.filter(ImageFilter.GaussianBlur(2))
@@ -390,9 +375,9 @@ def generate_minimal_profile(
 
     # --- Static render ---
     if not render_gif or (not pfp_animated and not bg_animated):
-        card = prepare_background(bg.copy())
+        card = prepare_background(bg, bg_key)
         stats_layer = create_stats_layer()
-        avatar_layer = create_avatar_layer(pfp.copy())
+        avatar_layer = create_avatar_layer(pfp, pfp_key)
 
         card = Image.alpha_composite(card, stats_layer)
         card = Image.alpha_composite(card, avatar_layer)
@@ -406,7 +391,7 @@ def generate_minimal_profile(
 
     # --- Animated render (avatar animated, bg static) ---
     if pfp_animated and not bg_animated:
-        card_base = prepare_background(bg.copy())
+        card_base = prepare_background(bg, bg_key)
         stats_layer = create_stats_layer()
         card_base = Image.alpha_composite(card_base, stats_layer)
 
@@ -440,7 +425,7 @@ def generate_minimal_profile(
     # --- Animated render (bg animated, avatar static) ---
     if bg_animated and not pfp_animated:
         stats_layer = create_stats_layer()
-        avatar_layer = create_avatar_layer(pfp.copy())
+        avatar_layer = create_avatar_layer(pfp, pfp_key)
 
         avg_duration = imgtools.get_avg_duration(bg)
         frames: t.List[Image.Image] = []
@@ -26,7 +26,7 @@ import logging
 import typing as t
 from io import BytesIO
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 try:
     from .. import imgtools
@@ -58,6 +58,7 @@ def generate_runescape_profile(
         avatar_bytes = imgtools.download_image(avatar_bytes)
 
     pfp = imgtools.open_avatar(avatar_bytes)
+    pfp_key = imgtools.asset_key(avatar_bytes)
 
     pfp_animated = getattr(pfp, "is_animated", False)
     log.debug(f"PFP animated: {pfp_animated}")
@@ -78,7 +79,7 @@ def generate_runescape_profile(
     if balance:
         balance_text = f"{imgtools.abbreviate_number(balance)}"
         balance_size = 20
-        balance_font = ImageFont.truetype(str(font_path), balance_size)
+        balance_font = imgtools.get_font(font_path, balance_size)
         draw.text(
             xy=(44, 23),
             text=balance_text,
@@ -90,7 +91,7 @@ def generate_runescape_profile(
     if prestige:
         prestige_text = f"{imgtools.abbreviate_number(prestige)}"
         prestige_size = 35
-        prestige_font = ImageFont.truetype(str(font_path), prestige_size)
+        prestige_font = imgtools.get_font(font_path, prestige_size)
         draw.text(
             xy=(197, 149),
             text=prestige_text,
@@ -103,7 +104,7 @@ def generate_runescape_profile(
     # Draw level
     level_text = f"{imgtools.abbreviate_number(level)}"
     level_size = 20
-    level_font = ImageFont.truetype(str(font_path), level_size)
+    level_font = imgtools.get_font(font_path, level_size)
     draw.text(
         xy=(20, 58),
         text=level_text,
@@ -115,11 +116,11 @@ def generate_runescape_profile(
     # Draw rank
     rank_text = f"#{imgtools.abbreviate_number(position)}"
     rank_size = 20
-    rank_font = ImageFont.truetype(str(font_path), rank_size)
+    rank_font = imgtools.get_font(font_path, rank_size)
     lb, rb = 2, 32
     while rank_font.getlength(rank_text) > rb - lb:
         rank_size -= 1
-        rank_font = ImageFont.truetype(str(font_path), rank_size)
+        rank_font = imgtools.get_font(font_path, rank_size)
     draw.text(
         xy=(17, 93),
         text=rank_text,
@@ -130,7 +131,7 @@ def generate_runescape_profile(
     # Draw messages
     messages_text = f"{imgtools.abbreviate_number(messages)}"
     messages_size = 20
-    messages_font = ImageFont.truetype(str(font_path), messages_size)
+    messages_font = imgtools.get_font(font_path, messages_size)
     draw.text(
         xy=(27, 127),
         text=messages_text,
@@ -142,11 +143,11 @@ def generate_runescape_profile(
     # Draw voicetime
     voicetime_text = f"{imgtools.abbreviate_time(voicetime, short=True)}"
     voicetime_size = 20
-    voicetime_font = ImageFont.truetype(str(font_path), voicetime_size)
+    voicetime_font = imgtools.get_font(font_path, voicetime_size)
     lb, rb = 30, 65
     while voicetime_font.getlength(voicetime_text) > rb - lb:
         voicetime_size -= 1
-        voicetime_font = ImageFont.truetype(str(font_path), voicetime_size)
+        voicetime_font = imgtools.get_font(font_path, voicetime_size)
     draw.text(
         xy=(46, 155),
         text=voicetime_text,
@@ -161,7 +162,7 @@ def generate_runescape_profile(
     percent = round((current_xp - previous_xp) / (next_xp - previous_xp) * 100)
     xp_text = f"{current}/{goal} ({percent}%)"
     xp_size = 20
-    xp_font = ImageFont.truetype(str(font_path), xp_size)
+    xp_font = imgtools.get_font(font_path, xp_size)
     draw.text(
         xy=(105, 182),
         text=xp_text,
@@ -204,10 +205,7 @@ def generate_runescape_profile(
         return buffer.getvalue(), True
 
     # Place the pfp
-    if pfp.mode != "RGBA":
-        pfp = pfp.convert("RGBA")
-    pfp = pfp.resize((145, 145), Image.Resampling.LANCZOS)
-    pfp = imgtools.make_profile_circle(pfp)
+    pfp = imgtools.fit_avatar(pfp, (145, 145), pfp_key)
     card.paste(pfp, (65, 9), pfp)
     # Place the template
     card.paste(template, (0, 0), template)
@@ -123,6 +123,7 @@ class MessageListener(MixinMeta):
         weekly = None
         if conf.weeklysettings.on:
             weekly = conf.get_weekly_profile(message.author).add_message()
+        self.ranks.update(message.guild, conf, user_id)
 
         if perf_counter() - self.last_save > 300:
             # Save at least every 5 minutes
@@ -260,6 +261,7 @@ class MessageListener(MixinMeta):
         profile.xp += xp_to_add
         if weekly:
             weekly.xp += xp_to_add
+        self.ranks.update(message.guild, conf, user_id)
         # Check for levelups
         await self.check_levelups(
             guild=message.guild,
@@ -219,6 +219,7 @@ class VoiceListener(MixinMeta):
             profile.xp += xp_to_add
             if weekly:
                 weekly.xp += xp_to_add
+        self.ranks.update(member.guild, conf, member.id)
 
         # Now we need to update everyone else in the channel in case the exp gaining states have changed
         # Get the channel now that the user has left
@@ -48,6 +48,10 @@ from .abc import CompositeMetaClass
 from .commands import Commands
 from .commands.user import view_profile_context
 from .common.models import DB, VoiceTracking, run_migrations
+from .common.ranks import RankIndex
+from .common.rendercache import RenderCache
+from .common.renderpool import RenderPool, default_pool_size
+from .common.storage import ShardedStorage
 from .dashboard.integration import DashboardIntegration
 from .generator.tenor.converter import TenorAPI
 from .listeners import Listeners
@@ -80,7 +84,7 @@ class LevelUp(
     """
 
     __author__ = "[vertyco](https://github.com/vertyco/vrt-cogs)"
-    __version__ = "5.2.7"
+    __version__ = "5.6.0"
     __contributors__ = [
         "[aikaterna](https://github.com/aikaterna/aikaterna-cogs)",
         "[AAA3A](https://github.com/AAA3A-AAA3A/AAA3A-cogs)",
@@ -92,9 +96,10 @@ class LevelUp(
 
         # Cache
         self.db: DB = DB()
+        self.ranks: RankIndex = RankIndex()  # Leaderboard rankings, see common/ranks.py
         self.lastmsg: t.Dict[int, t.Dict[int, float]] = {}  # GuildID: {UserID: LastMessageTime}
         self.msg_cache: t.Dict[int, t.Dict[int, t.List[str]]] = {}  # GuildID: {UserID: [normalized messages]}
-        self.profile_cache: t.Dict[int, t.Dict[int, t.Tuple[str, bytes]]] = {}  # GuildID: {UserID: (last_used, bytes)}
+        self.render_cache: RenderCache = RenderCache(self.db.render_cache_mb * 1024 * 1024)  # See common/rendercache.py
         self.stars: t.Dict[int, t.Dict[int, datetime]] = {}  # Guild_ID: {User_ID: {User_ID: datetime}}
 
         # {guild_id: {member_id: tracking_data}}
@@ -104,6 +109,7 @@ class LevelUp(
         self.cog_path = cog_data_path(self)
         self.bundled_path = bundled_data_path(self)
         # Settings Files
+        self.storage = ShardedStorage(self.cog_path / "storage")
         self.settings_file = self.cog_path / "LevelUp.json"
         self.old_settings_file = self.cog_path / "settings.json"
         # Custom Paths
@@ -129,6 +135,9 @@ class LevelUp(
         # Prevents resource exhaustion during burst activity (e.g., raid level-ups)
         self._subprocess_semaphore = asyncio.Semaphore(os.cpu_count() or 4)
 
+        # Persistent pool of pre-warmed render workers (None when disabled)
+        self.render_pool: t.Optional[RenderPool] = None
+
         # Managed API process
         self._managed_api_process: t.Optional[asyncio.subprocess.Process] = None
         self._managed_api_pid_file = self.temp_dir / "managed_api.pid"
@@ -148,6 +157,56 @@ class LevelUp(
         self.stop_levelup_tasks()
         # Stop managed API process
         await self._stop_managed_api()
+        await self._stop_render_pool()
+
+    async def _start_render_pool(self) -> None:
+        """Start the persistent render worker pool if enabled"""
+        await self._stop_render_pool()
+        if self.db.render_workers < 0:
+            return
+        size = self.db.render_workers or default_pool_size()
+        # The semaphore gates both the pool and the one-shot fallback, so size it to the pool
+        self._subprocess_semaphore = asyncio.Semaphore(size)
+        self.render_pool = RenderPool(size, self.db.render_timeout)
+        await self.render_pool.start()
+
+    async def _stop_render_pool(self) -> None:
+        """Stop the persistent render worker pool if running"""
+        if self.render_pool is None:
+            return
+        pool, self.render_pool = self.render_pool, None
+        await pool.close()
+        self._subprocess_semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+    async def render_image(self, request_data: dict) -> t.Tuple[t.Optional[bytes], bool]:
+        """
+        Render a profile/levelup image out of process.
+
+        Uses the persistent render pool when it is running, otherwise spawns a one-shot subprocess.
+
+        Args:
+            request_data: Dictionary with generation parameters (ProfileRequest or LevelUpRequest schema)
+
+        Returns:
+            Tuple of (image_bytes, animated) or (None, False) on error
+        """
+        if self.render_pool is not None:
+            # Add custom fonts directory to request so workers can find them
+            request_data["custom_fonts_dir"] = str(self.custom_fonts)
+            async with self._subprocess_semaphore:
+                img_bytes, response = await self.render_pool.submit(request_data)
+            if img_bytes and response:
+                return img_bytes, response.animated
+            log.warning("Render pool failed, falling back to one-shot subprocess")
+
+        output_path, result = await self.run_profile_subprocess(request_data)
+        if not output_path or not result:
+            return None, False
+        img_bytes = await asyncio.to_thread(output_path.read_bytes)
+        animated = result.get("animated", result.get("format", "webp") == "gif")
+        with suppress(OSError):
+            output_path.unlink()
+        return img_bytes, animated
 
     async def run_profile_subprocess(
         self,
@@ -440,13 +499,22 @@ class LevelUp(
             if not self.initialized:
                 # Do not save if not initialized, we don't want to overwrite the config with default data
                 return
+            changes = None
             try:
                 log.debug("Saving config")
                 async with self.io_lock:
-                    await asyncio.to_thread(self.db.to_file, self.settings_file)
-                log.debug("Config saved")
+                    start = perf_counter()
+                    changes = self.storage.collect(self.db)
+                    await asyncio.to_thread(self.storage.write, changes)
+                log.debug(
+                    f"Config saved ({len(changes.guilds)}/{len(self.db.configs)} guilds written "
+                    f"in {(perf_counter() - start) * 1000:.1f}ms)"
+                )
             except Exception as e:
                 log.error("Failed to save config", exc_info=e)
+                if changes is not None:
+                    # Make sure the guilds we failed to write get picked up next time
+                    self.db.mark_dirty(*changes.guilds)
             finally:
                 self.last_save = perf_counter()
 
@@ -457,10 +525,21 @@ class LevelUp(
         if not hasattr(self, "__author__"):
             return
         migrated = False
-        if self.settings_file.exists():
+        if self.storage.exists():
             log.info("Loading config")
+            try:
+                self.db = await asyncio.to_thread(self.storage.load)
+            except Exception as e:
+                log.error("Failed to load config!", exc_info=e)
+                return
+        elif self.settings_file.exists():
+            log.warning("Migrating LevelUp.json to sharded storage")
             try:
                 self.db = await asyncio.to_thread(DB.from_file, self.settings_file)
+                written, elapsed = await asyncio.to_thread(self.storage.flush, self.db)
+                # Keep the old file around as a backup, but out of the way of future loads
+                self.settings_file.replace(self.settings_file.with_suffix(".json.bak"))
+                log.warning(f"Migrated {written} guilds to sharded storage in {elapsed:.2f}s")
             except Exception as e:
                 log.error("Failed to load config!", exc_info=e)
                 return
@@ -515,6 +594,9 @@ class LevelUp(
         if self.db.managed_api:
             await self._start_managed_api()
 
+        self.render_cache.resize(self.db.render_cache_mb * 1024 * 1024)
+        await self._start_render_pool()
+
     async def load_tenor(self) -> None:
         tokens = await self.bot.get_shared_api_tokens("tenor")
         if "api_key" in tokens:
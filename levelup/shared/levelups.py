@@ -210,18 +210,9 @@ class LevelUps(MixinMeta):
                 except Exception as e:
                     log.error("Failed to fetch levelup image from API", exc_info=e)
 
-            # Try subprocess if API failed or not configured
+            # Try the render pool (or a one-shot subprocess) if API failed or not configured
             if not img_bytes:
-                output_path, result = await self.run_profile_subprocess(request_data)
-
-                if output_path and result:
-                    img_bytes = output_path.read_bytes()
-                    animated = result.get("animated", False)
-                    # Clean up output file
-                    try:
-                        output_path.unlink()
-                    except Exception:
-                        pass
+                img_bytes, animated = await self.render_image(request_data)
 
             # Final fallback - run in-process
             if not img_bytes:
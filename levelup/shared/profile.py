@@ -4,7 +4,6 @@ import logging
 import random
 import typing as t
 from io import BytesIO
-from time import perf_counter
 
 import aiohttp
 import discord
@@ -14,8 +13,8 @@ from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, humanize_number
 
 from ..abc import MixinMeta
-from ..common import formatter, utils
-from ..common.models import Profile
+from ..common import rendercache, utils
+from ..common.models import GuildSettings, Profile
 from ..generator import imgtools
 from ..generator.styles import default, gaming, minimal, runescape
 
@@ -40,6 +39,15 @@ class ProfileFormatting(MixinMeta):
             )
         return discord.File(BytesIO(img_bytes), filename=f"profile.{ext}")
 
+    def cache_profile_file(self, cache_key: t.Optional[str], file: discord.File) -> discord.File:
+        """Store a rendered profile in the render cache under its input hash"""
+        if cache_key is None:
+            return file
+        img_bytes = file.fp.read()
+        file.fp.seek(0)
+        self.render_cache.put(cache_key, img_bytes, file.filename or "profile.webp")
+        return file
+
     async def add_xp(self, member: discord.Member, xp: int) -> int:
         """Add XP to a user and check for level ups"""
         if not isinstance(member, discord.Member):
@@ -48,6 +56,7 @@ class ProfileFormatting(MixinMeta):
         profile = conf.get_profile(member)
         profile.xp += xp
         profile.level = conf.algorithm.get_level(profile.xp)
+        self.ranks.update(member.guild, conf, member.id)
         self.save(False)
         return int(profile.xp)
 
@@ -59,6 +68,7 @@ class ProfileFormatting(MixinMeta):
         profile = conf.get_profile(member)
         profile.xp = xp
         profile.level = conf.algorithm.get_level(profile.xp)
+        self.ranks.update(member.guild, conf, member.id)
         self.save(False)
         return int(profile.xp)
 
@@ -70,6 +80,7 @@ class ProfileFormatting(MixinMeta):
         profile = conf.get_profile(member)
         profile.xp = max(0, profile.xp - xp)
         profile.level = conf.algorithm.get_level(profile.xp)
+        self.ranks.update(member.guild, conf, member.id)
         self.save(False)
         return int(profile.xp)
 
@@ -156,6 +167,26 @@ class ProfileFormatting(MixinMeta):
         # Fallback to random
         return random.choice(valid).read_bytes()
 
+    def background_is_random(self, profile: Profile, guild_conf: t.Optional[GuildSettings] = None) -> bool:
+        """Whether `get_profile_background` falls back to a random file for this profile
+
+        Mirrors its priority without any lookups, so URL and banner backgrounds are not counted as random.
+        """
+        if profile.background.startswith("b64:") or profile.background.lower().startswith("http"):
+            return False
+        if profile.background == "random":
+            return True
+        valid = list(self.backgrounds.glob("*.webp")) + list(self.custom_backgrounds.iterdir())
+        names = {path.stem for path in valid} | {path.name for path in valid}
+        if profile.background in names:
+            return False
+        if guild_conf and guild_conf.default_background != "default":
+            if guild_conf.default_background.lower().startswith("http"):
+                return False
+            if guild_conf.default_background in names:
+                return False
+        return True
+
     async def get_banner(self, user_id: int) -> t.Optional[str]:
         """Fetch a user's banner from Discord's API
 
@@ -205,14 +236,7 @@ class ProfileFormatting(MixinMeta):
         current_diff = next_level_xp - last_level_xp
         progress = current_diff - (next_level_xp - current_xp)
 
-        stat = await asyncio.to_thread(
-            formatter.get_user_position,
-            guild=guild,
-            conf=conf,
-            lbtype="xp",
-            target_user=member.id,
-            key="xp",
-        )
+        stat = self.ranks.get_position(guild=guild, conf=conf, lbtype="lb", target_user=member.id, key="xp")
         bar = utils.get_bar(progress, current_diff)
 
         level = conf.emojis.get("level", self.bot)
@@ -317,6 +341,7 @@ class ProfileFormatting(MixinMeta):
             request_data["role_icon_url"] = member.top_role.icon.url
 
         # Get background URL/bytes
+        background = None
         if profile_style != "runescape":
             background = await self.get_profile_background(member.id, profile, try_return_url=True, guild_id=guild.id)
             if isinstance(background, str):
@@ -333,6 +358,21 @@ class ProfileFormatting(MixinMeta):
         # Always use avatar URL (external API and subprocess both support URL fetching)
         request_data["avatar_url"] = str(member.display_avatar.url)
 
+        # Serve unchanged profiles straight from the render cache
+        cache_key = None
+        # A random background is picked again on every view, so those renders can't be reused
+        random_background = isinstance(background, bytes) and self.background_is_random(profile, conf)
+        if self.db.render_cache_mb and not random_background:
+            cache_key = rendercache.make_key(
+                request_data,
+                background=profile.background,
+                guild_background=conf.default_background,
+                filesize_limit=guild.filesize_limit,
+            )
+            if cached := self.render_cache.get(cache_key):
+                img_bytes, filename = cached
+                return discord.File(BytesIO(img_bytes), filename=filename)
+
         # Try API first if configured (external or managed local)
         if api_url := self.get_api_url():
             endpoints = {
@@ -363,23 +403,17 @@ class ProfileFormatting(MixinMeta):
                             data = await response.json()
                             img_b64, animated = data["b64"], data["animated"]
                             img_bytes = base64.b64decode(img_b64)
-                            return self.make_profile_file(member, img_bytes, animated)
+                            return self.cache_profile_file(
+                                cache_key, self.make_profile_file(member, img_bytes, animated)
+                            )
                         log.error(f"Failed to fetch profile from API: {response.status}")
             except Exception as e:
                 log.error("Failed to fetch profile from API, falling back to subprocess", exc_info=e)
 
-        # Use subprocess for image generation
-        output_path, result = await self.run_profile_subprocess(request_data)
-
-        if output_path and result:
-            img_bytes = output_path.read_bytes()
-            animated = result.get("animated", result.get("format", "webp") == "gif")
-            # Clean up output file
-            try:
-                output_path.unlink()
-            except Exception:
-                pass
-            return self.make_profile_file(member, img_bytes, animated)
+        # Use the render pool (or a one-shot subprocess) for image generation
+        img_bytes, animated = await self.render_image(request_data)
+        if img_bytes:
+            return self.cache_profile_file(cache_key, self.make_profile_file(member, img_bytes, animated))
 
         # Final fallback - run in-process (should rarely happen)
         log.warning("Subprocess failed, falling back to in-process generation")
@@ -441,31 +475,11 @@ class ProfileFormatting(MixinMeta):
             return self.make_profile_file(member, img_bytes, animated)
 
         file = await asyncio.to_thread(_run)
-        return file
+        return self.cache_profile_file(cache_key, file)
 
     async def get_user_profile_cached(self, member: discord.Member) -> t.Union[discord.File, discord.Embed]:
-        """Cached version of get_user_profile"""
-        if not self.db.cache_seconds:
-            return await self.get_user_profile(member)
-        now = perf_counter()
-        cachedata = self.profile_cache.setdefault(member.guild.id, {}).get(member.id)
-        if cachedata is None:
-            file = await self.get_user_profile(member)
-            if not isinstance(file, discord.File):
-                return file
-            filebytes = file.fp.read()
-            filename = file.filename or "profile.webp"
-            self.profile_cache[member.guild.id][member.id] = (now, filebytes, filename)
-            return discord.File(BytesIO(filebytes), filename=filename)
-
-        last_used, imgbytes, filename = cachedata
-        if last_used and now - last_used < self.db.cache_seconds:
-            return discord.File(BytesIO(imgbytes), filename=filename)
-
-        file = await self.get_user_profile(member)
-        if not isinstance(file, discord.File):
-            return file
-        filebytes = file.fp.read()
-        filename = file.filename or "profile.webp"
-        self.profile_cache[member.guild.id][member.id] = (now, filebytes, filename)
-        return discord.File(BytesIO(filebytes), filename=filename)
+        """Cached version of get_user_profile
+
+        Rendered cards are cached by their inputs inside get_user_profile, this is kept for API compatibility.
+        """
+        return await self.get_user_profile(member)
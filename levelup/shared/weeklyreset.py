@@ -202,6 +202,7 @@ class WeeklyReset(MixinMeta):
         conf.weeklysettings.refresh()
         conf.users_weekly.clear()
         conf.weeklysettings.last_embed = dict(embed.to_dict())
+        self.ranks.invalidate(guild.id)
         self.save()
         if ctx:
             await ctx.send(_("Weekly stats have been reset."))
@@ -5,6 +5,8 @@ from piccolo.engine.postgres import PostgresEngine
 from piccolo.engine.sqlite import SQLiteEngine
 from redbot.core.bot import Red
 
+from .common.rollups import Rollups
+from .common.status import StatusCounts
 from .common.utils import DBUtils
 from .db.tables import GlobalSettings
 
@@ -20,6 +22,8 @@ class MixinMeta(ABC):
         self.bot: Red
         self.db: SQLiteEngine | PostgresEngine | None
         self.db_utils: DBUtils
+        self.rollups: Rollups
+        self.status_counts: StatusCounts
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -29,6 +33,10 @@ class MixinMeta(ABC):
     def db_active(self) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    async def cleanup_old_snapshots(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def configure_task_intervals(self, settings: GlobalSettings) -> None:
         raise NotImplementedError
@@ -16,11 +16,13 @@ from ..abc import MixinMeta
 from ..common import utils
 from ..common.checks import ensure_db_connection
 from ..db.tables import (
+    DailyRollup,
     GlobalEconomySnapshot,
     GlobalMemberSnapshot,
     GlobalPerformanceSnapshot,
     GuildEconomySnapshot,
     GuildMemberSnapshot,
+    HourlyRollup,
 )
 
 log = logging.getLogger("red.vrt.metrics.admin")
@@ -119,6 +121,8 @@ class Admin(MixinMeta):
         embed.add_field(name="Member Interval (min)", value=str(global_settings.member_interval))
         embed.add_field(name="Performance Interval (min)", value=str(global_settings.performance_interval))
 
+        embed.add_field(name="Raw Snapshot Age (Days)", value=str(global_settings.raw_snapshot_age_days))
+        embed.add_field(name="Hourly Rollup Age (Days)", value=str(global_settings.hourly_rollup_age_days))
         embed.add_field(name="Max Snapshot Age (Days)", value=str(global_settings.max_snapshot_age_days))
         embed.add_field(name="Track Bank", value=str(global_settings.track_bank))
         embed.add_field(name="Track Members", value=str(global_settings.track_members))
@@ -132,6 +136,8 @@ class Admin(MixinMeta):
         embed.add_field(name="Economy Data Points", value=str(economy_count))
         embed.add_field(name="Member Data Points", value=str(member_count))
         embed.add_field(name="Performance Data Points", value=str(performance_count))
+        embed.add_field(name="Hourly Rollups", value=str(await HourlyRollup.count()))
+        embed.add_field(name="Daily Rollups", value=str(await DailyRollup.count()))
         await ctx.send(embed=embed)
 
     @global_settings.command(name="economyinterval")
@@ -163,12 +169,53 @@ class Admin(MixinMeta):
 
     @global_settings.command(name="maxage")
     async def set_max_snapshot_age(self, ctx: commands.Context, days: commands.positive_int):
-        """Set the maximum age in days to keep snapshots."""
+        """Set the maximum age in days to keep any metrics history.
+
+        History older than the hourly rollup age is only kept as daily rollups.
+        """
         global_settings = await self.db_utils.get_create_global_settings()
+        if days < global_settings.hourly_rollup_age_days:
+            await ctx.send(
+                f"Max snapshot age can't be lower than the hourly rollup age ({global_settings.hourly_rollup_age_days} days)."
+            )
+            return
         global_settings.max_snapshot_age_days = days
         await global_settings.save()
         await ctx.send(f"Max snapshot age set to {days} days.")
 
+    @global_settings.command(name="rawage")
+    async def set_raw_snapshot_age(self, ctx: commands.Context, days: commands.positive_int):
+        """Set the maximum age in days to keep raw snapshots.
+
+        Older history is still graphed from the hourly and daily rollups.
+        """
+        global_settings = await self.db_utils.get_create_global_settings()
+        if days > global_settings.hourly_rollup_age_days:
+            await ctx.send(
+                f"Raw snapshot age can't be higher than the hourly rollup age ({global_settings.hourly_rollup_age_days} days)."
+            )
+            return
+        global_settings.raw_snapshot_age_days = days
+        await global_settings.save()
+        await ctx.send(f"Raw snapshot age set to {days} days.")
+
+    @global_settings.command(name="hourlyage")
+    async def set_hourly_rollup_age(self, ctx: commands.Context, days: commands.positive_int):
+        """Set the maximum age in days to keep hourly rollups.
+
+        Older history is still graphed from the daily rollups.
+        """
+        global_settings = await self.db_utils.get_create_global_settings()
+        if not global_settings.raw_snapshot_age_days <= days <= global_settings.max_snapshot_age_days:
+            await ctx.send(
+                f"Hourly rollup age must be between the raw snapshot age ({global_settings.raw_snapshot_age_days} days) "
+                f"and the max snapshot age ({global_settings.max_snapshot_age_days} days)."
+            )
+            return
+        global_settings.hourly_rollup_age_days = days
+        await global_settings.save()
+        await ctx.send(f"Hourly rollup age set to {days} days.")
+
     @global_settings.command(name="track")
     async def toggle_tracking(self, ctx: commands.Context, metric: t.Literal["bank", "members", "performance"]):
         """Toggle tracking for a specific global metric."""
@@ -301,6 +348,7 @@ class Admin(MixinMeta):
                     .where(GuildMemberSnapshot.member_total == 0)
                     .returning(GuildMemberSnapshot.id)
                 )
+                await self.rollups.rebuild(GuildMemberSnapshot)
                 await ctx.send(f"Deleted {len(deleted)} guild member snapshots with 0 members.")
 
     def _find_outlier_ids(
@@ -381,6 +429,7 @@ class Admin(MixinMeta):
             return 0
 
         deleted = await table.delete().where(table.id.is_in(outlier_ids)).returning(table.id)
+        await self.rollups.rebuild(table)
         results.append(f"**{label}:** Deleted {len(deleted)} outliers")
         return len(deleted)
 
@@ -455,13 +504,19 @@ class Admin(MixinMeta):
                 return await ctx.send("No EconomyTrack data found in config!")
 
             et_data = data["117"]
+            # Newer EconomyTrack versions keep their points in series files instead of the config
+            series_path = path.parent / "series"
+
+            def _points(legacy: list, name: str) -> list:
+                return legacy or utils.read_economytrack_series(series_path / f"{name}.bin")
 
             guild_economy_snapshots: list[GuildEconomySnapshot] = []
             guild_member_snapshots: list[GuildMemberSnapshot] = []
             global_economy_snapshots: list[GlobalEconomySnapshot] = []
 
             # Import global economy data
-            async for entry in AsyncIter(et_data.get("GLOBAL", {}).get("data", []), steps=100):
+            global_points = await asyncio.to_thread(_points, et_data.get("GLOBAL", {}).get("data", []), "global_bank")
+            async for entry in AsyncIter(global_points, steps=100):
                 timestamp, bank_total = entry
                 timestamp_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                 global_economy_snapshots.append(GlobalEconomySnapshot(created_on=timestamp_dt, bank_total=bank_total))
@@ -476,7 +531,8 @@ class Admin(MixinMeta):
                 await guild_settings.save()
 
                 # Import guild economy data
-                async for entry in AsyncIter(guild_data.get("data", []), steps=100):
+                bank_points = await asyncio.to_thread(_points, guild_data.get("data", []), f"{guild_id}_bank")
+                async for entry in AsyncIter(bank_points, steps=100):
                     timestamp, bank_total = entry
                     timestamp_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                     guild_economy_snapshots.append(
@@ -488,7 +544,10 @@ class Admin(MixinMeta):
                     )
 
                 # Import guild member data
-                async for entry in AsyncIter(guild_data.get("member_data", []), steps=100):
+                member_points = await asyncio.to_thread(
+                    _points, guild_data.get("member_data", []), f"{guild_id}_members"
+                )
+                async for entry in AsyncIter(member_points, steps=100):
                     timestamp, member_total = entry
                     timestamp_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                     guild_member_snapshots.append(
@@ -506,10 +565,13 @@ class Admin(MixinMeta):
             if overwrite:
                 if guild_economy_snapshots:
                     await GuildEconomySnapshot.delete(force=True)
+                    await self.rollups.clear(GuildEconomySnapshot)
                 if guild_member_snapshots:
                     await GuildMemberSnapshot.delete(force=True)
+                    await self.rollups.clear(GuildMemberSnapshot)
                 if global_economy_snapshots:
                     await GlobalEconomySnapshot.delete(force=True)
+                    await self.rollups.clear(GlobalEconomySnapshot)
 
             # Insert data in chunks
             if guild_economy_snapshots:
@@ -524,6 +586,14 @@ class Admin(MixinMeta):
                 for chunk in utils.chunk(global_economy_snapshots, 100):
                     await GlobalEconomySnapshot.insert(*chunk)
 
+            # Imported history is backdated, aggregate it into the rollups
+            if guild_economy_snapshots:
+                await self.rollups.rebuild(GuildEconomySnapshot)
+            if guild_member_snapshots:
+                await self.rollups.rebuild(GuildMemberSnapshot)
+            if global_economy_snapshots:
+                await self.rollups.rebuild(GlobalEconomySnapshot)
+
             await ctx.send(
                 f"Imported:\n"
                 f"- {len(guild_economy_snapshots)} guild economy snapshots\n"
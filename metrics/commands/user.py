@@ -67,19 +67,9 @@ class User(MixinMeta):
         if show_global:
             title = f"Global Bank Metrics ({currency_name})"
             table = GlobalEconomySnapshot
-            query = GlobalEconomySnapshot.select(
-                GlobalEconomySnapshot.created_on,
-                getattr(GlobalEconomySnapshot, query_key),
-            ).where(getattr(GlobalEconomySnapshot, query_key).is_not_null())
         else:
             title = f"Bank Metrics for {ctx.guild.name} ({currency_name})"
             table = GuildEconomySnapshot
-            query = GuildEconomySnapshot.select(
-                GuildEconomySnapshot.created_on,
-                getattr(GuildEconomySnapshot, query_key),
-            ).where(
-                (GuildEconomySnapshot.guild == ctx.guild.id) & (getattr(GuildEconomySnapshot, query_key).is_not_null())
-            )
 
         if timespan and timespan.lower() == "none":
             timespan = None
@@ -89,9 +79,16 @@ class User(MixinMeta):
             end_time=end,
             timezone=settings.timezone,
         )
-        query = query.where((table.created_on >= start_time) & (table.created_on <= end_time))
-
-        data: list[dict] = await query.order_by(table.created_on)
+        series = await self.rollups.get_series(
+            table,
+            [query_key],
+            start_time,
+            end_time,
+            global_settings,
+            interval_minutes,
+            guild_id=None if show_global else ctx.guild.id,
+        )
+        data = series.data
         if not data:
             return await ctx.send("No data available for the specified timespan.", ephemeral=True)
         if len(data) < 2:
@@ -110,30 +107,32 @@ class User(MixinMeta):
             # Apply a rolling average to smooth out the data
             actual_delta = df.index[-1] - df.index[0]
             point_count = len(df.index)
-            rolling_window = utils.get_window(actual_delta, point_count, interval_minutes)
+            rolling_window = utils.get_window(actual_delta, point_count, series.interval_minutes)
             rolling_column = "(Rolling Avg)"
             df[rolling_column] = df[currency_name].rolling(window=rolling_window, min_periods=1).mean()
             df.reset_index(inplace=True)
             # ------- END DATA SMOOTHING -------
+            stats = series.stats[query_key]
             image_bytes = plots.render_bank_plot(df, currency_name, rolling_column)
             buffer = BytesIO(image_bytes)
             buffer.seek(0)
             file = discord.File(buffer, filename=f"{uuid4()}.png")
             timeframe = humanize_timedelta(timedelta=actual_delta)
+            smoothing = utils.describe_smoothing(rolling_window, series.resolution)
             dataset_label = "Average Balance" if average_balance else "Total Balance"
             scope_label = "Global" if show_global else ctx.guild.name
             embed = discord.Embed(
                 title=title,
-                description=f"{dataset_label} trend for **{scope_label}** over **{timeframe}**\nSmoothing window: {rolling_window} points",
+                description=f"{dataset_label} trend for **{scope_label}** over **{timeframe}**\n{smoothing}",
                 color=color,
             )
             embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Timezone: {settings.timezone}")
-            highest = int(df[currency_name].max())
-            lowest = int(df[currency_name].min())
+            highest = int(stats["highest"])
+            lowest = int(stats["lowest"])
             field = (
-                f"`Current: `{humanize_number(int(df[currency_name].iloc[-1]))}\n"
-                f"`Average: `{humanize_number(int(df[currency_name].mean()))}\n"
+                f"`Current: `{humanize_number(int(stats['current']))}\n"
+                f"`Average: `{humanize_number(int(stats['average']))}\n"
                 f"`Highest: `{humanize_number(highest)}\n"
                 f"`Lowest:  `{humanize_number(lowest)}\n"
                 f"`Diff:    `{humanize_number(highest - lowest)}"
@@ -181,19 +180,9 @@ class User(MixinMeta):
         if show_global:
             title = "Global Member Metrics"
             table = GlobalMemberSnapshot
-            query = GlobalMemberSnapshot.select(
-                GlobalMemberSnapshot.created_on,
-                getattr(GlobalMemberSnapshot, query_key),
-            ).where(getattr(GlobalMemberSnapshot, query_key).is_not_null())
         else:
             title = f"Member Metrics for {ctx.guild.name}"
             table = GuildMemberSnapshot
-            query = GuildMemberSnapshot.select(
-                GuildMemberSnapshot.created_on,
-                getattr(GuildMemberSnapshot, query_key),
-            ).where(
-                (GuildMemberSnapshot.guild == ctx.guild.id) & (getattr(GuildMemberSnapshot, query_key).is_not_null())
-            )
 
         if timespan and timespan.lower() == "none":
             timespan = None
@@ -203,9 +192,16 @@ class User(MixinMeta):
             end_time=end,
             timezone=settings.timezone,
         )
-        query = query.where((table.created_on >= start_time) & (table.created_on <= end_time))
-
-        data: list[dict] = await query.order_by(table.created_on)
+        series = await self.rollups.get_series(
+            table,
+            [query_key],
+            start_time,
+            end_time,
+            global_settings,
+            interval_minutes,
+            guild_id=None if show_global else ctx.guild.id,
+        )
+        data = series.data
         if not data:
             return await ctx.send("No data available for the specified timespan.", ephemeral=True)
         if len(data) < 2:
@@ -221,31 +217,30 @@ class User(MixinMeta):
             df.index.rename("Date", inplace=True)
             actual_delta = df.index[-1] - df.index[0]
             point_count = len(df.index)
-            rolling_window = utils.get_window(actual_delta, point_count, interval_minutes)
+            rolling_window = utils.get_window(actual_delta, point_count, series.interval_minutes)
             rolling_column = "(Rolling Avg)"
             df[rolling_column] = df[dataset_label].rolling(window=rolling_window, min_periods=1).mean()
             df.reset_index(inplace=True)
+            stats = series.stats[query_key]
             image_bytes = plots.render_member_plot(df, dataset_label, rolling_column, rolling_color)
             buffer = BytesIO(image_bytes)
             buffer.seek(0)
             file = discord.File(buffer, filename=f"{uuid4()}.png")
             timeframe = humanize_timedelta(timedelta=actual_delta)
+            smoothing = utils.describe_smoothing(rolling_window, series.resolution)
             scope_label = "Global" if show_global else ctx.guild.name
             embed = discord.Embed(
                 title=title,
-                description=(
-                    f"{dataset_label} trend for **{scope_label}** over **{timeframe}**\n"
-                    f"Smoothing window: {rolling_window} points"
-                ),
+                description=(f"{dataset_label} trend for **{scope_label}** over **{timeframe}**\n{smoothing}"),
                 color=color,
             )
             embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Timezone: {settings.timezone}")
-            highest = int(df[dataset_label].max())
-            lowest = int(df[dataset_label].min())
+            highest = int(stats["highest"])
+            lowest = int(stats["lowest"])
             field = (
-                f"`Current: `{humanize_number(int(df[dataset_label].iloc[-1]))}\n"
-                f"`Average: `{humanize_number(int(df[dataset_label].mean()))}\n"
+                f"`Current: `{humanize_number(int(stats['current']))}\n"
+                f"`Average: `{humanize_number(int(stats['average']))}\n"
                 f"`Highest: `{humanize_number(highest)}\n"
                 f"`Lowest:  `{humanize_number(lowest)}\n"
                 f"`Diff:    `{humanize_number(highest - lowest)}"
@@ -290,11 +285,6 @@ class User(MixinMeta):
 
         query_key, dataset_label, unit_suffix, decimals = metric_map[metric.lower()]
 
-        query = GlobalPerformanceSnapshot.select(
-            GlobalPerformanceSnapshot.created_on,
-            getattr(GlobalPerformanceSnapshot, query_key),
-        ).where(getattr(GlobalPerformanceSnapshot, query_key).is_not_null())
-
         if timespan and timespan.lower() == "none":
             timespan = None
         start_time, end_time = utils.get_timespan(
@@ -303,11 +293,15 @@ class User(MixinMeta):
             end_time=end,
             timezone=settings.timezone,
         )
-        query = query.where(
-            (GlobalPerformanceSnapshot.created_on >= start_time) & (GlobalPerformanceSnapshot.created_on <= end_time)
+        series = await self.rollups.get_series(
+            GlobalPerformanceSnapshot,
+            [query_key],
+            start_time,
+            end_time,
+            global_settings,
+            interval_minutes,
         )
-
-        data: list[dict] = await query.order_by(GlobalPerformanceSnapshot.created_on)
+        data = series.data
         if not data:
             return await ctx.send("No data available for the specified timespan.", ephemeral=True)
         if len(data) < 2:
@@ -323,18 +317,20 @@ class User(MixinMeta):
             df.index.rename("Date", inplace=True)
             actual_delta = df.index[-1] - df.index[0]
             point_count = len(df.index)
-            rolling_window = utils.get_window(actual_delta, point_count, interval_minutes)
+            rolling_window = utils.get_window(actual_delta, point_count, series.interval_minutes)
             rolling_column = "(Rolling Avg)"
             df[rolling_column] = df[dataset_label].rolling(window=rolling_window, min_periods=1).mean()
             df.reset_index(inplace=True)
+            stats = series.stats[query_key]
             image_bytes = plots.render_performance_plot(df, dataset_label, rolling_column)
             buffer = BytesIO(image_bytes)
             buffer.seek(0)
             file = discord.File(buffer, filename=f"{uuid4()}.png")
             timeframe = humanize_timedelta(timedelta=actual_delta)
+            smoothing = utils.describe_smoothing(rolling_window, series.resolution)
 
-            highest = df[dataset_label].max()
-            lowest = df[dataset_label].min()
+            highest = stats["highest"]
+            lowest = stats["lowest"]
             diff = highest - lowest
 
             def format_value(value: float) -> str:
@@ -346,14 +342,14 @@ class User(MixinMeta):
 
             embed = discord.Embed(
                 title="Global Performance Metrics",
-                description=(f"{dataset_label} trend over **{timeframe}**\nSmoothing window: {rolling_window} points"),
+                description=f"{dataset_label} trend over **{timeframe}**\n{smoothing}",
                 color=color,
             )
             embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Timezone: {settings.timezone}")
             field = (
-                f"`Current: `{format_value(df[dataset_label].iloc[-1])}\n"
-                f"`Average: `{format_value(df[dataset_label].mean())}\n"
+                f"`Current: `{format_value(stats['current'])}\n"
+                f"`Average: `{format_value(stats['average'])}\n"
                 f"`Highest: `{format_value(highest)}\n"
                 f"`Lowest:  `{format_value(lowest)}\n"
                 f"`Diff:    `{format_value(diff)}"
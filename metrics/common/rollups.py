@@ -0,0 +1,415 @@
+"""Hourly and daily rollups of the snapshot tables.
+
+Graphs over long timespans don't need every raw snapshot, so each snapshot task also folds
+its rows into per-hour and per-day buckets holding the min/max/avg/last of every metric.
+Queries read from the coarsest resolution that still gives the graph enough points, which
+lets raw rows be pruned long before the rollups.
+
+Buckets are truncated to the hour/day (UTC) in Python rather than with date_trunc so the
+same code runs on both SQLite and Postgres.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from piccolo.columns.defaults.timestamptz import TimestamptzNow
+from piccolo.table import Table
+
+from ..db.tables import (
+    DailyRollup,
+    GlobalEconomySnapshot,
+    GlobalMemberSnapshot,
+    GlobalPerformanceSnapshot,
+    GlobalSettings,
+    GuildEconomySnapshot,
+    GuildMemberSnapshot,
+    HourlyRollup,
+)
+
+log = logging.getLogger("red.vrt.metrics.rollups")
+
+SNAPSHOT_TABLES: list[type[Table]] = [
+    GuildEconomySnapshot,
+    GuildMemberSnapshot,
+    GlobalEconomySnapshot,
+    GlobalMemberSnapshot,
+    GlobalPerformanceSnapshot,
+]
+
+# Resolution -> (rollup table, bucket size), coarsest first
+RESOLUTIONS: dict[str, tuple[type[Table], timedelta]] = {
+    "day": (DailyRollup, timedelta(days=1)),
+    "hour": (HourlyRollup, timedelta(hours=1)),
+}
+
+# Minimum points a graph should have before a coarser resolution is used
+MIN_GRAPH_POINTS = 100
+
+
+def truncate(ts: datetime, resolution: str) -> datetime:
+    """Start of the hour/day (UTC) the timestamp falls in"""
+    ts = ts.astimezone(timezone.utc)
+    if resolution == "day":
+        return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def metric_columns(table: type[Table]) -> list[str]:
+    """Names of the value columns of a snapshot table"""
+    return [col._meta.name for col in table._meta.columns if col._meta.name not in ("id", "created_on", "guild")]
+
+
+@dataclass
+class Bucket:
+    """Running aggregate of one metric over one bucket"""
+
+    min: float | None = None
+    max: float | None = None
+    total: float = 0.0
+    last: float | None = None
+    samples: int = 0
+
+    @property
+    def avg(self) -> float | None:
+        return self.total / self.samples if self.samples else None
+
+    def add(self, value: int | float | None) -> None:
+        if value is None:
+            return
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.total += value
+        self.last = value
+        self.samples += 1
+
+
+# (guild, metric) -> aggregate
+Buckets = dict[tuple[int, str], Bucket]
+
+
+def to_rows(rollup: type[Table], source: str, start: datetime, buckets: Buckets) -> list[Table]:
+    return [
+        rollup(
+            bucket=start,
+            source=source,
+            guild=guild,
+            metric=metric,
+            min_value=bucket.min,
+            max_value=bucket.max,
+            avg_value=bucket.avg,
+            last_value=bucket.last,
+            samples=bucket.samples,
+        )
+        for (guild, metric), bucket in buckets.items()
+        if bucket.samples
+    ]
+
+
+@dataclass
+class Series:
+    """Time series ready for graphing"""
+
+    data: list[dict]  # created_on + requested metrics, oldest first
+    interval_minutes: int  # Spacing between points, for the smoothing window
+    resolution: str  # "raw", "hour" or "day"
+    stats: dict[str, dict[str, float]] = field(default_factory=dict)  # metric -> first/current/average/highest/lowest
+
+
+class Rollups:
+    """Maintains the rollup tables and reads graph data from the best resolution.
+
+    The buckets currently being filled are kept in memory per source table, so a snapshot
+    only rewrites the current hour/day rows instead of re-aggregating them from raw rows.
+    """
+
+    def __init__(self):
+        # (resolution, source) -> (bucket start, aggregates)
+        self.current: dict[tuple[str, str], tuple[datetime, Buckets]] = {}
+        self.locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    async def record(self, table: type[Table], rows: list[Table]) -> None:
+        """Fold freshly inserted snapshot rows into the current hour and day buckets"""
+        if not rows:
+            return
+        records = [row.to_dict() for row in rows]
+        source = table._meta.tablename
+        try:
+            async with self.locks[source]:
+                for resolution in RESOLUTIONS:
+                    await self._fold(table, resolution, records)
+        except Exception as e:
+            # Next record reloads the buckets from the database
+            self.reset(source)
+            log.exception(f"Failed to update rollups for {source}", exc_info=e)
+
+    async def _fold(self, table: type[Table], resolution: str, records: list[dict]) -> None:
+        source = table._meta.tablename
+        rollup, step = RESOLUTIONS[resolution]
+        metrics = metric_columns(table)
+        grouped: dict[datetime, list[dict]] = defaultdict(list)
+        for record in records:
+            grouped[truncate(record["created_on"], resolution)].append(record)
+
+        for start, bucket_records in sorted(grouped.items()):
+            state = self.current.get((resolution, source))
+            if state is None or state[0] != start:
+                # New bucket, or first snapshot since load: pick up whatever is already stored
+                state = (start, await self._load_buckets(rollup, source, start, step))
+                self.current[(resolution, source)] = state
+            buckets = state[1]
+            touched: set[int] = set()
+            for record in sorted(bucket_records, key=lambda x: x["created_on"]):
+                guild = record.get("guild") or 0
+                touched.add(guild)
+                for metric in metrics:
+                    buckets.setdefault((guild, metric), Bucket()).add(record[metric])
+            await self._write(rollup, source, start, step, buckets, touched)
+
+    @staticmethod
+    async def _load_buckets(rollup: type[Table], source: str, start: datetime, step: timedelta) -> Buckets:
+        rows = await rollup.select().where(
+            (rollup.source == source) & (rollup.bucket >= start) & (rollup.bucket < start + step)
+        )
+        buckets: Buckets = {}
+        for row in rows:
+            buckets[(row["guild"], row["metric"])] = Bucket(
+                min=row["min_value"],
+                max=row["max_value"],
+                total=(row["avg_value"] or 0.0) * row["samples"],
+                last=row["last_value"],
+                samples=row["samples"],
+            )
+        return buckets
+
+    @staticmethod
+    async def _write(
+        rollup: type[Table],
+        source: str,
+        start: datetime,
+        step: timedelta,
+        buckets: Buckets,
+        guilds: set[int],
+    ) -> None:
+        """Replace the stored rows of one bucket for the given guilds"""
+        rows = to_rows(rollup, source, start, {k: v for k, v in buckets.items() if k[0] in guilds})
+        async with rollup._meta.db.transaction():
+            await rollup.delete().where(
+                (rollup.source == source)
+                & (rollup.bucket >= start)
+                & (rollup.bucket < start + step)
+                & (rollup.guild.is_in(list(guilds)))
+            )
+            # Chunked to stay under the bind parameter limit on bots with many guilds
+            for i in range(0, len(rows), 500):
+                await rollup.insert(*rows[i : i + 500])
+
+    def reset(self, source: str) -> None:
+        for resolution in RESOLUTIONS:
+            self.current.pop((resolution, source), None)
+
+    async def clear(self, table: type[Table]) -> None:
+        """Delete every rollup of a source"""
+        source = table._meta.tablename
+        async with self.locks[source]:
+            for rollup, _ in RESOLUTIONS.values():
+                await rollup.delete().where(rollup.source == source)
+            self.reset(source)
+
+    async def rebuild(self, table: type[Table]) -> None:
+        """Recompute a source's rollups from its raw rows
+
+        Used after raw rows are deleted or backdated (pruning, imports) and to backfill
+        rollups for snapshots taken before they existed. Rollups older than the oldest raw
+        row are left alone since their raw data is already gone.
+        """
+        source = table._meta.tablename
+        first = await table.select(table.created_on).order_by(table.created_on).first()
+        if not first:
+            return
+        day = truncate(first["created_on"], "day")
+        today = truncate(TimestamptzNow().python(), "day")
+        log.info(f"Rebuilding rollups for {source} from {day.date()}")
+        for rollup, _ in RESOLUTIONS.values():
+            await rollup.delete().where((rollup.source == source) & (rollup.bucket >= day) & (rollup.bucket < today))
+        # One day of raw rows at a time to keep memory flat
+        while day < today:
+            await self._rebuild_range(table, day, day + timedelta(days=1))
+            day += timedelta(days=1)
+        # The current day is still being recorded to, hold off the snapshot tasks while it's redone
+        async with self.locks[source]:
+            for rollup, _ in RESOLUTIONS.values():
+                await rollup.delete().where((rollup.source == source) & (rollup.bucket >= today))
+            await self._rebuild_range(table, today, None)
+            self.reset(source)
+
+    @staticmethod
+    async def _rebuild_range(table: type[Table], start: datetime, end: datetime | None) -> None:
+        source = table._meta.tablename
+        metrics = metric_columns(table)
+        query = table.select().where(table.created_on >= start)
+        if end is not None:
+            query = query.where(table.created_on < end)
+        records: list[dict] = await query.order_by(table.created_on)
+        if not records:
+            return
+        for resolution, (rollup, _) in RESOLUTIONS.items():
+            buckets: dict[datetime, Buckets] = defaultdict(dict)
+            for record in records:
+                bucket_start = truncate(record["created_on"], resolution)
+                guild = record.get("guild") or 0
+                for metric in metrics:
+                    buckets[bucket_start].setdefault((guild, metric), Bucket()).add(record[metric])
+            rows = [
+                row
+                for bucket_start, aggregates in buckets.items()
+                for row in to_rows(rollup, source, bucket_start, aggregates)
+            ]
+            for i in range(0, len(rows), 500):
+                await rollup.insert(*rows[i : i + 500])
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    async def pick_resolution(
+        self,
+        table: type[Table],
+        start: datetime,
+        end: datetime,
+        settings: GlobalSettings,
+        guild_id: int = 0,
+    ) -> str:
+        """Coarsest resolution that still has enough points for the timespan
+
+        Falls back to a coarser one when the finer data for the start of the timespan
+        has already been pruned.
+        """
+        if not settings.rollups_backfilled:
+            return "raw"
+        source = table._meta.tablename
+        first = (
+            await DailyRollup.select(DailyRollup.bucket)
+            .where((DailyRollup.source == source) & (DailyRollup.guild == guild_id))
+            .order_by(DailyRollup.bucket)
+            .first()
+        )
+        if first:
+            # Don't count the part of the timespan before tracking started
+            start = max(start, first["bucket"])
+        span = end - start
+        for resolution, (_, step) in RESOLUTIONS.items():
+            if span / step >= MIN_GRAPH_POINTS:
+                return resolution
+
+        now = TimestamptzNow().python()
+        # Same day-aligned cutoffs the cleanup task prunes at
+        raw_cutoff = truncate(now - timedelta(days=settings.raw_snapshot_age_days), "day")
+        hourly_cutoff = truncate(now - timedelta(days=settings.hourly_rollup_age_days), "day")
+        if start >= raw_cutoff:
+            return "raw"
+        if start >= hourly_cutoff:
+            return "hour"
+        return "day"
+
+    async def get_series(
+        self,
+        table: type[Table],
+        metrics: list[str],
+        start: datetime,
+        end: datetime,
+        settings: GlobalSettings,
+        interval_minutes: int,
+        guild_id: int | None = None,
+    ) -> Series:
+        """Graph data and stats for the given metrics of a snapshot table
+
+        Raw rows are returned as-is. Rollup buckets are returned as one point per bucket
+        holding its average, while the stats still use the true min/max/last values.
+        """
+        resolution = await self.pick_resolution(table, start, end, settings, guild_id or 0)
+        if resolution == "raw":
+            return await self._get_raw_series(table, metrics, start, end, interval_minutes, guild_id)
+
+        rollup, step = RESOLUTIONS[resolution]
+        rows = (
+            await rollup.select(
+                rollup.bucket,
+                rollup.metric,
+                rollup.min_value,
+                rollup.max_value,
+                rollup.avg_value,
+                rollup.last_value,
+                rollup.samples,
+            )
+            .where(
+                (rollup.source == table._meta.tablename)
+                & (rollup.guild == (guild_id or 0))
+                & (rollup.metric.is_in(metrics))
+                & (rollup.bucket >= truncate(start, resolution))
+                & (rollup.bucket <= end)
+            )
+            .order_by(rollup.bucket)
+        )
+
+        points: dict[datetime, dict] = {}
+        by_metric: dict[str, list[dict]] = defaultdict(list)
+        for row in rows:
+            if row["avg_value"] is None:
+                continue
+            points.setdefault(row["bucket"], {"created_on": row["bucket"]})[row["metric"]] = row["avg_value"]
+            by_metric[row["metric"]].append(row)
+
+        stats: dict[str, dict[str, float]] = {}
+        for metric, metric_rows in by_metric.items():
+            samples = sum(row["samples"] for row in metric_rows)
+            stats[metric] = {
+                "first": metric_rows[0]["avg_value"],
+                "current": metric_rows[-1]["last_value"],
+                "average": sum(row["avg_value"] * row["samples"] for row in metric_rows) / max(samples, 1),
+                "highest": max(row["max_value"] for row in metric_rows),
+                "lowest": min(row["min_value"] for row in metric_rows),
+            }
+        return Series(
+            data=list(points.values()),
+            interval_minutes=int(step.total_seconds() // 60),
+            resolution=resolution,
+            stats=stats,
+        )
+
+    @staticmethod
+    async def _get_raw_series(
+        table: type[Table],
+        metrics: list[str],
+        start: datetime,
+        end: datetime,
+        interval_minutes: int,
+        guild_id: int | None,
+    ) -> Series:
+        query = table.select(table.created_on, *[getattr(table, metric) for metric in metrics]).where(
+            (table.created_on >= start) & (table.created_on <= end)
+        )
+        if guild_id is not None:
+            query = query.where(table.guild == guild_id)
+        rows: list[dict] = await query.order_by(table.created_on)
+        data = [row for row in rows if any(row[metric] is not None for metric in metrics)]
+
+        stats: dict[str, dict[str, float]] = {}
+        for metric in metrics:
+            values = [row[metric] for row in data if row[metric] is not None]
+            if not values:
+                continue
+            stats[metric] = {
+                "first": values[0],
+                "current": values[-1],
+                "average": sum(values) / len(values),
+                "highest": max(values),
+                "lowest": min(values),
+            }
+        return Series(data=data, interval_minutes=interval_minutes, resolution="raw", stats=stats)
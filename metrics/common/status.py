@@ -0,0 +1,150 @@
+"""Live member status counts.
+
+Kept up to date from member join/leave and presence events so member snapshots only need
+to read a few counters per guild instead of walking every member of every guild.
+Counts are rebuilt from the member cache periodically to correct any drift from missed events.
+"""
+
+import logging
+from collections import Counter
+
+import discord
+from redbot.core.utils import AsyncIter
+
+log = logging.getLogger("red.vrt.metrics.status")
+
+STATUS_KEYS = ("online", "idle", "dnd", "offline")
+
+
+def status_key(status: discord.Status) -> str | None:
+    match status:
+        case discord.Status.online:
+            return "online"
+        case discord.Status.idle:
+            return "idle"
+        case discord.Status.dnd:
+            return "dnd"
+        case discord.Status.offline | discord.Status.invisible:
+            return "offline"
+    return None
+
+
+class StatusCounts:
+    """Member status counts per guild (bots included) and across all guilds (unique non-bot users)"""
+
+    def __init__(self):
+        self.guilds: dict[int, Counter[str]] = {}
+        # Global counts, each user is counted once no matter how many guilds they share with the bot
+        self.users: dict[int, str | None] = {}
+        self.user_guilds: Counter[int] = Counter()
+        self.totals: Counter[str] = Counter()
+        self.ready = False
+
+    def get_guild(self, guild_id: int) -> Counter[str] | None:
+        return self.guilds.get(guild_id)
+
+    async def count_guild(self, guild: discord.Guild) -> Counter[str]:
+        counts: Counter[str] = Counter()
+        async for member in AsyncIter(guild.members, steps=500):
+            if key := status_key(member.status):
+                counts[key] += 1
+        self.guilds[guild.id] = counts
+        return counts
+
+    async def reconcile(self, guilds: list[discord.Guild]) -> None:
+        """Recount everything from the member cache"""
+        guild_counts: dict[int, Counter[str]] = {}
+        users: dict[int, str | None] = {}
+        user_guilds: Counter[int] = Counter()
+        for guild in guilds:
+            counts: Counter[str] = Counter()
+            async for member in AsyncIter(guild.members, steps=500):
+                key = status_key(member.status)
+                if key:
+                    counts[key] += 1
+                if member.bot:
+                    continue
+                users[member.id] = key
+                user_guilds[member.id] += 1
+            guild_counts[guild.id] = counts
+
+        totals: Counter[str] = Counter(key for key in users.values() if key)
+        drift = sum(abs(totals[key] - self.totals[key]) for key in STATUS_KEYS)
+        if self.ready and drift:
+            log.debug(f"Member status counts drifted by {drift} since the last reconcile")
+        self.guilds = guild_counts
+        self.users = users
+        self.user_guilds = user_guilds
+        self.totals = totals
+        self.ready = True
+
+    # =========================================================================
+    # Event hooks
+    # =========================================================================
+
+    def member_joined(self, member: discord.Member) -> None:
+        key = status_key(member.status)
+        counts = self.guilds.get(member.guild.id)
+        if counts is not None and key:
+            counts[key] += 1
+        if not member.bot:
+            self._add_user(member.id, key)
+
+    def member_left(self, member: discord.Member) -> None:
+        key = status_key(member.status)
+        counts = self.guilds.get(member.guild.id)
+        if counts is not None and key and counts[key] > 0:
+            counts[key] -= 1
+        if not member.bot:
+            self._remove_user(member.id)
+
+    def status_changed(self, before: discord.Member, after: discord.Member) -> None:
+        old, new = status_key(before.status), status_key(after.status)
+        if old == new:
+            return
+        counts = self.guilds.get(after.guild.id)
+        if counts is not None:
+            if old and counts[old] > 0:
+                counts[old] -= 1
+            if new:
+                counts[new] += 1
+        # Presence updates arrive once per shared guild, only the first one changes the global counts
+        if after.bot or after.id not in self.users or self.users[after.id] == new:
+            return
+        current = self.users[after.id]
+        if current and self.totals[current] > 0:
+            self.totals[current] -= 1
+        if new:
+            self.totals[new] += 1
+        self.users[after.id] = new
+
+    def guild_left(self, guild: discord.Guild) -> None:
+        self.guilds.pop(guild.id, None)
+        for member in guild.members:
+            if not member.bot:
+                self._remove_user(member.id)
+
+    async def guild_joined(self, guild: discord.Guild) -> None:
+        await self.count_guild(guild)
+        for member in guild.members:
+            if not member.bot:
+                self._add_user(member.id, status_key(member.status))
+
+    def _add_user(self, user_id: int, key: str | None) -> None:
+        self.user_guilds[user_id] += 1
+        if user_id in self.users:
+            return
+        self.users[user_id] = key
+        if key:
+            self.totals[key] += 1
+
+    def _remove_user(self, user_id: int) -> None:
+        if user_id not in self.user_guilds:
+            return
+        self.user_guilds[user_id] -= 1
+        if self.user_guilds[user_id] > 0:
+            return
+        del self.user_guilds[user_id]
+        old = self.users.pop(user_id, None)
+        if old and self.totals[old] > 0:
+            self.totals[old] -= 1
@@ -1,5 +1,7 @@
 import logging
+import struct
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import discord
 import pytz
@@ -47,6 +49,31 @@ def get_window(delta: timedelta, data_points: int, snapshot_interval_minutes: in
     return desired_points
 
 
+def describe_smoothing(window: int, resolution: str) -> str:
+    """Smoothing line for graph embeds, noting when the points are rollup averages."""
+    labels = {"hour": "hourly averages", "day": "daily averages"}
+    if resolution in labels:
+        return f"Smoothing window: {window} points ({labels[resolution]})"
+    return f"Smoothing window: {window} points"
+
+
+def read_economytrack_series(path: Path) -> list[tuple[int, int]]:
+    """Read an EconomyTrack series file as (timestamp, value) points, oldest first.
+
+    The file is a ring buffer: a header followed by int64 timestamp and value columns.
+    """
+    if not path.exists():
+        return []
+    raw = path.read_bytes()
+    magic, _version, capacity, start, count = struct.unpack_from("<4sIqqq", raw)
+    if magic != b"ETRB":
+        return []
+    timestamps = struct.unpack_from(f"<{capacity}q", raw, 32)
+    values = struct.unpack_from(f"<{capacity}q", raw, 32 + capacity * 8)
+    slots = [(start + i) % capacity for i in range(count)]
+    return [(timestamps[i], values[i]) for i in slots]
+
+
 def get_timespan(
     timespan: str | None = None,
     start_time: str | None = None,
@@ -0,0 +1,34 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.columns.column_types import Float
+from piccolo.columns.indexes import IndexMethod
+
+ID = "2026-10-16T13:00:00:000000"
+VERSION = "1.28.0"
+DESCRIPTION = "add member snapshot duration"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="metrics", description=DESCRIPTION)
+
+    manager.add_column(
+        table_class_name="GlobalMemberSnapshot",
+        tablename="global_member_snapshot",
+        column_name="snapshot_duration_seconds",
+        db_column_name="snapshot_duration_seconds",
+        column_class_name="Float",
+        column_class=Float,
+        params={
+            "default": 0.0,
+            "null": True,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    return manager
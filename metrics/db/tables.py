@@ -47,7 +47,10 @@ class GlobalSettings(TableMixin, Table):
     performance_interval = BigInt(default=3)  # Minutes between performance snapshots
 
     # Data retention
-    max_snapshot_age_days = BigInt(default=3600)  # Max age of snapshots to keep
+    max_snapshot_age_days = BigInt(default=3600)  # Max age of snapshots (and daily rollups) to keep
+    raw_snapshot_age_days = BigInt(default=30)  # Max age of raw snapshot rows, older history lives in the rollups
+    hourly_rollup_age_days = BigInt(default=365)  # Max age of hourly rollups
+    rollups_backfilled = Boolean(default=False)  # Whether rollups have been built from pre-existing snapshots
 
     # Global tracking toggles
     track_bank = Boolean(default=False)  # Whether to track bank data globally
@@ -118,6 +121,9 @@ class GlobalMemberSnapshot(Table):
     dnd_members = BigInt(null=True)  # Total DND members
     offline_members = BigInt(null=True)  # Total offline/invisible members
 
+    # Snapshot metadata
+    snapshot_duration_seconds = Float(null=True)  # Duration to complete this snapshot
+
 
 class GlobalPerformanceSnapshot(Table):
     """Server/bot performance metrics captured at high frequency."""
@@ -142,6 +148,38 @@ class GlobalPerformanceSnapshot(Table):
     snapshot_duration_seconds = Float(null=True)  # Duration to complete this snapshot
 
 
+# =============================================================================
+# Rollup Tables
+# =============================================================================
+
+
+class RollupMixin:
+    """One metric of one snapshot table aggregated over a time bucket."""
+
+    bucket = Timestamptz(index=True)  # Start of the hour/day (UTC)
+    source = Text(index=True)  # Snapshot table name, e.g. "guild_member_snapshot"
+    guild = BigInt(default=0, index=True)  # Guild ID, 0 for global snapshots
+    metric = Text()  # Snapshot column name, e.g. "online_members"
+
+    min_value = Float(null=True)
+    max_value = Float(null=True)
+    avg_value = Float(null=True)
+    last_value = Float(null=True)  # Value of the latest snapshot in the bucket
+    samples = BigInt(default=0)  # Number of snapshots aggregated
+
+
+class HourlyRollup(RollupMixin, Table):
+    """Snapshot metrics aggregated per hour."""
+
+    id: Serial
+
+
+class DailyRollup(RollupMixin, Table):
+    """Snapshot metrics aggregated per day."""
+
+    id: Serial
+
+
 # =============================================================================
 # Table Registry
 # =============================================================================
@@ -158,5 +196,8 @@ TABLES: list[type[Table]] = sort_table_classes(
         GlobalEconomySnapshot,
         GlobalMemberSnapshot,
         GlobalPerformanceSnapshot,
+        # Rollups
+        HourlyRollup,
+        DailyRollup,
     ]
 )
@@ -0,0 +1,6 @@
+from ..abc import CompositeMetaClass
+from .members import MemberListener
+
+
+class Listeners(MemberListener, metaclass=CompositeMetaClass):
+    """Subclass all listener classes"""
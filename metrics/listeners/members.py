@@ -0,0 +1,29 @@
+import discord
+from redbot.core import commands
+
+from ..abc import MixinMeta
+
+
+class MemberListener(MixinMeta):
+    """Keeps the live member status counts current between reconciles."""
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.status_counts.member_joined(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.status_counts.member_left(member)
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        if before.status != after.status:
+            self.status_counts.status_changed(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        await self.status_counts.guild_joined(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.status_counts.guild_left(guild)
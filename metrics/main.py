@@ -13,32 +13,30 @@ from redbot_orm import register_cog
 
 from .abc import CompositeMetaClass
 from .commands import Commands
+from .common.rollups import SNAPSHOT_TABLES, Rollups, truncate
+from .common.status import StatusCounts
 from .common.utils import DBUtils
-from .db.tables import (
-    TABLES,
-    GlobalEconomySnapshot,
-    GlobalMemberSnapshot,
-    GlobalPerformanceSnapshot,
-    GuildEconomySnapshot,
-    GuildMemberSnapshot,
-)
+from .db.tables import TABLES, DailyRollup, HourlyRollup
+from .listeners import Listeners
 from .tasks import TaskLoops
 
 log = logging.getLogger("red.vrt.metrics")
 RequestType = t.Literal["discord_deleted_user", "owner", "user", "user_strict"]
 
 
-class Metrics(Commands, TaskLoops, commands.Cog, metaclass=CompositeMetaClass):
+class Metrics(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMetaClass):
     """Track various metrics about your server."""
 
     __author__ = "Vertyco"
-    __version__ = "1.0.7"
+    __version__ = "1.1.0"
 
     def __init__(self, bot: Red):
         super().__init__()
         self.bot: Red = bot
         self.db: SQLiteEngine | PostgresEngine | None = None
         self.db_utils: DBUtils = DBUtils()
+        self.rollups: Rollups = Rollups()
+        self.status_counts: StatusCounts = StatusCounts()
 
     def format_help_for_context(self, ctx: commands.Context):
         helpcmd = super().format_help_for_context(ctx)
@@ -79,49 +77,44 @@ class Metrics(Commands, TaskLoops, commands.Cog, metaclass=CompositeMetaClass):
         global_settings = await self.db_utils.get_create_global_settings()
         self.configure_task_intervals(global_settings)
         self.start_tasks()
-        asyncio.create_task(self.cleanup_old_snapshots())
 
     async def cleanup_old_snapshots(self) -> None:
-        """Remove snapshots older than the configured max age."""
+        """Remove snapshots and rollups older than their configured max age.
+
+        Raw snapshots are kept for `raw_snapshot_age_days`, hourly rollups for
+        `hourly_rollup_age_days` and daily rollups for `max_snapshot_age_days`.
+        Cutoffs are aligned to the start of a day so the oldest remaining day is always complete.
+        """
         try:
             global_settings = await self.db_utils.get_create_global_settings()
-            cutoff = TimestamptzNow().python() - timedelta(days=global_settings.max_snapshot_age_days)
+            if not global_settings.rollups_backfilled:
+                # Snapshots taken before rollups existed need aggregating before any raw rows are pruned
+                for table in SNAPSHOT_TABLES:
+                    await self.rollups.rebuild(table)
+                global_settings.rollups_backfilled = True
+                await global_settings.save()
+                log.info("Rollups backfilled from existing snapshots")
+
+            now = TimestamptzNow().python()
+            raw_cutoff = truncate(now - timedelta(days=global_settings.raw_snapshot_age_days), "day")
+            hourly_cutoff = truncate(now - timedelta(days=global_settings.hourly_rollup_age_days), "day")
+            daily_cutoff = truncate(now - timedelta(days=global_settings.max_snapshot_age_days), "day")
+
+            total_deleted = 0
+            for table in SNAPSHOT_TABLES:
+                deleted = await table.delete().where(table.created_on < raw_cutoff).returning(table.id)
+                total_deleted += len(deleted)
+            if total_deleted:
+                log.info(f"Cleaned up {total_deleted} snapshots older than {raw_cutoff}")
 
-            economy_deleted = (
-                await GlobalEconomySnapshot.delete()
-                .where(GlobalEconomySnapshot.created_on < cutoff)
-                .returning(GlobalEconomySnapshot.id)
-            )
-            member_deleted = (
-                await GlobalMemberSnapshot.delete()
-                .where(GlobalMemberSnapshot.created_on < cutoff)
-                .returning(GlobalMemberSnapshot.id)
-            )
-            perf_deleted = (
-                await GlobalPerformanceSnapshot.delete()
-                .where(GlobalPerformanceSnapshot.created_on < cutoff)
-                .returning(GlobalPerformanceSnapshot.id)
+            hourly_deleted = (
+                await HourlyRollup.delete().where(HourlyRollup.bucket < hourly_cutoff).returning(HourlyRollup.id)
             )
-            guild_economy_deleted = (
-                await GuildEconomySnapshot.delete()
-                .where(GuildEconomySnapshot.created_on < cutoff)
-                .returning(GuildEconomySnapshot.id)
+            daily_deleted = (
+                await DailyRollup.delete().where(DailyRollup.bucket < daily_cutoff).returning(DailyRollup.id)
             )
-            guild_member_deleted = (
-                await GuildMemberSnapshot.delete()
-                .where(GuildMemberSnapshot.created_on < cutoff)
-                .returning(GuildMemberSnapshot.id)
-            )
-
-            total_deleted = (
-                len(economy_deleted)
-                + len(member_deleted)
-                + len(perf_deleted)
-                + len(guild_economy_deleted)
-                + len(guild_member_deleted)
-            )
-            if total_deleted:
-                log.info(f"Cleaned up {total_deleted} snapshots older than {cutoff}")
+            if hourly_deleted or daily_deleted:
+                log.info(f"Cleaned up {len(hourly_deleted)} hourly and {len(daily_deleted)} daily rollups")
         except Exception as e:
             log.exception("Failed to clean up old snapshots", exc_info=e)
 
@@ -1,9 +1,10 @@
 # Task loops can be defined here
 from ..abc import CompositeMetaClass
+from .cleanup import Cleanup
 from .snapshot import Snapshot
 
 
-class TaskLoops(Snapshot, metaclass=CompositeMetaClass):
+class TaskLoops(Snapshot, Cleanup, metaclass=CompositeMetaClass):
     """
     Subclass all task loops in this directory so you can import this single task loop class in your cog's class constructor.
 
@@ -17,6 +18,10 @@ class TaskLoops(Snapshot, metaclass=CompositeMetaClass):
             self.member_snapshot_task.start()
         if not self.performance_snapshot_task.is_running():
             self.performance_snapshot_task.start()
+        if not self.member_status_reconcile_task.is_running():
+            self.member_status_reconcile_task.start()
+        if not self.cleanup_task.is_running():
+            self.cleanup_task.start()
 
     def stop_tasks(self) -> None:
         if self.economy_snapshot_task.is_running():
@@ -25,3 +30,7 @@ class TaskLoops(Snapshot, metaclass=CompositeMetaClass):
             self.member_snapshot_task.cancel()
         if self.performance_snapshot_task.is_running():
             self.performance_snapshot_task.cancel()
+        if self.member_status_reconcile_task.is_running():
+            self.member_status_reconcile_task.cancel()
+        if self.cleanup_task.is_running():
+            self.cleanup_task.cancel()
@@ -0,0 +1,21 @@
+import logging
+
+from discord.ext import tasks
+
+from ..abc import MixinMeta
+
+log = logging.getLogger("red.vrt.metrics.tasks.cleanup")
+
+
+class Cleanup(MixinMeta):
+    @tasks.loop(hours=24)
+    async def cleanup_task(self) -> None:
+        """Prune snapshots and rollups past their retention."""
+        if not self.db_active():
+            return
+        await self.cleanup_old_snapshots()
+
+    @cleanup_task.before_loop
+    async def before_cleanup(self) -> None:
+        await self.bot.wait_until_red_ready()
+        log.info("Cleanup task is starting...")
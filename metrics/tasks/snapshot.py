@@ -4,11 +4,9 @@ import os
 from collections import defaultdict
 from time import perf_counter
 
-import discord
 import psutil
 from discord.ext import tasks
 from redbot.core import bank
-from redbot.core.utils import AsyncIter
 
 from ..abc import MixinMeta
 from ..db.tables import (
@@ -102,6 +100,7 @@ class Snapshot(MixinMeta):
 
                 if guild_snapshots:
                     await GuildEconomySnapshot.insert(*guild_snapshots)
+                    await self.rollups.record(GuildEconomySnapshot, guild_snapshots)
 
             if not track_global_bank:
                 return
@@ -110,12 +109,14 @@ class Snapshot(MixinMeta):
                 global_bank_total = sum(global_bank_balances.values())
                 global_average_balance = global_bank_total // len(global_bank_balances)
 
-                await GlobalEconomySnapshot(
+                snapshot = GlobalEconomySnapshot(
                     bank_total=global_bank_total,
                     average_balance=global_average_balance,
                     member_count=len(global_bank_balances),
                     guild_count=len(guild_snapshots) if not is_global else None,
-                ).save()
+                )
+                await snapshot.save()
+                await self.rollups.record(GlobalEconomySnapshot, [snapshot])
         except Exception as e:
             log.exception("Error in economy snapshot task", exc_info=e)
 
@@ -130,11 +131,12 @@ class Snapshot(MixinMeta):
 
     @tasks.loop(minutes=10)
     async def member_snapshot_task(self) -> None:
-        """Capture member statistics."""
+        """Capture member statistics from the live status counts."""
         try:
             if not self.db_active():
                 return
 
+            start = perf_counter()
             global_config: GlobalSettings = await self.db_utils.get_create_global_settings()
 
             # Guild-level member snapshots
@@ -152,65 +154,45 @@ class Snapshot(MixinMeta):
                     log.debug(f"Skipping guild {guild.id} ({guild.name}) - 0 members reported")
                     continue
 
-                online_members, idle_members, dnd_members, offline_members = 0, 0, 0, 0
-
-                async for member in AsyncIter(guild.members):
-                    match member.status:
-                        case discord.Status.online:
-                            online_members += 1
-                        case discord.Status.idle:
-                            idle_members += 1
-                        case discord.Status.dnd:
-                            dnd_members += 1
-                        case discord.Status.offline | discord.Status.invisible:
-                            offline_members += 1
+                counts = self.status_counts.get_guild(guild.id)
+                if counts is None:
+                    # Not counted since load, every later snapshot reads the live counts
+                    counts = await self.status_counts.count_guild(guild)
 
                 guild_snapshots.append(
                     GuildMemberSnapshot(
                         guild=settings.id,
                         member_total=member_total,
-                        online_members=online_members,
-                        idle_members=idle_members,
-                        dnd_members=dnd_members,
-                        offline_members=offline_members,
+                        online_members=counts["online"],
+                        idle_members=counts["idle"],
+                        dnd_members=counts["dnd"],
+                        offline_members=counts["offline"],
                     )
                 )
 
             if guild_snapshots:
                 await GuildMemberSnapshot.insert(*guild_snapshots)
+                await self.rollups.record(GuildMemberSnapshot, guild_snapshots)
 
             if not global_config.track_members:
                 return
 
             # Global member snapshot
-            members: dict[int, discord.Member] = {}
-            async for member in AsyncIter(self.bot.get_all_members(), steps=500):
-                if member.bot:
-                    continue
-                members[member.id] = member
-
-            global_member_total = len(members)
-            global_online, global_idle, global_dnd, global_offline = 0, 0, 0, 0
-
-            for member in members.values():
-                match member.status:
-                    case discord.Status.online:
-                        global_online += 1
-                    case discord.Status.idle:
-                        global_idle += 1
-                    case discord.Status.dnd:
-                        global_dnd += 1
-                    case discord.Status.offline | discord.Status.invisible:
-                        global_offline += 1
-
-            await GlobalMemberSnapshot(
+            if not self.status_counts.ready:
+                await self.status_counts.reconcile(self.bot.guilds)
+            totals = self.status_counts.totals
+
+            snapshot = GlobalMemberSnapshot(
                 guild_count=len(self.bot.guilds),
-                member_total=global_member_total,
-                online_members=global_online,
-                idle_members=global_idle,
-                dnd_members=global_dnd,
-                offline_members=global_offline,
-            ).save()
+                member_total=len(self.status_counts.users),
+                online_members=totals["online"],
+                idle_members=totals["idle"],
+                dnd_members=totals["dnd"],
+                offline_members=totals["offline"],
+                snapshot_duration_seconds=perf_counter() - start,
+            )
+            await snapshot.save()
+            await self.rollups.record(GlobalMemberSnapshot, [snapshot])
         except Exception as e:
             log.exception("Error in member snapshot task", exc_info=e)
 
@@ -219,6 +201,20 @@ class Snapshot(MixinMeta):
         await self.bot.wait_until_red_ready()
         log.info("Member snapshot task is starting...")
 
+    @tasks.loop(hours=1)
+    async def member_status_reconcile_task(self) -> None:
+        """Recount member statuses from the cache to correct drift from missed events."""
+        try:
+            start = perf_counter()
+            await self.status_counts.reconcile(self.bot.guilds)
+            log.debug(f"Reconciled member status counts in {perf_counter() - start:.2f}s")
+        except Exception as e:
+            log.exception("Error reconciling member status counts", exc_info=e)
+
+    @member_status_reconcile_task.before_loop
+    async def before_member_status_reconcile(self) -> None:
+        await self.bot.wait_until_red_ready()
+
     # =========================================================================
     # Performance Snapshot Task
     # =========================================================================
@@ -247,7 +243,7 @@ class Snapshot(MixinMeta):
             shard_count = self.bot.shard_count or 1
             guild_count = len(self.bot.guilds)
 
-            await GlobalPerformanceSnapshot(
+            snapshot = GlobalPerformanceSnapshot(
                 latency_ms=latency * 1000,
                 shard_count=shard_count,
                 cpu_usage_percent=cpu_usage_percent,
@@ -256,7 +252,9 @@ class Snapshot(MixinMeta):
                 active_tasks=active_tasks,
                 guild_count=guild_count,
                 snapshot_duration_seconds=perf_counter() - start,
-            ).save()
+            )
+            await snapshot.save()
+            await self.rollups.record(GlobalPerformanceSnapshot, [snapshot])
         except Exception as e:
             log.exception("Error in performance snapshot task", exc_info=e)
 
@@ -26,10 +26,12 @@ if t.TYPE_CHECKING:
     from ..main import Metrics
 
 from ..common import plots, utils
+from ..common.rollups import Series
 from ..db.tables import (
     GlobalEconomySnapshot,
     GlobalMemberSnapshot,
     GlobalPerformanceSnapshot,
+    GlobalSettings,
     GuildEconomySnapshot,
     GuildMemberSnapshot,
 )
@@ -422,7 +424,8 @@ class MetricsDashboardLayout(ui.LayoutView):
         )
 
         # Query data based on category and scope
-        data = await self._query_metrics(start_time, end_time)
+        series = await self._query_metrics(start_time, end_time, global_settings, interval_minutes)
+        data = series.data
 
         if not data or len(data) < 2:
             self._graph_file = None
@@ -439,23 +442,20 @@ class MetricsDashboardLayout(ui.LayoutView):
 
             actual_delta = df.index[-1] - df.index[0]
             point_count = len(df.index)
-            rolling_window = utils.get_window(actual_delta, point_count, interval_minutes)
+            rolling_window = utils.get_window(actual_delta, point_count, series.interval_minutes)
 
-            # Calculate stats for each metric
+            # Stats come from the full-resolution min/max/last values even when graphing rollups
             stats = {}
             for metric_key in self.selected_metrics:
-                if metric_key in df.columns:
-                    col = df[metric_key].dropna()
-                    if len(col) > 0:
-                        first_val = col.iloc[0]
-                        current_val = col.iloc[-1]
-                        stats[metric_key] = {
-                            "current": current_val,
-                            "average": col.mean(),
-                            "highest": col.max(),
-                            "lowest": col.min(),
-                            "delta": current_val - first_val,
-                        }
+                if metric_key in series.stats:
+                    metric_stats = series.stats[metric_key]
+                    stats[metric_key] = {
+                        "current": metric_stats["current"],
+                        "average": metric_stats["average"],
+                        "highest": metric_stats["highest"],
+                        "lowest": metric_stats["lowest"],
+                        "delta": metric_stats["current"] - metric_stats["first"],
+                    }
 
             # Generate multi-metric plot
             image_bytes = plots.render_multi_metric_plot(
@@ -486,35 +486,28 @@ class MetricsDashboardLayout(ui.LayoutView):
         self,
         start_time: datetime,
         end_time: datetime,
-    ) -> list[dict]:
-        """Query metrics data from the database."""
-        columns_to_select = ["created_on"] + self.selected_metrics
-
+        global_settings: GlobalSettings,
+        interval_minutes: int,
+    ) -> Series:
+        """Query metrics data from the database at the best available resolution."""
+        guild_id = None if self.show_global else self.ctx.guild.id
         if self.selected_category == "members":
-            if self.show_global:
-                table = GlobalMemberSnapshot
-                query = table.select(*[getattr(table, col) for col in columns_to_select])
-            else:
-                table = GuildMemberSnapshot
-                query = table.select(*[getattr(table, col) for col in columns_to_select]).where(
-                    table.guild == self.ctx.guild.id
-                )
+            table = GlobalMemberSnapshot if self.show_global else GuildMemberSnapshot
         elif self.selected_category == "economy":
-            if self.show_global:
-                table = GlobalEconomySnapshot
-                query = table.select(*[getattr(table, col) for col in columns_to_select])
-            else:
-                table = GuildEconomySnapshot
-                query = table.select(*[getattr(table, col) for col in columns_to_select]).where(
-                    table.guild == self.ctx.guild.id
-                )
+            table = GlobalEconomySnapshot if self.show_global else GuildEconomySnapshot
         else:
             # Performance is global only
             table = GlobalPerformanceSnapshot
-            query = table.select(*[getattr(table, col) for col in columns_to_select])
-
-        query = query.where((table.created_on >= start_time) & (table.created_on <= end_time))
-        return await query.order_by(table.created_on)
+            guild_id = None
+        return await self.cog.rollups.get_series(
+            table,
+            self.selected_metrics,
+            start_time,
+            end_time,
+            global_settings,
+            interval_minutes,
+            guild_id=guild_id,
+        )
 
 
 async def open_metrics_dashboard(ctx: commands.Context, cog: "Metrics") -> None:
@@ -25,6 +25,7 @@ class MixinMeta(ABC):
         self.db_utils: DBUtils
 
         self.chat_cache: tracker.ChannelChatCache
+        self.active_channels: set[int]
         self.guild_spawn_cooldowns: dict[int, float]
         self.guild_spawn_locks: dict[int, asyncio.Lock]
 
@@ -36,6 +37,10 @@ class MixinMeta(ABC):
     def db_active(self) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    async def load_active_channels(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def reset_durability_warnings(self, player_id: int) -> None:
         raise NotImplementedError
@@ -56,6 +56,10 @@ class DatabaseCommands(MixinMeta):
             if conn:
                 await conn.close()
 
+        self.active_channels.clear()
+        self.db_utils.pending_players.clear()
+        await self.db_utils.get_cached_player_tool.cache.clear()  # type: ignore
+
         await ctx.send("Database has been nuked, please reload the cog.")
 
     @dbsetgroup.command(name="diagnose")
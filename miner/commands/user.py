@@ -10,7 +10,7 @@ from redbot.core.utils.chat_formatting import humanize_number
 
 from ..abc import MixinMeta
 from ..common import achievements, constants
-from ..db.tables import ActiveChannel, GuildSettings, Player, ensure_db_connection
+from ..db.tables import GuildSettings, Player, ensure_db_connection
 from ..views.dynamic_menu import DynamicMenu
 from ..views.leaderboard_menu import LeaderboardView
 from ..views.mining_view import RockView
@@ -221,6 +221,8 @@ class User(MixinMeta):
         }
         update_kwargs[Player.durability] = max_dura
         await player.update_self(update_kwargs)
+        # Wear queued before the repair landed is undone by it
+        self.db_utils.drop_pending_durability(player.id)
         self.reset_durability_warnings(player.id)
 
         embed = discord.Embed(
@@ -356,6 +358,8 @@ class User(MixinMeta):
             return
 
         # Re-fetch player to validate resources haven't changed (Suggestion #2)
+        # Mining queued during the confirm wait has to land on the old tool first
+        await self.db_utils.flush_players([ctx.author.id])
         await player.refresh()
         missing_after: list[str] = []
         for resource, cost in (next_tool.upgrade_cost or {}).items():
@@ -380,6 +384,8 @@ class User(MixinMeta):
         update_kwargs[Player.tool] = next_tool_name
         update_kwargs[Player.durability] = next_tool.max_durability
         await Player.update(update_kwargs).where(Player.id == ctx.author.id)
+        # Swings queued while the upgrade was written wore down the old tool, not the new one
+        self.db_utils.drop_pending_durability(ctx.author.id)
         self.reset_durability_warnings(player.id)
         done_embed = discord.Embed(
             title="Upgrade Successful!",
@@ -556,8 +562,7 @@ class User(MixinMeta):
         the average tool tier and player count of recent chatters.
         """
         # Check if this is an active mining channel
-        is_mining_channel = await ActiveChannel.exists().where(ActiveChannel.id == ctx.channel.id)
-        if not is_mining_channel:
+        if ctx.channel.id not in self.active_channels:
             return await ctx.send(
                 "Rocks cannot spawn in this channel. Ask an admin to enable it with `/minerset toggle`.",
                 ephemeral=True,
@@ -1,7 +1,10 @@
+import logging
 import typing as t
+from dataclasses import dataclass, field
 
 import discord
 from aiocache import cached
+from piccolo.columns.defaults.timestamptz import TimestamptzNow
 from piccolo.query.functions.aggregate import Sum
 
 from ..common import constants
@@ -14,6 +17,26 @@ from .tables import (
     ResourceLedger,
 )
 
+log = logging.getLogger("red.vrt.miner.db.utils")
+
+# Counter columns written back by save_player_achievement_stats
+STATS_COLUMNS = [
+    column for column in PlayerAchievementStats._meta.columns if column._meta.name not in ("id", "player", "created_on")
+]
+
+FLUSH_PLAYERS_SQL = """
+UPDATE player SET
+    stone = player.stone + v.stone,
+    iron = player.iron + v.iron,
+    gems = player.gems + v.gems,
+    durability = COALESCE(v.durability, GREATEST(0, player.durability + v.durability_delta)),
+    tool = COALESCE(v.tool, player.tool),
+    updated_on = now()
+FROM unnest({}::bigint[], {}::bigint[], {}::bigint[], {}::bigint[], {}::bigint[], {}::bigint[], {}::text[])
+    AS v(id, stone, iron, gems, durability_delta, durability, tool)
+WHERE player.id = v.id
+"""
+
 
 def key_builder(func: t.Callable, *args, **kwargs) -> str:
     func_name = str(func.__name__).replace("get_cached_", "miner_")
@@ -26,7 +49,108 @@ def key_builder(func: t.Callable, *args, **kwargs) -> str:
     return f"{func_name}:{target}"
 
 
+@dataclass(slots=True)
+class PendingPlayerWrite:
+    """Changes to a player row that haven't been written yet"""
+
+    resources: dict[constants.Resource, int] = field(default_factory=dict)
+    durability_delta: int = 0
+    # Absolute values, set when the tool changes
+    durability: int | None = None
+    tool: constants.ToolName | None = None
+
+    def add_durability(self, delta: int) -> None:
+        if self.durability is None:
+            self.durability_delta += delta
+        else:
+            self.durability = max(0, self.durability + delta)
+
+    def merge(self, newer: "PendingPlayerWrite") -> None:
+        for resource, amount in newer.resources.items():
+            self.resources[resource] = self.resources.get(resource, 0) + amount
+        if newer.tool is not None:
+            self.tool = newer.tool
+        if newer.durability is not None:
+            self.durability = newer.durability
+            self.durability_delta = 0
+        self.add_durability(newer.durability_delta)
+
+    def apply(self, player: Player) -> None:
+        """Show the pending changes on a row fetched from the database"""
+        for resource, amount in self.resources.items():
+            setattr(player, resource, (getattr(player, resource) or 0) + amount)
+        if self.durability is not None:
+            player.durability = self.durability
+        else:
+            player.durability = max(0, player.durability + self.durability_delta)
+        if self.tool is not None:
+            player.tool = self.tool
+
+
 class DBUtils:
+    def __init__(self) -> None:
+        # Player changes queued by the mining views, written in bulk by flush_players
+        self.pending_players: dict[int, PendingPlayerWrite] = {}
+
+    def queue_player_write(
+        self,
+        user: discord.User | discord.Member | int,
+        *,
+        resources: dict[constants.Resource, int] | None = None,
+        durability_delta: int = 0,
+        durability: int | None = None,
+        tool: constants.ToolName | None = None,
+    ) -> None:
+        uid = user if isinstance(user, int) else user.id
+        write = PendingPlayerWrite(
+            resources=dict(resources or {}),
+            durability_delta=durability_delta,
+            durability=durability,
+            tool=tool,
+        )
+        if uid in self.pending_players:
+            self.pending_players[uid].merge(write)
+        else:
+            self.pending_players[uid] = write
+
+    def drop_pending_durability(self, uid: int) -> None:
+        """Forget queued wear and downgrades, used when the tool is replaced or repaired outside the queue"""
+        if write := self.pending_players.get(uid):
+            write.durability_delta = 0
+            write.durability = None
+            write.tool = None
+
+    async def flush_players(self, uids: t.Iterable[int] | None = None) -> None:
+        """Write queued player changes in a single statement"""
+        if uids is None:
+            uids = list(self.pending_players)
+        writes = {uid: self.pending_players.pop(uid) for uid in uids if uid in self.pending_players}
+        if not writes:
+            return
+        columns: list[list[t.Any]] = [[] for _ in range(7)]
+        for uid, write in writes.items():
+            row = (
+                uid,
+                write.resources.get("stone", 0),
+                write.resources.get("iron", 0),
+                write.resources.get("gems", 0),
+                write.durability_delta,
+                write.durability,
+                write.tool,
+            )
+            for column, value in zip(columns, row):
+                column.append(value)
+        try:
+            await Player.raw(FLUSH_PLAYERS_SQL, *columns)
+        except Exception:
+            # Put them back so the next flush retries, merging anything queued meanwhile
+            for uid, write in writes.items():
+                newer = self.pending_players.get(uid)
+                if newer is not None:
+                    write.merge(newer)
+                self.pending_players[uid] = write
+            raise
+
     @staticmethod
     async def get_create_global_settings() -> GlobalSettings:
         settings: GlobalSettings = await GlobalSettings.objects().get_or_create(
@@ -34,10 +158,17 @@ class DBUtils:
         )
         return settings
 
-    @staticmethod
-    async def get_create_player(user: discord.User | discord.Member | int) -> Player:
+    async def get_create_player(self, user: discord.User | discord.Member | int, flush: bool = True) -> Player:
+        """Fetch a player, writing their queued changes first unless flush is False
+
+        With flush=False the queued changes are only applied to the returned row.
+        """
         uid = user if isinstance(user, int) else user.id
+        if flush and uid in self.pending_players:
+            await self.flush_players([uid])
         player = await Player.objects().get_or_create((Player.id == uid), defaults={Player.id: uid})
+        if not flush and uid in self.pending_players:
+            self.pending_players[uid].apply(player)
         return player
 
     @staticmethod
@@ -51,6 +182,30 @@ class DBUtils:
         )
         return stats
 
+    @staticmethod
+    async def get_create_players_achievement_stats(uids: t.Iterable[int]) -> dict[int, PlayerAchievementStats]:
+        uids = list(dict.fromkeys(uids))
+        if not uids:
+            return {}
+        await PlayerAchievementStats.insert(*(PlayerAchievementStats(player=uid) for uid in uids)).on_conflict(
+            target=PlayerAchievementStats.player, action="DO NOTHING"
+        )
+        rows = await PlayerAchievementStats.objects().where(PlayerAchievementStats.player.is_in(uids))
+        return {row.player: row for row in rows}
+
+    @staticmethod
+    async def save_player_achievement_stats(rows: t.Iterable[PlayerAchievementStats]) -> None:
+        """Upsert the counters of several stats rows in one statement"""
+        rows = list(rows)
+        if not rows:
+            return
+        now = TimestamptzNow().python()
+        for row in rows:
+            row.updated_on = now
+        await PlayerAchievementStats.insert(*rows).on_conflict(
+            target=PlayerAchievementStats.player, action="DO UPDATE", values=STATS_COLUMNS
+        )
+
     @staticmethod
     async def get_player_achievements(user: discord.User | discord.Member | int) -> list[PlayerAchievement]:
         uid = user if isinstance(user, int) else user.id
@@ -58,53 +213,71 @@ class DBUtils:
         rows.sort(key=lambda row: row.created_on.timestamp() if row.created_on else 0.0, reverse=True)
         return rows
 
-    @staticmethod
     async def ensure_player_achievements(
+        self,
         user: discord.User | discord.Member | int,
         keys: t.Iterable[str],
     ) -> list[PlayerAchievement]:
         uid = user if isinstance(user, int) else user.id
-        unique_keys = tuple(dict.fromkeys(key for key in keys if key))
-        if not unique_keys:
-            return []
-
-        lookup_keys = [f"{uid}:{key}" for key in unique_keys]
-        existing = await PlayerAchievement.objects().where(PlayerAchievement.lookup_key.is_in(lookup_keys))
-        existing_lookup = {row.lookup_key for row in existing}
-
-        created: list[PlayerAchievement] = []
-        for key in unique_keys:
-            lookup_key = f"{uid}:{key}"
-            if lookup_key in existing_lookup:
-                continue
-            row = await PlayerAchievement.objects().get_or_create(
-                (PlayerAchievement.lookup_key == lookup_key),
-                defaults={
-                    PlayerAchievement.lookup_key: lookup_key,
-                    PlayerAchievement.player: uid,
-                    PlayerAchievement.key: key,
-                },
-            )
-            created.append(row)
+        created = await self.ensure_players_achievements({uid: keys})
+        return created.get(uid, [])
+
+    @staticmethod
+    async def ensure_players_achievements(
+        keys_by_player: dict[int, t.Iterable[str]],
+    ) -> dict[int, list[PlayerAchievement]]:
+        """Insert missing achievement rows for several players at once, returning only the new ones"""
+        rows = [
+            PlayerAchievement(lookup_key=f"{uid}:{key}", player=uid, key=key)
+            for uid, keys in keys_by_player.items()
+            for key in dict.fromkeys(key for key in keys if key)
+        ]
+        if not rows:
+            return {}
 
+        inserted = await (
+            PlayerAchievement.insert(*rows)
+            .on_conflict(target=PlayerAchievement.lookup_key, action="DO NOTHING")
+            .returning(PlayerAchievement.lookup_key)
+        )
+        if not inserted:
+            return {}
+        lookup_keys = [row["lookup_key"] for row in inserted]
+        created = await PlayerAchievement.objects().where(PlayerAchievement.lookup_key.is_in(lookup_keys))
         created.sort(key=lambda row: row.created_on.timestamp() if row.created_on else 0.0, reverse=True)
-        return created
+
+        by_player: dict[int, list[PlayerAchievement]] = {}
+        for row in created:
+            by_player.setdefault(row.player, []).append(row)
+        return by_player
 
     @staticmethod
     async def get_player_resource_lower_bounds(
         user: discord.User | discord.Member | int,
     ) -> dict[constants.Resource, int]:
         uid = user if isinstance(user, int) else user.id
-        bounds: dict[constants.Resource, int] = {resource: 0 for resource in constants.RESOURCES}
+        bounds = await DBUtils.get_players_resource_lower_bounds([uid])
+        return bounds[uid]
 
-        query = ResourceLedger.select(ResourceLedger.resource, Sum(ResourceLedger.amount).as_alias("total")).where(
-            (ResourceLedger.player == uid) & (ResourceLedger.amount > 0)
-        )
-        query = query.group_by(ResourceLedger.resource)
+    @staticmethod
+    async def get_players_resource_lower_bounds(
+        uids: t.Iterable[int],
+    ) -> dict[int, dict[constants.Resource, int]]:
+        uids = list(dict.fromkeys(uids))
+        bounds = {uid: {resource: 0 for resource in constants.RESOURCES} for uid in uids}
+        if not uids:
+            return bounds
+
+        query = ResourceLedger.select(
+            ResourceLedger.player,
+            ResourceLedger.resource,
+            Sum(ResourceLedger.amount).as_alias("total"),
+        ).where(ResourceLedger.player.is_in(uids) & (ResourceLedger.amount > 0))
+        query = query.group_by(ResourceLedger.player, ResourceLedger.resource)
         rows: list[dict[str, t.Any]] = await query
         for row in rows:
             resource = t.cast(constants.Resource, row["resource"])
-            bounds[resource] = int(row.get("total", 0) or 0)
+            bounds[row["player"]][resource] = int(row.get("total", 0) or 0)
 
         return bounds
 
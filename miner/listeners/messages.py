@@ -4,7 +4,6 @@ import discord
 from redbot.core import commands
 
 from ..abc import MixinMeta
-from ..db.tables import ActiveChannel
 
 log = logging.getLogger("red.vrt.miner.listeners.messages")
 
@@ -24,11 +23,10 @@ class MessageListener(MixinMeta):
         channel: discord.TextChannel | discord.Thread = message.channel
 
         # Check if this is an active mining channel
-        is_mining_channel = await ActiveChannel.exists().where(ActiveChannel.id == channel.id)
-        if not is_mining_channel:
+        if channel.id not in self.active_channels:
             return
 
         # Track the user in the channel's chat cache for rock quality scaling
-        # Get or create the user's player data to know their tool tier
-        player = await self.db_utils.get_create_player(message.author)
-        self.chat_cache.add_user(channel.id, message.author.id, player.tool)
+        # The tool tier is cached, so only a player's first message in a while touches the database
+        tool = await self.db_utils.get_cached_player_tool(message.author)
+        self.chat_cache.add_user(channel.id, message.author.id, tool)
@@ -17,6 +17,7 @@ from .commands import Commands
 from .common import achievements, constants, tracker
 from .db.tables import (
     TABLES,
+    ActiveChannel,
     GuildSettings,
     Player,
     PlayerAchievement,
@@ -35,7 +36,7 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
     """Pickaxe in hand, fortune awaits"""
 
     __author__ = "Vertyco"
-    __version__ = "1.2.2"
+    __version__ = "1.2.4"
 
     def __init__(self, bot: Red):
         super().__init__()
@@ -44,6 +45,7 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
         self.db_utils = DBUtils()
 
         self.chat_cache = tracker.ChannelChatCache()
+        self.active_channels: set[int] = set()  # Mining channel IDs, mirrors the ActiveChannel table
         self.guild_spawn_cooldowns: dict[int, float] = {}  # {guild_id: last_spawn_timestamp}
         self.guild_spawn_locks: dict[int, asyncio.Lock] = {}
         self._durability_warning_state: dict[int, float] = {}
@@ -71,7 +73,9 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
     async def red_delete_data_for_user(self, *, requester: RequestType, user_id: int):
         if not self.db:
             return "Data not deleted, database connection is not active"
+        self.db_utils.pending_players.pop(user_id, None)
         await Player.delete().where(Player.id == user_id)
+        await self.db_utils.get_cached_player_tool.cache.delete(f"miner_player_tool:{user_id}")  # type: ignore
         return f"Data for user ID {user_id} has been deleted"
 
     async def cog_load(self) -> None:
@@ -79,6 +83,10 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
 
     async def cog_unload(self) -> None:
         if self.db:
+            try:
+                await self.db_utils.flush_players()
+            except Exception as e:
+                log.error("Failed to write pending player changes", exc_info=e)
             self.db.pool.terminate()
             log.info("Database connection terminated")
 
@@ -107,6 +115,7 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
                 WHERE durability = 0
             """
             await Player.raw(textwrap.dedent(sql))
+            await self.load_active_channels()
         except Exception as e:
             log.error("Failed to connect to database", exc_info=e)
             self.db = None
@@ -129,6 +138,13 @@ class Miner(Commands, Listeners, TaskLoops, commands.Cog, metaclass=CompositeMet
             return False
         return self.db is not None
 
+    async def load_active_channels(self) -> None:
+        """Cache the active mining channel IDs so the message listener never has to query for them."""
+
+        channel_ids = await ActiveChannel.select(ActiveChannel.id).output(as_list=True)
+        self.active_channels = set(channel_ids)
+        log.info(f"Loaded {len(self.active_channels)} active mining channels")
+
     # ---------------------------- DURABILITY UTILITIES ----------------------------
     def reset_durability_warnings(self, player_id: int) -> None:
         """Clear tracked durability warnings for a player (e.g., after repair or tool reset)."""
@@ -171,7 +171,8 @@ class RockView(discord.ui.View):
                 self.action_window.append(txt)
                 return
 
-            player = await self.cog.db_utils.get_create_player(interaction.user)
+            # Overswing damage is queued and written when the rock finalizes
+            player = await self.cog.db_utils.get_create_player(interaction.user, flush=False)
             current_tool = constants.TOOLS[player.tool]
             downgraded_tool = constants.TOOLS[constants.TOOL_ORDER[constants.TOOL_ORDER.index(player.tool) - 1]]
             shatter_txt = f"You swing too hastily at the {self.rocktype.display_name} and your {current_tool.display_name} shatters!"
@@ -193,8 +194,10 @@ class RockView(discord.ui.View):
                 txt = f"‼️{interaction.user.name} shattered their {current_tool.display_name}!"
                 self.action_window.append(txt)
                 await interaction.followup.send(shatter_txt, ephemeral=True)
-                kwargs = {Player.tool: downgraded_tool.key, Player.durability: downgraded_tool.max_durability or 0}
-                await player.update_self(kwargs)
+                self.cog.db_utils.queue_player_write(
+                    player.id, tool=downgraded_tool.key, durability=downgraded_tool.max_durability or 0
+                )
+                await self.cog.db_utils.flush_players([player.id])
                 self.shattered_users.add(interaction.user.id)
                 await self._set_shatter_recovery_stage(interaction.user.id, 1)
                 self.cog.reset_durability_warnings(player.id)
@@ -209,8 +212,10 @@ class RockView(discord.ui.View):
                 if not new_durability:
                     # Tool was shattered
                     await interaction.followup.send(shatter_txt, ephemeral=True)
-                    kwargs = {Player.tool: downgraded_tool.key, Player.durability: downgraded_tool.max_durability or 0}
-                    await player.update_self(kwargs)
+                    self.cog.db_utils.queue_player_write(
+                        player.id, tool=downgraded_tool.key, durability=downgraded_tool.max_durability or 0
+                    )
+                    await self.cog.db_utils.flush_players([player.id])
                     self.shattered_users.add(interaction.user.id)
                     await self._set_shatter_recovery_stage(interaction.user.id, 1)
                     self.cog.reset_durability_warnings(player.id)
@@ -219,7 +224,7 @@ class RockView(discord.ui.View):
                     await self.cog.db_utils.get_cached_player_tool.cache.delete(f"miner_player_tool:{player.id}")  # type: ignore
                     return
 
-                await player.update_self({Player.durability: new_durability})
+                self.cog.db_utils.queue_player_write(player.id, durability_delta=-self.rocktype.overswing_damage)
                 await self._maybe_send_durability_warning(
                     interaction,
                     player.id,
@@ -306,6 +311,7 @@ class RockView(discord.ui.View):
         self.stop()
 
         if self.participants:
+            await self.cog.db_utils.flush_players(self.participants.keys())
             players = await Player.objects().where(Player.id.is_in(list(self.participants.keys())))
             mapped_players: dict[int, Player] = {p.id: p for p in players}
         else:
@@ -316,18 +322,18 @@ class RockView(discord.ui.View):
         payouts, performance_scores, performance_bonus_pct, synergy_context = self._compute_payouts()
         if payouts:
             ledgers: list[ResourceLedger] = []
+            downgraded: list[int] = []
             sorted_participants = sorted(self.participants.items(), key=lambda x: x[1], reverse=True)
             for uid, dmg in sorted_participants:
                 payout = payouts.get(uid, {})
                 if not payout:
                     continue
-                update_kwargs = {}
+                resources: dict[constants.Resource, int] = {}
                 lines: list[str] = []
                 for resource, to_add in payout.items():
                     if to_add <= 0:
                         continue
-                    column = getattr(Player, resource)
-                    update_kwargs[column] = column + to_add
+                    resources[resource] = to_add
                     emoji = constants.resource_emoji(resource)
                     lines.append(f"+`{to_add}` {emoji}")
                     ledgers.append(
@@ -338,7 +344,7 @@ class RockView(discord.ui.View):
                         )
                     )
 
-                if update_kwargs:
+                if resources:
                     hits = self.hits[uid]
                     overswings = self.overswings.get(uid, 0)
                     score = performance_scores.get(uid, 0)
@@ -351,6 +357,7 @@ class RockView(discord.ui.View):
                     )
 
                     player: Player = mapped_players[uid]
+                    write: dict[str, t.Any] = {"resources": resources}
                     if player.tool != "wood":
                         current_tool = constants.TOOLS[player.tool]
                         downgraded_tool = constants.TOOLS[
@@ -364,7 +371,7 @@ class RockView(discord.ui.View):
                             buffer.write(
                                 f"-# -`{dura_deduction}` durability to {current_tool.display_name} (now `{new_durability}`)\n"
                             )
-                            update_kwargs[Player.durability] = new_durability
+                            write["durability"] = new_durability
                             warning_note = self._durability_warning_note(player.id, current_tool, new_durability)
                             if warning_note:
                                 buffer.write(f"-# {warning_note}\n")
@@ -372,11 +379,20 @@ class RockView(discord.ui.View):
                             buffer.write(
                                 f"-# ‼️{player.tool.title()} broke due to overuse, downgraded to {downgraded_tool.display_name}\n"
                             )
-                            update_kwargs[Player.tool] = downgraded_tool.key
-                            update_kwargs[Player.durability] = downgraded_tool.max_durability or 0
+                            write["tool"] = downgraded_tool.key
+                            write["durability"] = downgraded_tool.max_durability or 0
+                            downgraded.append(player.id)
                             self.cog.reset_durability_warnings(player.id)
-                    await player.update_self(update_kwargs)
-
+                    self.cog.db_utils.queue_player_write(player.id, **write)
+                    # Keep the fetched row current for the achievement checks below
+                    player.tool = write.get("tool", player.tool)
+                    player.durability = write.get("durability", player.durability)
+                    for resource, to_add in resources.items():
+                        setattr(player, resource, (getattr(player, resource) or 0) + to_add)
+
+            await self.cog.db_utils.flush_players(mapped_players.keys())
+            for uid in downgraded:
+                await self.cog.db_utils.get_cached_player_tool.cache.delete(f"miner_player_tool:{uid}")  # type: ignore
             if ledgers:
                 await ResourceLedger.insert(*ledgers)
 
@@ -414,8 +430,12 @@ class RockView(discord.ui.View):
         depleted = self.current_hp <= 0
         role_by_user = {uid: role_name for role_name, uid in synergy_context.get("roles", [])}
 
-        for uid in mapped_players:
-            live_keys = await self._update_stats_and_collect_achievement_keys(
+        # Every participant's stats, unlock checks and new achievements are read and written together
+        stats_by_player = await self.cog.db_utils.get_create_players_achievement_stats(mapped_players.keys())
+        live_keys: dict[int, list[str]] = {}
+        for uid, stats in stats_by_player.items():
+            live_keys[uid] = self._update_stats_and_collect_achievement_keys(
+                stats=stats,
                 uid=uid,
                 performance_scores=performance_scores,
                 role_by_user=role_by_user,
@@ -424,14 +444,28 @@ class RockView(discord.ui.View):
                 depleted=depleted,
                 full_synergy=len(synergy_context.get("roles", [])) >= 3,
             )
-            exact_unlocks = await self.cog.sync_player_achievements(uid)
-            live_unlocks = await self.cog.unlock_player_achievements(uid, live_keys)
-            combined = achievements.dedupe_achievement_defs([*exact_unlocks, *live_unlocks])
+        await self.cog.db_utils.save_player_achievement_stats(stats_by_player.values())
+
+        resource_lower_bounds = await self.cog.db_utils.get_players_resource_lower_bounds(mapped_players.keys())
+        keys_by_player = {
+            uid: [
+                *achievements.get_exact_retroactive_unlock_keys(player.tool, resource_lower_bounds[uid]),
+                *live_keys.get(uid, []),
+            ]
+            for uid, player in mapped_players.items()
+        }
+        new_rows = await self.cog.db_utils.ensure_players_achievements(keys_by_player)
+        for uid, rows in new_rows.items():
+            unlocked = [
+                achievements.ACHIEVEMENTS_BY_KEY[row.key] for row in rows if row.key in achievements.ACHIEVEMENTS_BY_KEY
+            ]
+            combined = achievements.dedupe_achievement_defs(unlocked)
             if combined and self.message:
                 await self.cog.announce_achievement_unlocks(self.message.channel, uid, combined)
 
-    async def _update_stats_and_collect_achievement_keys(
+    def _update_stats_and_collect_achievement_keys(
         self,
+        stats: PlayerAchievementStats,
         uid: int,
         performance_scores: dict[int, int],
         role_by_user: dict[int, str],
@@ -440,7 +474,6 @@ class RockView(discord.ui.View):
         depleted: bool,
         full_synergy: bool,
     ) -> list[str]:
-        stats = await self.cog.get_player_achievement_stats(uid)
         keys: list[str] = []
 
         overswings = self.overswings.get(uid, 0)
@@ -472,42 +505,36 @@ class RockView(discord.ui.View):
         role_stabilizer_total = (stats.role_stabilizer_total or 0) + (1 if role_name == "Stabilizer" else 0)
         role_finisher_total = (stats.role_finisher_total or 0) + (1 if role_name == "Finisher" else 0)
 
-        update_kwargs: dict[t.Any, t.Any] = {
-            PlayerAchievementStats.rocks_mined_total: rocks_mined_total,
-            PlayerAchievementStats.group_sessions_total: group_sessions_total,
-            PlayerAchievementStats.modifier_rocks_mined_total: modifier_rocks_total,
-            PlayerAchievementStats.mined_small: rock_variety_seen["small"],
-            PlayerAchievementStats.mined_medium: rock_variety_seen["medium"],
-            PlayerAchievementStats.mined_large: rock_variety_seen["large"],
-            PlayerAchievementStats.mined_meteor: rock_variety_seen["meteor"],
-            PlayerAchievementStats.mined_geode: rock_variety_seen["volatile geode"],
-            PlayerAchievementStats.clean_streak_current: clean_streak_current,
-            PlayerAchievementStats.clean_streak_best: clean_streak_best,
-            PlayerAchievementStats.perf_max_streak_current: perf_max_streak_current,
-            PlayerAchievementStats.perf_max_streak_best: perf_max_streak_best,
-            PlayerAchievementStats.role_breaker_total: role_breaker_total,
-            PlayerAchievementStats.role_stabilizer_total: role_stabilizer_total,
-            PlayerAchievementStats.role_finisher_total: role_finisher_total,
-        }
+        stats.rocks_mined_total = rocks_mined_total
+        stats.group_sessions_total = group_sessions_total
+        stats.modifier_rocks_mined_total = modifier_rocks_total
+        stats.mined_small = rock_variety_seen["small"]
+        stats.mined_medium = rock_variety_seen["medium"]
+        stats.mined_large = rock_variety_seen["large"]
+        stats.mined_meteor = rock_variety_seen["meteor"]
+        stats.mined_geode = rock_variety_seen["volatile geode"]
+        stats.clean_streak_current = clean_streak_current
+        stats.clean_streak_best = clean_streak_best
+        stats.perf_max_streak_current = perf_max_streak_current
+        stats.perf_max_streak_best = perf_max_streak_best
+        stats.role_breaker_total = role_breaker_total
+        stats.role_stabilizer_total = role_stabilizer_total
+        stats.role_finisher_total = role_finisher_total
         if shatter_recovery_stage and uid not in self.shattered_users:
-            update_kwargs[PlayerAchievementStats.shatter_recovery_stage] = 0
+            stats.shatter_recovery_stage = 0
 
         if depleted and participant_count == 1:
-            solo_columns = {
-                "small": (PlayerAchievementStats.best_solo_small_seconds, stats.best_solo_small_seconds or 0.0),
-                "medium": (PlayerAchievementStats.best_solo_medium_seconds, stats.best_solo_medium_seconds or 0.0),
-                "large": (PlayerAchievementStats.best_solo_large_seconds, stats.best_solo_large_seconds or 0.0),
-                "meteor": (PlayerAchievementStats.best_solo_meteor_seconds, stats.best_solo_meteor_seconds or 0.0),
-                "volatile geode": (
-                    PlayerAchievementStats.best_solo_geode_seconds,
-                    stats.best_solo_geode_seconds or 0.0,
-                ),
+            solo_attrs = {
+                "small": "best_solo_small_seconds",
+                "medium": "best_solo_medium_seconds",
+                "large": "best_solo_large_seconds",
+                "meteor": "best_solo_meteor_seconds",
+                "volatile geode": "best_solo_geode_seconds",
             }
-            solo_column, current_best = solo_columns[self.rocktype.key]
+            solo_attr = solo_attrs[self.rocktype.key]
+            current_best = getattr(stats, solo_attr) or 0.0
             if current_best <= 0 or duration_seconds < current_best:
-                update_kwargs[solo_column] = duration_seconds
-
-        await stats.update_self(update_kwargs)
+                setattr(stats, solo_attr, duration_seconds)
 
         for threshold, key in achievements.CLEAN_STREAK_THRESHOLDS:
             if clean_streak_current >= threshold:
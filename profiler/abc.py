@@ -4,6 +4,7 @@ from abc import ABCMeta, abstractmethod
 from discord.ext.commands.cog import CogMeta
 from redbot.core.bot import Red
 
+from .common.loop_monitor import LoopMonitor
 from .common.models import DB, Method
 
 
@@ -33,6 +34,7 @@ class MixinMeta(metaclass=ABCMeta):
         # {method_key: Method}
         self.methods: t.Dict[str, Method] = {}
         self.currently_tracked: t.Set[str] = set()
+        self.loop_monitor: LoopMonitor
 
     @abstractmethod
     def save(self) -> None:
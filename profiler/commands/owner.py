@@ -16,10 +16,12 @@ from redbot.core.utils.chat_formatting import box, humanize_number, pagify
 from ..abc import MixinMeta
 from ..common.formatting import humanize_size
 from ..common.io_profiler import IOProfileResult, run_io_profile
+from ..common.loop_monitor import HISTORY_MINUTES
 from ..common.mem_profiler import profile_cog_memory, profile_memory
 from ..common.models import IGNORED_COGS
 from ..common.pyspy_profiler import ProfileResult, run_pyspy_profile
 from ..views.io_menu import IOMenu
+from ..views.loop_menu import LoopMenu
 from ..views.profile_menu import ProfileMenu
 from ..views.pyspy_menu import PySpyMenu
 
@@ -95,9 +97,9 @@ class Owner(MixinMeta):
         monitoring = 0
         for methods in self.db.stats.values():
             monitoring += len(methods)
-            for statprofiles in methods.values():
-                records += len(statprofiles)
-        txt += f"- Monitoring: `{humanize_number(monitoring)}` methods (`{humanize_number(records)}` Records)\n"
+            for method_stats in methods.values():
+                records += method_stats.count
+        txt += f"- Monitoring: `{humanize_number(monitoring)}` methods (`{humanize_number(records)}` Calls)\n"
 
         # TRACKED COGS
         y = "**Included**"
@@ -120,6 +122,10 @@ class Owner(MixinMeta):
         txt += f"- All methods with a runtime greater than **{self.db.tracked_threshold}ms** are being recorded\n"
         txt += f"The following methods are being tracked: {joined}\n"
 
+        # LOOP MONITOR
+        txt += "## Event Loop Monitor:\n"
+        txt += f"- Stalls longer than **{self.db.loop_threshold}ms** have their stack captured\n"
+
         await ctx.send(txt)
 
     @profiler.command(name="cleanup", aliases=["c"])
@@ -136,6 +142,7 @@ class Owner(MixinMeta):
         Clear all saved metrics
         """
         self.db.stats.clear()
+        self.loop_monitor.clear()
         await self.save()
         await ctx.send("All metrics have been cleared")
 
@@ -675,3 +682,36 @@ class Owner(MixinMeta):
 
         view = IOMenu(ctx, result)
         await view.start()
+
+    @profiler.command(name="loop", aliases=["lag", "loopmonitor"])
+    async def view_loop_monitor(self, ctx: commands.Context, hours: int = 1):
+        """
+        View event loop lag and the functions that stalled it
+
+        The loop monitor is always running. It measures how late the event loop
+        schedules callbacks, and when the loop is blocked for longer than the
+        threshold it captures the stack of whatever was running. Stalls are grouped
+        by cog and function so blocking code can be tracked down.
+
+        Stalls blocking the loop for too long are what cause gateway heartbeat warnings.
+
+        **Arguments**:
+        - `hours`: How many hours of lag history to show (default: 1, max: 24)
+        """
+        if not 1 <= hours <= HISTORY_MINUTES // 60:
+            return await ctx.send(f"Hours must be between 1 and {HISTORY_MINUTES // 60}.")
+        async with ctx.typing():
+            view = LoopMenu(ctx, self.loop_monitor, hours)
+            await view.start()
+
+    @profiler.command(name="loopthreshold")
+    async def set_loop_threshold(self, ctx: commands.Context, threshold: float):
+        """
+        Set how long (ms) the event loop must be blocked before a stall is captured
+        """
+        if threshold < 10:
+            return await ctx.send("Threshold must be at least 10ms")
+        self.db.loop_threshold = threshold
+        self.loop_monitor.threshold = threshold
+        await ctx.send(f"Loop stall threshold is now set to **{threshold}ms**")
+        await self.save()
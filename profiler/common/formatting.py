@@ -1,24 +1,29 @@
 import math
-import statistics
 import typing as t
 from datetime import datetime, timedelta
 
 from redbot.core.utils.chat_formatting import box
 from tabulate import tabulate
 
-from .models import DB, StatsProfile
+from .models import DB, MethodStats
+
+
+def _format_runtime(seconds: float) -> str:
+    return f"{seconds:.4f}s" if seconds > 1 else f"{seconds * 1000:.2f}ms"
 
 
 def format_method_pages(
     method_key: str,
-    data: t.List[StatsProfile],
+    method_stats: MethodStats,
     threshold: float = 0.0,
     sort_by_delta: bool = False,
 ) -> t.List[str]:
+    summary = method_stats.summarize()
+    data = sorted(method_stats.samples, key=lambda i: i.timestamp)
     if threshold:
         data = [i for i in data if (i.total_tt * 1000) >= threshold]
 
-    if not data:
+    if not summary or not data:
         if threshold:
             return ["No data to display. Come back later or try a lower threshold."]
         else:
@@ -27,32 +32,17 @@ def format_method_pages(
     if sort_by_delta and data:
         data.sort(key=lambda i: i.total_tt, reverse=True)
 
-    runtimes = [profile.total_tt for profile in data]
-    max_runtime = max(runtimes)
-    min_runtime = min(runtimes)
-    avg_runtime = statistics.mean(runtimes)
-
-    max_exe = f"{max_runtime:.4f}s" if max_runtime > 1 else f"{max_runtime * 1000:.2f}ms"
-    min_exe = f"{min_runtime:.4f}s" if min_runtime > 1 else f"{min_runtime * 1000:.2f}ms"
-    avg_exe = f"{avg_runtime:.4f}s" if avg_runtime > 1 else f"{avg_runtime * 1000:.2f}ms"
-
-    # Now calculate the calls per minute
-    oldest_profile = min(data, key=lambda i: i.timestamp)
-    timeframe_minutes = (datetime.now() - oldest_profile.timestamp).total_seconds() / 60
-    calls_per_minute = len(data) / timeframe_minutes if timeframe_minutes else 0
-
-    total_calls = len(data)
-    error_count = len([i for i in data if i.exception_thrown])
-
     base_page = (
         f"# {method_key}\n"
         "## Overview\n"
-        f"- Max Runtime: {max_exe}\n"
-        f"- Min Runtime: {min_exe}\n"
-        f"- Avg Runtime: {avg_exe}\n"
-        f"- Calls/Min: {calls_per_minute:.1f}\n"
-        f"- Total Calls: {total_calls}\n"
-        f"- Errors: {error_count}\n"
+        f"- Max Runtime: {_format_runtime(summary.max_tt)}\n"
+        f"- Min Runtime: {_format_runtime(summary.min_tt)}\n"
+        f"- Avg Runtime: {_format_runtime(summary.avg_tt)}\n"
+        f"- P50/P95/P99: {_format_runtime(summary.p50)} / {_format_runtime(summary.p95)} / "
+        f"{_format_runtime(summary.p99)}\n"
+        f"- Calls/Min: {summary.calls_per_minute:.1f}\n"
+        f"- Total Calls: {summary.count}\n"
+        f"- Errors: {summary.errors}\n"
     )
 
     warning_sign = "⚠️"
@@ -77,23 +67,23 @@ def format_method_pages(
         page += "\n"
         if threshold:
             page += f"Filtering by threshold: `{threshold:.2f}ms`\n"
-        page += f"Page `{idx + 1}/{len(data)}`"
+        page += f"Sampled call `{idx + 1}/{len(data)}`"
         pages.append(page)
 
     return pages
 
 
-def format_method_error_pages(method_key: str, data: t.List[StatsProfile]) -> t.List[str]:
+def format_method_error_pages(method_key: str, method_stats: MethodStats) -> t.List[str]:
     """Create pages that show only the errored runs for a given method.
 
     Parameters
     - method_key: The identifier of the method being inspected.
-    - data: The list of StatsProfile entries for this method.
+    - method_stats: The aggregated stats for this method, its most recent errors are shown.
 
     Returns
     - List of page strings suitable for sending as message content.
     """
-    error_profiles = [i for i in data if i.exception_thrown]
+    error_profiles = sorted(method_stats.errors, key=lambda i: i.timestamp, reverse=True)
 
     if not error_profiles:
         return ["No errors recorded for this method."]
@@ -128,58 +118,42 @@ def format_runtime_pages(
     sort_by: str,
     query: str = None,
 ) -> t.List[str]:
-    now = datetime.now()
+    since = (datetime.now() - timedelta(hours=db.delta)).timestamp()
     stats: t.Dict[str, list] = {}
     keys = list(db.stats.keys())
     for k in keys:
         methodlist = db.stats[k]
         method_keys = list(methodlist.keys())
         for method_key in method_keys:
-            profiles = methodlist[method_key]
+            method_stats = methodlist[method_key]
             if query and query not in method_key:
                 continue
 
-            # Calculate the calls per minute and total calls in the last specified delta
-            valid_profiles = [i for i in profiles if i.timestamp > (now - timedelta(hours=db.delta))]
-            if not valid_profiles:
+            summary = method_stats.summarize(since)
+            if not summary:
                 # Don't show any results beyond the set delta
                 continue
 
-            runtimes = [profile.total_tt for profile in valid_profiles]
-
-            max_runtime = max(runtimes)
-            min_runtime = min(runtimes)
-            avg_runtime = statistics.mean(runtimes)
-
-            # Now calculate the calls per minute
-            oldest_profile = min(valid_profiles, key=lambda i: i.timestamp)
-            timeframe_minutes = (now - oldest_profile.timestamp).total_seconds() / 60
-            calls_per_minute = len(valid_profiles) / timeframe_minutes if timeframe_minutes else 0
-
-            total_calls = len(valid_profiles)
-            error_count = len([i for i in valid_profiles if i.exception_thrown])
-
             # Calculate impact score
-            std_dev = statistics.stdev(runtimes) if len(runtimes) > 1 else 0
-            variability_score = std_dev / avg_runtime if avg_runtime > 0 else 0
-            impact_score = (avg_runtime * calls_per_minute) * (1 + variability_score)
+            variability_score = summary.std_dev / summary.avg_tt if summary.avg_tt > 0 else 0
+            impact_score = (summary.avg_tt * summary.calls_per_minute) * (1 + variability_score)
 
             name = method_key
-            if profiles[0].func_type != "method":
-                name = f"{method_key} ({profiles[0].func_type[0].upper()})"
+            if method_stats.func_type != "method":
+                name = f"{method_key} ({method_stats.func_type[0].upper()})"
 
             if method_key in db.tracked_methods:
                 name = f"+ {name}"
-            elif error_count > 0:
+            elif summary.errors > 0:
                 name = f"- {name}"
 
             stats[name] = [
-                min_runtime,
-                max_runtime,
-                avg_runtime,
-                calls_per_minute,
-                total_calls,
-                error_count,
+                summary.min_tt,
+                summary.max_tt,
+                summary.avg_tt,
+                summary.calls_per_minute,
+                summary.count,
+                summary.errors,
                 impact_score,
             ]
 
@@ -278,20 +252,6 @@ def format_runtime_pages(
     return pages
 
 
-def format_runtimes(stats: t.Dict[str, t.List[StatsProfile]]):
-    rows = []
-    for method_key, profiles in stats.items():
-        for profile in profiles:
-            if profile.total_tt < 1:
-                exe_time = f"{profile.total_tt * 1000:.2f}ms"
-            else:
-                exe_time = f"{profile.total_tt:.4f}s"
-
-            rows.append([method_key, exe_time, profile.is_command, profile.is_coro])
-    cols = ["Method", "Time", "Command", "Coro"]
-    return tabulate(rows, headers=cols)
-
-
 def timedelta_format(delta: t.Optional[timedelta] = None, seconds: t.Optional[int] = None) -> str:
     try:
         obj = seconds if seconds is not None else delta.total_seconds()
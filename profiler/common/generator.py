@@ -5,21 +5,25 @@ import plotly.graph_objects as go
 import plotly.io as pio
 from redbot.core.utils.chat_formatting import humanize_timedelta
 
-from .models import StatsProfile
+from .models import MethodStats, get_percentiles
 
 
-def generate_line_graph(profile_data: t.List[StatsProfile]) -> bytes:
-    sorted_data = sorted(profile_data, key=lambda x: x.timestamp)
-    # Extracting the total_tt and timestamp from each profile
-    execution_times: t.List[float] = [profile.total_tt * 1000 for profile in sorted_data]
-    timestamps: t.List[datetime] = [profile.timestamp for profile in sorted_data]
+def generate_line_graph(method_stats: MethodStats) -> bytes:
+    windows = method_stats.get_windows()
+    # Percentiles of each window, in milliseconds
+    timestamps: t.List[datetime] = [datetime.fromtimestamp(window.start) for window in windows]
+    percentiles = [
+        [value * 1000 for value in get_percentiles([window], (0.5, 0.95, 0.99), window.min_tt, window.max_tt)]
+        for window in windows
+    ]
 
     delta = timestamps[-1] - timestamps[0]
     humanized_delta = humanize_timedelta(timedelta=delta)
 
     # Creating the plot
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=timestamps, y=execution_times, mode="lines+markers", name="Total Execution Time"))
+    for idx, name in enumerate(("P50", "P95", "P99")):
+        fig.add_trace(go.Scatter(x=timestamps, y=[row[idx] for row in percentiles], mode="lines+markers", name=name))
 
     # Customizing the plot
     fig.update_layout(
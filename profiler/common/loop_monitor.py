@@ -0,0 +1,394 @@
+"""
+Event loop lag monitor.
+
+A heartbeat task sleeps for a short interval and measures how late it wakes up, which is
+the scheduling lag every other callback on the loop sees. A watchdog thread checks the
+heartbeat and, when the loop has been blocked for longer than the threshold, grabs the
+stack of whatever the loop thread is running at that moment. Stalls are attributed to
+the innermost frame belonging to a loaded cog and aggregated by cog and function.
+
+Lag is kept as per-minute windows in a rolling history, stalls in a bounded list.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from time import perf_counter
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+from redbot.core.bot import Red
+
+log = logging.getLogger("red.vrt.profiler.loop_monitor")
+
+HEARTBEAT_INTERVAL = 0.1  # Seconds between heartbeats
+HISTORY_MINUTES = 24 * 60  # Lag windows kept
+MAX_STALLS = 100  # Most recent stalls kept with their stacks
+STACK_LIMIT = 25  # Frames kept per captured stack
+
+
+@dataclass
+class LagWindow:
+    """Heartbeat lag over one minute"""
+
+    start: float  # Unix timestamp
+    samples: int = 0
+    total_lag: float = 0.0
+    max_lag: float = 0.0
+    stalls: int = 0
+
+    @property
+    def avg_lag(self) -> float:
+        return self.total_lag / self.samples if self.samples else 0.0
+
+
+@dataclass
+class Stall:
+    """The loop was blocked for longer than the threshold"""
+
+    timestamp: float  # Unix timestamp the stall was detected
+    duration: float  # Seconds the loop was blocked
+    cog: str
+    function: str
+    stack: str = ""  # Empty if the stall ended before the watchdog could sample it
+
+
+@dataclass
+class Offender:
+    """Stalls attributed to one function"""
+
+    cog: str
+    function: str
+    count: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+    last_seen: float = 0.0
+    stack: str = ""  # Stack of the worst stall
+
+
+@dataclass
+class LoopMonitorResult:
+    """Copy of the monitor's state for rendering off the loop"""
+
+    threshold: float  # Milliseconds
+    started: float  # Unix timestamp
+    windows: t.List[LagWindow] = field(default_factory=list)
+    stalls: t.List[Stall] = field(default_factory=list)
+    offenders: t.List[Offender] = field(default_factory=list)
+
+
+class LoopMonitor:
+    def __init__(self, bot: Red, threshold: float = 100.0):
+        self.bot = bot
+        self.threshold = threshold  # Milliseconds
+
+        self.windows: t.Deque[LagWindow] = deque(maxlen=HISTORY_MINUTES)
+        self.stalls: t.Deque[Stall] = deque(maxlen=MAX_STALLS)
+        # {(cog_name, function): Offender}
+        self.offenders: t.Dict[t.Tuple[str, str], Offender] = {}
+        self.started = time.time()
+
+        self.task: t.Optional[asyncio.Task] = None
+        self.thread: t.Optional[threading.Thread] = None
+        self.stopping = threading.Event()
+
+        self.loop_thread_id: t.Optional[int] = None
+        self.last_beat = perf_counter()
+        # Set by the watchdog thread, completed by the next heartbeat
+        self.pending: t.Optional[Stall] = None
+        # [(module_prefix, cog_name)] longest prefix first, swapped whole so the watchdog can read it
+        self.cog_modules: t.List[t.Tuple[str, str]] = []
+
+    def start(self) -> None:
+        if self.task and not self.task.done():
+            return
+        self.stopping.clear()
+        self.started = time.time()
+        self.loop_thread_id = threading.get_ident()
+        self.last_beat = perf_counter()
+        self.map_cog_modules()
+        self.task = asyncio.create_task(self.heartbeat())
+        self.thread = threading.Thread(target=self.watchdog, name="profiler-loop-monitor", daemon=True)
+        self.thread.start()
+        log.debug("Loop monitor started")
+
+    def stop(self) -> None:
+        self.stopping.set()
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        self.thread = None
+
+    def clear(self) -> None:
+        self.windows.clear()
+        self.stalls.clear()
+        self.offenders.clear()
+        self.started = time.time()
+
+    def map_cog_modules(self) -> None:
+        cog_modules = []
+        for cog_name, cog in list(self.bot.cogs.items()):
+            module = type(cog).__module__
+            package = module.rpartition(".")[0] or module
+            cog_modules.append((package, cog_name))
+        self.cog_modules = sorted(cog_modules, key=lambda i: len(i[0]), reverse=True)
+
+    def get_window(self, now: float) -> LagWindow:
+        start = now - now % 60
+        if not self.windows or self.windows[-1].start != start:
+            self.windows.append(LagWindow(start=start))
+        return self.windows[-1]
+
+    async def heartbeat(self) -> None:
+        beats = 0
+        while True:
+            expected = perf_counter() + HEARTBEAT_INTERVAL
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            beat = perf_counter()
+            self.last_beat = beat
+            lag = max(0.0, beat - expected)
+
+            window = self.get_window(time.time())
+            window.samples += 1
+            window.total_lag += lag
+            window.max_lag = max(window.max_lag, lag)
+
+            stall, self.pending = self.pending, None
+            if stall is None and lag * 1000 >= self.threshold:
+                # Over before the watchdog looked, only the duration is known
+                stall = Stall(timestamp=time.time(), duration=lag, cog="Unknown", function="Unknown")
+            if stall is not None:
+                stall.duration = max(stall.duration, lag)
+                window.stalls += 1
+                self.add_stall(stall)
+
+            beats += 1
+            if beats % 600 == 0:
+                # Pick up cogs loaded since the last mapping
+                self.map_cog_modules()
+
+    def add_stall(self, stall: Stall) -> None:
+        self.stalls.append(stall)
+        key = (stall.cog, stall.function)
+        offender = self.offenders.get(key)
+        if offender is None:
+            offender = self.offenders[key] = Offender(cog=stall.cog, function=stall.function)
+        offender.count += 1
+        offender.total += stall.duration
+        offender.last_seen = stall.timestamp
+        if stall.duration >= offender.worst:
+            offender.worst = stall.duration
+            offender.stack = stall.stack or offender.stack
+
+    def watchdog(self) -> None:
+        """Runs in its own thread, samples the loop thread's stack while it's blocked"""
+        sampled_beat = None
+        while not self.stopping.wait(max(self.threshold / 2000, 0.01)):
+            beat = self.last_beat
+            blocked = perf_counter() - beat - HEARTBEAT_INTERVAL
+            if blocked * 1000 < self.threshold or beat == sampled_beat:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                stall = self.capture(frame, blocked)
+            except Exception as e:
+                log.warning("Failed to capture a stalled loop stack", exc_info=e)
+                continue
+            finally:
+                del frame
+            if self.last_beat != beat:
+                # The loop moved on while sampling, the stack may belong to something else
+                continue
+            sampled_beat = beat
+            self.pending = stall
+
+    def capture(self, frame, blocked: float) -> Stall:
+        cog, function = self.attribute(frame)
+        stack = "".join(traceback.format_list(traceback.extract_stack(frame, limit=STACK_LIMIT)))
+        return Stall(timestamp=time.time(), duration=blocked, cog=cog, function=function, stack=stack)
+
+    def attribute(self, frame) -> t.Tuple[str, str]:
+        """Cog and function of the innermost frame that belongs to a loaded cog"""
+        innermost = frame
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            for prefix, cog_name in self.cog_modules:
+                if module == prefix or module.startswith(f"{prefix}."):
+                    return cog_name, f"{module}.{qualname(frame)}"
+            frame = frame.f_back
+        module = innermost.f_globals.get("__name__", "")
+        return f"<{module.partition('.')[0] or 'unknown'}>", f"{module}.{qualname(innermost)}"
+
+    def snapshot(self) -> LoopMonitorResult:
+        return LoopMonitorResult(
+            threshold=self.threshold,
+            started=self.started,
+            windows=[replace(i) for i in self.windows],
+            stalls=[replace(i) for i in self.stalls],
+            offenders=sorted((replace(i) for i in self.offenders.values()), key=lambda i: i.total, reverse=True),
+        )
+
+
+def qualname(frame) -> str:
+    code = frame.f_code
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds:.2f}s" if seconds >= 1 else f"{seconds * 1000:.0f}ms"
+
+
+def _truncate(s: str, max_len: int = 60) -> str:
+    return s if len(s) <= max_len else "..." + s[-(max_len - 3) :]
+
+
+def format_loop_insights(result: LoopMonitorResult, hours: int = 1) -> t.List[str]:
+    """Format loop monitor results into pages."""
+    cutoff = time.time() - hours * 3600
+    windows = [i for i in result.windows if i.start >= cutoff]
+    stalls = [i for i in result.stalls if i.timestamp >= cutoff]
+    samples = sum(i.samples for i in windows)
+    avg_lag = sum(i.total_lag for i in windows) / samples if samples else 0.0
+    max_lag = max((i.max_lag for i in windows), default=0.0)
+    stall_count = sum(i.stalls for i in windows)
+    started = int(result.started)
+
+    pages = []
+
+    # Page 1: Overview
+    overview = [
+        f"# Event Loop Monitor (Last {'Hour' if hours == 1 else f'{hours} Hours'})",
+        f"- Monitoring since <t:{started}:F> (<t:{started}:R>)",
+        f"- Stall Threshold: `{result.threshold:.0f}ms`",
+        f"- Avg Lag: `{_format_ms(avg_lag)}`",
+        f"- Max Lag: `{_format_ms(max_lag)}`",
+        f"- Stalls: `{stall_count:,}`",
+    ]
+    if windows:
+        last = windows[-1]
+        overview.append(f"- Current Minute: avg `{_format_ms(last.avg_lag)}` • max `{_format_ms(last.max_lag)}`")
+    overview.append("")
+    if result.offenders:
+        overview.append("## Top Offenders (All Time)")
+        for idx, offender in enumerate(result.offenders[:10], 1):
+            overview.append(
+                f"{idx}. **{offender.cog}** `{_truncate(offender.function)}` • {offender.count:,} stalls • "
+                f"worst {_format_ms(offender.worst)} • total {_format_ms(offender.total)}"
+            )
+    else:
+        overview.append("✅ No stalls recorded")
+    pages.append("\n".join(overview))
+
+    # Page 2: By cog
+    if result.offenders:
+        by_cog: t.Dict[str, t.List[float]] = {}
+        for offender in result.offenders:
+            count, total, worst = by_cog.get(offender.cog, [0, 0.0, 0.0])
+            by_cog[offender.cog] = [count + offender.count, total + offender.total, max(worst, offender.worst)]
+        cog_page = ["# Stalls by Cog", ""]
+        ranked = sorted(by_cog.items(), key=lambda i: i[1][1], reverse=True)
+        for idx, (cog_name, (count, total, worst)) in enumerate(ranked[:15], 1):
+            cog_page.append(
+                f"{idx}. **{cog_name}** • {count:,} stalls • worst {_format_ms(worst)} • total {_format_ms(total)}"
+            )
+        cog_page.append("")
+        cog_page.append("-# `<package>` means no cog frame was on the stack when it stalled")
+        pages.append("\n".join(cog_page))
+
+    # Remaining pages: most recent stalls with their stacks
+    for stall in reversed(stalls[-10:]):
+        ts = int(stall.timestamp)
+        page = (
+            "# Stall\n"
+            f"- Time: <t:{ts}:F> (<t:{ts}:R>)\n"
+            f"- Blocked For: `{_format_ms(stall.duration)}`\n"
+            f"- Cog: **{stall.cog}**\n"
+            f"- Function: `{stall.function}`\n"
+        )
+        if stall.stack:
+            stack = stall.stack
+            if len(stack) > 1500:
+                stack = "...\n" + stack[-1500:]
+            page += f"```py\n{stack}\n```"
+        else:
+            page += "-# The stall ended before its stack could be sampled"
+        pages.append(page)
+
+    return pages
+
+
+def generate_loop_chart(result: LoopMonitorResult, hours: int = 1) -> bytes:
+    """Generate charts of loop lag over time and the worst offenders."""
+    cutoff = time.time() - hours * 3600
+    windows = [i for i in result.windows if i.start >= cutoff]
+    offenders = result.offenders[:10]
+    cols = 2 if offenders else 1
+    subtitles = ["Loop Lag per Minute"]
+    if offenders:
+        subtitles.append("Top Offenders by Total Stall Time")
+
+    fig = make_subplots(rows=1, cols=cols, subplot_titles=subtitles, horizontal_spacing=0.25 if offenders else 0)
+
+    timestamps = [datetime.fromtimestamp(i.start) for i in windows]
+    fig.add_trace(
+        go.Scatter(
+            x=timestamps,
+            y=[i.max_lag * 1000 for i in windows],
+            mode="lines",
+            name="Max",
+            marker_color="rgb(239, 85, 59)",
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=timestamps,
+            y=[i.avg_lag * 1000 for i in windows],
+            mode="lines",
+            name="Avg",
+            marker_color="rgb(99, 110, 250)",
+            fill="tozeroy",
+        ),
+        row=1,
+        col=1,
+    )
+    fig.update_yaxes(title_text="Lag (ms)", row=1, col=1)
+
+    if offenders:
+        names = [_truncate(f"{i.cog}: {i.function.rpartition('.')[2]}", 50) for i in reversed(offenders)]
+        totals = [i.total * 1000 for i in reversed(offenders)]
+        fig.add_trace(
+            go.Bar(
+                y=names,
+                x=totals,
+                orientation="h",
+                marker_color="rgb(0, 204, 150)",
+                text=[f"{i.count:,}x" for i in reversed(offenders)],
+                textposition="outside",
+                name="Stall Time",
+            ),
+            row=1,
+            col=2,
+        )
+        fig.update_xaxes(title_text="Total Stall Time (ms)", row=1, col=2)
+
+    fig.update_layout(
+        title=dict(text=f"Event Loop Lag (threshold {result.threshold:.0f}ms)", x=0.5, xanchor="center"),
+        template="plotly_dark",
+        showlegend=True,
+        height=500,
+        width=1600,
+        margin=dict(l=80, r=80, t=80, b=50),
+    )
+    return pio.to_image(fig, format="png")
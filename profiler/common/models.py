@@ -1,13 +1,38 @@
+import math
+import random
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from time import time
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from . import Base
 
 IGNORED_COGS = ["Profiler"]
 
+WINDOW_SECONDS = 60  # Calls are aggregated into windows of this length
+RESERVOIR_SIZE = 200  # Raw calls kept per method for inspection
+ERROR_SAMPLES = 50  # Most recent failed calls kept per method
+
+# Runtimes are counted in log-scaled buckets, each octave above HISTOGRAM_MIN split into
+# BUCKETS_PER_OCTAVE buckets (~9% wide), so percentiles are accurate to about 4.5%
+HISTOGRAM_MIN = 1e-6
+BUCKETS_PER_OCTAVE = 8
+
+
+def bucket_index(seconds: float) -> int:
+    if seconds <= HISTOGRAM_MIN:
+        return 0
+    return math.ceil(math.log2(seconds / HISTOGRAM_MIN) * BUCKETS_PER_OCTAVE)
+
+
+def bucket_value(index: int) -> float:
+    """Geometric midpoint of a bucket"""
+    if index <= 0:
+        return HISTOGRAM_MIN
+    return HISTOGRAM_MIN * 2 ** ((index - 0.5) / BUCKETS_PER_OCTAVE)
+
 
 @dataclass
 class Method:
@@ -26,6 +51,191 @@ class StatsProfile(Base):
     latency: t.Optional[float] = None  # Websocket latency during the call
 
 
+@dataclass(slots=True)
+class StatsWindow:
+    """Every call of a method that started within one WINDOW_SECONDS window"""
+
+    start: float  # Window start, unix timestamp
+    first: float  # First call in the window, unix timestamp
+    count: int = 0
+    errors: int = 0
+    total_tt: float = 0.0  # Sum of runtimes
+    total_sq: float = 0.0  # Sum of squared runtimes, for the standard deviation
+    min_tt: float = 0.0
+    max_tt: float = 0.0
+    buckets: t.Dict[int, int] = field(default_factory=dict)  # {bucket_index: calls}
+
+    def add(self, total_tt: float, failed: bool) -> None:
+        if not self.count or total_tt < self.min_tt:
+            self.min_tt = total_tt
+        if total_tt > self.max_tt:
+            self.max_tt = total_tt
+        self.count += 1
+        self.total_tt += total_tt
+        self.total_sq += total_tt * total_tt
+        if failed:
+            self.errors += 1
+        idx = bucket_index(total_tt)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+
+
+@dataclass
+class StatsSummary:
+    count: int
+    errors: int
+    min_tt: float
+    max_tt: float
+    avg_tt: float
+    std_dev: float
+    calls_per_minute: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(slots=True)
+class MethodStats:
+    """Streaming runtime stats for one method
+
+    Calls are folded into fixed time windows holding counts, sums and a runtime histogram,
+    so memory per window doesn't grow with call volume. Raw calls are only kept in a
+    bounded reservoir sample (plus the most recent failures) for the inspect pages.
+    Plain dataclasses rather than models since recording happens inline on every call.
+    """
+
+    func_type: str  # Function type (command, slash, method, task)
+    is_coro: bool  # Async if True
+    windows: t.List[StatsWindow] = field(default_factory=list)  # Oldest first
+    samples: t.List[StatsProfile] = field(default_factory=list)  # Uniform sample of the calls in the kept windows
+    errors: t.List[StatsProfile] = field(default_factory=list)  # Most recent failed calls
+    seen: int = 0  # Calls offered to the reservoir
+
+    def record(
+        self,
+        total_tt: float,
+        exception_thrown: t.Optional[str] = None,
+        latency: t.Optional[float] = None,
+        timestamp: t.Optional[float] = None,
+    ) -> None:
+        now = time() if timestamp is None else timestamp
+        start = now - now % WINDOW_SECONDS
+        if not self.windows or self.windows[-1].start != start:
+            self.windows.append(StatsWindow(start=start, first=now))
+        self.windows[-1].add(total_tt, exception_thrown is not None)
+
+        # Only build a profile object when the reservoir takes it
+        self.seen += 1
+        profile = None
+        if len(self.samples) < RESERVOIR_SIZE:
+            profile = self._profile(total_tt, exception_thrown, latency, now)
+            self.samples.append(profile)
+        else:
+            idx = random.randrange(self.seen)
+            if idx < RESERVOIR_SIZE:
+                profile = self._profile(total_tt, exception_thrown, latency, now)
+                self.samples[idx] = profile
+        if exception_thrown is not None:
+            self.errors.append(profile or self._profile(total_tt, exception_thrown, latency, now))
+            if len(self.errors) > ERROR_SAMPLES:
+                del self.errors[0]
+
+    def _profile(
+        self,
+        total_tt: float,
+        exception_thrown: t.Optional[str],
+        latency: t.Optional[float],
+        timestamp: float,
+    ) -> StatsProfile:
+        return StatsProfile(
+            total_tt=total_tt,
+            func_type=self.func_type,
+            is_coro=self.is_coro,
+            exception_thrown=exception_thrown,
+            timestamp=datetime.fromtimestamp(timestamp),
+            latency=latency,
+        )
+
+    @property
+    def count(self) -> int:
+        return sum(window.count for window in self.windows)
+
+    def get_windows(self, since: t.Optional[float] = None) -> t.List[StatsWindow]:
+        if since is None:
+            return list(self.windows)
+        return [window for window in self.windows if window.start + WINDOW_SECONDS > since]
+
+    def prune(self, oldest: float) -> bool:
+        """Drop windows and samples older than the oldest timestamp, returns True if anything was removed"""
+        windows = self.get_windows(oldest)
+        oldest_time = datetime.fromtimestamp(oldest)
+        samples = [i for i in self.samples if i.timestamp >= oldest_time]
+        errors = [i for i in self.errors if i.timestamp >= oldest_time]
+        if len(windows) == len(self.windows) and len(samples) == len(self.samples) and len(errors) == len(self.errors):
+            return False
+        self.windows = windows
+        self.samples = samples
+        self.errors = errors
+        # Keep the reservoir uniform over what's left
+        self.seen = max(len(samples), sum(window.count for window in windows))
+        return True
+
+    def summarize(self, since: t.Optional[float] = None) -> t.Optional[StatsSummary]:
+        windows = self.get_windows(since)
+        count = sum(window.count for window in windows)
+        if not count:
+            return None
+        total = sum(window.total_tt for window in windows)
+        total_sq = sum(window.total_sq for window in windows)
+        avg_tt = total / count
+        variance = (total_sq - total * avg_tt) / (count - 1) if count > 1 else 0.0
+        min_tt = min(window.min_tt for window in windows if window.count)
+        max_tt = max(window.max_tt for window in windows)
+        timeframe_minutes = (time() - windows[0].first) / 60
+        p50, p95, p99 = get_percentiles(windows, (0.5, 0.95, 0.99), min_tt, max_tt)
+        return StatsSummary(
+            count=count,
+            errors=sum(window.errors for window in windows),
+            min_tt=min_tt,
+            max_tt=max_tt,
+            avg_tt=avg_tt,
+            std_dev=math.sqrt(max(0.0, variance)),
+            calls_per_minute=count / timeframe_minutes if timeframe_minutes else 0,
+            p50=p50,
+            p95=p95,
+            p99=p99,
+        )
+
+
+def get_percentiles(
+    windows: t.List[StatsWindow],
+    quantiles: t.Sequence[float],
+    min_tt: float,
+    max_tt: float,
+) -> t.List[float]:
+    """Approximate runtime percentiles from the merged histograms of the windows"""
+    merged: t.Dict[int, int] = {}
+    for window in windows:
+        for idx, count in window.buckets.items():
+            merged[idx] = merged.get(idx, 0) + count
+    total = sum(merged.values())
+    if not total:
+        return [0.0 for _ in quantiles]
+
+    ordered = sorted(merged.items())
+    results = []
+    for quantile in quantiles:
+        rank = quantile * total
+        cumulative = 0
+        value = bucket_value(ordered[-1][0])
+        for idx, count in ordered:
+            cumulative += count
+            if cumulative >= rank:
+                value = bucket_value(idx)
+                break
+        results.append(min(max(value, min_tt), max_tt))
+    return results
+
+
 class DB(Base):
     save_stats: bool = False  # Save stats persistently
     delta: int = 1  # Data retention in hours
@@ -42,8 +252,38 @@ class DB(Base):
     tracked_methods: t.List[str] = []  # List of specific methods to track
     tracked_threshold: float = 0.0  # Minimum execution delta to record a profile of tracked methods
 
-    # {cog_name: {method_key: [StatsProfile]}}
-    stats: t.Dict[str, t.Dict[str, t.List[StatsProfile]]] = {}
+    # Event loop monitor
+    loop_threshold: float = 100.0  # Event loop stalls longer than this (ms) have their stack captured
+
+    # {cog_name: {method_key: MethodStats}}
+    stats: t.Dict[str, t.Dict[str, MethodStats]] = {}
+
+    @field_validator("stats", mode="before")
+    @classmethod
+    def _aggregate_legacy_stats(cls, value: t.Any) -> t.Any:
+        """Older versions saved a list of StatsProfile per method, fold them into windows"""
+        if not isinstance(value, dict):
+            return value
+        converted = {}
+        for cog_name, methods in value.items():
+            converted[cog_name] = {}
+            for method_key, data in methods.items():
+                if not isinstance(data, list):
+                    converted[cog_name][method_key] = data
+                    continue
+                profiles = sorted((StatsProfile.model_validate(i) for i in data), key=lambda i: i.timestamp)
+                if not profiles:
+                    continue
+                method = MethodStats(func_type=profiles[0].func_type, is_coro=profiles[0].is_coro)
+                for profile in profiles:
+                    method.record(
+                        profile.total_tt,
+                        profile.exception_thrown,
+                        profile.latency,
+                        profile.timestamp.timestamp(),
+                    )
+                converted[cog_name][method_key] = method
+        return converted
 
     def get_methods(self) -> t.Set[str]:
         keys = set()
@@ -56,40 +296,42 @@ class DB(Base):
         for methods in self.stats.values():
             methods.pop(method, None)
 
+    def get_method_stats(self, method_key: str) -> t.Optional[MethodStats]:
+        for methods in list(self.stats.values()):
+            if method_stats := methods.get(method_key):
+                return method_stats
+        return None
+
     def cleanup(self) -> int:
-        oldest_time = datetime.now() - timedelta(hours=self.delta)
+        oldest = (datetime.now() - timedelta(hours=self.delta)).timestamp()
         cleaned = 0
         keys = list(self.stats.keys())
         for cog_name in keys:
             methods = self.stats[cog_name].copy()
-            for method_key, profiles in methods.items():
+            for method_key, method_stats in methods.items():
                 invalid = [
-                    profiles[0].func_type in ["command", "hybrid", "slash"] and not self.track_commands,
-                    profiles[0].func_type == "listener" and not self.track_listeners,
-                    profiles[0].func_type == "task" and not self.track_tasks,
-                    profiles[0].func_type == "method" and not self.track_methods,
+                    method_stats.func_type in ["command", "hybrid", "slash"] and not self.track_commands,
+                    method_stats.func_type == "listener" and not self.track_listeners,
+                    method_stats.func_type == "task" and not self.track_tasks,
+                    method_stats.func_type == "method" and not self.track_methods,
+                    cog_name not in self.tracked_cogs and method_key not in self.tracked_methods,
                 ]
                 if any(invalid):
                     self.stats[cog_name].pop(method_key)
                     cleaned += 1
                     continue
 
-                indexes_to_remove = []
-                for idx, profile in enumerate(profiles):
-                    if method_key in self.tracked_methods and (profile.total_tt * 1000) < self.tracked_threshold:
-                        indexes_to_remove.append(idx)
-                    elif cog_name not in self.tracked_cogs and method_key not in self.tracked_methods:
-                        indexes_to_remove.append(idx)
-                    elif profile.timestamp < oldest_time:
-                        indexes_to_remove.append(idx)
-
-                if indexes_to_remove:
-                    self.stats[cog_name][method_key] = [
-                        p for idx, p in enumerate(profiles) if idx not in indexes_to_remove
-                    ]
+                if method_key in self.tracked_methods and self.tracked_threshold:
+                    # Threshold may have been raised since these were recorded
+                    samples = [i for i in method_stats.samples if (i.total_tt * 1000) >= self.tracked_threshold]
+                    if len(samples) != len(method_stats.samples):
+                        method_stats.samples = samples
+                        cleaned += 1
+
+                if method_stats.prune(oldest):
                     cleaned += 1
 
-                if not self.stats[cog_name][method_key]:
+                if not method_stats.windows:
                     self.stats[cog_name].pop(method_key)
                     cleaned += 1
 
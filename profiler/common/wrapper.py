@@ -5,7 +5,7 @@ import typing as t
 from time import perf_counter
 
 from ..abc import MixinMeta
-from .models import StatsProfile
+from .models import MethodStats
 
 log = logging.getLogger("red.vrt.profiler.wrapper")
 
@@ -32,8 +32,8 @@ class Wrapper(MixinMeta):
                     raise exc
                 finally:
                     delta = perf_counter() - start
-                    await asyncio.to_thread(
-                        self.add_stats,
+                    # Recording is a few dict/list updates, cheaper inline than a thread hop
+                    self.add_stats(
                         func,
                         delta,
                         cog_name,
@@ -86,13 +86,19 @@ class Wrapper(MixinMeta):
             return
         try:
             key = f"{func.__module__}.{func.__name__}"
-            stats_profile = StatsProfile(
-                total_tt=profile_or_delta,
-                func_type=func_type,
-                is_coro=asyncio.iscoroutinefunction(func),
-                exception_thrown=exception_thrown,
-                latency=latency,
-            )
-            self.db.stats.setdefault(cog_name, {}).setdefault(key, []).append(stats_profile)
+            if (
+                self.db.tracked_threshold
+                and (profile_or_delta * 1000) < self.db.tracked_threshold
+                and key in self.db.tracked_methods
+            ):
+                return
+            methods = self.db.stats.setdefault(cog_name, {})
+            method_stats = methods.get(key)
+            if method_stats is None:
+                method_stats = methods[key] = MethodStats(
+                    func_type=func_type,
+                    is_coro=asyncio.iscoroutinefunction(func),
+                )
+            method_stats.record(profile_or_delta, exception_thrown, latency)
         except Exception as e:
             log.exception(f"Failed to {func_type} stats for the {cog_name} cog", exc_info=e)
@@ -9,6 +9,7 @@ from redbot.core.bot import Red
 from .abc import CompositeMetaClass
 from .commands.owner import Owner
 from .common.listeners import Listeners
+from .common.loop_monitor import LoopMonitor
 from .common.models import DB, Method
 from .common.profiling import Profiling
 from .common.wrapper import Wrapper
@@ -26,7 +27,7 @@ class Profiler(Owner, Profiling, Wrapper, Listeners, commands.Cog, metaclass=Com
     """
 
     __author__ = "[vertyco](https://github.com/vertyco/vrt-cogs)"
-    __version__ = "1.10.2"
+    __version__ = "1.12.0"
 
     def __init__(self, bot: Red):
         super().__init__()
@@ -51,6 +52,7 @@ class Profiler(Owner, Profiling, Wrapper, Listeners, commands.Cog, metaclass=Com
         # {method_key: Method}
         self.methods: t.Dict[str, Method] = {}
         self.currently_tracked: t.Set[str] = set()
+        self.loop_monitor = LoopMonitor(bot)
         self.map_methods()
 
     def format_help_for_context(self, ctx: commands.Context):
@@ -67,12 +69,15 @@ class Profiler(Owner, Profiling, Wrapper, Listeners, commands.Cog, metaclass=Com
     async def cog_unload(self) -> None:
         self.detach_profilers()
         self.save_loop.cancel()
+        self.loop_monitor.stop()
 
     async def _initialize(self) -> None:
         await self.bot.wait_until_red_ready()
         data = await self.config.db()
         self.db = await asyncio.to_thread(DB.model_validate, data)
         log.info("Config loaded")
+        self.loop_monitor.threshold = self.db.loop_threshold
+        self.loop_monitor.start()
         self.build()
         await asyncio.to_thread(self.db.cleanup)
         await asyncio.sleep(10)
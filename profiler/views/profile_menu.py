@@ -143,11 +143,8 @@ class ProfileMenu(discord.ui.View):
                 await interaction.response.defer()
             return
 
-        for methodlist in self.db.stats.values():
-            method_stats = methodlist.get(self.inspecting)
-            if method_stats:
-                break
-        else:
+        method_stats = self.db.get_method_stats(self.inspecting)
+        if not method_stats:
             return await interaction.response.send_message("No method found with that key", ephemeral=True)
 
         with suppress(discord.NotFound):
@@ -215,10 +212,8 @@ class ProfileMenu(discord.ui.View):
                 except ValueError:
                     return await interaction.followup.send("Invalid threshold, must be a decimal", ephemeral=True)
 
-            for methodlist in self.db.stats.values():
-                if method_stats := methodlist.get(self.inspecting):
-                    break
-            else:
+            method_stats = self.db.get_method_stats(self.inspecting)
+            if not method_stats:
                 return await interaction.followup.send("No method found with that key", ephemeral=True)
 
             await interaction.followup.send(
@@ -247,15 +242,13 @@ class ProfileMenu(discord.ui.View):
         if modal.query is None:
             return
 
-        for methodlist in self.db.stats.values():
-            if method_stats := methodlist.get(modal.query):
-                break
-        else:
+        method_stats = self.db.get_method_stats(modal.query)
+        if not method_stats:
             return await interaction.followup.send("No method found with that key", ephemeral=True)
 
         self.inspecting = modal.query
         self.pages = await asyncio.to_thread(format_method_pages, modal.query, method_stats)
-        if len(method_stats) > 10:
+        if len(method_stats.windows) > 1:
             self.plot = await asyncio.to_thread(generate_line_graph, method_stats)
         await self.update()
 
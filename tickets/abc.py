@@ -1,4 +1,5 @@
 from abc import ABC, ABCMeta, abstractmethod
+from multiprocessing.pool import Pool
 from typing import Dict, List
 
 import discord
@@ -26,6 +27,7 @@ class MixinMeta(ABC):
         self.views: List[discord.ui.View]
         self.view_cache: Dict[int, List[discord.ui.View]]
         self.closing_channels: set[int]
+        self.transcript_pool: Pool | None
 
     @abstractmethod
     async def initialize(self, target_guild: discord.Guild = None) -> None:
@@ -34,3 +36,7 @@ class MixinMeta(ABC):
     @abstractmethod
     async def save(self) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def get_transcript_pool(self) -> Pool:
+        raise NotImplementedError
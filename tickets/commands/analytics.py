@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Iterable
+from typing import Any
 
 import discord
 from redbot.core import commands
@@ -11,6 +11,7 @@ from ..abc import MixinMeta
 from ..common.models import (
     EventType,
     GuildSettings,
+    bucket_start,
     get_server_stats_for_timespan,
     get_staff_stats_for_timespan,
     get_user_stats_for_timespan,
@@ -40,9 +41,11 @@ def format_time(seconds: float | None) -> str:
     return humanize_timedelta(seconds=int(seconds))
 
 
-def _oldest_ts(timestamps: Iterable[datetime]) -> datetime | None:
-    """Return the oldest datetime from an iterable, or None if empty."""
-    return min(timestamps, default=None)
+def _oldest_ts(buckets: dict[int, Any]) -> datetime | None:
+    """Return the start of the oldest hourly bucket, or None if there are none."""
+    if not buckets:
+        return None
+    return bucket_start(min(buckets))
 
 
 def _period_text(timespan, oldest: datetime | None) -> str:
@@ -96,7 +99,7 @@ class AnalyticsCommands(MixinMeta):
             return await ctx.send(_("{} has no recorded staff activity.").format(target.display_name))
 
         stats = conf.staff_stats[target.id]
-        oldest = _oldest_ts(e.timestamp for e in stats.events)
+        oldest = _oldest_ts(stats.buckets)
         timespan_text = _period_text(timespan, oldest)
         filtered = get_staff_stats_for_timespan(stats, timespan)
 
@@ -165,7 +168,7 @@ class AnalyticsCommands(MixinMeta):
             return await ctx.send(_("{} has no recorded ticket activity.").format(user.display_name))
 
         stats = conf.user_stats[user.id]
-        oldest = stats.first_ticket or _oldest_ts(e.timestamp for e in stats.events)
+        oldest = stats.first_ticket or _oldest_ts(stats.buckets)
         timespan_text = _period_text(timespan, oldest)
         filtered = get_user_stats_for_timespan(stats, timespan)
 
@@ -230,7 +233,7 @@ class AnalyticsCommands(MixinMeta):
         conf = self.db.get_conf(ctx.guild)
         limit = min(max(1, limit), 25)
 
-        oldest = _oldest_ts(e.timestamp for e in conf.server_stats.events)
+        oldest = _oldest_ts(conf.server_stats.buckets)
         timespan_text = _period_text(timespan, oldest)
 
         # Gather user stats
@@ -280,7 +283,7 @@ class AnalyticsCommands(MixinMeta):
         conf: GuildSettings = self.db.get_conf(ctx.guild)
         stats = conf.server_stats
 
-        oldest = _oldest_ts(e.timestamp for e in stats.events)
+        oldest = _oldest_ts(stats.buckets)
         timespan_text = _period_text(timespan, oldest)
         filtered = get_server_stats_for_timespan(stats, timespan)
 
@@ -353,7 +356,7 @@ class AnalyticsCommands(MixinMeta):
         conf = self.db.get_conf(ctx.guild)
         stats = conf.server_stats
 
-        oldest = _oldest_ts(e.timestamp for e in stats.events)
+        oldest = _oldest_ts(stats.buckets)
         timespan_text = _period_text(timespan, oldest)
         filtered = get_server_stats_for_timespan(stats, timespan)
 
@@ -426,7 +429,7 @@ class AnalyticsCommands(MixinMeta):
         """
         conf = self.db.get_conf(ctx.guild)
 
-        oldest = _oldest_ts(e.timestamp for e in conf.server_stats.events)
+        oldest = _oldest_ts(conf.server_stats.buckets)
         timespan_text = _period_text(timespan, oldest)
         filtered = get_server_stats_for_timespan(conf.server_stats, timespan)
 
@@ -620,6 +623,7 @@ class AnalyticsCommands(MixinMeta):
         stats.response_count = len(remaining_response_times)
         stats.fastest_response = min(remaining_response_times) if remaining_response_times else None
         stats.slowest_response = max(remaining_response_times) if remaining_response_times else None
+        stats.rebuild_buckets()
 
         await self.save()
         await ctx.send(
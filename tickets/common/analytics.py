@@ -57,7 +57,7 @@ def record_ticket_opened(
     user_stats.last_ticket = now
 
     # Record user event
-    user_stats.events.append(
+    user_stats.add_event(
         UserEvent(
             timestamp=now,
             event_type=EventType.TICKET_OPENED,
@@ -94,7 +94,7 @@ def record_ticket_opened(
     server_stats.monthly_opened[month_key] += 1
 
     # Record server event
-    server_stats.events.append(
+    server_stats.add_event(
         ServerEvent(
             timestamp=now,
             event_type=EventType.TICKET_OPENED,
@@ -176,7 +176,7 @@ def record_ticket_closed(
         user_stats.total_wait_time += wait_time
 
     # Record user event
-    user_stats.events.append(
+    user_stats.add_event(
         UserEvent(
             timestamp=now,
             event_type=EventType.TICKET_CLOSED,
@@ -204,7 +204,7 @@ def record_ticket_closed(
         staff_stats.last_active = now
 
         # Record staff event
-        staff_stats.events.append(
+        staff_stats.add_event(
             StaffEvent(
                 timestamp=now,
                 event_type=EventType.TICKET_CLOSED,
@@ -226,7 +226,7 @@ def record_ticket_closed(
     server_stats.monthly_closed[month_key] += 1
 
     # Record server event
-    server_stats.events.append(
+    server_stats.add_event(
         ServerEvent(
             timestamp=now,
             event_type=EventType.TICKET_CLOSED,
@@ -264,7 +264,7 @@ def record_ticket_claimed(
     if staff_stats.last_active is None or now > staff_stats.last_active:
         staff_stats.last_active = now
 
-    staff_stats.events.append(
+    staff_stats.add_event(
         StaffEvent(
             timestamp=now,
             event_type=EventType.TICKET_CLAIMED,
@@ -314,7 +314,7 @@ def record_staff_first_response(
         staff_stats.slowest_response = response_time
 
     # Record event
-    staff_stats.events.append(
+    staff_stats.add_event(
         StaffEvent(
             timestamp=now,
             event_type=EventType.FIRST_RESPONSE,
@@ -355,7 +355,7 @@ def record_staff_message(
     staff_stats.last_active = now
 
     # Record event
-    staff_stats.events.append(
+    staff_stats.add_event(
         StaffEvent(
             timestamp=now,
             event_type=EventType.MESSAGE_SENT,
@@ -381,3 +381,5 @@ def record_user_message(
 
     user_stats = conf.get_user_stats(user_id)
     user_stats.messages_sent += 1
+    # Owner messages aren't kept as events, only counted towards their hour
+    user_stats.get_bucket(datetime.now().astimezone()).messages += 1
@@ -100,6 +100,98 @@ class ServerEvent(Base):
     resolution_time: float | None = None
 
 
+# =============================================================================
+# Hourly Buckets (pre-aggregated events for timespan queries)
+# =============================================================================
+
+
+def bucket_key(timestamp: datetime) -> int:
+    """Unix timestamp of the start of the local hour an event falls in"""
+    return int(timestamp.astimezone().replace(minute=0, second=0, microsecond=0).timestamp())
+
+
+def bucket_start(key: int) -> datetime:
+    """Local datetime a bucket key starts at"""
+    return datetime.fromtimestamp(key).astimezone()
+
+
+class StaffBucket(Base):
+    """One hour of a staff member's events"""
+
+    claimed: int = 0
+    messages: int = 0
+    response_count: int = 0
+    total_response_time: float = 0
+    fastest_response: float | None = None
+    slowest_response: float | None = None
+    resolution_count: int = 0
+    total_resolution_time: float = 0
+
+    def add(self, event: StaffEvent) -> None:
+        if event.event_type == EventType.TICKET_CLAIMED:
+            self.claimed += 1
+        elif event.event_type == EventType.MESSAGE_SENT:
+            self.messages += 1
+        elif event.event_type == EventType.FIRST_RESPONSE and event.response_time is not None:
+            self.response_count += 1
+            self.total_response_time += event.response_time
+            if self.fastest_response is None or event.response_time < self.fastest_response:
+                self.fastest_response = event.response_time
+            if self.slowest_response is None or event.response_time > self.slowest_response:
+                self.slowest_response = event.response_time
+        elif event.event_type == EventType.TICKET_CLOSED and event.resolution_time is not None:
+            self.resolution_count += 1
+            self.total_resolution_time += event.resolution_time
+
+
+class UserBucket(Base):
+    """One hour of a ticket-opening user's events"""
+
+    opened: int = 0
+    closed: int = 0
+    messages: int = 0
+    resolution_count: int = 0
+    total_resolution_time: float = 0
+    wait_count: int = 0
+    total_wait_time: float = 0
+    panel_usage: dict[str, int] = {}  # {panel_name: opened count}
+
+    def add(self, event: UserEvent) -> None:
+        if event.event_type == EventType.TICKET_OPENED:
+            self.opened += 1
+            self.panel_usage[event.panel_name] = self.panel_usage.get(event.panel_name, 0) + 1
+        elif event.event_type == EventType.TICKET_CLOSED:
+            self.closed += 1
+            if event.resolution_time is not None:
+                self.resolution_count += 1
+                self.total_resolution_time += event.resolution_time
+            if event.wait_time is not None:
+                self.wait_count += 1
+                self.total_wait_time += event.wait_time
+        elif event.event_type == EventType.MESSAGE_SENT:
+            self.messages += 1
+
+
+class ServerBucket(Base):
+    """One hour of server-wide events, the hour and weekday come from the bucket key"""
+
+    opened: int = 0
+    closed: int = 0
+    resolution_count: int = 0
+    total_resolution_time: float = 0
+    panel_usage: dict[str, int] = {}  # {panel_name: opened count}
+
+    def add(self, event: ServerEvent) -> None:
+        if event.event_type == EventType.TICKET_OPENED:
+            self.opened += 1
+            self.panel_usage[event.panel_name] = self.panel_usage.get(event.panel_name, 0) + 1
+        elif event.event_type == EventType.TICKET_CLOSED:
+            self.closed += 1
+            if event.resolution_time is not None:
+                self.resolution_count += 1
+                self.total_resolution_time += event.resolution_time
+
+
 # =============================================================================
 # Modal & Message Models
 # =============================================================================
@@ -251,6 +343,25 @@ class StaffStats(Base):
 
     # Event history for timespan queries
     events: list[StaffEvent] = []
+    buckets: dict[int, StaffBucket] = {}  # {bucket_key: StaffBucket}
+
+    def get_bucket(self, timestamp: datetime) -> StaffBucket:
+        """Get or create the hourly bucket a timestamp falls in"""
+        key = bucket_key(timestamp)
+        if key not in self.buckets:
+            self.buckets[key] = StaffBucket()
+        return self.buckets[key]
+
+    def add_event(self, event: StaffEvent) -> None:
+        """Record an event and fold it into its hourly bucket"""
+        self.events.append(event)
+        self.get_bucket(event.timestamp).add(event)
+
+    def rebuild_buckets(self) -> None:
+        """Recompute the hourly buckets from the retained events"""
+        self.buckets = {}
+        for event in self.events:
+            self.get_bucket(event.timestamp).add(event)
 
     @property
     def avg_response_time(self) -> float | None:
@@ -300,6 +411,29 @@ class UserStats(Base):
 
     # Event history for timespan queries
     events: list[UserEvent] = []
+    buckets: dict[int, UserBucket] = {}  # {bucket_key: UserBucket}
+
+    def get_bucket(self, timestamp: datetime) -> UserBucket:
+        """Get or create the hourly bucket a timestamp falls in"""
+        key = bucket_key(timestamp)
+        if key not in self.buckets:
+            self.buckets[key] = UserBucket()
+        return self.buckets[key]
+
+    def add_event(self, event: UserEvent) -> None:
+        """Record an event and fold it into its hourly bucket"""
+        self.events.append(event)
+        self.get_bucket(event.timestamp).add(event)
+
+    def rebuild_buckets(self) -> None:
+        """Recompute the hourly buckets from the retained events"""
+        # Owner messages are only counted in the buckets, not kept as events
+        messages = {key: bucket.messages for key, bucket in self.buckets.items() if bucket.messages}
+        self.buckets = {}
+        for event in self.events:
+            self.get_bucket(event.timestamp).add(event)
+        for key, count in messages.items():
+            self.buckets.setdefault(key, UserBucket()).messages = count
 
     @property
     def avg_resolution_time(self) -> float | None:
@@ -344,6 +478,25 @@ class ServerStats(Base):
 
     # Event history for timespan queries
     events: list[ServerEvent] = []
+    buckets: dict[int, ServerBucket] = {}  # {bucket_key: ServerBucket}
+
+    def get_bucket(self, timestamp: datetime) -> ServerBucket:
+        """Get or create the hourly bucket a timestamp falls in"""
+        key = bucket_key(timestamp)
+        if key not in self.buckets:
+            self.buckets[key] = ServerBucket()
+        return self.buckets[key]
+
+    def add_event(self, event: ServerEvent) -> None:
+        """Record an event and fold it into its hourly bucket"""
+        self.events.append(event)
+        self.get_bucket(event.timestamp).add(event)
+
+    def rebuild_buckets(self) -> None:
+        """Recompute the hourly buckets from the retained events"""
+        self.buckets = {}
+        for event in self.events:
+            self.get_bucket(event.timestamp).add(event)
 
     @property
     def avg_resolution_time(self) -> float | None:
@@ -500,7 +653,7 @@ class DB(Base):
 
 def prune_old_events(conf: GuildSettings) -> int:
     """
-    Remove events older than retention period.
+    Remove events and hourly buckets older than retention period.
 
     Args:
         conf: The guild settings to prune
@@ -512,24 +665,36 @@ def prune_old_events(conf: GuildSettings) -> int:
         return 0  # Unlimited retention
 
     cutoff = datetime.now().astimezone() - timedelta(days=conf.data_retention_days)
+    cutoff_key = bucket_key(cutoff)
     removed = 0
 
-    for staff_stats in conf.staff_stats.values():
-        original_len = len(staff_stats.events)
-        staff_stats.events = [e for e in staff_stats.events if e.timestamp >= cutoff]
-        removed += original_len - len(staff_stats.events)
+    all_stats: list[StaffStats | UserStats | ServerStats] = [
+        *conf.staff_stats.values(),
+        *conf.user_stats.values(),
+        conf.server_stats,
+    ]
+    for stats in all_stats:
+        original_len = len(stats.events)
+        stats.events = [e for e in stats.events if e.timestamp >= cutoff]
+        removed += original_len - len(stats.events)
+        stats.buckets = {k: v for k, v in stats.buckets.items() if k >= cutoff_key}
+
+    return removed
+
 
+def backfill_buckets(conf: GuildSettings) -> None:
+    """Build the hourly buckets for a guild from its retained events"""
+    for staff_stats in conf.staff_stats.values():
+        staff_stats.rebuild_buckets()
     for user_stats in conf.user_stats.values():
-        original_len = len(user_stats.events)
-        user_stats.events = [e for e in user_stats.events if e.timestamp >= cutoff]
-        removed += original_len - len(user_stats.events)
+        user_stats.rebuild_buckets()
+    conf.server_stats.rebuild_buckets()
 
-    # Prune server events
-    original_len = len(conf.server_stats.events)
-    conf.server_stats.events = [e for e in conf.server_stats.events if e.timestamp >= cutoff]
-    removed += original_len - len(conf.server_stats.events)
 
-    return removed
+def _buckets_since(buckets: dict[int, t.Any], timespan: timedelta) -> list[t.Any]:
+    """Buckets from the hour the timespan starts in onwards"""
+    cutoff_key = bucket_key(datetime.now().astimezone() - timespan)
+    return [bucket for key, bucket in buckets.items() if key >= cutoff_key]
 
 
 def get_staff_stats_for_timespan(
@@ -539,6 +704,9 @@ def get_staff_stats_for_timespan(
     """
     Get staff stats filtered to a timespan.
 
+    Timespans are answered from the hourly buckets, so the window starts at
+    the beginning of the hour the cutoff falls in.
+
     Args:
         stats: The staff stats to filter
         timespan: Time window to filter to, or None for all-time
@@ -559,29 +727,24 @@ def get_staff_stats_for_timespan(
             "resolution_count": stats.resolution_count,
         }
 
-    # Filter events to timespan
-    cutoff = datetime.now().astimezone() - timespan
-    relevant_events = [e for e in stats.events if e.timestamp >= cutoff]
-
-    # Calculate stats from filtered events
-    claimed = sum(1 for e in relevant_events if e.event_type == EventType.TICKET_CLAIMED)
-    messages = sum(1 for e in relevant_events if e.event_type == EventType.MESSAGE_SENT)
+    buckets: list[StaffBucket] = _buckets_since(stats.buckets, timespan)
 
-    response_events = [e for e in relevant_events if e.event_type == EventType.FIRST_RESPONSE]
-    response_times = [e.response_time for e in response_events if e.response_time is not None]
-
-    close_events = [e for e in relevant_events if e.event_type == EventType.TICKET_CLOSED]
-    resolution_times = [e.resolution_time for e in close_events if e.resolution_time is not None]
+    response_count = sum(b.response_count for b in buckets)
+    resolution_count = sum(b.resolution_count for b in buckets)
+    fastest = [b.fastest_response for b in buckets if b.fastest_response is not None]
+    slowest = [b.slowest_response for b in buckets if b.slowest_response is not None]
 
     return {
-        "tickets_claimed": claimed,
-        "messages_sent": messages,
-        "avg_response_time": sum(response_times) / len(response_times) if response_times else None,
-        "avg_resolution_time": sum(resolution_times) / len(resolution_times) if resolution_times else None,
-        "fastest_response": min(response_times) if response_times else None,
-        "slowest_response": max(response_times) if response_times else None,
-        "response_count": len(response_times),
-        "resolution_count": len(resolution_times),
+        "tickets_claimed": sum(b.claimed for b in buckets),
+        "messages_sent": sum(b.messages for b in buckets),
+        "avg_response_time": (sum(b.total_response_time for b in buckets) / response_count if response_count else None),
+        "avg_resolution_time": (
+            sum(b.total_resolution_time for b in buckets) / resolution_count if resolution_count else None
+        ),
+        "fastest_response": min(fastest) if fastest else None,
+        "slowest_response": max(slowest) if slowest else None,
+        "response_count": response_count,
+        "resolution_count": resolution_count,
     }
 
 
@@ -592,6 +755,9 @@ def get_user_stats_for_timespan(
     """
     Get user stats filtered to a timespan.
 
+    Timespans are answered from the hourly buckets, so the window starts at
+    the beginning of the hour the cutoff falls in.
+
     Args:
         stats: The user stats to filter
         timespan: Time window to filter to, or None for all-time
@@ -610,31 +776,24 @@ def get_user_stats_for_timespan(
             "panel_usage": stats.panel_usage.copy(),
         }
 
-    # Filter events to timespan
-    cutoff = datetime.now().astimezone() - timespan
-    relevant_events = [e for e in stats.events if e.timestamp >= cutoff]
-
-    # Calculate stats from filtered events
-    opened = sum(1 for e in relevant_events if e.event_type == EventType.TICKET_OPENED)
-    closed = sum(1 for e in relevant_events if e.event_type == EventType.TICKET_CLOSED)
-    messages = sum(1 for e in relevant_events if e.event_type == EventType.MESSAGE_SENT)
+    buckets: list[UserBucket] = _buckets_since(stats.buckets, timespan)
 
-    close_events = [e for e in relevant_events if e.event_type == EventType.TICKET_CLOSED]
-    resolution_times = [e.resolution_time for e in close_events if e.resolution_time is not None]
-    wait_times = [e.wait_time for e in close_events if e.wait_time is not None]
+    resolution_count = sum(b.resolution_count for b in buckets)
+    wait_count = sum(b.wait_count for b in buckets)
 
-    # Panel usage for timespan
     panel_usage: dict[str, int] = {}
-    for e in relevant_events:
-        if e.event_type == EventType.TICKET_OPENED:
-            panel_usage[e.panel_name] = panel_usage.get(e.panel_name, 0) + 1
+    for b in buckets:
+        for panel_name, count in b.panel_usage.items():
+            panel_usage[panel_name] = panel_usage.get(panel_name, 0) + count
 
     return {
-        "tickets_opened": opened,
-        "tickets_closed": closed,
-        "messages_sent": messages,
-        "avg_resolution_time": sum(resolution_times) / len(resolution_times) if resolution_times else None,
-        "avg_wait_time": sum(wait_times) / len(wait_times) if wait_times else None,
+        "tickets_opened": sum(b.opened for b in buckets),
+        "tickets_closed": sum(b.closed for b in buckets),
+        "messages_sent": sum(b.messages for b in buckets),
+        "avg_resolution_time": (
+            sum(b.total_resolution_time for b in buckets) / resolution_count if resolution_count else None
+        ),
+        "avg_wait_time": sum(b.total_wait_time for b in buckets) / wait_count if wait_count else None,
         "panel_usage": panel_usage,
     }
 
@@ -646,6 +805,9 @@ def get_server_stats_for_timespan(
     """
     Get server stats filtered to a timespan.
 
+    Timespans are answered from the hourly buckets, so the window starts at
+    the beginning of the hour the cutoff falls in.
+
     Args:
         stats: The server stats to filter
         timespan: Time window to filter to, or None for all-time
@@ -666,32 +828,32 @@ def get_server_stats_for_timespan(
             "busiest_day": stats.busiest_day,
         }
 
-    # Filter events to timespan
-    cutoff = datetime.now().astimezone() - timespan
-    relevant_events = [e for e in stats.events if e.timestamp >= cutoff]
-
-    # Calculate stats from filtered events
-    opened = sum(1 for e in relevant_events if e.event_type == EventType.TICKET_OPENED)
-    closed = sum(1 for e in relevant_events if e.event_type == EventType.TICKET_CLOSED)
+    cutoff_key = bucket_key(datetime.now().astimezone() - timespan)
 
-    close_events = [e for e in relevant_events if e.event_type == EventType.TICKET_CLOSED]
-    resolution_times = [e.resolution_time for e in close_events if e.resolution_time is not None]
-
-    # Build distributions for timespan
+    opened = closed = resolution_count = 0
+    total_resolution_time = 0.0
     hourly: dict[int, int] = {}
     daily: dict[int, int] = {}
     panel_usage: dict[str, int] = {}
 
-    for e in relevant_events:
-        if e.event_type == EventType.TICKET_OPENED:
-            hourly[e.hour] = hourly.get(e.hour, 0) + 1
-            daily[e.weekday] = daily.get(e.weekday, 0) + 1
-            panel_usage[e.panel_name] = panel_usage.get(e.panel_name, 0) + 1
+    for key, b in stats.buckets.items():
+        if key < cutoff_key:
+            continue
+        opened += b.opened
+        closed += b.closed
+        resolution_count += b.resolution_count
+        total_resolution_time += b.total_resolution_time
+        if b.opened:
+            start = bucket_start(key)
+            hourly[start.hour] = hourly.get(start.hour, 0) + b.opened
+            daily[start.weekday()] = daily.get(start.weekday(), 0) + b.opened
+        for panel_name, count in b.panel_usage.items():
+            panel_usage[panel_name] = panel_usage.get(panel_name, 0) + count
 
     return {
         "total_tickets_opened": opened,
         "total_tickets_closed": closed,
-        "avg_resolution_time": sum(resolution_times) / len(resolution_times) if resolution_times else None,
+        "avg_resolution_time": total_resolution_time / resolution_count if resolution_count else None,
         "hourly_distribution": hourly,
         "daily_distribution": daily,
         "panel_usage": panel_usage,
@@ -840,7 +1002,17 @@ async def run_migrations(data: dict[str, t.Any], config: Config) -> tuple[DB, bo
         await config.db.set(data)
 
     # Pydantic handles all default values automatically
-    return DB.load(data), migrated
+    db = DB.load(data)
+
+    # Build hourly analytics buckets from the events recorded before they existed
+    if "3.6.0" not in db.migrations:
+        log.info("Building hourly analytics buckets from existing events")
+        for guild_conf in db.configs.values():
+            backfill_buckets(guild_conf)
+        db.migrations.append("3.6.0")
+        migrated = True
+
+    return db, migrated
 
 
 async def migrate_from_old_config(config: Config) -> tuple[DB, bool]:
@@ -6,14 +6,20 @@ Handles:
 - Compressing images to WebP format for smaller file sizes
 - Embedding attachments as base64 data URIs in the HTML
 - Managing file size budgets to stay within Discord's upload limits
+
+Attachments are spooled to disk by the caller and referenced by path, so only the
+files actually embedded are ever read back into memory.
 """
 
 import asyncio
 import base64
 import logging
+import math
 import mimetypes
+import os
 import re
 from io import BytesIO
+from multiprocessing.pool import Pool
 from pathlib import Path
 from typing import Optional
 
@@ -58,6 +64,13 @@ DISCORD_CDN_CSS_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Any Discord CDN attachment URL, used for the single substitution pass over the HTML.
+# Stops at characters that end an attribute value so the embedded URL is a prefix of the match.
+DISCORD_CDN_URL_PATTERN = re.compile(
+    r"https?://(?:cdn\.discordapp\.com|media\.discordapp\.net)/attachments/(\d+)/(\d+)/[^\s\"'<>]*",
+    re.IGNORECASE,
+)
+
 # Image extensions that can be compressed to WebP
 COMPRESSIBLE_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff"}
 
@@ -77,6 +90,15 @@ DEFAULT_WEBP_QUALITY = 85
 # Images larger than this will go to the zip file
 MAX_INDIVIDUAL_IMAGE_SIZE = 2 * 1024 * 1024  # 2MB
 
+# Worker processes used to compress transcript images
+TRANSCRIPT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# How long to wait on the worker pool before embedding the images uncompressed,
+# scales with how many images each worker has to get through
+COMPRESSION_TIMEOUT_BASE = 10
+COMPRESSION_TIMEOUT_PER_IMAGE = 3
+COMPRESSION_TIMEOUT_MAX = 120
+
 
 def strip_exporter_comment(html: str) -> str:
     """Remove the DiscordChatExporterPy attribution comment from the HTML.
@@ -123,6 +145,16 @@ def can_compress_to_webp(filename: str) -> bool:
     return Path(filename).suffix.lower() in COMPRESSIBLE_IMAGE_EXTENSIONS
 
 
+def _prepare_for_webp(img: Image.Image) -> Image.Image:
+    """Convert an image to a mode WebP can encode, keeping transparency"""
+    if img.mode in ("RGBA", "LA", "P"):
+        if img.mode == "P" and "transparency" in img.info:
+            img = img.convert("RGBA")
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
 def compress_image_to_webp(
     image_data: bytes,
     quality: int = DEFAULT_WEBP_QUALITY,
@@ -140,15 +172,7 @@ def compress_image_to_webp(
         If compression fails, returns original data with False
     """
     try:
-        img = Image.open(BytesIO(image_data))
-
-        # Handle different image modes
-        if img.mode in ("RGBA", "LA", "P"):
-            # Keep transparency
-            if img.mode == "P" and "transparency" in img.info:
-                img = img.convert("RGBA")
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
+        img = _prepare_for_webp(Image.open(BytesIO(image_data)))
 
         # Compress to WebP
         output = BytesIO()
@@ -175,6 +199,29 @@ def compress_image_to_webp(
         return image_data, False
 
 
+def compress_file_to_webp(source: str, dest: str, quality: int = DEFAULT_WEBP_QUALITY) -> int:
+    """Compress an image file to a WebP file, runs in the transcript worker pool.
+
+    Args:
+        source: Path of the image to compress
+        dest: Path to write the WebP file to
+        quality: WebP quality (0-100)
+
+    Returns:
+        Size of the WebP file, or 0 if compression failed or didn't make it smaller
+    """
+    try:
+        with Image.open(source) as img:
+            _prepare_for_webp(img).save(dest, format="WEBP", quality=quality, method=6)
+        size = os.path.getsize(dest)
+    except Exception:
+        return 0
+    if size < os.path.getsize(source):
+        return size
+    os.remove(dest)
+    return 0
+
+
 def create_data_uri(data: bytes, mime_type: str) -> str:
     """Create a base64 data URI from binary data.
 
@@ -203,10 +250,87 @@ def calculate_base64_size(data_size: int) -> int:
     return int(data_size * 4 / 3) + 4  # +4 for padding
 
 
+async def compress_images(
+    files: list[dict],
+    pool: Optional[Pool] = None,
+) -> dict[int, tuple[Path, int]]:
+    """Compress spooled images to WebP files next to them.
+
+    Runs in the worker pool when one is given, otherwise one at a time in a thread.
+
+    Args:
+        files: Spooled file dicts with 'filename' and 'path'
+        pool: Process pool to compress in
+
+    Returns:
+        Mapping of id(file dict) -> (WebP path, WebP size) for the images that got smaller
+    """
+    jobs = [(str(f["path"]), f"{f['path']}.webp") for f in files]
+    if not jobs:
+        return {}
+
+    sizes: list[int] = [0] * len(jobs)
+    if pool is not None:
+        result = pool.starmap_async(compress_file_to_webp, jobs)
+        timeout = min(
+            COMPRESSION_TIMEOUT_MAX,
+            COMPRESSION_TIMEOUT_BASE + COMPRESSION_TIMEOUT_PER_IMAGE * math.ceil(len(jobs) / TRANSCRIPT_WORKERS),
+        )
+        try:
+            sizes = await asyncio.to_thread(result.get, timeout)
+        except Exception as e:
+            log.warning(f"Compressing transcript images failed, embedding them as-is: {e}")
+    else:
+        sizes = await asyncio.to_thread(lambda: [compress_file_to_webp(*job) for job in jobs])
+
+    compressed: dict[int, tuple[Path, int]] = {}
+    for f, (_source, dest), size in zip(files, jobs, sizes):
+        if size:
+            compressed[id(f)] = (Path(dest), size)
+            log.debug(f"Compressed {f['filename']}: {f['size']} -> {size} bytes")
+    return compressed
+
+
+def embed_urls(html: str, embeds: dict[str, tuple[Path, str]]) -> str:
+    """Replace attachment URLs with data URIs in a single pass over the HTML.
+
+    Args:
+        html: The transcript HTML
+        embeds: Mapping of URL (as it appears in the HTML) -> (file to embed, MIME type)
+
+    Returns:
+        HTML with every occurrence of those URLs swapped for their data URI
+    """
+    if not embeds:
+        return html
+
+    # Group by channel/attachment ID so each CDN match only checks its own candidates
+    candidates: dict[tuple[str, str], list[str]] = {}
+    for url in sorted(embeds, key=len, reverse=True):
+        match = DISCORD_CDN_URL_PATTERN.match(url)
+        if match:
+            candidates.setdefault((match.group(1), match.group(2)), []).append(url)
+
+    data_uris: dict[str, str] = {}
+
+    def swap(match: re.Match) -> str:
+        text = match.group(0)
+        for url in candidates.get((match.group(1), match.group(2)), []):
+            if text.startswith(url):
+                if url not in data_uris:
+                    path, mime_type = embeds[url]
+                    data_uris[url] = create_data_uri(path.read_bytes(), mime_type)
+                return data_uris[url] + text[len(url) :]
+        return text
+
+    return DISCORD_CDN_URL_PATTERN.sub(swap, html)
+
+
 async def process_transcript_html(
     html: str,
     downloaded_files: list[dict],
     guild_filesize_limit: int,
+    pool: Optional[Pool] = None,
 ) -> tuple[str, list[dict], list[str]]:
     """Process an exported HTML transcript for self-contained viewing.
 
@@ -218,8 +342,9 @@ async def process_transcript_html(
 
     Args:
         html: Raw HTML from chat_exporter
-        downloaded_files: List of dicts with 'filename', 'content' (bytes), and optionally 'url'
+        downloaded_files: List of dicts with 'filename', 'path' (spooled file), 'size', and optionally 'url'
         guild_filesize_limit: Discord's file size limit for this guild
+        pool: Process pool to compress images in, compresses in a thread if not given
 
     Returns:
         Tuple of:
@@ -273,134 +398,84 @@ async def process_transcript_html(
     # Match quoted src/href attributes (src="url" or src='url')
     for match in DISCORD_CDN_ATTR_QUOTED_PATTERN.finditer(html):
         full_url = match.group(2)  # Full URL including query params
-        path = extract_attachment_path(full_url)
-        urls_in_html[full_url] = path
-        log.debug(f"Found quoted URL in HTML: {full_url[:80]}...")
+        urls_in_html[full_url] = extract_attachment_path(full_url)
 
     # Match unquoted src/href attributes (src=url) - this is what chat_exporter produces
     for match in DISCORD_CDN_ATTR_UNQUOTED_PATTERN.finditer(html):
         full_url = match.group(2)
-        path = extract_attachment_path(full_url)
-        urls_in_html[full_url] = path
-        log.debug(f"Found unquoted URL in HTML: {full_url[:80]}...")
+        urls_in_html[full_url] = extract_attachment_path(full_url)
 
     # Match CSS url() patterns
     for match in DISCORD_CDN_CSS_PATTERN.finditer(html):
         full_url = match.group(1)
-        path = extract_attachment_path(full_url)
-        urls_in_html[full_url] = path
-        log.debug(f"Found URL in CSS: {full_url[:80]}...")
+        urls_in_html[full_url] = extract_attachment_path(full_url)
 
-    # Step 5: Match HTML URLs to downloaded files by path
+    # Step 5: Match HTML URLs to downloaded files by path, one URL per file
     matched_urls: dict[str, dict] = {}  # Maps full HTML URL -> file data
+    processed_file_ids: set[int] = set()  # Track by id() to avoid duplicates
     for full_url, path in urls_in_html.items():
-        if path in path_to_file:
-            matched_urls[full_url] = path_to_file[path]
-            log.debug(f"Matched URL to file: {path_to_file[path]['filename']}")
+        file_data = path_to_file.get(path)
+        if file_data is None or id(file_data) in processed_file_ids:
+            continue
+        processed_file_ids.add(id(file_data))
+        matched_urls[full_url] = file_data
 
     log.debug(f"Matched {len(matched_urls)}/{len(urls_in_html)} URLs to downloaded files")
 
-    # Step 6: Process files - compress images and decide what to embed
-    files_to_embed: list[tuple[str, bytes, str]] = []  # (url_in_html, data, mime_type)
+    # Step 6: Compress every image that could be embedded, in parallel
+    compressed = await compress_images(
+        [f for f in matched_urls.values() if f["size"] and can_compress_to_webp(f["filename"])],
+        pool,
+    )
+
+    # Step 7: Decide what to embed, smallest first to maximize number of embedded files
+    embeds: dict[str, tuple[Path, str]] = {}  # url_in_html -> (file to embed, mime_type)
     files_for_zip: list[dict] = []
     embedded_filenames: list[str] = []
-    processed_file_ids: set[int] = set()  # Track by id() to avoid duplicates
-
-    # Sort by size (smallest first) to maximize number of embedded files
-    sorted_urls = sorted(matched_urls.keys(), key=lambda u: len(matched_urls[u].get("content", b"")))
-
     current_budget = available_budget
 
-    def process_file(html_url: str, file_data: dict) -> None:
-        nonlocal current_budget
-
-        # Avoid processing the same file multiple times
-        file_id = id(file_data)
-        if file_id in processed_file_ids:
-            return
-        processed_file_ids.add(file_id)
-
+    for html_url, file_data in sorted(matched_urls.items(), key=lambda i: i[1]["size"]):
         filename = file_data["filename"]
-        content = file_data.get("content", b"")
 
-        if not content:
-            return
+        if not file_data["size"]:
+            continue
 
-        # Videos always go to zip
-        if is_video(filename):
+        # Videos, audio and anything that isn't an image go to the zip
+        if not is_image(filename):
             files_for_zip.append(file_data)
-            return
+            continue
 
-        # Audio files go to zip (usually large)
-        if is_audio(filename):
+        if id(file_data) in compressed:
+            embed_path, embed_size = compressed[id(file_data)]
+            mime_type = "image/webp"
+        else:
+            # Compression didn't help, or GIF and other non-compressible formats, use as-is
+            embed_path, embed_size = file_data["path"], file_data["size"]
+            mime_type = get_mime_type(filename)
+
+        # Check against max individual size using PROCESSED size (after compression)
+        if embed_size > MAX_INDIVIDUAL_IMAGE_SIZE:
+            log.debug(f"File {filename} too large for embedding ({embed_size} bytes after processing)")
             files_for_zip.append(file_data)
-            return
-
-        # Check if it's an image we can process
-        if is_image(filename):
-            # Try to compress if it's a compressible format
-            processed_data = content
-            mime_type = "image/webp"  # Default to webp if we compress
-
-            if can_compress_to_webp(filename):
-                compressed, was_compressed = compress_image_to_webp(content)
-                if was_compressed:
-                    processed_data = compressed
-                    log.debug(f"Compressed {filename}: {len(content)} -> {len(processed_data)} bytes")
-                else:
-                    # Compression didn't help, use original
-                    processed_data = content
-                    mime_type = get_mime_type(filename)
-            else:
-                # GIF or other non-compressible, use as-is
-                processed_data = content
-                mime_type = get_mime_type(filename)
-
-            # Check if this file fits in our budget
-            embedded_size = calculate_base64_size(len(processed_data))
-
-            # Check against max individual size using PROCESSED size (after compression)
-            if len(processed_data) > MAX_INDIVIDUAL_IMAGE_SIZE:
-                # Individual file too large even after compression, skip embedding
-                log.debug(f"File {filename} too large for embedding ({len(processed_data)} bytes after processing)")
-                files_for_zip.append(file_data)
-                return
-
-            if embedded_size <= current_budget:
-                files_to_embed.append((html_url, processed_data, mime_type))
-                current_budget -= embedded_size
-                embedded_filenames.append(filename)
-                log.debug(f"Will embed {filename} ({embedded_size} bytes, budget remaining: {current_budget})")
-            else:
-                # Doesn't fit, add to zip
-                log.debug(f"No budget for {filename} ({embedded_size} bytes needed, {current_budget} available)")
-                files_for_zip.append(file_data)
+            continue
+
+        # Check if this file fits in our budget
+        embedded_size = calculate_base64_size(embed_size)
+        if embedded_size <= current_budget:
+            embeds[html_url] = (embed_path, mime_type)
+            current_budget -= embedded_size
+            embedded_filenames.append(filename)
+            log.debug(f"Will embed {filename} ({embedded_size} bytes, budget remaining: {current_budget})")
         else:
-            # Non-image, non-video, non-audio file - add to zip
+            log.debug(f"No budget for {filename} ({embedded_size} bytes needed, {current_budget} available)")
             files_for_zip.append(file_data)
 
-    # Process in a thread to avoid blocking
-    def process_all_files():
-        for html_url in sorted_urls:
-            process_file(html_url, matched_urls[html_url])
-
-    await asyncio.to_thread(process_all_files)
-
-    # Step 7: Replace URLs in HTML with data URIs
-    def replace_urls(html_content: str) -> str:
-        result = html_content
-        for html_url, data, mime_type in files_to_embed:
-            data_uri = create_data_uri(data, mime_type)
-            # Replace all occurrences of this URL
-            result = result.replace(html_url, data_uri)
-        return result
-
-    processed_html = await asyncio.to_thread(replace_urls, html)
+    # Step 8: Replace URLs in HTML with data URIs
+    processed_html = await asyncio.to_thread(embed_urls, html, embeds)
 
     # Also add any downloaded files that weren't matched to URLs to the zip
-    matched_file_ids = processed_file_ids
     for f in downloaded_files:
-        if id(f) not in matched_file_ids:
+        if id(f) not in processed_file_ids:
             files_for_zip.append(f)
             log.debug(f"Unmatched file going to zip: {f['filename']}")
 
@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import re
+import tempfile
 import typing as t
 import zipfile
 from collections import defaultdict
 from contextlib import suppress
 from datetime import datetime, time
-from io import BytesIO, StringIO
+from io import StringIO
 from pathlib import Path
 
 import chat_exporter
@@ -554,6 +555,10 @@ async def close_ticket(
     is_thread = isinstance(channel, discord.Thread)
     exporter_success = False
 
+    # Attachments and the zip are spooled to disk instead of held in memory
+    spool = tempfile.TemporaryDirectory(prefix="tickets-transcript-", ignore_cleanup_errors=True)
+    spool_dir = Path(spool.name)
+
     if conf.transcript:
         temp_message = await channel.send(embed=em)
 
@@ -613,7 +618,9 @@ async def close_ticket(
                         p = Path(i.filename)
                         i.filename = f"{p.stem}_{filenames[i.filename]}{p.suffix}"
 
-                    files.append({"filename": i.filename, "content": await i.read(), "url": i.url})
+                    path = spool_dir / f"{len(files)}{Path(i.filename).suffix}"
+                    await i.save(path)
+                    files.append({"filename": i.filename, "path": path, "size": path.stat().st_size, "url": i.url})
 
             if msg.content:
                 line = f"{msg.created_at.strftime('%m-%d-%Y %I:%M:%S %p')} - {msg.author.name}: {msg.content}\n"
@@ -648,6 +655,7 @@ async def close_ticket(
                 html=buffer.getvalue(),
                 downloaded_files=files,
                 guild_filesize_limit=transcript_budget,
+                pool=cog.get_transcript_pool() if files else None,
             )
             # Replace buffer content with processed HTML
             buffer = StringIO()
@@ -666,22 +674,21 @@ async def close_ticket(
             # Fall back to original HTML and all files in zip
             files_for_zip = files
 
-    def zip_files():
+    def zip_files() -> Path | None:
         if files_for_zip:
-            # Create a zip archive in memory
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zip_file:
+            # Each file is streamed from the spool into the archive
+            zip_path = spool_dir / "attachments.zip"
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zip_file:
                 for file_dict in files_for_zip:
-                    zip_file.writestr(
-                        file_dict["filename"],
-                        file_dict["content"],
+                    zip_file.write(
+                        file_dict["path"],
+                        arcname=file_dict["filename"],
                         compress_type=zipfile.ZIP_DEFLATED,
                         compresslevel=9,
                     )
-            zip_buffer.seek(0)
-            return zip_buffer.getvalue()
+            return zip_path
 
-    zip_bytes = await asyncio.to_thread(zip_files)
+    zip_path = await asyncio.to_thread(zip_files)
 
     # Send off new messages
     view = None
@@ -697,7 +704,7 @@ async def close_ticket(
         )
 
     text = buffer.getvalue()
-    zip_size = len(zip_bytes) if zip_bytes else 0
+    zip_size = zip_path.stat().st_size if zip_path else 0
 
     if log_chan and ticket.logmsg:
         upload_limit = guild.filesize_limit
@@ -705,7 +712,7 @@ async def close_ticket(
         fitted_text_size = _text_size_bytes(fitted_text) if fitted_text else 0
 
         text_file = text_to_file(fitted_text, fitted_name) if fitted_text else None
-        zip_file = discord.File(BytesIO(zip_bytes), filename="attachments.zip") if zip_bytes else None
+        zip_file = discord.File(zip_path, filename="attachments.zip") if zip_size else None
 
         perms = [
             log_chan.permissions_for(guild.me).embed_links,
@@ -760,6 +767,8 @@ async def close_ticket(
         except (discord.Forbidden, discord.HTTPException):
             pass
 
+    await asyncio.to_thread(spool.cleanup)
+
     # Mark channel as being closed to prevent race condition with delete listeners
     cog.closing_channels.add(cid)
 
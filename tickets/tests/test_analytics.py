@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from tickets.common.analytics import record_staff_message, record_ticket_claimed, record_ticket_opened
+from tickets.common.models import (
+    EventType,
+    GuildSettings,
+    Panel,
+    StaffEvent,
+    backfill_buckets,
+    get_server_stats_for_timespan,
+    get_staff_stats_for_timespan,
+    get_user_stats_for_timespan,
+    prune_old_events,
+)
+
+
+def make_conf() -> GuildSettings:
+    conf = GuildSettings()
+    conf.panels["support"] = Panel()
+    return conf
+
+
+def test_recorders_fill_hourly_buckets():
+    conf = make_conf()
+    record_ticket_opened(conf, 111, "support", 222)
+    record_ticket_opened(conf, 111, "support", 223)
+    record_ticket_claimed(conf, 333, 222, "support")
+    record_staff_message(conf, 333, 222, "support")
+
+    server = get_server_stats_for_timespan(conf.server_stats, timedelta(days=1))
+    assert server["total_tickets_opened"] == 2
+    assert server["panel_usage"] == {"support": 2}
+    assert sum(server["hourly_distribution"].values()) == 2
+
+    user = get_user_stats_for_timespan(conf.user_stats[111], timedelta(days=1))
+    assert user["tickets_opened"] == 2
+
+    staff = get_staff_stats_for_timespan(conf.staff_stats[333], timedelta(days=1))
+    assert staff["tickets_claimed"] == 1
+    assert staff["messages_sent"] == 1
+
+
+def test_timespan_excludes_older_buckets():
+    conf = make_conf()
+    stats = conf.get_staff_stats(333)
+    now = datetime.now().astimezone()
+    for days_ago, response_time in ((10, 600.0), (1, 60.0), (0, 120.0)):
+        stats.add_event(
+            StaffEvent(
+                timestamp=now - timedelta(days=days_ago),
+                event_type=EventType.FIRST_RESPONSE,
+                ticket_channel_id=days_ago,
+                response_time=response_time,
+            )
+        )
+
+    week = get_staff_stats_for_timespan(stats, timedelta(days=7))
+    assert week["response_count"] == 2
+    assert week["avg_response_time"] == 90.0
+    assert week["fastest_response"] == 60.0
+    assert week["slowest_response"] == 120.0
+
+
+def test_backfill_matches_recorded_buckets():
+    conf = make_conf()
+    record_ticket_opened(conf, 111, "support", 222)
+    record_ticket_claimed(conf, 333, 222, "support")
+    recorded = conf.server_stats.dump()["buckets"], conf.staff_stats[333].dump()["buckets"]
+
+    conf.server_stats.buckets = {}
+    conf.staff_stats[333].buckets = {}
+    backfill_buckets(conf)
+    assert (conf.server_stats.dump()["buckets"], conf.staff_stats[333].dump()["buckets"]) == recorded
+
+
+def test_prune_drops_old_buckets():
+    conf = make_conf()
+    conf.data_retention_days = 7
+    stats = conf.get_staff_stats(333)
+    now = datetime.now().astimezone()
+    for days_ago in (30, 0):
+        stats.add_event(
+            StaffEvent(
+                timestamp=now - timedelta(days=days_ago),
+                event_type=EventType.TICKET_CLAIMED,
+                ticket_channel_id=days_ago,
+            )
+        )
+
+    assert prune_old_events(conf) == 1
+    assert len(stats.buckets) == 1
+    assert get_staff_stats_for_timespan(stats, timedelta(days=365))["tickets_claimed"] == 1
@@ -0,0 +1,52 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+COG_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def spec_loaded_cog(monkeypatch):
+    """Load the cog the way Red does, by spec from its folder with nothing on sys.path pointing at it"""
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if Path(p or ".").resolve() != COG_DIR.parent])
+    previous = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "tickets"}
+    for name in previous:
+        del sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(
+        "tickets", COG_DIR / "__init__.py", submodule_search_locations=[str(COG_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["tickets"] = module
+    spec.loader.exec_module(module)
+    yield module
+
+    for name in [name for name in sys.modules if name.split(".")[0] == "tickets"]:
+        del sys.modules[name]
+    sys.modules.update(previous)
+
+
+@pytest.mark.asyncio
+async def test_spec_loaded_cog_compresses_in_pool(spec_loaded_cog, tmp_path):
+    from tickets.common.transcript import compress_images
+    from tickets.tickets import Tickets
+
+    path = tmp_path / "image.png"
+    Image.linear_gradient("L").resize((512, 512)).convert("RGB").save(path)
+    files = [{"filename": "image.png", "path": path, "size": path.stat().st_size}]
+
+    cog = SimpleNamespace(transcript_pool=None)
+    pool = Tickets.get_transcript_pool(cog)
+    try:
+        compressed = await compress_images(files, pool)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    webp_path, size = compressed[id(files[0])]
+    assert webp_path.exists()
+    assert 0 < size < files[0]["size"]
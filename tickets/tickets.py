@@ -1,7 +1,11 @@
 import asyncio
 import datetime
 import logging
+import multiprocessing as mp
+import site
 import typing as t
+from multiprocessing.pool import Pool
+from pathlib import Path
 from time import perf_counter
 
 import discord
@@ -19,6 +23,7 @@ from .common.analytics import (
 )
 from .common.functions import Functions
 from .common.models import DB, GuildSettings, migrate_from_old_config, run_migrations
+from .common.transcript import TRANSCRIPT_WORKERS
 from .common.utils import (
     close_ticket,
     get_ticket_owner,
@@ -41,7 +46,7 @@ class Tickets(TicketCommands, Functions, commands.Cog, metaclass=CompositeMetaCl
     """
 
     __author__ = "[vertyco](https://github.com/vertyco/vrt-cogs)"
-    __version__ = "3.5.0"
+    __version__ = "3.6.1"
 
     def format_help_for_context(self, ctx):
         helpcmd = super().format_help_for_context(ctx)
@@ -73,6 +78,7 @@ class Tickets(TicketCommands, Functions, commands.Cog, metaclass=CompositeMetaCl
         self.view_cache: t.Dict[int, t.List[discord.ui.View]] = {}  # Saved views to end on reload
         self.initializing = False
         self.closing_channels: set[int] = set()  # Channels currently being closed (to avoid race conditions)
+        self.transcript_pool: Pool | None = None  # Image compression workers, started by the first transcript
 
         self.auto_close.start()
 
@@ -87,6 +93,19 @@ class Tickets(TicketCommands, Functions, commands.Cog, metaclass=CompositeMetaCl
         if self.save_task is None or self.save_task.done():
             self.save_task = asyncio.create_task(self._debounced_flush())
 
+    def get_transcript_pool(self) -> Pool:
+        if self.transcript_pool is None:
+            # maxtasksperchild respawns workers so decoding huge images can't keep their RSS inflated.
+            # Red loads cogs by spec, so workers put the cog's parent folder on sys.path (with a stdlib
+            # initializer, they can't import anything from the cog yet) before unpickling any jobs
+            self.transcript_pool = mp.get_context("spawn").Pool(
+                processes=TRANSCRIPT_WORKERS,
+                maxtasksperchild=50,
+                initializer=site.addsitedir,
+                initargs=(str(Path(__file__).resolve().parent.parent),),
+            )
+        return self.transcript_pool
+
     async def _debounced_flush(self) -> None:
         try:
             await asyncio.sleep(self.save_debounce_seconds)
@@ -170,6 +189,9 @@ class Tickets(TicketCommands, Functions, commands.Cog, metaclass=CompositeMetaCl
             self.save_task.cancel()
         if self.save_dirty:
             await self._flush_save()
+        if self.transcript_pool is not None:
+            self.transcript_pool.terminate()
+            await asyncio.to_thread(self.transcript_pool.join)
 
     async def _startup(self) -> None:
         await self.bot.wait_until_red_ready()